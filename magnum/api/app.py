@@ -28,7 +28,11 @@ API_SERVICE_OPTS = [
     cfg.IntOpt('max_limit',
                default=1000,
                help='The maximum number of items returned in a single '
-                    'response from a collection resource.')
+                    'response from a collection resource.'),
+    cfg.IntOpt('max_bulk_bays',
+               default=50,
+               help='The maximum number of bays created by a single bulk '
+                    'bay creation request.'),
 ]
 
 CONF = cfg.CONF
@@ -30,6 +30,7 @@ from magnum.api.controllers import link
 from magnum.api.controllers.v1 import bay
 from magnum.api.controllers.v1 import baymodel
 from magnum.api.controllers.v1 import container
+from magnum.api.controllers.v1 import manifest
 from magnum.api.controllers.v1 import node
 from magnum.api.controllers.v1 import pod
 from magnum.api.controllers.v1 import replicationcontroller as rc
@@ -164,6 +165,7 @@ class Controller(rest.RestController):
     bays = bay.BaysController()
     baymodels = baymodel.BayModelsController()
     containers = container.ContainersController()
+    manifests = manifest.ManifestsController()
     nodes = node.NodesController()
     pods = pod.PodsController()
     rcs = rc.ReplicationControllersController()
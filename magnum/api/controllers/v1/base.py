@@ -39,6 +39,10 @@ class K8sResourceBase(base.APIBase):
 
     _bay_uuid = None
 
+    # The manifest parsed by parse_manifest, sent to the conductor along
+    # with the resource so that it is not parsed again there.
+    _parsed_manifest = None
+
     def _get_bay_uuid(self):
         return self._bay_uuid
 
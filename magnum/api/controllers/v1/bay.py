@@ -15,8 +15,12 @@
 
 import datetime
 
+from oslo_config import cfg
+from oslo_log import log as logging
+from oslo_utils import excutils
 import pecan
 from pecan import rest
+import six
 import wsme
 from wsme import types as wtypes
 import wsmeext.pecan as wsme_pecan
@@ -27,7 +31,35 @@ from magnum.api.controllers.v1 import collection
 from magnum.api.controllers.v1 import types
 from magnum.api.controllers.v1 import utils as api_utils
 from magnum.common import exception
+from magnum.i18n import _
+from magnum.i18n import _LE
 from magnum import objects
+from magnum.objects.bay import Status as bay_status
+
+
+LOG = logging.getLogger(__name__)
+
+# The fields of a bay which can be changed once it is created.
+MUTABLE_FIELDS = ['name', 'node_count']
+
+
+def _cast_bay_create(cast, bays, *args):
+    """Cast the creation of bays, failing them if the cast fails.
+
+    The bays are saved in CREATE_IN_PROGRESS status before the cast, so
+    they would otherwise be left in progress without a stack.
+    """
+    try:
+        cast(*args)
+    except Exception as e:
+        with excutils.save_and_reraise_exception():
+            LOG.exception(_LE('Unable to request the creation of bays %s'),
+                          ', '.join(bay.uuid for bay in bays))
+            for bay in bays:
+                bay.status = bay_status.CREATE_FAILED
+                bay.status_reason = (_('Unable to request the creation of '
+                                       'the bay: %s') % six.text_type(e))
+                bay.save()
 
 
 class BayPatchType(types.JsonPatchType):
@@ -171,6 +203,63 @@ class BayCollection(collection.Collection):
         return sample
 
 
+class BayBulk(base.APIBase):
+    """API representation of a bulk bay creation.
+
+    The bays are created from the same template bay, either ``count`` of them
+    or one per name in ``names``.
+    """
+
+    bay = wsme.wsattr(Bay, mandatory=True)
+    """The template of the bays to create"""
+
+    count = wtypes.IntegerType(minimum=1)
+    """The number of bays to create"""
+
+    names = [wtypes.StringType(min_length=1, max_length=255)]
+    """The names of the bays to create, one bay per name"""
+
+    def __init__(self, **kwargs):
+        super(BayBulk, self).__init__()
+        self.fields = ['bay', 'count', 'names']
+        for field in self.fields:
+            setattr(self, field, kwargs.get(field, wtypes.Unset))
+
+    def get_names(self):
+        """Return the names of the bays to create.
+
+        Bays created from a count are named after the template bay with an
+        index suffix, or left unnamed if the template bay has no name.
+        """
+        has_count = self.count is not wtypes.Unset
+        has_names = self.names is not wtypes.Unset
+        if has_count == has_names:
+            raise exception.InvalidParameterValue(
+                _('Exactly one of count or names must be specified.'))
+        count = len(self.names) if has_names else self.count
+        if count > cfg.CONF.api.max_bulk_bays:
+            raise exception.InvalidParameterValue(
+                _('At most %s bays can be created at once.') %
+                cfg.CONF.api.max_bulk_bays)
+        if has_names:
+            if not self.names:
+                raise exception.InvalidParameterValue(
+                    _('At least one bay name must be specified.'))
+            return list(self.names)
+        name = self.bay.name
+        if name is wtypes.Unset:
+            return [wtypes.Unset] * self.count
+        return ['%s-%d' % (name, i) for i in range(self.count)]
+
+    @classmethod
+    def sample(cls):
+        return cls(bay=Bay(name='example',
+                           baymodel_id='4a96ac4b-2447-43f1-8ca6-'
+                                       '9fd6f36d146d',
+                           node_count=2),
+                   count=3)
+
+
 class BaysController(rest.RestController):
     """REST controller for Bays."""
     def __init__(self):
@@ -182,6 +271,7 @@ class BaysController(rest.RestController):
 
     _custom_actions = {
         'detail': ['GET'],
+        'bulk': ['POST'],
     }
 
     def _get_bays_collection(self, marker, limit,
@@ -257,10 +347,13 @@ class BaysController(rest.RestController):
 
         return Bay.convert_with_links(rpc_bay)
 
-    @wsme_pecan.wsexpose(Bay, body=Bay, status_code=201)
+    @wsme_pecan.wsexpose(Bay, body=Bay, status_code=202)
     def post(self, bay):
         """Create a new bay.
 
+        The bay is returned in CREATE_IN_PROGRESS status while the conductor
+        creates its stack.
+
         :param bay: a bay within the request body.
         """
         if self.from_bays:
@@ -272,20 +365,65 @@ class BaysController(rest.RestController):
         bay_dict['project_id'] = auth_token['project']['id']
         bay_dict['user_id'] = auth_token['user']['id']
         new_bay = objects.Bay(context, **bay_dict)
+        new_bay.status = bay_status.CREATE_IN_PROGRESS
+        new_bay.create()
         if isinstance(bay.bay_create_timeout, wsme.types.UnsetType):
             bay.bay_create_timeout = 0
-        res_bay = pecan.request.rpcapi.bay_create(new_bay,
-                                                  bay.bay_create_timeout)
+        _cast_bay_create(pecan.request.rpcapi.bay_create, [new_bay],
+                         new_bay, bay.bay_create_timeout)
 
         # Set the HTTP Location Header
-        pecan.response.location = link.build_url('bays', res_bay.uuid)
-        return Bay.convert_with_links(res_bay)
+        pecan.response.location = link.build_url('bays', new_bay.uuid)
+        return Bay.convert_with_links(new_bay)
+
+    @wsme_pecan.wsexpose(BayCollection, body=BayBulk, status_code=202)
+    def bulk(self, bulk):
+        """Create several bays from the same bay template.
+
+        All the bays are returned in CREATE_IN_PROGRESS status, and their
+        stacks are created by the conductor with a single request.
+
+        :param bulk: a bulk bay creation within the request body.
+        """
+        if self.from_bays:
+            raise exception.OperationNotPermitted
+
+        names = bulk.get_names()
+        bay_dict = bulk.bay.as_dict()
+        context = pecan.request.context
+        auth_token = context.auth_token_info['token']
+        bay_dict['project_id'] = auth_token['project']['id']
+        bay_dict['user_id'] = auth_token['user']['id']
+        bay_dict.pop('uuid', None)
+
+        new_bays = []
+        for name in names:
+            new_bay = objects.Bay(context, **bay_dict)
+            if name is not wtypes.Unset:
+                new_bay.name = name
+            new_bay.status = bay_status.CREATE_IN_PROGRESS
+            new_bay.create()
+            new_bays.append(new_bay)
+
+        bay_create_timeout = bulk.bay.bay_create_timeout
+        if isinstance(bay_create_timeout, wsme.types.UnsetType):
+            bay_create_timeout = 0
+        _cast_bay_create(pecan.request.rpcapi.bay_bulk_create, new_bays,
+                         new_bays, bay_create_timeout)
+
+        return BayCollection.convert_with_links(new_bays, None, expand=True)
 
     @wsme.validate(types.uuid, [BayPatchType])
-    @wsme_pecan.wsexpose(Bay, types.uuid_or_name, body=[BayPatchType])
+    @wsme_pecan.wsexpose(Bay, types.uuid_or_name, body=[BayPatchType],
+                         status_code=202)
     def patch(self, bay_ident, patch):
         """Update an existing bay.
 
+        Only the name and the node_count of a bay can be changed.  A new
+        name is saved right away, while a new node_count is applied to the
+        stack of the bay by the conductor, which records a failure on the
+        status_reason of the bay.
+
         :param bay_ident: UUID or logical name of a bay.
         :param patch: a json PATCH document to apply to this bay.
         """
@@ -311,18 +449,39 @@ class BaysController(rest.RestController):
             if rpc_bay[field] != patch_val:
                 rpc_bay[field] = patch_val
 
-        res_bay = pecan.request.rpcapi.bay_update(rpc_bay)
-        return Bay.convert_with_links(res_bay)
+        delta = set(rpc_bay.obj_what_changed())
+        immutable = delta - set(MUTABLE_FIELDS)
+        if immutable:
+            raise exception.InvalidParameterValue(err=(
+                _("cannot change bay property(ies) %s.") %
+                ", ".join(sorted(immutable))))
+
+        if 'node_count' in delta:
+            rpc_bay.status = bay_status.UPDATE_IN_PROGRESS
+            pecan.request.rpcapi.bay_update(rpc_bay)
+        elif delta:
+            rpc_bay.save()
+        return Bay.convert_with_links(rpc_bay)
 
-    @wsme_pecan.wsexpose(None, types.uuid_or_name, status_code=204)
+    @wsme_pecan.wsexpose(None, types.uuid_or_name, status_code=202)
     def delete(self, bay_ident):
         """Delete a bay.
 
+        The bay is set in DELETE_IN_PROGRESS status, and its stack is deleted
+        by the conductor, which destroys the bay once the stack is gone.
+
         :param bay_ident: UUID of a bay or logical name of the bay.
         """
         if self.from_bays:
             raise exception.OperationNotPermitted
 
         rpc_bay = api_utils.get_rpc_resource('Bay', bay_ident)
-
-        pecan.request.rpcapi.bay_delete(rpc_bay.uuid)
+        status = rpc_bay.status
+        rpc_bay.status = bay_status.DELETE_IN_PROGRESS
+        rpc_bay.save()
+        try:
+            pecan.request.rpcapi.bay_delete(rpc_bay.uuid)
+        except Exception:
+            with excutils.save_and_reraise_exception():
+                rpc_bay.status = status
+                rpc_bay.save()
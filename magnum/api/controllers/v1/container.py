@@ -15,9 +15,14 @@
 
 import datetime
 
+from docker import errors
+from oslo_config import cfg
 from oslo_log import log as logging
+from oslo_utils import strutils
 import pecan
 from pecan import rest
+from requests import exceptions as req_exceptions
+import six
 import wsme
 from wsme import types as wtypes
 import wsmeext.pecan as wsme_pecan
@@ -28,10 +33,30 @@ from magnum.api.controllers.v1 import collection
 from magnum.api.controllers.v1 import types
 from magnum.api.controllers.v1 import utils as api_utils
 from magnum.common import exception
+from magnum.conductor.handlers.common import docker_client
+from magnum.i18n import _
 from magnum import objects
 
 LOG = logging.getLogger(__name__)
 
+cfg.CONF.import_opt('stats_window',
+                    'magnum.conductor.handlers.docker_conductor',
+                    group='docker')
+cfg.CONF.import_opt('stats_max_window',
+                    'magnum.conductor.handlers.docker_conductor',
+                    group='docker')
+cfg.CONF.import_opt('exec_stream_timeout',
+                    'magnum.conductor.handlers.docker_conductor',
+                    group='docker')
+cfg.CONF.import_opt('exec_stream_max_bytes',
+                    'magnum.conductor.handlers.docker_conductor',
+                    group='docker')
+cfg.CONF.import_opt('client_cache_size',
+                    'magnum.conductor.handlers.docker_conductor',
+                    group='docker')
+
+_docker_clients = docker_client.DockerClientCache()
+
 
 class ContainerPatchType(types.JsonPatchType):
 
@@ -131,6 +156,148 @@ class Container(base.APIBase):
         return cls._convert_with_links(sample, 'http://localhost:9511', expand)
 
 
+class ImagePrepull(base.APIBase):
+    """API representation of images to pull on a bay ahead of time."""
+
+    bay_uuid = wsme.wsattr(types.uuid_or_name, mandatory=True)
+    """UUID or logical name of the bay to pull the images on"""
+
+    images = wsme.wsattr([wtypes.text], mandatory=True)
+    """The names of the images to pull"""
+
+    @classmethod
+    def sample(cls):
+        return cls(bay_uuid='fff114da-3bfa-4a0f-a123-c0dffad9718e',
+                   images=['ubuntu', 'nginx:1.9'])
+
+
+class ContainerBulkAction(base.APIBase):
+    """API representation of an action on several containers."""
+
+    action = wsme.wsattr(wtypes.Enum(str, 'start', 'stop', 'reboot', 'pause',
+                                     'unpause', 'delete'),
+                         mandatory=True)
+    """The action to run on the containers"""
+
+    containers = wsme.wsattr([types.uuid], mandatory=True)
+    """The UUIDs of the containers"""
+
+    @classmethod
+    def sample(cls):
+        return cls(action='stop',
+                   containers=['27e3153e-d5bf-4b7e-b517-fb518e17f34c'])
+
+
+class ContainerActionResult(base.APIBase):
+    """API representation of the result of an action on a container."""
+
+    uuid = types.uuid
+    """Unique UUID of the container"""
+
+    status = wtypes.text
+    """The status of the container after the action"""
+
+    error = wtypes.text
+    """The reason the action failed on the container, if it did"""
+
+    @classmethod
+    def sample(cls):
+        return cls(uuid='27e3153e-d5bf-4b7e-b517-fb518e17f34c',
+                   status='Stopped', error=None)
+
+
+class ContainerStats(base.APIBase):
+    """API representation of the resource usage of containers."""
+
+    uuid = types.uuid
+    """Unique UUID of the container"""
+
+    samples = int
+    """The number of Docker stats samples aggregated"""
+
+    cpu_percent = float
+    """The average CPU usage, in percent of one CPU"""
+
+    cpu_percent_max = float
+    """The peak CPU usage, in percent of one CPU"""
+
+    memory_usage = int
+    """The memory usage in bytes"""
+
+    memory_max_usage = int
+    """The peak memory usage in bytes"""
+
+    memory_limit = int
+    """The memory limit in bytes"""
+
+    network_rx_bytes = int
+    """The bytes received over the network during the window"""
+
+    network_tx_bytes = int
+    """The bytes sent over the network during the window"""
+
+    blkio_read_bytes = int
+    """The bytes read from block devices during the window"""
+
+    blkio_write_bytes = int
+    """The bytes written to block devices during the window"""
+
+    @classmethod
+    def sample(cls):
+        return cls(uuid='27e3153e-d5bf-4b7e-b517-fb518e17f34c',
+                   samples=6, cpu_percent=12.5, cpu_percent_max=20.1,
+                   memory_usage=104857600, memory_max_usage=115343360,
+                   memory_limit=2147483648, network_rx_bytes=2048,
+                   network_tx_bytes=1024, blkio_read_bytes=0,
+                   blkio_write_bytes=4096)
+
+
+class BayContainerStats(base.APIBase):
+    """API representation of the resource usage of the containers of a bay.
+
+    Only the running containers of the bay are included, busiest first, up
+    to the number of containers sampled by a single request.
+    """
+
+    bay_uuid = types.uuid
+    """Unique UUID of the bay"""
+
+    containers = [ContainerStats]
+    """The resource usage of each container"""
+
+    total = ContainerStats
+    """The resource usage of all the containers"""
+
+    unsampled = int
+    """The number of running containers left out of the statistics"""
+
+    @classmethod
+    def sample(cls):
+        container = ContainerStats.sample()
+        return cls(bay_uuid='fff114da-3bfa-4a0f-a123-c0dffad9718e',
+                   containers=[container],
+                   total=ContainerStats(
+                       cpu_percent=container.cpu_percent,
+                       cpu_percent_max=container.cpu_percent_max,
+                       memory_usage=container.memory_usage,
+                       memory_max_usage=container.memory_max_usage,
+                       network_rx_bytes=container.network_rx_bytes,
+                       network_tx_bytes=container.network_tx_bytes,
+                       blkio_read_bytes=container.blkio_read_bytes,
+                       blkio_write_bytes=container.blkio_write_bytes),
+                   unsampled=0)
+
+
+def _validate_stats_window(window):
+    if window is None:
+        return cfg.CONF.docker.stats_window
+    if not 0 < window <= cfg.CONF.docker.stats_max_window:
+        raise exception.InvalidParameterValue(
+            _("The stats window must be between 1 and %d seconds.")
+            % cfg.CONF.docker.stats_max_window)
+    return window
+
+
 class ContainerCollection(collection.Collection):
     """API representation of a collection of containers."""
 
@@ -235,6 +402,125 @@ class LogsController(object):
         return pecan.request.rpcapi.container_logs(container_uuid)
 
 
+class StatsController(object):
+    @wsme_pecan.wsexpose(ContainerStats, types.uuid_or_name, int)
+    def _default(self, container_ident, window=None):
+        if pecan.request.method != 'GET':
+            pecan.abort(405, ('HTTP method %s is not allowed'
+                              % pecan.request.method))
+        window = _validate_stats_window(window)
+        container_uuid = api_utils.get_rpc_resource('Container',
+                                                    container_ident).uuid
+        LOG.debug('Calling conductor.container_stats with %s' %
+                  container_uuid)
+        return ContainerStats(**pecan.request.rpcapi.container_stats(
+            container_uuid, window))
+
+
+def _get_docker_for_stream(container_ident):
+    """Return the docker client and the Docker id of a container.
+
+    The streaming controllers are not exposed through wsme, so errors abort
+    the request with their HTTP code.
+    """
+    try:
+        container = api_utils.get_rpc_resource('Container', container_ident)
+        docker_id = container.docker_id
+        if not docker_id:
+            docker_id = pecan.request.rpcapi.container_show(
+                container.uuid).docker_id
+        bay = objects.Bay.get_by_uuid(pecan.request.context,
+                                      container.bay_uuid)
+    except exception.MagnumException as e:
+        pecan.abort(e.code, six.text_type(e))
+    if not docker_id:
+        pecan.abort(409, _('Container %s has not been created on its bay '
+                           'yet.') % container.uuid)
+    return _docker_clients.get(bay), docker_id
+
+
+def _stream_response(stream_func, *args, **kwargs):
+    """Send the chunks of a Docker stream as the response body."""
+    try:
+        stream = stream_func(*args, **kwargs)
+    except errors.APIError as api_error:
+        code = getattr(api_error.response, 'status_code', None) or 500
+        pecan.abort(code, "Docker API Error : %s" % api_error)
+    except (req_exceptions.ConnectionError, req_exceptions.Timeout) as e:
+        pecan.abort(503, _('Unable to reach the Docker daemon of the bay: '
+                           '%s') % e)
+
+    pecan.response.content_type = 'text/plain'
+    # pecan only leaves generator bodies unread, so hand it one.
+    pecan.response.app_iter = iter(stream)
+    return pecan.response
+
+
+class StreamLogsController(object):
+    """Streams the logs of a container straight from its bay.
+
+    The logs are proxied chunk by chunk from the Docker logs stream of the
+    container, so neither the API nor the conductor hold the whole log in
+    memory and no RPC message carries it.
+    """
+
+    @staticmethod
+    def _parse_options(tail, since, timestamps, follow):
+        try:
+            if tail != 'all':
+                tail = int(tail)
+                if tail <= 0:
+                    raise ValueError(tail)
+            if since is not None:
+                since = int(since)
+                if since < 0:
+                    raise ValueError(since)
+            timestamps = strutils.bool_from_string(timestamps, strict=True)
+            follow = strutils.bool_from_string(follow, strict=True)
+        except ValueError as e:
+            pecan.abort(400, _("Invalid logs option: %s") % e)
+        return tail, since, timestamps, follow
+
+    @pecan.expose()
+    def _default(self, container_ident, tail='all', since=None,
+                 timestamps='false', follow='false'):
+        if pecan.request.method != 'GET':
+            pecan.abort(405, ('HTTP method %s is not allowed'
+                              % pecan.request.method))
+        tail, since, timestamps, follow = self._parse_options(
+            tail, since, timestamps, follow)
+        docker, docker_id = _get_docker_for_stream(container_ident)
+        LOG.debug('Streaming logs of container %s' % container_ident)
+        return _stream_response(docker.logs_stream, docker_id, tail=tail,
+                                since=since, timestamps=timestamps,
+                                follow=follow)
+
+
+class StreamExecuteController(object):
+    """Streams the output of a command run in a container.
+
+    The stdout and stderr of the command are proxied chunk by chunk from its
+    bay as the command runs.  The output is cut after
+    ``docker.exec_stream_timeout`` seconds or
+    ``docker.exec_stream_max_bytes`` bytes.
+    """
+
+    @pecan.expose()
+    def _default(self, container_ident, command=None):
+        if pecan.request.method != 'PUT':
+            pecan.abort(405, ('HTTP method %s is not allowed'
+                              % pecan.request.method))
+        if not command:
+            pecan.abort(400, _("A command is required."))
+        docker, docker_id = _get_docker_for_stream(container_ident)
+        LOG.debug('Streaming command %s of container %s'
+                  % (command, container_ident))
+        return _stream_response(
+            docker.exec_stream, docker_id, command,
+            timeout=cfg.CONF.docker.exec_stream_timeout,
+            max_bytes=cfg.CONF.docker.exec_stream_max_bytes)
+
+
 class ExecuteController(object):
     @wsme_pecan.wsexpose(types.uuid_or_name, wtypes.text, wtypes.text)
     def _default(self, container_ident, command):
@@ -260,6 +546,9 @@ class ContainersController(rest.RestController):
     pause = PauseController()
     unpause = UnpauseController()
     logs = LogsController()
+    stream_logs = StreamLogsController()
+    stream_execute = StreamExecuteController()
+    stats = StatsController()
     execute = ExecuteController()
 
     from_containers = False
@@ -268,6 +557,9 @@ class ContainersController(rest.RestController):
 
     _custom_actions = {
         'detail': ['GET'],
+        'prepull': ['POST'],
+        'actions': ['POST'],
+        'bay_stats': ['GET'],
     }
 
     def _get_containers_collection(self, marker, limit,
@@ -285,8 +577,9 @@ class ContainersController(rest.RestController):
         containers = objects.Container.list(pecan.request.context, limit,
                                             marker_obj, sort_key=sort_key,
                                             sort_dir=sort_dir)
-        containers = [pecan.request.rpcapi.container_show(c.uuid)
-                      for c in containers]
+        if containers:
+            containers = pecan.request.rpcapi.container_sync_status(
+                containers)
 
         return ContainerCollection.convert_with_links(containers, limit,
                                                       url=resource_url,
@@ -331,6 +624,26 @@ class ContainersController(rest.RestController):
                                                sort_key, sort_dir, expand,
                                                resource_url)
 
+    @wsme_pecan.wsexpose(BayContainerStats, types.uuid_or_name, int)
+    def bay_stats(self, bay_ident, window=None):
+        """Retrieve the resource usage of the containers of a bay.
+
+        :param bay_ident: UUID or logical name of a bay.
+        :param window: number of seconds to aggregate the usage over.
+        """
+        if self.from_containers:
+            raise exception.OperationNotPermitted
+
+        window = _validate_stats_window(window)
+        bay = api_utils.get_rpc_resource('Bay', bay_ident)
+        stats = pecan.request.rpcapi.bay_container_stats(bay.uuid, window)
+        return BayContainerStats(
+            bay_uuid=stats['bay_uuid'],
+            containers=[ContainerStats(**snapshot)
+                        for snapshot in stats['containers']],
+            total=ContainerStats(**stats['total']),
+            unsampled=stats.get('unsampled', 0))
+
     @wsme_pecan.wsexpose(Container, types.uuid_or_name)
     def get_one(self, container_ident):
         """Retrieve information about the given container.
@@ -370,6 +683,44 @@ class ContainersController(rest.RestController):
                                                  res_container.uuid)
         return Container.convert_with_links(res_container)
 
+    @wsme_pecan.wsexpose([ContainerActionResult], body=ContainerBulkAction)
+    def actions(self, bulk_action):
+        """Run the same action on several containers.
+
+        The result of the action is returned for every container, and a
+        container failing does not stop the action on the others.
+
+        :param bulk_action: an action and its containers within the request
+                            body.
+        """
+        if self.from_containers:
+            raise exception.OperationNotPermitted
+
+        if not bulk_action.containers:
+            raise exception.InvalidParameterValue(
+                _("At least one container is required."))
+        results = pecan.request.rpcapi.container_bulk_action(
+            bulk_action.containers, bulk_action.action)
+        return [ContainerActionResult(**result) for result in results]
+
+    @wsme_pecan.wsexpose(None, body=ImagePrepull, status_code=202)
+    def prepull(self, prepull):
+        """Pull images on a bay ahead of the creation of containers.
+
+        The images are pulled in the background by the conductor, and the
+        containers created from them afterwards do not wait for a pull.
+
+        :param prepull: a bay and its images within the request body.
+        """
+        if self.from_containers:
+            raise exception.OperationNotPermitted
+
+        if not prepull.images:
+            raise exception.InvalidParameterValue(
+                _("At least one image is required."))
+        bay = api_utils.get_rpc_resource('Bay', prepull.bay_uuid)
+        pecan.request.rpcapi.image_prepull(bay.uuid, prepull.images)
+
     @wsme.validate(types.uuid, [ContainerPatchType])
     @wsme_pecan.wsexpose(Container, types.uuid_or_name,
                          body=[ContainerPatchType])
@@ -0,0 +1,134 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import pecan
+from pecan import rest
+import wsmeext.pecan as wsme_pecan
+
+from magnum.api.controllers import base
+from magnum.api.controllers.v1 import base as v1_base
+from magnum.api.controllers.v1 import pod as api_pod
+from magnum.api.controllers.v1 import replicationcontroller as api_rc
+from magnum.api.controllers.v1 import service as api_service
+from magnum.common import exception
+from magnum.common import k8s_manifest
+from magnum.i18n import _
+from magnum import objects
+
+
+# The API type, object and result key of each kind of resource.
+KINDS = {
+    'Pod': (api_pod.Pod, objects.Pod, 'pods'),
+    'Service': (api_service.Service, objects.Service, 'services'),
+    'ReplicationController': (api_rc.ReplicationController,
+                              objects.ReplicationController, 'rcs'),
+}
+
+
+class Manifest(v1_base.K8sResourceBase):
+    """API representation of a manifest of several k8s resources.
+
+    The manifest is either a single JSON object or YAML document of kind
+    List, or several YAML documents.
+    """
+
+    @classmethod
+    def sample(cls):
+        return cls(bay_uuid='7ae81bb3-dec3-4289-8d6c-da80bd8001ae',
+                   manifest='''{
+                       "kind": "List",
+                       "items": [{
+                           "kind": "Service",
+                           "metadata": {"name": "frontend"},
+                           "spec": {"ports": [{"port": 80}],
+                                    "selector": {"name": "frontend"}}
+                       }]
+                   }''')
+
+
+class ManifestResources(base.APIBase):
+    """API representation of the k8s resources created from a manifest."""
+
+    pods = [api_pod.Pod]
+    """The pods created"""
+
+    services = [api_service.Service]
+    """The services created"""
+
+    rcs = [api_rc.ReplicationController]
+    """The ReplicationControllers created"""
+
+
+class ManifestsController(rest.RestController):
+    """REST controller for manifests of several k8s resources."""
+
+    _custom_actions = {
+        'apply': ['POST'],
+    }
+
+    @wsme_pecan.wsexpose(ManifestResources, body=Manifest, status_code=201)
+    def apply(self, bay_manifest):
+        """Create all the resources of a manifest in a bay.
+
+        All the resources are validated before any is created, and they
+        are created with a single call to the conductor.
+
+        :param bay_manifest: a bay and its manifest within the request body.
+        """
+        try:
+            resources = k8s_manifest.parse_all(bay_manifest._get_manifest())
+        except ValueError as e:
+            raise exception.InvalidParameterValue(message=str(e))
+
+        context = pecan.request.context
+        auth_token = context.auth_token_info['token']
+        objs = dict((key, []) for api_type, obj_class, key in KINDS.values())
+        manifests = dict((key, []) for key in objs)
+        names = set()
+        for resource in resources:
+            kind = resource.get('kind')
+            if kind not in KINDS:
+                raise exception.InvalidParameterValue(
+                    _("Kind %s of a resource of the manifest is not "
+                      "supported.") % kind)
+            api_type, obj_class, key = KINDS[kind]
+            api_resource = api_type()
+            api_resource.parse_manifest(resource)
+            # A resource of a manifest with several documents has no
+            # manifest string of its own, so it is given its document.
+            api_resource.manifest = json.dumps(resource)
+            if (kind, api_resource.name) in names:
+                raise exception.InvalidParameterValue(
+                    _("The manifest defines the %(kind)s %(name)s twice.") %
+                    {'kind': kind, 'name': api_resource.name})
+            names.add((kind, api_resource.name))
+
+            resource_dict = api_resource.as_dict()
+            resource_dict['bay_uuid'] = bay_manifest.bay_uuid
+            resource_dict['project_id'] = auth_token['project']['id']
+            resource_dict['user_id'] = auth_token['user']['id']
+            objs[key].append(obj_class(context, **resource_dict))
+            manifests[key].append(resource)
+
+        created = pecan.request.rpcapi.manifest_apply(objs['pods'],
+                                                      objs['services'],
+                                                      objs['rcs'],
+                                                      manifests)
+        return ManifestResources(
+            pods=[api_pod.Pod.convert_with_links(obj)
+                  for obj in created['pods']],
+            services=[api_service.Service.convert_with_links(obj)
+                      for obj in created['services']],
+            rcs=[api_rc.ReplicationController.convert_with_links(obj)
+                 for obj in created['rcs']])
@@ -112,11 +112,12 @@ class Pod(v1_base.K8sResourceBase):
                      updated_at=datetime.datetime.utcnow())
         return cls._convert_with_links(sample, 'http://localhost:9511', expand)
 
-    def parse_manifest(self):
-        try:
-            manifest = k8s_manifest.parse(self._get_manifest())
-        except ValueError as e:
-            raise exception.InvalidParameterValue(message=str(e))
+    def parse_manifest(self, manifest=None):
+        if manifest is None:
+            try:
+                manifest = k8s_manifest.parse(self._get_manifest())
+            except ValueError as e:
+                raise exception.InvalidParameterValue(message=str(e))
         try:
             self.name = manifest["metadata"]["name"]
         except (KeyError, TypeError):
@@ -132,6 +133,7 @@ class Pod(v1_base.K8sResourceBase):
                 "Field spec['containers'] can't be empty in manifest.")
         if "labels" in manifest["metadata"]:
             self.labels = manifest["metadata"]["labels"]
+        self._parsed_manifest = manifest
 
 
 class PodCollection(collection.Collection):
@@ -260,7 +262,8 @@ class PodsController(rest.RestController):
         pod_dict['project_id'] = auth_token['project']['id']
         pod_dict['user_id'] = auth_token['user']['id']
         pod_obj = objects.Pod(context, **pod_dict)
-        new_pod = pecan.request.rpcapi.pod_create(pod_obj)
+        new_pod = pecan.request.rpcapi.pod_create(pod_obj,
+                                                  pod._parsed_manifest)
         # Set the HTTP Location Header
         pecan.response.location = link.build_url('pods', new_pod.uuid)
         return Pod.convert_with_links(new_pod)
@@ -302,7 +305,7 @@ class PodsController(rest.RestController):
                 rpc_pod[field] = patch_val
 
         if pod.manifest or pod.manifest_url:
-            pecan.request.rpcapi.pod_update(rpc_pod)
+            pecan.request.rpcapi.pod_update(rpc_pod, pod._parsed_manifest)
         else:
             rpc_pod.save()
         return Pod.convert_with_links(rpc_pod)
@@ -132,11 +132,12 @@ class ReplicationController(v1_base.K8sResourceBase):
                      updated_at=datetime.datetime.utcnow())
         return cls._convert_with_links(sample, 'http://localhost:9511', expand)
 
-    def parse_manifest(self):
-        try:
-            manifest = k8s_manifest.parse(self._get_manifest())
-        except ValueError as e:
-            raise exception.InvalidParameterValue(message=str(e))
+    def parse_manifest(self, manifest=None):
+        if manifest is None:
+            try:
+                manifest = k8s_manifest.parse(self._get_manifest())
+            except ValueError as e:
+                raise exception.InvalidParameterValue(message=str(e))
         try:
             self.name = manifest["metadata"]["name"]
         except (KeyError, TypeError):
@@ -166,6 +167,7 @@ class ReplicationController(v1_base.K8sResourceBase):
             raise exception.InvalidParameterValue(
                 "Field spec['template']['spec']['containers'] "
                 "can't be empty in manifest.")
+        self._parsed_manifest = manifest
 
 
 class ReplicationControllerCollection(collection.Collection):
@@ -298,7 +300,7 @@ class ReplicationControllersController(rest.RestController):
         rc_dict['project_id'] = auth_token['project']['id']
         rc_dict['user_id'] = auth_token['user']['id']
         rc_obj = objects.ReplicationController(context, **rc_dict)
-        new_rc = pecan.request.rpcapi.rc_create(rc_obj)
+        new_rc = pecan.request.rpcapi.rc_create(rc_obj, rc._parsed_manifest)
         if not new_rc:
             raise exception.InvalidState()
 
@@ -345,7 +347,7 @@ class ReplicationControllersController(rest.RestController):
                 rpc_rc[field] = patch_val
 
         if rc.manifest or rc.manifest_url:
-            pecan.request.rpcapi.rc_update(rpc_rc)
+            pecan.request.rpcapi.rc_update(rpc_rc, rc._parsed_manifest)
         else:
             rpc_rc.save()
         return ReplicationController.convert_with_links(rpc_rc)
@@ -123,11 +123,12 @@ class Service(v1_base.K8sResourceBase):
                      updated_at=datetime.datetime.utcnow())
         return cls._convert_with_links(sample, 'http://localhost:9511', expand)
 
-    def parse_manifest(self):
-        try:
-            manifest = k8s_manifest.parse(self._get_manifest())
-        except ValueError as e:
-            raise exception.InvalidParameterValue(message=str(e))
+    def parse_manifest(self, manifest=None):
+        if manifest is None:
+            try:
+                manifest = k8s_manifest.parse(self._get_manifest())
+            except ValueError as e:
+                raise exception.InvalidParameterValue(message=str(e))
         try:
             self.name = manifest["metadata"]["name"]
         except (KeyError, TypeError):
@@ -143,6 +144,7 @@ class Service(v1_base.K8sResourceBase):
             self.selector = manifest["spec"]["selector"]
         if "labels" in manifest["metadata"]:
             self.labels = manifest["metadata"]["labels"]
+        self._parsed_manifest = manifest
 
 
 class ServiceCollection(collection.Collection):
@@ -275,7 +277,8 @@ class ServicesController(rest.RestController):
         service_dict['project_id'] = auth_token['project']['id']
         service_dict['user_id'] = auth_token['user']['id']
         service_obj = objects.Service(context, **service_dict)
-        new_service = pecan.request.rpcapi.service_create(service_obj)
+        new_service = pecan.request.rpcapi.service_create(
+            service_obj, service._parsed_manifest)
         if new_service is None:
             raise exception.InvalidState()
 
@@ -320,7 +323,8 @@ class ServicesController(rest.RestController):
                 rpc_service[field] = patch_val
 
         if service.manifest or service.manifest_url:
-            pecan.request.rpcapi.service_update(rpc_service)
+            pecan.request.rpcapi.service_update(rpc_service,
+                                                service._parsed_manifest)
         else:
             rpc_service.save()
         return Service.convert_with_links(rpc_service)
@@ -23,10 +23,16 @@ from oslo_log import log as logging
 
 from magnum.common import rpc_service as service
 from magnum.common import short_id
+from magnum.conductor import bay_lock
 from magnum.conductor.handlers import bay_conductor
 from magnum.conductor.handlers import conductor_listener
 from magnum.conductor.handlers import docker_conductor
+from magnum.conductor.handlers import heat_notification
 from magnum.conductor.handlers import kube as k8s_conductor
+from magnum.conductor import hash_ring
+from magnum.conductor import k8s_watch
+from magnum.conductor import periodic
+from magnum.conductor import template_definition
 from magnum.i18n import _LE
 from magnum.i18n import _LI
 
@@ -45,11 +51,13 @@ def main():
     cfg.CONF.import_opt('topic', 'magnum.conductor.config', group='conductor')
 
     conductor_id = short_id.generate_id()
+    ring = hash_ring.ConductorRing(conductor_id)
+    heat_poller = bay_conductor.HeatPollerService(conductor_id, ring)
     endpoints = [
         docker_conductor.Handler(),
         k8s_conductor.Handler(),
-        bay_conductor.Handler(),
-        conductor_listener.Handler(),
+        bay_conductor.Handler(heat_poller),
+        conductor_listener.Handler(ring, heat_poller),
     ]
 
     if (not os.path.isfile(cfg.CONF.bay.k8s_atomic_template_path)
@@ -63,4 +71,13 @@ def main():
 
     server = service.Service(cfg.CONF.conductor.topic,
                              conductor_id, endpoints)
+    bay_lock.start_heartbeat(conductor_id)
+    template_definition.TemplateDefinition.fill_token_pools()
+    ring.start()
+    k8s_watcher = None
+    if cfg.CONF.kubernetes.k8s_watch:
+        k8s_watcher = k8s_watch.K8sWatchService(ring)
+    periodic.setup(heat_poller, k8s_watcher)
+    if cfg.CONF.bay_heat.use_notifications:
+        heat_notification.get_notification_listener().start()
     server.serve()
@@ -20,13 +20,15 @@ class RequestContext(context.RequestContext):
                  domain_name=None, user=None, user_id=None, project=None,
                  project_id=None, is_admin=False, is_public_api=False,
                  read_only=False, show_deleted=False, request_id=None,
-                 trust_id=None, auth_token_info=None):
+                 trust_id=None, auth_token_info=None, all_tenants=False):
         """Stores several additional request parameters:
 
         :param domain_id: The ID of the domain.
         :param domain_name: The name of the domain.
         :param is_public_api: Specifies whether the request should be processed
                               without authentication.
+        :param all_tenants: Specifies whether an admin context sees the
+                            resources of all tenants.
 
         """
         self.is_public_api = is_public_api
@@ -38,6 +40,7 @@ class RequestContext(context.RequestContext):
         self.auth_url = auth_url
         self.auth_token_info = auth_token_info
         self.trust_id = trust_id
+        self.all_tenants = all_tenants
 
         super(RequestContext, self).__init__(auth_token=auth_token,
                                              user=user, tenant=project,
@@ -61,7 +64,8 @@ class RequestContext(context.RequestContext):
                 'show_deleted': self.show_deleted,
                 'request_id': self.request_id,
                 'trust_id': self.trust_id,
-                'auth_token_info': self.auth_token_info}
+                'auth_token_info': self.auth_token_info,
+                'all_tenants': self.all_tenants}
 
     @classmethod
     def from_dict(cls, values):
@@ -70,3 +74,16 @@ class RequestContext(context.RequestContext):
 
 def make_context(*args, **kwargs):
     return RequestContext(*args, **kwargs)
+
+
+def make_admin_context(show_deleted=False, all_tenants=False):
+    """Create an administrator context.
+
+    :param show_deleted: if True, will show deleted items when query db
+    :param all_tenants: if True, will see the resources of all tenants
+    """
+    return RequestContext(user_id=None,
+                          project=None,
+                          is_admin=True,
+                          show_deleted=show_deleted,
+                          all_tenants=all_tenants)
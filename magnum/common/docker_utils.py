@@ -23,3 +23,122 @@ def parse_docker_image(image_id):
         image_tag = image_parts[1]
 
     return image_repo, image_tag
+
+
+class StatsAggregator(object):
+    """Rolling counters over the samples of a Docker stats stream.
+
+    Only the counters and the previous sample are kept, so aggregating a
+    window of any length takes constant memory.  The CPU usage is computed
+    between consecutive samples, and the network and block I/O are the
+    bytes transferred between the first and the last sample.
+    """
+
+    def __init__(self):
+        self.samples = 0
+        self._cpu_samples = 0
+        self._cpu_percent_total = 0.0
+        self._cpu_percent_max = 0.0
+        self._previous_cpu = None
+        self._memory_usage = 0
+        self._memory_max_usage = 0
+        self._memory_limit = 0
+        self._first_io = None
+        self._last_io = None
+
+    @staticmethod
+    def _cpu(sample):
+        cpu_stats = sample.get('cpu_stats') or {}
+        cpu_usage = cpu_stats.get('cpu_usage') or {}
+        return (cpu_usage.get('total_usage', 0),
+                cpu_stats.get('system_cpu_usage', 0),
+                len(cpu_usage.get('percpu_usage') or []) or 1)
+
+    @staticmethod
+    def _io(sample):
+        # Docker remote API 1.21 reports the network per interface.
+        networks = sample.get('networks') or {
+            'eth0': sample.get('network') or {}}
+        rx_bytes = sum(network.get('rx_bytes', 0)
+                       for network in networks.values())
+        tx_bytes = sum(network.get('tx_bytes', 0)
+                       for network in networks.values())
+        read_bytes = write_bytes = 0
+        blkio_stats = sample.get('blkio_stats') or {}
+        for io in blkio_stats.get('io_service_bytes_recursive') or []:
+            if io.get('op') == 'Read':
+                read_bytes += io.get('value', 0)
+            elif io.get('op') == 'Write':
+                write_bytes += io.get('value', 0)
+        return rx_bytes, tx_bytes, read_bytes, write_bytes
+
+    def add(self, sample):
+        """Add a decoded sample of the Docker stats stream."""
+        cpu = self._cpu(sample)
+        if self._previous_cpu is not None:
+            cpu_delta = cpu[0] - self._previous_cpu[0]
+            system_delta = cpu[1] - self._previous_cpu[1]
+            if cpu_delta >= 0 and system_delta > 0:
+                cpu_percent = 100.0 * cpu_delta / system_delta * cpu[2]
+                self._cpu_samples += 1
+                self._cpu_percent_total += cpu_percent
+                self._cpu_percent_max = max(self._cpu_percent_max,
+                                            cpu_percent)
+        self._previous_cpu = cpu
+
+        memory_stats = sample.get('memory_stats') or {}
+        self._memory_usage = memory_stats.get('usage', 0)
+        self._memory_max_usage = max(self._memory_max_usage,
+                                     self._memory_usage,
+                                     memory_stats.get('max_usage', 0))
+        self._memory_limit = memory_stats.get('limit', 0)
+
+        self._last_io = self._io(sample)
+        if self._first_io is None:
+            self._first_io = self._last_io
+        self.samples += 1
+
+    def snapshot(self):
+        """Return the statistics aggregated over the samples added."""
+        if self._first_io is None:
+            io = (0, 0, 0, 0)
+        else:
+            io = [last - first
+                  for first, last in zip(self._first_io, self._last_io)]
+        cpu_percent = 0.0
+        if self._cpu_samples:
+            cpu_percent = self._cpu_percent_total / self._cpu_samples
+        return {'samples': self.samples,
+                'cpu_percent': round(cpu_percent, 2),
+                'cpu_percent_max': round(self._cpu_percent_max, 2),
+                'memory_usage': self._memory_usage,
+                'memory_max_usage': self._memory_max_usage,
+                'memory_limit': self._memory_limit,
+                'network_rx_bytes': io[0],
+                'network_tx_bytes': io[1],
+                'blkio_read_bytes': io[2],
+                'blkio_write_bytes': io[3]}
+
+
+def sum_stats(snapshots):
+    """Sum the statistics snapshots of several containers.
+
+    The CPU and memory usage and the bytes transferred are summed, and the
+    peak CPU and memory usage are those of the busiest container.
+    """
+    total = {'cpu_percent': 0.0,
+             'cpu_percent_max': 0.0,
+             'memory_usage': 0,
+             'memory_max_usage': 0,
+             'network_rx_bytes': 0,
+             'network_tx_bytes': 0,
+             'blkio_read_bytes': 0,
+             'blkio_write_bytes': 0}
+    for snapshot in snapshots:
+        for key in total:
+            if key in ('cpu_percent_max', 'memory_max_usage'):
+                total[key] = max(total[key], snapshot[key])
+            else:
+                total[key] += snapshot[key]
+    total['cpu_percent'] = round(total['cpu_percent'], 2)
+    return total
@@ -11,6 +11,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import copy
+import hashlib
 import json
 
 import six
@@ -24,6 +27,15 @@ if hasattr(yaml, 'CSafeDumper'):
 else:
     yaml_dumper = yaml.SafeDumper
 
+if hasattr(yaml, 'CSafeLoader'):
+    yaml_loader = yaml.CSafeLoader
+else:
+    yaml_loader = yaml.SafeLoader
+
+# The number of parsed manifests kept, most recently used last.
+CACHE_SIZE = 64
+_cache = collections.OrderedDict()
+
 
 def _construct_yaml_str(self, node):
     # Override the default string handling function
@@ -31,19 +43,12 @@ def _construct_yaml_str(self, node):
     return self.construct_scalar(node)
 
 
-def parse(manifest_str):
-    '''Takes a string and returns a dict containing the parsed structure.
-    This includes determination of whether the string is using the
-    JSON or YAML format.
-    '''
-    if not manifest_str:
-        msg = _("'manifest' can't be empty")
-        raise ValueError(msg)
-    if manifest_str.startswith('{'):
+def _load(manifest_str):
+    if manifest_str.lstrip().startswith('{'):
         manifest = json.loads(manifest_str)
     else:
         try:
-            manifest = yaml.safe_load(manifest_str)
+            manifest = yaml.load(manifest_str, Loader=yaml_loader)
         except yaml.YAMLError as yea:
             yea = six.text_type(yea)
             msg = _('Error parsing manifest: %s') % yea
@@ -58,3 +63,70 @@ def parse(manifest_str):
                            'or YAML mapping.'))
     # TODO(yuanying): check manifest version
     return manifest
+
+
+def parse(manifest_str):
+    '''Takes a string and returns a dict containing the parsed structure.
+    This includes determination of whether the string is using the
+    JSON or YAML format.
+
+    The parsed manifests are cached by the hash of their content, so a
+    manifest sent again is not parsed again.  Each call returns a copy
+    which the caller is free to change.
+    '''
+    if not manifest_str:
+        msg = _("'manifest' can't be empty")
+        raise ValueError(msg)
+
+    if isinstance(manifest_str, six.text_type):
+        key = hashlib.sha1(manifest_str.encode('utf-8')).hexdigest()
+    else:
+        key = hashlib.sha1(manifest_str).hexdigest()
+    manifest = _cache.pop(key, None)
+    if manifest is None:
+        manifest = _load(manifest_str)
+    _cache[key] = manifest
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return copy.deepcopy(manifest)
+
+
+def parse_all(manifest_str):
+    '''Takes a string and returns the list of the resources it defines.
+
+    The string is either a JSON object, or one or more YAML documents.  A
+    document of kind ``List`` defines the resources of its ``items``.
+    '''
+    if not manifest_str:
+        msg = _("'manifest' can't be empty")
+        raise ValueError(msg)
+    if manifest_str.lstrip().startswith('{'):
+        documents = [json.loads(manifest_str)]
+    else:
+        try:
+            documents = [document for document in
+                         yaml.load_all(manifest_str, Loader=yaml_loader)
+                         if document is not None]
+        except yaml.YAMLError as yea:
+            yea = six.text_type(yea)
+            msg = _('Error parsing manifest: %s') % yea
+            raise ValueError(msg)
+
+    resources = []
+    for document in documents:
+        if isinstance(document, dict) and document.get('kind') == 'List':
+            items = document.get('items')
+            if not isinstance(items, list):
+                raise ValueError(_("Field items of a List must be a list."))
+            resources.extend(items)
+        else:
+            resources.append(document)
+
+    if not resources:
+        msg = _("'manifest' can't be empty")
+        raise ValueError(msg)
+    for resource in resources:
+        if not isinstance(resource, dict):
+            raise ValueError(_('A resource of the manifest is not a JSON '
+                               'object or YAML mapping.'))
+    return resources
@@ -121,6 +121,10 @@ class KeystoneClientV3(object):
         elif self.context.auth_token is not None:
             kwargs['token'] = self.context.auth_token
             kwargs['project_id'] = self.context.project_id
+        elif self.context.is_admin:
+            # An admin context without a token, as used by the conductor
+            # periodic tasks, acts as the magnum service user.
+            kwargs.update(self._service_admin_creds())
         else:
             LOG.error(_LE("Keystone v3 API connection failed, no password "
                           "trust or auth_token!"))
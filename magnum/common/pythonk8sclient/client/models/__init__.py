@@ -1,5 +1,10 @@
 #!/usr/bin/env python
-"""Add all of the modules in the current directory to __all__"""
+"""Lazy registry of the model classes of the Kubernetes API.
+
+Each model class lives in the module of the same name in this package.
+The modules are imported the first time their class is looked up with
+get(), rather than all of them with the package."""
+import importlib
 import os
 
 __all__ = []
@@ -7,3 +12,21 @@ __all__ = []
 for module in os.listdir(os.path.dirname(__file__)):
   if module != '__init__.py' and module[-3:] == '.py':
     __all__.append(module[:-3])
+
+_classes = {}
+
+
+def get(name):
+  """Return the model class called name, importing its module if needed.
+
+  Raises:
+      KeyError -- if there is no model called name
+  """
+  try:
+    return _classes[name]
+  except KeyError:
+    if name not in __all__:
+      raise KeyError(name)
+  module = importlib.import_module('%s.%s' % (__name__, name))
+  _classes[name] = getattr(module, name)
+  return _classes[name]
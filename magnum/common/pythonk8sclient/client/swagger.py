@@ -4,9 +4,9 @@ server communication, and is invariant across implementations. Specifics of
 the methods and models for each application are generated from the Swagger
 templates."""
 
-import ast
 import sys
 import os
+import collections
 import re
 import urllib
 import urllib2
@@ -16,9 +16,192 @@ import datetime
 import mimetypes
 import random
 import string
+import StringIO
+
+import requests
+from requests import adapters
 
 from magnum.common import utils
-from models import *
+from magnum.common.pythonk8sclient.client import models
+
+
+# The native types of the swagger types, by name.
+NATIVE_TYPES = {'int': int, 'long': long, 'float': float, 'dict': dict,
+                'list': list, 'str': str, 'bool': bool, 'datetime': datetime}
+
+# The response modes of ApiClient: responses are deserialized into models,
+# wrapped into lazy views of the models, or returned as decoded JSON.
+MODELS = 'models'
+VIEWS = 'views'
+DICTS = 'dicts'
+
+# The size of the chunks read from the responses decoded while received.
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# The swagger types and attribute map of each model, by model name.
+_modelAttributes = {}
+
+
+def _getModelAttributes(name):
+  """Return the swaggerTypes and attributeMap of the model called name."""
+  try:
+    return _modelAttributes[name]
+  except KeyError:
+    instance = models.get(name)()
+    _modelAttributes[name] = (instance.swaggerTypes, instance.attributeMap)
+    return _modelAttributes[name]
+
+
+class JSONListStream(object):
+  """Decode a JSON list object while it is received
+
+  The elements of the items array are decoded and yielded one at a time
+  when iterating, so only one of them is held in memory at once. The other
+  members of the object, e.g. metadata, are decoded into fields; those
+  sent after the items are only there once the iteration is over.
+
+  Args:
+      chunks -- iterable of the strings making up the JSON text
+      itemsKey -- key of the array to iterate
+  """
+  def __init__(self, chunks, itemsKey='items', onClose=None):
+    self.fields = {}
+    self._chunks = iter(chunks)
+    self._itemsKey = itemsKey
+    self._onClose = onClose
+    self._decoder = json.JSONDecoder()
+    self._buffer = ''
+    self._pos = 0
+    self._eof = False
+
+  def __iter__(self):
+    try:
+      self._expect('{')
+      if self._peek() == '}':
+        self._pos += 1
+        return
+      while True:
+        key = self._value()
+        self._expect(':')
+        if key == self._itemsKey and self._peek() == '[':
+          self._pos += 1
+          if self._peek() == ']':
+            self._pos += 1
+          else:
+            while True:
+              yield self._value()
+              if self._expect(',]') == ']':
+                break
+        else:
+          self.fields[key] = self._value()
+        if self._expect(',}') == '}':
+          return
+    finally:
+      self.close()
+
+  def close(self):
+    if self._onClose is not None:
+      self._onClose()
+      self._onClose = None
+
+  def _read(self):
+    """Append the next chunk to the buffer, return False at the end."""
+    for chunk in self._chunks:
+      if chunk:
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+    self._eof = True
+    return False
+
+  def _peek(self):
+    while True:
+      self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+      if self._pos < len(self._buffer):
+        return self._buffer[self._pos]
+      if not self._read():
+        raise ValueError('Unexpected end of JSON list')
+
+  def _expect(self, chars):
+    char = self._peek()
+    if char not in chars:
+      raise ValueError('Expected %s in JSON list at %r' %
+                       (' or '.join(chars), self._buffer[self._pos:][:20]))
+    self._pos += 1
+    return char
+
+  def _value(self):
+    self._peek()
+    while True:
+      try:
+        value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        # A number ending the buffer may go on in the next chunk.
+        if end < len(self._buffer) or self._eof:
+          self._pos = end
+          return value
+      except ValueError:
+        if self._eof:
+          raise
+      self._read()
+
+
+class ModelView(object):
+  """Read-only view of a model over the decoded JSON of a response
+
+  The attributes are looked up in the JSON object when read, and nested
+  objects are wrapped into views in turn, so reading a few attributes of a
+  large response does not build its whole model. Attributes of native
+  types are returned as decoded, except datetimes.
+
+  Args:
+      apiClient -- ApiClient converting the attributes
+      obj -- decoded JSON object
+      objClass -- name of the model class
+  """
+  __slots__ = ('_apiClient', '_obj', '_objClass')
+
+  def __init__(self, apiClient, obj, objClass):
+    self._apiClient = apiClient
+    self._obj = obj
+    self._objClass = objClass
+
+  def __getattr__(self, attr):
+    swaggerTypes, attributeMap = _getModelAttributes(self._objClass)
+    if attr not in swaggerTypes:
+      raise AttributeError(attr)
+    return self._apiClient.view(self._obj.get(attributeMap[attr]),
+                                swaggerTypes[attr])
+
+  def __repr__(self):
+    return '<%s view %r>' % (self._objClass, self._obj)
+
+  @property
+  def raw(self):
+    """The decoded JSON object of the view."""
+    return self._obj
+
+  def toModel(self):
+    """Deserialize the whole model."""
+    return self._apiClient.deserialize(self._obj, self._objClass)
+
+
+class ListView(collections.Sequence):
+  """Read-only view of a list whose elements are viewed when read."""
+
+  def __init__(self, apiClient, obj, objClass):
+    self._apiClient = apiClient
+    self._obj = obj
+    self._objClass = objClass
+
+  def __len__(self):
+    return len(self._obj)
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return ListView(self._apiClient, self._obj[index], self._objClass)
+    return self._apiClient.view(self._obj[index], self._objClass)
 
 
 class ApiClient(object):
@@ -28,13 +211,26 @@ class ApiClient(object):
     host: The base path for the server to call
     headerName: a header to pass when making calls to the API
     headerValue: a header value to pass when making calls to the API
+    poolSize: the number of keep-alive connections kept open to the host
+    responseMode: how loadResponse returns the responses, one of MODELS,
+      VIEWS and DICTS
   """
-  def __init__(self, host=None, headerName=None, headerValue=None):
+  def __init__(self, host=None, headerName=None, headerValue=None,
+               poolSize=None, responseMode=MODELS):
     self.defaultHeaders = {}
+    self.responseMode = responseMode
     if (headerName is not None):
       self.defaultHeaders[headerName] = headerValue
     self.host = host
     self.cookie = None
+    # Requests are sent over a session so that the connections to the host
+    # are kept alive and reused between calls.
+    self.session = requests.Session()
+    if poolSize is not None:
+      adapter = adapters.HTTPAdapter(pool_connections=1,
+                                     pool_maxsize=poolSize)
+      self.session.mount('http://', adapter)
+      self.session.mount('https://', adapter)
     self.boundary = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(30))
     # Set default User-Agent.
     self.user_agent = 'Python-Swagger'
@@ -50,13 +246,25 @@ class ApiClient(object):
   def setDefaultHeader(self, headerName, headerValue):
     self.defaultHeaders[headerName] = headerValue
 
-  def callAPI(self, resourcePath, method, queryParams, postData,
-              headerParams=None, files=None):
+  def close(self):
+    """Close the connections kept open to the host."""
+    self.session.close()
 
+  def _buildUrl(self, resourcePath, queryParams):
     url = self.host + resourcePath
+    if queryParams:
+      # Need to remove None values, these should not be sent
+      sentQueryParams = {}
+      for param, value in queryParams.items():
+        if value is not None:
+          sentQueryParams[param] = ApiClient.sanitizeForSerialization(value)
+      url = url + '?' + urllib.urlencode(sentQueryParams)
+    return url
 
+  def _buildHeaders(self, headerParams):
     mergedHeaderParams = self.defaultHeaders.copy()
-    mergedHeaderParams.update(headerParams)
+    if headerParams:
+      mergedHeaderParams.update(headerParams)
     headers = {}
     if mergedHeaderParams:
       for param, value in mergedHeaderParams.iteritems():
@@ -64,16 +272,64 @@ class ApiClient(object):
 
     if self.cookie:
       headers['Cookie'] = ApiClient.sanitizeForSerialization(self.cookie)
+    return headers
 
-    data = None
+  def streamAPI(self, resourcePath, queryParams, headerParams=None,
+                timeout=None):
+    """Stream the JSON objects sent one per line by a GET request
 
-    if queryParams:
-      # Need to remove None values, these should not be sent
-      sentQueryParams = {}
-      for param, value in queryParams.items():
-        if value is not None:
-          sentQueryParams[param] = ApiClient.sanitizeForSerialization(value)
-      url = url + '?' + urllib.urlencode(sentQueryParams)
+    The objects are yielded as they are received, e.g. the events of a
+    watch, and the connection is closed with the generator.
+
+    Args:
+        timeout -- seconds to wait for the next object before giving up
+    """
+    url = self._buildUrl(resourcePath, queryParams)
+    headers = self._buildHeaders(headerParams)
+    utils.raise_exception_invalid_scheme(url)
+
+    response = self.session.get(url, headers=headers, stream=True,
+                                timeout=timeout)
+    try:
+      if response.status_code >= 400:
+        raise urllib2.HTTPError(url, response.status_code, response.reason,
+                                response.headers,
+                                StringIO.StringIO(response.content))
+      for line in response.iter_lines():
+        if line:
+          yield json.loads(line)
+    finally:
+      response.close()
+
+  def listAPI(self, resourcePath, queryParams, headerParams=None):
+    """Decode the items of a GET request listing resources as received
+
+    Returns:
+        JSONListStream -- yielding the items as decoded JSON objects,
+            closing the connection at the end of the iteration
+    """
+    url = self._buildUrl(resourcePath, queryParams)
+    headers = self._buildHeaders(headerParams)
+    utils.raise_exception_invalid_scheme(url)
+
+    response = self.session.get(url, headers=headers, stream=True)
+    if response.status_code >= 400:
+      try:
+        raise urllib2.HTTPError(url, response.status_code, response.reason,
+                                response.headers,
+                                StringIO.StringIO(response.content))
+      finally:
+        response.close()
+    return JSONListStream(response.iter_content(CHUNK_SIZE),
+                          onClose=response.close)
+
+  def callAPI(self, resourcePath, method, queryParams, postData,
+              headerParams=None, files=None):
+
+    url = self._buildUrl(resourcePath, queryParams)
+    headers = self._buildHeaders(headerParams)
+
+    data = None
 
     if method in ['GET']:
       #Options to add statements later on and for compatibility
@@ -97,14 +353,15 @@ class ApiClient(object):
 
     utils.raise_exception_invalid_scheme(url)
 
-    request = MethodRequest(method=method, url=url, headers=headers,
-                            data=data)
-
     # Make the request
-    response = urllib2.urlopen(request) #nosec
+    response = self.session.request(method, url, headers=headers, data=data)
+    string = response.content
+    if response.status_code >= 400:
+      # Keep raising urllib2 errors, callers read the body from them.
+      raise urllib2.HTTPError(url, response.status_code, response.reason,
+                              response.headers, StringIO.StringIO(string))
     if 'Set-Cookie' in response.headers:
       self.cookie = response.headers['Set-Cookie']
-    string = response.read()
 
     try:
       data = json.loads(string)
@@ -190,6 +447,32 @@ class ApiClient(object):
     ))
     return '\r\n'.join(lines)
 
+  def loadResponse(self, obj, objClass):
+    """Return the decoded JSON of a response according to responseMode."""
+    if self.responseMode == DICTS:
+      return obj
+    if self.responseMode == VIEWS:
+      return self.view(obj, objClass)
+    return self.deserialize(obj, objClass)
+
+  def view(self, obj, objClass):
+    """Wrap decoded JSON into a lazy view of its swagger type.
+
+    Args:
+        obj -- decoded JSON value
+        objClass -- name of the swagger type of the value
+    Returns:
+        ModelView, ListView, or the value itself for native types"""
+    if obj is None:
+      return None
+    if objClass.startswith('list['):
+      return ListView(self, obj, objClass[len('list['):-1])
+    if objClass == 'datetime':
+      return self.__parse_string_to_datetime(obj)
+    if objClass == 'any' or objClass in NATIVE_TYPES:
+      return obj
+    return ModelView(self, obj, objClass)
+
   def deserialize(self, obj, objClass):
     """Derialize a JSON string into an object.
 
@@ -208,10 +491,12 @@ class ApiClient(object):
         subClass = match.group(1)
         return [self.deserialize(subObj, subClass) for subObj in obj]
 
-      if (objClass in ['int', 'float', 'long', 'dict', 'list', 'str', 'bool', 'datetime']):
-        objClass = ast.literal_eval(objClass)
+      if objClass == 'any':
+        return obj
+      if objClass in NATIVE_TYPES:
+        objClass = NATIVE_TYPES[objClass]
       else:  # not a native type, must be model class
-        objClass = ast.literal_eval(objClass + '.' + objClass)
+        objClass = models.get(objClass)
 
     if objClass in [int, long, float, dict, list, str, bool]:
       return objClass(obj)
@@ -224,7 +509,7 @@ class ApiClient(object):
         if obj is not None and instance.attributeMap[attr] in obj and type(obj) in [list, dict]:
           value = obj[instance.attributeMap[attr]]
           if attrType in ['str', 'int', 'long', 'float', 'bool']:
-            attrType = ast.literal_eval(attrType)
+            attrType = NATIVE_TYPES[attrType]
             try:
               value = attrType(value)
             except UnicodeEncodeError:
@@ -260,17 +545,3 @@ class ApiClient(object):
         return parse(string)
     except ImportError:
         return string
-
-class MethodRequest(urllib2.Request):
-  def __init__(self, *args, **kwargs):
-    """Construct a MethodRequest. Usage is the same as for
-    `urllib2.Request` except it also takes an optional `method`
-    keyword argument. If supplied, `method` will be used instead of
-    the default."""
-
-    if 'method' in kwargs:
-      self.method = kwargs.pop('method')
-    return urllib2.Request.__init__(self, *args, **kwargs)
-
-  def get_method(self):
-    return getattr(self, 'method', urllib2.Request.get_method(self))
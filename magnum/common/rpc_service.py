@@ -81,5 +81,9 @@ class API(object):
     def _cast(self, method, *args, **kwargs):
         self._client.cast(self._context, method, *args, **kwargs)
 
+    def _fanout_cast(self, method, *args, **kwargs):
+        client = self._client.prepare(fanout=True)
+        client.cast(self._context, method, *args, **kwargs)
+
     def echo(self, message):
         self._cast('echo', message=message)
@@ -48,28 +48,32 @@ class API(rpc_service.API):
     # Bay Operations
 
     def bay_create(self, bay, bay_create_timeout):
-        return self._call('bay_create', bay=bay,
-                          bay_create_timeout=bay_create_timeout)
+        self._cast('bay_create', bay=bay,
+                   bay_create_timeout=bay_create_timeout)
+
+    def bay_bulk_create(self, bays, bay_create_timeout):
+        self._cast('bay_bulk_create', bays=bays,
+                   bay_create_timeout=bay_create_timeout)
 
     def bay_list(self, context, limit, marker, sort_key, sort_dir):
         return objects.Bay.list(context, limit, marker, sort_key, sort_dir)
 
     def bay_delete(self, uuid):
-        return self._call('bay_delete', uuid=uuid)
+        self._cast('bay_delete', uuid=uuid)
 
     def bay_show(self, context, uuid):
         return objects.Bay.get_by_uuid(context, uuid)
 
     def bay_update(self, bay):
-        return self._call('bay_update', bay=bay)
+        self._cast('bay_update', bay=bay)
 
     # Service Operations
 
-    def service_create(self, service):
-        return self._call('service_create', service=service)
+    def service_create(self, service, manifest=None):
+        return self._call('service_create', service=service, manifest=manifest)
 
-    def service_update(self, service):
-        return self._call('service_update', service=service)
+    def service_update(self, service, manifest=None):
+        return self._call('service_update', service=service, manifest=manifest)
 
     def service_list(self, context, limit, marker, sort_key, sort_dir):
         return objects.Service.list(context, limit, marker, sort_key, sort_dir)
@@ -82,14 +86,14 @@ class API(rpc_service.API):
 
     # Pod Operations
 
-    def pod_create(self, pod):
-        return self._call('pod_create', pod=pod)
+    def pod_create(self, pod, manifest=None):
+        return self._call('pod_create', pod=pod, manifest=manifest)
 
     def pod_list(self, context, limit, marker, sort_key, sort_dir):
         return objects.Pod.list(context, limit, marker, sort_key, sort_dir)
 
-    def pod_update(self, pod):
-        return self._call('pod_update', pod=pod)
+    def pod_update(self, pod, manifest=None):
+        return self._call('pod_update', pod=pod, manifest=manifest)
 
     def pod_delete(self, uuid):
         return self._call('pod_delete', uuid=uuid)
@@ -99,11 +103,11 @@ class API(rpc_service.API):
 
     # ReplicationController Operations
 
-    def rc_create(self, rc):
-        return self._call('rc_create', rc=rc)
+    def rc_create(self, rc, manifest=None):
+        return self._call('rc_create', rc=rc, manifest=manifest)
 
-    def rc_update(self, rc):
-        return self._call('rc_update', rc=rc)
+    def rc_update(self, rc, manifest=None):
+        return self._call('rc_update', rc=rc, manifest=manifest)
 
     def rc_list(self, context, limit, marker, sort_key, sort_dir):
         return objects.ReplicationController.list(context, limit, marker,
@@ -115,6 +119,10 @@ class API(rpc_service.API):
     def rc_show(self, context, uuid):
         return objects.ReplicationController.get_by_uuid(context, uuid)
 
+    def manifest_apply(self, pods, services, rcs, manifests=None):
+        return self._call('manifest_apply', pods=pods, services=services,
+                          rcs=rcs, manifests=manifests)
+
     # Container operations
 
     def container_create(self, name, container_uuid, container):
@@ -132,6 +140,9 @@ class API(rpc_service.API):
     def container_show(self, container_uuid):
         return self._call('container_show', container_uuid=container_uuid)
 
+    def container_sync_status(self, containers):
+        return self._call('container_sync_status', containers=containers)
+
     def container_reboot(self, container_uuid):
         return self._call('container_reboot', container_uuid=container_uuid)
 
@@ -154,6 +165,21 @@ class API(rpc_service.API):
         return self._call('container_execute', container_uuid=container_uuid,
                           command=command)
 
+    def container_bulk_action(self, container_uuids, action):
+        return self._call('container_bulk_action',
+                          container_uuids=container_uuids, action=action)
+
+    def container_stats(self, container_uuid, window):
+        return self._call('container_stats', container_uuid=container_uuid,
+                          window=window)
+
+    def bay_container_stats(self, bay_uuid, window):
+        return self._call('bay_container_stats', bay_uuid=bay_uuid,
+                          window=window)
+
+    def image_prepull(self, bay_uuid, images):
+        self._cast('image_prepull', bay_uuid=bay_uuid, images=images)
+
 
 class ListenerAPI(rpc_service.API):
     def __init__(self, context=None, topic=None, server=None, timeout=None):
@@ -162,3 +188,9 @@ class ListenerAPI(rpc_service.API):
 
     def ping_conductor(self):
         return self._call('ping_conductor')
+
+    def conductor_heartbeat(self, conductor_id):
+        self._fanout_cast('conductor_heartbeat', conductor_id=conductor_id)
+
+    def poll_bay(self, bay_uuid):
+        self._cast('poll_bay', bay_uuid=bay_uuid)
@@ -15,25 +15,41 @@ import contextlib
 
 from oslo_config import cfg
 from oslo_log import log as logging
-import oslo_messaging as messaging
 from oslo_utils import excutils
 
 from magnum.common import exception
-from magnum.conductor.api import ListenerAPI
+from magnum.i18n import _LE
 from magnum.i18n import _LI
 from magnum.i18n import _LW
 from magnum import objects
+from magnum.openstack.common import loopingcall
 
 
-cfg.CONF.import_opt('topic', 'magnum.conductor.config',
-                    group='conductor')
-cfg.CONF.import_opt('conductor_life_check_timeout', 'magnum.conductor.config',
+cfg.CONF.import_opt('heartbeat_interval', 'magnum.conductor.config',
                     group='conductor')
 
 
 LOG = logging.getLogger(__name__)
 
 
+def start_heartbeat(conductor_id):
+    """Renew the leases on the bay locks of a conductor on a timer.
+
+    The locks of a conductor that stops sending heartbeats expire after
+    ``conductor.lock_lease_timeout`` seconds and can then be stolen.
+    """
+    def heartbeat():
+        try:
+            objects.BayLock.renew(conductor_id)
+        except Exception:
+            LOG.exception(_LE('Unable to renew the bay locks of conductor '
+                              '%s'), conductor_id)
+
+    timer = loopingcall.FixedIntervalLoopingCall(f=heartbeat)
+    timer.start(cfg.CONF.conductor.heartbeat_interval)
+    return timer
+
+
 class BayLock(object):
 
     def __init__(self, context, bay, conductor_id):
@@ -41,20 +57,12 @@ class BayLock(object):
         self.bay = bay
         self.conductor_id = conductor_id
 
-    @staticmethod
-    def conductor_alive(context, conductor_id):
-        topic = cfg.CONF.conductor.topic
-        timeout = cfg.CONF.conductor.conductor_life_check_timeout
-        listener_api = ListenerAPI(context=context, topic=topic,
-                                   server=conductor_id, timeout=timeout)
-        try:
-            return listener_api.ping_conductor()
-        except messaging.MessagingTimeout:
-            return False
-
     def acquire(self, retry=True):
         """Acquire a lock on the bay.
 
+        A lock held by another conductor is stolen only once its lease has
+        expired.
+
         :param retry: When True, retry if lock was released while stealing.
         """
         lock_conductor_id = objects.BayLock.create(self.bay.uuid,
@@ -65,17 +73,12 @@ class BayLock(object):
                                    'bay': self.bay.uuid})
             return
 
-        if (lock_conductor_id == self.conductor_id or
-                self.conductor_alive(self.context, lock_conductor_id)):
+        if lock_conductor_id == self.conductor_id:
             LOG.debug("Lock on bay %(bay)s is owned by conductor "
                       "%(conductor)s" % {'bay': self.bay.uuid,
                                          'conductor': lock_conductor_id})
             raise exception.OperationInProgress(bay_name=self.bay.name)
         else:
-            LOG.info(_LI("Stale lock detected on bay %(bay)s.  Conductor "
-                         "%(conductor)s will attempt to steal the lock"),
-                     {'bay': self.bay.uuid, 'conductor': self.conductor_id})
-
             result = objects.BayLock.steal(self.bay.uuid,
                                            lock_conductor_id,
                                            self.conductor_id)
@@ -94,6 +97,10 @@ class BayLock(object):
                              {'bay': self.bay.uuid,
                               'conductor': self.conductor_id})
                     return self.acquire(retry=False)
+            elif result == lock_conductor_id:
+                LOG.debug("Lock on bay %(bay)s is leased by conductor "
+                          "%(conductor)s" % {'bay': self.bay.uuid,
+                                             'conductor': lock_conductor_id})
             else:
                 new_lock_conductor_id = result
                 LOG.info(_LI("Failed to steal lock on bay %(bay)s. "
@@ -21,10 +21,21 @@ SERVICE_OPTS = [
     cfg.StrOpt('topic',
                default='magnum-conductor',
                help='The queue to add conductor tasks to'),
-    cfg.IntOpt('conductor_life_check_timeout',
-               default=4,
-               help=('RPC timeout for the conductor liveness check that is '
-                     'used for bay locking.')),
+    cfg.IntOpt('lock_lease_timeout',
+               default=30,
+               help=('Seconds a bay lock stays valid unless the conductor '
+                     'holding it renews it. After that the lock can be '
+                     'taken over by another conductor.')),
+    cfg.IntOpt('heartbeat_interval',
+               default=10,
+               help=('Seconds between two heartbeats of a conductor to the '
+                     'other conductors, which also renew the leases on its '
+                     'bay locks.')),
+    cfg.IntOpt('heartbeat_timeout',
+               default=30,
+               help=('Seconds without heartbeat after which a conductor is '
+                     'removed from the hash ring that distributes the bays '
+                     'among the conductors.')),
 ]
 
 opt_group = cfg.OptGroup(
@@ -12,18 +12,29 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import copy
+import os
+import time
+
+from eventlet import greenpool
 from heatclient.common import template_utils
 from heatclient import exc
 from oslo_config import cfg
 from oslo_log import log as logging
+import six
+from six.moves.urllib import parse as urlparse
 
 from magnum.common import clients
 from magnum.common import exception
 from magnum.common import short_id
+from magnum.conductor.api import ListenerAPI
+from magnum.conductor import bay_lock
+from magnum.conductor.handlers import kube
 from magnum.conductor.template_definition import TemplateDefinition as TDef
 from magnum.i18n import _
 from magnum.i18n import _LE
 from magnum.i18n import _LI
+from magnum.i18n import _LW
 from magnum import objects
 from magnum.objects.bay import Status as bay_status
 from magnum.openstack.common import loopingcall
@@ -34,7 +45,10 @@ bay_heat_opts = [
                default=2000,
                help=('Number of attempts to query the Heat stack for '
                      'finding out the status of the created stack and '
-                     'getting template outputs.  This value is ignored '
+                     'getting template outputs.  As the interval between '
+                     'two attempts backs off up to max_wait_interval, the '
+                     'polling of a stack lasts up to about max_attempts * '
+                     'max_wait_interval seconds.  This value is ignored '
                      'during bay creation if timeout is set as the poll '
                      'will continue until bay creation either ends '
                      'or times out.')),
@@ -42,13 +56,43 @@ bay_heat_opts = [
                default=1,
                help=('Sleep time interval between two attempts of querying '
                      'the Heat stack.  This interval is in seconds.')),
+    cfg.IntOpt('max_wait_interval',
+               default=60,
+               help=('Maximum sleep time interval between two attempts of '
+                     'querying a Heat stack.  While the stack status does '
+                     'not change, the interval doubles from wait_interval '
+                     'up to this value.  This interval is in seconds.')),
+    cfg.IntOpt('max_stacks_per_poll',
+               default=50,
+               help=('Maximum number of Heat stacks to query with a single '
+                     'stack list request when polling the status of '
+                     'in-progress bays.')),
+    cfg.IntOpt('max_concurrent_stacks',
+               default=10,
+               help=('Maximum number of Heat stacks created at the same time '
+                     'by a bulk bay creation.')),
     cfg.IntOpt('bay_create_timeout',
                default=None,
                help=('The length of time to let bay creation continue.  This '
-                     'interval is in minutes.  The default is no timeout.'))
+                     'interval is in minutes.  The default is no timeout.')),
+    cfg.BoolOpt('use_notifications',
+                default=False,
+                help=('Update the status of bays when Heat notifies that '
+                      'their stack changed.  Heat stacks are then only '
+                      'polled every max_wait_interval seconds, as a '
+                      'fallback for lost notifications.')),
+    cfg.StrOpt('notification_topic',
+               default='notifications',
+               help='The topic Heat sends notifications to.'),
+    cfg.StrOpt('notification_pool',
+               default='magnum-conductor',
+               help=('The listener pool of the conductors, so that Heat '
+                     'notifications are not taken from other consumers '
+                     'of the notification topic.')),
 ]
 
 cfg.CONF.register_opts(bay_heat_opts, group='bay_heat')
+cfg.CONF.import_opt('topic', 'magnum.conductor.config', group='conductor')
 
 
 LOG = logging.getLogger(__name__)
@@ -59,19 +103,73 @@ def _get_baymodel(context, bay):
     return baymodel
 
 
-def _extract_template_definition(context, bay):
-    baymodel = _get_baymodel(context, bay)
-    cluster_distro = baymodel.cluster_distro
-    cluster_coe = baymodel.coe
-    definition = TDef.get_template_definition('vm', cluster_distro,
-                                              cluster_coe)
+def _get_template_definition(baymodel):
+    return TDef.get_template_definition('vm', baymodel.cluster_distro,
+                                        baymodel.coe)
+
+
+def _extract_template_definition(context, bay, baymodel=None,
+                                 definition=None):
+    if baymodel is None:
+        baymodel = _get_baymodel(context, bay)
+    if definition is None:
+        definition = _get_template_definition(baymodel)
     return definition.extract_definition(baymodel, bay)
 
 
-def _create_stack(context, osc, bay, bay_create_timeout):
-    template_path, heat_params = _extract_template_definition(context, bay)
+class TemplateCache(object):
+    """Cache the Heat templates of the bays with the files they reference.
 
-    tpl_files, template = template_utils.get_template_contents(template_path)
+    Reading a template parses it and every file it references, so the
+    result is kept as long as none of these files is modified.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def get_template_contents(self, template_path):
+        """Return the files and the template, as copies of the cached ones."""
+        entry = self._entries.get(template_path)
+        if entry is None or entry[0] != self._mtimes(entry[0]):
+            tpl_files, template = template_utils.get_template_contents(
+                template_path)
+            paths = [template_path] + [self._path(url) for url in tpl_files]
+            mtimes = self._mtimes(paths)
+            if None in mtimes.values():
+                # Files that are not local can not be checked for changes.
+                self._entries.pop(template_path, None)
+                return tpl_files, template
+            entry = (mtimes, tpl_files, template)
+            self._entries[template_path] = entry
+
+        mtimes, tpl_files, template = entry
+        return dict(tpl_files), copy.deepcopy(template)
+
+    @staticmethod
+    def _path(url):
+        url = urlparse.urlparse(url)
+        return url.path if url.scheme == 'file' else None
+
+    @staticmethod
+    def _mtimes(paths):
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except (OSError, TypeError):
+                mtimes[path] = None
+        return mtimes
+
+
+_template_cache = TemplateCache()
+
+
+def _create_stack(context, osc, bay, bay_create_timeout, baymodel=None,
+                  definition=None):
+    template_path, heat_params = _extract_template_definition(
+        context, bay, baymodel=baymodel, definition=definition)
+
+    tpl_files, template = _template_cache.get_template_contents(template_path)
     # Make sure no duplicate stack name
     stack_name = '%s-%s' % (bay.name, short_id.generate_id())
     if bay_create_timeout:
@@ -86,7 +184,7 @@ def _create_stack(context, osc, bay, bay_create_timeout):
         'stack_name': stack_name,
         'parameters': heat_params,
         'template': template,
-        'files': dict(list(tpl_files.items())),
+        'files': tpl_files,
         'timeout_mins': heat_timeout
     }
     created_stack = osc.heat().stacks.create(**fields)
@@ -97,16 +195,30 @@ def _create_stack(context, osc, bay, bay_create_timeout):
 def _update_stack(context, osc, bay):
     template_path, heat_params = _extract_template_definition(context, bay)
 
-    tpl_files, template = template_utils.get_template_contents(template_path)
+    tpl_files, template = _template_cache.get_template_contents(template_path)
     fields = {
         'parameters': heat_params,
         'template': template,
-        'files': dict(list(tpl_files.items()))
+        'files': tpl_files
     }
 
     return osc.heat().stacks.update(bay.stack_id, **fields)
 
 
+def _record_failure(context, bay_uuid, error, status=None):
+    # Bay operations are cast by the API, so their errors are reported on
+    # the bay.  The bay is reloaded to drop the changes that failed.
+    try:
+        bay = objects.Bay.get_by_uuid(context, bay_uuid)
+        if status is not None:
+            bay.status = status
+        bay.status_reason = six.text_type(error)
+        bay.save()
+    except Exception:
+        LOG.exception(_LE('Unable to record the failure of bay %s'),
+                      bay_uuid)
+
+
 def _update_stack_outputs(context, stack, bay):
     baymodel = _get_baymodel(context, bay)
     cluster_distro = baymodel.cluster_distro
@@ -117,53 +229,105 @@ def _update_stack_outputs(context, stack, bay):
 
 
 class Handler(object):
-    def __init__(self):
+    def __init__(self, heat_poller=None):
         super(Handler, self).__init__()
+        self._heat_poller = heat_poller or HeatPollerService()
 
     # Bay Operations
 
     def bay_create(self, context, bay, bay_create_timeout):
+        """Create the stack of a bay the API created in the database."""
         LOG.debug('bay_heat bay_create')
 
         osc = clients.OpenStackClients(context)
+        self._create_bay_stack(context, osc, bay, bay_create_timeout)
+
+        return bay
+
+    def bay_bulk_create(self, context, bays, bay_create_timeout):
+        """Create the stacks of bays sharing the same baymodel.
 
+        The baymodel and its template definition are only loaded once, and
+        up to ``bay_heat.max_concurrent_stacks`` stacks are created at the
+        same time.
+        """
+        LOG.debug('bay_heat bay_bulk_create')
+        if not bays:
+            return
+
+        osc = clients.OpenStackClients(context)
+        try:
+            baymodel = _get_baymodel(context, bays[0])
+            definition = _get_template_definition(baymodel)
+        except Exception as e:
+            for bay in bays:
+                _record_failure(context, bay.uuid, e,
+                                bay_status.CREATE_FAILED)
+            raise
+
+        def create(bay):
+            try:
+                self._create_bay_stack(context, osc, bay, bay_create_timeout,
+                                       baymodel=baymodel,
+                                       definition=definition)
+            except Exception:
+                LOG.exception(_LE('Unable to create the stack of bay %s'),
+                              bay.uuid)
+
+        pool = greenpool.GreenPool(cfg.CONF.bay_heat.max_concurrent_stacks)
+        for bay in bays:
+            pool.spawn_n(create, bay)
+        pool.waitall()
+
+    def _create_bay_stack(self, context, osc, bay, bay_create_timeout,
+                          **kwargs):
         try:
             created_stack = _create_stack(context, osc, bay,
-                                          bay_create_timeout)
+                                          bay_create_timeout, **kwargs)
         except Exception as e:
+            _record_failure(context, bay.uuid, e, bay_status.CREATE_FAILED)
             if isinstance(e, exc.HTTPBadRequest):
                 raise exception.InvalidParameterValue(message=str(e))
             else:
                 raise
         bay.stack_id = created_stack['stack']['id']
-        bay.create()
+        bay.save()
 
         self._poll_and_check(osc, bay)
 
-        return bay
-
     def bay_update(self, context, bay):
         LOG.debug('bay_heat bay_update')
 
         osc = clients.OpenStackClients(context)
-        stack = osc.heat().stacks.get(bay.stack_id)
-        if (stack.stack_status != bay_status.CREATE_COMPLETE and
-                stack.stack_status != bay_status.UPDATE_COMPLETE):
-            operation = _('Updating a bay when stack status is '
-                          '"%s"') % stack.stack_status
-            raise exception.NotSupported(operation=operation)
-
-        delta = set(bay.obj_what_changed())
-        if 'node_count' in delta:
-            delta.remove('node_count')
-
-            _update_stack(context, osc, bay)
+        try:
+            stack = osc.heat().stacks.get(bay.stack_id)
+            if (stack.stack_status != bay_status.CREATE_COMPLETE and
+                    stack.stack_status != bay_status.UPDATE_COMPLETE):
+                operation = _('Updating a bay when stack status is '
+                              '"%s"') % stack.stack_status
+                raise exception.NotSupported(operation=operation)
+
+            delta = set(bay.obj_what_changed()) - set(['status', 'name'])
+            if 'node_count' in delta:
+                delta.remove('node_count')
+            if delta:
+                raise exception.InvalidParameterValue(err=(
+                    "cannot change bay property(ies) %s." %
+                    ", ".join(delta)))
+        except Exception as e:
+            # The bay is left as it is, only the reason is recorded.
+            _record_failure(context, bay.uuid, e)
+            raise
+
+        if 'node_count' in bay.obj_what_changed():
+            try:
+                _update_stack(context, osc, bay)
+            except Exception as e:
+                _record_failure(context, bay.uuid, e,
+                                bay_status.UPDATE_FAILED)
+                raise
             self._poll_and_check(osc, bay)
 
-        if delta:
-            raise exception.InvalidParameterValue(err=(
-                "cannot change bay property(ies) %s." % ", ".join(delta)))
-
         bay.save()
         return bay
 
@@ -172,6 +336,10 @@ class Handler(object):
         osc = clients.OpenStackClients(context)
         bay = objects.Bay.get_by_uuid(context, uuid)
         stack_id = bay.stack_id
+        if stack_id is None:
+            # The creation of the bay failed before its stack was created.
+            bay.destroy()
+            return None
         # NOTE(sdake): This will execute a stack_delete operation.  This will
         # Ignore HTTPNotFound exceptions (stack wasn't present).  In the case
         # that Heat couldn't find the stack representing the bay, likely a user
@@ -181,6 +349,7 @@ class Handler(object):
         # If the exception is unhandled, the original exception will be raised.
         try:
             osc.heat().stacks.delete(stack_id)
+            kube.bay_endpoints.invalidate(uuid)
         except Exception as e:
             if isinstance(e, exc.HTTPNotFound):
                 LOG.info(_LI('The stack %s was not be found during bay'
@@ -188,6 +357,7 @@ class Handler(object):
                 bay.destroy()
                 return None
             else:
+                _record_failure(context, uuid, e, bay_status.DELETE_FAILED)
                 raise
 
         self._poll_and_check(osc, bay)
@@ -195,43 +365,87 @@ class Handler(object):
         return None
 
     def _poll_and_check(self, osc, bay):
-        poller = HeatPoller(osc, bay)
-        lc = loopingcall.FixedIntervalLoopingCall(f=poller.poll_and_check)
-        lc.start(cfg.CONF.bay_heat.wait_interval, True)
+        self._heat_poller.add(osc, bay)
 
 
 class HeatPoller(object):
 
-    def __init__(self, openstack_client, bay):
+    def __init__(self, openstack_client, bay, estimator=None, lock=None):
         self.openstack_client = openstack_client
         self.context = self.openstack_client.context
         self.bay = bay
         self.attempts = 0
+        self.estimator = estimator
+        self.lock = lock
+        self.started_at = time.time()
+        self.interval = cfg.CONF.bay_heat.wait_interval
+        self.next_poll = self.started_at
+        self._last_status = None
 
     def poll_and_check(self):
         # TODO(yuanying): temporary implementation to update api_address,
         # node_addresses and bay status
-        stack = self.openstack_client.heat().stacks.get(self.bay.stack_id)
+        heat = self.openstack_client.heat()
+        try:
+            stack = heat.stacks.get(self.bay.stack_id)
+        except exc.HTTPNotFound:
+            if (not self.context.all_tenants or
+                    self.context.project_id == self.bay.project_id):
+                raise
+            # The bay was resumed or handed over to an all_tenants context,
+            # and Heat only looks up the stacks of other projects for some
+            # admin tokens.  The stack is still in the list of the stacks
+            # of all the tenants.
+            stacks = heat.stacks.list(filters={'id': self.bay.stack_id},
+                                      show_deleted=True, global_tenant=True)
+            stack = next(iter(stacks), None)
+            if stack is None:
+                raise
+            self.check(stack, details=False)
+        else:
+            self.check(stack)
+
+    def check(self, stack, details=True):
+        """Update the bay from its stack.
+
+        :param details: False when the stack comes from a stack list, which
+                        has neither the outputs nor the timeout of the stack.
+        """
         self.attempts += 1
         # poll_and_check is detached and polling long time to check status,
         # so another user/client can call delete bay/stack.
         if stack.stack_status == bay_status.DELETE_COMPLETE:
             LOG.info(_LI('Bay has been deleted, stack_id: %s')
                      % self.bay.stack_id)
-            self.bay.destroy()
+            self._record_duration(stack.stack_status)
+            kube.bay_endpoints.invalidate(self.bay.uuid)
+            try:
+                self.bay.destroy()
+            except exception.BayNotFound:
+                # The bay was already destroyed on a Heat notification.
+                pass
             raise loopingcall.LoopingCallDone()
         if (stack.stack_status in [bay_status.CREATE_COMPLETE,
                                    bay_status.UPDATE_COMPLETE]):
-            _update_stack_outputs(self.context, stack, self.bay)
+            if details:
+                _update_stack_outputs(self.context, stack, self.bay)
+            else:
+                LOG.warning(_LW('Unable to read the outputs of the stack of '
+                                'another project, stack_id: %s')
+                            % self.bay.stack_id)
+            self._record_duration(stack.stack_status)
 
             self.bay.status = stack.stack_status
             self.bay.status_reason = stack.stack_status_reason
             self.bay.save()
+            # The outputs may have changed the api_address of the bay.
+            kube.bay_endpoints.invalidate(self.bay.uuid)
             raise loopingcall.LoopingCallDone()
         elif stack.stack_status != self.bay.status:
             self.bay.status = stack.stack_status
             self.bay.status_reason = stack.stack_status_reason
             self.bay.save()
+            kube.bay_endpoints.invalidate(self.bay.uuid)
         if stack.stack_status == bay_status.CREATE_FAILED:
             LOG.error(_LE('Unable to create bay, stack_id: %(stack_id)s, '
                           'reason: %(reason)s') %
@@ -254,8 +468,9 @@ class HeatPoller(object):
         # the timeout hasn't been set. If the timeout has been set then
         # the loop will end when the stack completes or the timeout occurs
         if stack.stack_status == bay_status.CREATE_IN_PROGRESS:
-            if (stack.timeout_mins is None and
-               self.attempts > cfg.CONF.bay_heat.max_attempts):
+            # Without the timeout of the stack, Heat is left to end it.
+            if (self.attempts > cfg.CONF.bay_heat.max_attempts and
+                    details and stack.timeout_mins is None):
                 LOG.error(_LE('Bay check exit after %(attempts)s attempts,'
                               'stack_id: %(id)s, stack_status: %(status)s') %
                           {'attempts': cfg.CONF.bay_heat.max_attempts,
@@ -270,3 +485,236 @@ class HeatPoller(object):
                            'id': self.bay.stack_id,
                            'status': stack.stack_status})
                 raise loopingcall.LoopingCallDone()
+
+        self._schedule_next_poll(stack.stack_status)
+
+    def _schedule_next_poll(self, status):
+        now = time.time()
+        if cfg.CONF.bay_heat.use_notifications:
+            # Status changes are pushed by Heat, polling is a fallback.
+            self.interval = cfg.CONF.bay_heat.max_wait_interval
+            self.next_poll = now + self.interval
+            return
+
+        if status == self._last_status:
+            self.interval = min(self.interval * 2,
+                                cfg.CONF.bay_heat.max_wait_interval)
+        else:
+            self._last_status = status
+            self.interval = cfg.CONF.bay_heat.wait_interval
+        delay = self.interval
+
+        expected = self._expected_duration(status)
+        if expected is not None:
+            remaining = self.started_at + expected - now
+            if 0 < remaining < delay:
+                # Poll when the stack is expected to finish, and poll
+                # quickly again from there on.
+                delay = remaining
+                self.interval = cfg.CONF.bay_heat.wait_interval
+
+        self.next_poll = now + delay
+
+    def _estimator_key(self, status):
+        # e.g. ('<baymodel uuid>', 'CREATE') for CREATE_IN_PROGRESS
+        return (self.bay.baymodel_id, status.split('_', 1)[0])
+
+    def _expected_duration(self, status):
+        if self.estimator is None or not status.endswith('_IN_PROGRESS'):
+            return None
+        return self.estimator.estimate(self._estimator_key(status))
+
+    def _record_duration(self, status):
+        # Only learn from operations that were seen in progress.
+        key = self._estimator_key(status)
+        if (self.estimator is not None and
+                self._last_status == '%s_IN_PROGRESS' % key[1]):
+            self.estimator.record(key, time.time() - self.started_at)
+
+
+class StackDurationEstimator(object):
+    """Learn how long Heat stack operations typically take.
+
+    Durations are kept per bay model and stack action as an exponential
+    moving average, so that :class:`HeatPoller` can poll a stack around
+    the time it is expected to finish.
+    """
+
+    def __init__(self, weight=0.3):
+        self.weight = weight
+        self._durations = {}
+
+    def record(self, key, duration):
+        current = self._durations.get(key)
+        if current is None:
+            self._durations[key] = duration
+        else:
+            self._durations[key] = current + self.weight * (duration -
+                                                            current)
+
+    def estimate(self, key):
+        return self._durations.get(key)
+
+
+class HeatPollerService(object):
+    """Poll the Heat stacks of all in-flight bays of this conductor.
+
+    A single looping call refreshes every tracked stack each
+    ``bay_heat.wait_interval`` seconds with one stack list request per
+    project and batch of ``bay_heat.max_stacks_per_poll`` stacks, so the
+    number of Heat requests does not grow with the number of bays.  The
+    listed stacks are handed to the :class:`HeatPoller` of each bay.
+    Only the stacks whose poller is due are listed, so each bay backs off
+    on its own while its stack status does not change.
+
+    When created with a conductor id, the service holds the lock of each
+    bay it polls, so that a bay is only polled by one conductor.  When
+    created with a ConductorRing, the bays owned by another conductor are
+    handed over to it, also when the ring is rebalanced.
+    """
+
+    def __init__(self, conductor_id=None, ring=None):
+        self.conductor_id = conductor_id
+        self._ring = ring
+        self._ring_version = ring.version if ring is not None else None
+        self._pollers = {}
+        self._timer = None
+        self._estimator = StackDurationEstimator()
+
+    def is_polling(self, bay):
+        return bay.stack_id in self._pollers
+
+    def owns(self, bay):
+        return self._ring is None or self._ring.is_owner(bay.uuid)
+
+    def add(self, osc, bay, hand_over=True):
+        """Start polling the stack of a bay.
+
+        :param hand_over: whether to hand the bay over to the conductor
+                          owning it on the hash ring.
+        :returns: False if the bay is polled by another conductor.
+        """
+        poller = self._pollers.get(bay.stack_id)
+        if poller is not None:
+            lock = poller.lock
+        elif hand_over and not self.owns(bay):
+            return self._hand_over(osc.context, bay)
+        else:
+            try:
+                lock = self._lock(osc.context, bay)
+            except exception.OperationInProgress:
+                LOG.debug("Bay %s is polled by another conductor" % bay.uuid)
+                return False
+
+        self._pollers[bay.stack_id] = HeatPoller(osc, bay, self._estimator,
+                                                 lock)
+        if self._timer is None:
+            self._timer = loopingcall.FixedIntervalLoopingCall(f=self.poll)
+            self._timer.start(cfg.CONF.bay_heat.wait_interval, True)
+        return True
+
+    def _lock(self, context, bay):
+        if self.conductor_id is None:
+            return None
+        lock = bay_lock.BayLock(context, bay, self.conductor_id)
+        lock.acquire()
+        return lock
+
+    def _hand_over(self, context, bay):
+        owner = self._ring.get_owner(bay.uuid)
+        try:
+            listener_api = ListenerAPI(context=context,
+                                       topic=cfg.CONF.conductor.topic,
+                                       server=owner)
+            listener_api.poll_bay(bay.uuid)
+        except Exception:
+            LOG.exception(_LE('Unable to hand bay %(bay)s over to conductor '
+                              '%(conductor)s'),
+                          {'bay': bay.uuid, 'conductor': owner})
+            return False
+        LOG.debug("Handed bay %(bay)s over to conductor %(conductor)s" %
+                  {'bay': bay.uuid, 'conductor': owner})
+        return True
+
+    def poll(self):
+        if self._ring is not None and self._ring.version != self._ring_version:
+            self._ring_version = self._ring.version
+            self._rebalance()
+
+        if not self._pollers:
+            self._timer = None
+            raise loopingcall.LoopingCallDone()
+
+        for pollers in self._batches():
+            self._poll_batch(pollers)
+
+    def _rebalance(self):
+        # The lock is released before the bay is handed over, so that the
+        # new owner can take it right away.
+        for poller in list(self._pollers.values()):
+            if not self.owns(poller.bay):
+                self._remove(poller)
+                self._hand_over(poller.context, poller.bay)
+
+    def _batches(self):
+        # Stack list only returns the stacks of the requesting project.
+        now = time.time()
+        projects = {}
+        for poller in list(self._pollers.values()):
+            if poller.next_poll > now:
+                continue
+            projects.setdefault(poller.context.project_id, []).append(poller)
+
+        size = cfg.CONF.bay_heat.max_stacks_per_poll
+        batches = []
+        for pollers in projects.values():
+            for i in range(0, len(pollers), size):
+                batches.append(pollers[i:i + size])
+        return batches
+
+    def _poll_batch(self, pollers):
+        osc = pollers[-1].openstack_client
+        stack_ids = [poller.bay.stack_id for poller in pollers]
+        try:
+            stacks = osc.heat().stacks.list(
+                filters={'id': stack_ids}, show_deleted=True,
+                global_tenant=osc.context.all_tenants)
+            stacks = dict((stack.id, stack) for stack in stacks)
+        except Exception:
+            LOG.exception(_LE('Unable to list Heat stacks %s'),
+                          ', '.join(stack_ids))
+            return
+
+        for poller in pollers:
+            self._check(poller, stacks.get(poller.bay.stack_id))
+
+    def _check(self, poller, stack):
+        try:
+            if stack is None or self._needs_stack_details(poller, stack):
+                poller.poll_and_check()
+            else:
+                poller.check(stack)
+        except loopingcall.LoopingCallDone:
+            self._remove(poller)
+        except Exception:
+            LOG.exception(_LE('Unable to check bay status, stack_id: %s'),
+                          poller.bay.stack_id)
+            self._remove(poller)
+
+    @staticmethod
+    def _needs_stack_details(poller, stack):
+        # Stack list entries carry neither the outputs nor the timeout of
+        # the stack, so they are fetched individually when needed.
+        return (stack.stack_status in [bay_status.CREATE_COMPLETE,
+                                       bay_status.UPDATE_COMPLETE] or
+                poller.attempts >= cfg.CONF.bay_heat.max_attempts)
+
+    def _remove(self, poller):
+        if self._pollers.get(poller.bay.stack_id) is poller:
+            del self._pollers[poller.bay.stack_id]
+            if poller.lock is not None:
+                try:
+                    poller.lock.release(poller.bay.uuid)
+                except Exception:
+                    LOG.exception(_LE('Unable to release the lock on bay '
+                                      '%s'), poller.bay.uuid)
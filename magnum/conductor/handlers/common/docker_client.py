@@ -12,8 +12,12 @@
 
 """Magnum Docker Client."""
 
+import collections
+import time
+
 from docker import client
 from docker import tls
+import eventlet
 from oslo_config import cfg
 from oslo_log import log as logging
 
@@ -25,6 +29,81 @@ LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
 
+class LogStream(object):
+    """Iterable over the chunks of a streamed Docker logs response.
+
+    Chunks are read from the response as they are iterated.  The connection
+    of the response is released once the stream is read or closed.
+    """
+
+    def __init__(self, docker, response):
+        self._docker = docker
+        self._response = response
+
+    def __iter__(self):
+        try:
+            for chunk in self._chunks():
+                yield chunk
+        finally:
+            self.close()
+
+    def _chunks(self):
+        return self._docker._multiplexed_response_stream_helper(
+            self._response)
+
+    def close(self):
+        self._response.close()
+
+
+class StatsStream(LogStream):
+    """Iterable over the samples of a streamed Docker stats response.
+
+    Docker sends a sample about every second, decoded from JSON as they are
+    iterated.
+    """
+
+    def _chunks(self):
+        return self._docker._stream_helper(self._response, decode=True)
+
+
+class ExecStream(LogStream):
+    """Iterable over the output chunks of a streamed Docker exec.
+
+    The stream ends once the command has run for ``timeout`` seconds or
+    ``max_bytes`` of output were read, whichever comes first.  Docker-py
+    reads the stream without a socket timeout, so each read is interrupted
+    when the time left runs out, even if no chunk arrives.
+    """
+
+    def __init__(self, docker, response, timeout=None, max_bytes=None):
+        super(ExecStream, self).__init__(docker, response)
+        self._timeout = timeout
+        self._max_bytes = max_bytes
+
+    def _chunks(self):
+        deadline = None
+        if self._timeout:
+            deadline = time.time() + self._timeout
+        remaining = self._max_bytes or None
+        chunks = super(ExecStream, self)._chunks()
+        while remaining != 0:
+            chunk = None
+            if deadline is None:
+                chunk = next(chunks, None)
+            else:
+                time_left = deadline - time.time()
+                if time_left <= 0:
+                    break
+                with eventlet.Timeout(time_left, False):
+                    chunk = next(chunks, None)
+            if chunk is None:
+                break
+            if remaining is not None:
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+            yield chunk
+
+
 class DockerHTTPClient(client.Client):
     def __init__(self, url='unix://var/run/docker.sock',
                  ver=DEFAULT_DOCKER_REMOTE_API_VERSION,
@@ -78,3 +157,127 @@ class DockerHTTPClient(client.Client):
 
     def get_container_logs(self, docker_id):
         return self.attach(docker_id, 1, 1, 0, 1)
+
+    def logs_stream(self, docker_id, tail='all', since=None,
+                    timestamps=False, follow=False):
+        """Stream the logs of a container.
+
+        :param docker_id: the Docker id of the container.
+        :param tail: the number of lines to return from the end of the logs,
+                     or 'all'.
+        :param since: a UNIX timestamp to return only the later logs.
+        :param timestamps: whether to prefix the lines with their timestamp.
+        :param follow: whether to keep streaming the new logs.
+        :returns: a :class:`LogStream` of the logs.
+        """
+        params = {'stdout': 1,
+                  'stderr': 1,
+                  'timestamps': timestamps and 1 or 0,
+                  'follow': follow and 1 or 0,
+                  'tail': tail}
+        if since is not None:
+            params['since'] = since
+        url = self._url('/containers/{0}/logs'.format(docker_id))
+        res = self._get(url, params=params, stream=True)
+        self._raise_for_status(res)
+        return LogStream(self, res)
+
+    def stats_stream(self, docker_id):
+        """Stream the resource usage statistics of a container.
+
+        :param docker_id: the Docker id of the container.
+        :returns: a :class:`StatsStream` of the statistics.
+        """
+        url = self._url('/containers/{0}/stats'.format(docker_id))
+        res = self._get(url, stream=True)
+        self._raise_for_status(res)
+        return StatsStream(self, res)
+
+    def exec_stream(self, docker_id, command, timeout=None, max_bytes=None):
+        """Run a command in a container and stream its output.
+
+        :param docker_id: the Docker id of the container.
+        :param command: the command to run.
+        :param timeout: the number of seconds to stream the output for.
+        :param max_bytes: the maximum number of bytes of output to stream.
+        :returns: an :class:`ExecStream` of the stdout and stderr of the
+                  command.
+        """
+        exec_id = self.exec_create(docker_id, command, True, True, False)
+        url = self._url('/exec/{0}/start'.format(exec_id['Id']))
+        res = self._post_json(url, data={'Tty': False, 'Detach': False},
+                              stream=True)
+        self._raise_for_status(res)
+        return ExecStream(self, res, timeout, max_bytes)
+
+
+class DockerClientCache(object):
+    """LRU cache of docker clients keyed by bay endpoint.
+
+    A docker client keeps its connections to the bay alive, so reusing it
+    saves the TCP and TLS handshakes of every call.  Clients are keyed by
+    the endpoint of the bay and the TLS settings, and the client of a bay is
+    closed when its endpoint changes.  Clients which are least recently
+    used or idle for more than ``docker.client_idle_timeout`` seconds are
+    closed too.
+    """
+
+    def __init__(self):
+        # Ordered from the least to the most recently used client.
+        self._clients = collections.OrderedDict()
+        self._bay_keys = {}
+
+    def __len__(self):
+        return len(self._clients)
+
+    @staticmethod
+    def _key(bay):
+        return ('tcp://%s:2376' % bay.api_address,
+                CONF.docker.docker_remote_api_version,
+                CONF.docker.default_timeout,
+                CONF.docker.api_insecure,
+                CONF.docker.ca_file,
+                CONF.docker.cert_file,
+                CONF.docker.key_file)
+
+    def get(self, bay):
+        """Return the docker client of a bay."""
+        now = time.time()
+        self._expire(now)
+
+        key = self._key(bay)
+        old_key = self._bay_keys.get(bay.uuid)
+        if old_key is not None and old_key != key:
+            self._close(old_key)
+        self._bay_keys[bay.uuid] = key
+
+        entry = self._clients.pop(key, None)
+        if entry is None:
+            docker = DockerHTTPClient(*key[:3])
+        else:
+            docker = entry[0]
+        self._clients[key] = (docker, now)
+
+        while len(self._clients) > CONF.docker.client_cache_size:
+            self._close(next(iter(self._clients)))
+        return docker
+
+    def clear(self):
+        for key in list(self._clients):
+            self._close(key)
+
+    def _close(self, key):
+        entry = self._clients.pop(key, None)
+        if entry is not None:
+            entry[0].close()
+        for bay_uuid, bay_key in list(self._bay_keys.items()):
+            if bay_key == key:
+                del self._bay_keys[bay_uuid]
+
+    def _expire(self, now):
+        deadline = now - CONF.docker.client_idle_timeout
+        for key, (docker, last_used) in list(self._clients.items()):
+            if last_used > deadline:
+                break
+            LOG.debug('Closing idle docker client of %s', key[0])
+            self._close(key)
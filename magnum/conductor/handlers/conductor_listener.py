@@ -10,13 +10,51 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from oslo_log import log as logging
+
+from magnum.common import clients
+from magnum.common import context as magnum_context
+from magnum.common import exception
+from magnum import objects
+
+LOG = logging.getLogger(__name__)
+
 
 class Handler(object):
     '''Listen on an AMQP queue named for the conductor.  Allows individual
     conductors to communicate with each other for multi-conductor support.
+
+    :param ring: the ConductorRing the heartbeats of the conductors are
+                 recorded in.
+    :param heat_poller: the HeatPollerService polling the bays handed over
+                        by the other conductors.
     '''
+    def __init__(self, ring=None, heat_poller=None):
+        self._ring = ring
+        self._heat_poller = heat_poller
+
     def ping_conductor(self, context):
         '''Respond affirmatively to confirm that the conductor performing the
         action is still alive.
         '''
         return True
+
+    def conductor_heartbeat(self, context, conductor_id):
+        '''Record that a conductor is alive.'''
+        if self._ring is not None:
+            self._ring.heartbeat(conductor_id)
+
+    def poll_bay(self, context, bay_uuid):
+        '''Start polling a bay this conductor owns on the hash ring.'''
+        if self._heat_poller is None:
+            return
+        # The bay may belong to any project and outlive the user token.
+        ctx = magnum_context.make_admin_context(all_tenants=True)
+        try:
+            bay = objects.Bay.get_by_uuid(ctx, bay_uuid)
+        except exception.BayNotFound:
+            LOG.debug("Bay %s handed over for polling no longer exists"
+                      % bay_uuid)
+            return
+        self._heat_poller.add(clients.OpenStackClients(ctx), bay,
+                              hand_over=False)
@@ -12,16 +12,22 @@
 
 """Magnum Docker RPC handler."""
 
+import time
+
 from docker import errors
+from eventlet import event
+from eventlet import greenpool
 import functools
 from oslo_config import cfg
 from oslo_log import log as logging
+import six
 
 from magnum.common import docker_utils
 from magnum.common import exception
 from magnum.common import utils
 from magnum.conductor.handlers.common import docker_client
 from magnum.i18n import _LE
+from magnum.i18n import _LW
 from magnum import objects
 from magnum.objects import container as obj_container
 
@@ -49,10 +55,59 @@ docker_opts = [
     cfg.StrOpt('key_file',
                help='Location of TLS private key file for '
                     'securing docker api requests (tlskey).'),
+    cfg.IntOpt('client_cache_size',
+               default=64,
+               help='Maximum number of bays to keep docker clients and '
+                    'connections open for.'),
+    cfg.IntOpt('client_idle_timeout',
+               default=300,
+               help='Number of seconds after which the docker client and '
+                    'the connections of an unused bay are closed.'),
+    cfg.IntOpt('image_cache_ttl',
+               default=300,
+               help='Number of seconds after which the inventory of the '
+                    'images present on a bay is listed again.'),
+    cfg.IntOpt('max_concurrent_actions',
+               default=10,
+               help='Maximum number of docker calls made concurrently by a '
+                    'bulk container action.'),
+    cfg.IntOpt('stats_window',
+               default=5,
+               help='Default number of seconds over which the statistics of '
+                    'containers are aggregated.'),
+    cfg.IntOpt('stats_max_window',
+               default=30,
+               help='Maximum number of seconds over which the statistics of '
+                    'containers can be aggregated.'),
+    cfg.IntOpt('stats_max_containers',
+               default=10,
+               help='Maximum number of running containers of a bay sampled '
+                    'by a single bay statistics request. As at most '
+                    'max_concurrent_actions containers are sampled at once, '
+                    'a request lasts up to ceil(stats_max_containers / '
+                    'max_concurrent_actions) windows.'),
+    cfg.IntOpt('exec_stream_timeout',
+               default=600,
+               help='Number of seconds after which the output of a command '
+                    'streamed from a container is cut.'),
+    cfg.IntOpt('exec_stream_max_bytes',
+               default=10485760,
+               help='Maximum number of bytes of output streamed from a '
+                    'command run in a container.'),
 ]
 
 CONF.register_opts(docker_opts, 'docker')
 
+# Docker call and resulting status of the bulk container actions.
+BULK_ACTIONS = {
+    'start': ('start', obj_container.RUNNING),
+    'stop': ('stop', obj_container.STOPPED),
+    'reboot': ('restart', obj_container.RUNNING),
+    'pause': ('pause', obj_container.PAUSED),
+    'unpause': ('unpause', obj_container.RUNNING),
+    'delete': ('remove_container', None),
+}
+
 
 def wrap_container_exception(f):
     def wrapped(self, context, *args, **kwargs):
@@ -70,44 +125,120 @@ def wrap_container_exception(f):
     return functools.wraps(f)(wrapped)
 
 
+class DockerImageCache(object):
+    """Inventory of the images present on each bay.
+
+    The images of a bay are listed at most once every
+    ``docker.image_cache_ttl`` seconds, so that creating a container from an
+    image already on the bay does not pull it from the registry again.
+    Concurrent pulls of the same image on a bay are made only once, and the
+    other callers wait for its result.
+    """
+
+    def __init__(self):
+        # Bay uuid to the set of image names and the time they were listed.
+        self._images = {}
+        self._pulls = {}
+
+    @staticmethod
+    def _image_name(image_repo, image_tag):
+        return '%s:%s' % (image_repo, image_tag or 'latest')
+
+    def _inventory(self, docker, bay_uuid):
+        now = time.time()
+        entry = self._images.get(bay_uuid)
+        if entry is None or entry[1] <= now - CONF.docker.image_cache_ttl:
+            names = set()
+            for image in docker.images():
+                names.update(image.get('RepoTags') or [])
+            entry = (names, now)
+            self._images[bay_uuid] = entry
+        return entry[0]
+
+    def ensure_image(self, docker, bay_uuid, image_repo, image_tag=None):
+        """Pull an image on a bay unless it is already present."""
+        name = self._image_name(image_repo, image_tag)
+        if name in self._inventory(docker, bay_uuid):
+            return
+
+        key = (bay_uuid, name)
+        pull = self._pulls.get(key)
+        if pull is not None:
+            LOG.debug('Waiting for the pull of image %s on bay %s'
+                      % (name, bay_uuid))
+            pull.wait()
+            return
+
+        pull = self._pulls[key] = event.Event()
+        try:
+            LOG.debug('Pulling image %s on bay %s' % (name, bay_uuid))
+            docker.pull(image_repo, tag=image_tag)
+        except Exception as e:
+            pull.send_exception(e)
+            raise
+        else:
+            entry = self._images.get(bay_uuid)
+            if entry is not None:
+                entry[0].add(name)
+            pull.send()
+        finally:
+            del self._pulls[key]
+
+    def invalidate(self, bay_uuid):
+        """Forget the images of a bay, to list them again on next use."""
+        self._images.pop(bay_uuid, None)
+
+
 class Handler(object):
 
     def __init__(self):
         super(Handler, self).__init__()
+        self._docker_clients = docker_client.DockerClientCache()
+        self._docker_images = DockerImageCache()
 
     @staticmethod
-    def _find_container_by_name(docker, name):
+    def _find_container_by_name(docker, container):
+        """Look up the Docker container of a container without docker_id.
+
+        Only the Docker containers matching the name of the container are
+        inspected, to match their hostname with the container uuid.
+        """
+        filters = {'name': container.name} if container.name else None
         try:
-            for info in docker.list_instances(inspect=True):
-                if info['Config'].get('Hostname') == name:
+            for info in docker.containers(all=True, filters=filters):
+                info = docker.inspect_container(info['Id'])
+                if info and info['Config'].get('Hostname') == container.uuid:
                     return info
         except errors.APIError as e:
             if e.response.status_code != 404:
                 raise
         return {}
 
-    def _encode_utf8(self, value):
-        return unicode(value).encode('utf-8')
+    def _find_docker_id(self, docker, container):
+        """Return the Docker id of a container.
 
-    @staticmethod
-    def _docker_for_bay(bay):
-        tcp_url = 'tcp://%s:2376' % bay.api_address
-        return docker_client.DockerHTTPClient(
-            tcp_url,
-            CONF.docker.docker_remote_api_version,
-            CONF.docker.default_timeout
-        )
-
-    @classmethod
-    def _docker_for_container(cls, context, container):
+        The Docker id is saved when the container is created.  It is looked
+        up and saved for the containers created before that.
+        """
+        if not container.docker_id:
+            info = self._find_container_by_name(docker, container)
+            if not info:
+                return None
+            container.docker_id = info['Id']
+            container.save()
+        return container.docker_id
+
+    def _docker_for_bay(self, bay):
+        return self._docker_clients.get(bay)
+
+    def _docker_for_container(self, context, container):
         bay = objects.Bay.get_by_uuid(context, container.bay_uuid)
-        return cls._docker_for_bay(bay)
+        return self._docker_for_bay(bay)
 
-    @classmethod
-    def get_docker_client(cls, context, container):
+    def get_docker_client(self, context, container):
         if utils.is_uuid_like(container):
             container = objects.Container.get_by_uuid(context, container)
-        return cls._docker_for_container(context, container)
+        return self._docker_for_container(context, container)
 
     # Container operations
 
@@ -119,40 +250,67 @@ class Handler(object):
                   % (image_id, name))
         try:
             image_repo, image_tag = docker_utils.parse_docker_image(image_id)
-            docker.pull(image_repo, tag=image_tag)
-            docker.inspect_image(self._encode_utf8(container.image_id))
-            docker.create_container(image_id, name=name,
-                                    hostname=container_uuid,
-                                    command=container.command)
+            self._docker_images.ensure_image(docker, container.bay_uuid,
+                                             image_repo, image_tag)
+            result = docker.create_container(image_id, name=name,
+                                             hostname=container_uuid,
+                                             command=container.command)
+            container.docker_id = result['Id']
             container.status = obj_container.STOPPED
             return container
         except errors.APIError as api_error:
+            # The image may have been removed from the bay
+            self._docker_images.invalidate(container.bay_uuid)
             container.status = obj_container.ERROR
             raise exception.ContainerException(
                 "Docker API Error : %s" % str(api_error))
         finally:
             container.save()
 
+    def image_prepull(self, context, bay_uuid, images):
+        """Pull images on a bay ahead of the creation of containers.
+
+        The images already present on the bay are not pulled again, and an
+        image which cannot be pulled does not stop the pull of the others.
+        """
+        LOG.debug("image_prepull of %s on bay %s" % (images, bay_uuid))
+        bay = objects.Bay.get_by_uuid(context, bay_uuid)
+        docker = self._docker_for_bay(bay)
+        for image_id in images:
+            image_repo, image_tag = docker_utils.parse_docker_image(image_id)
+            try:
+                self._docker_images.ensure_image(docker, bay.uuid,
+                                                 image_repo, image_tag)
+            except errors.APIError as e:
+                LOG.warning(_LW("Unable to pull image %(image)s on bay "
+                                "%(bay)s: %(error)s"),
+                            {'image': image_id, 'bay': bay.uuid, 'error': e})
+
     @wrap_container_exception
     def container_delete(self, context, container_uuid):
         LOG.debug("container_delete %s" % container_uuid)
-        docker = self.get_docker_client(context, container_uuid)
+        container = objects.Container.get_by_uuid(context, container_uuid)
+        docker = self.get_docker_client(context, container)
         try:
-            docker_id = self._find_container_by_name(docker, container_uuid)
+            docker_id = self._find_docker_id(docker, container)
             if not docker_id:
                 return None
             return docker.remove_container(docker_id)
         except errors.APIError as api_error:
+            error_message = str(api_error)
+            if '404' in error_message:
+                # The Docker container is already gone
+                return None
             raise exception.ContainerException(
-                "Docker API Error : %s" % str(api_error))
+                "Docker API Error : %s" % error_message)
 
     @wrap_container_exception
     def container_show(self, context, container_uuid):
         LOG.debug("container_show %s" % container_uuid)
-        docker = self.get_docker_client(context, container_uuid)
         container = objects.Container.get_by_uuid(context, container_uuid)
+        docker = self.get_docker_client(context, container)
         try:
-            docker_id = self._find_container_by_name(docker, container_uuid)
+            docker_id = self._find_docker_id(docker, container)
             result = docker.inspect_container(docker_id)
             status = result.get('State')
             if status:
@@ -175,14 +333,81 @@ class Handler(object):
             raise exception.ContainerException(
                 "Docker API Error : %s" % (error_message))
 
+    @staticmethod
+    def _status_from_docker(docker_status):
+        """Convert the status of a listed Docker container."""
+        if docker_status.startswith('Up'):
+            if '(Paused)' in docker_status:
+                return obj_container.PAUSED
+            return obj_container.RUNNING
+        return obj_container.STOPPED
+
+    def _sync_bay_statuses(self, context, bay_uuid, containers):
+        """Return the statuses of the containers of a bay.
+
+        The Docker containers of the bay are all listed at once, and the
+        containers missing from the list are in error.
+        """
+        bay = objects.Bay.get_by_uuid(context, bay_uuid)
+        docker = self._docker_for_bay(bay)
+        docker_statuses = dict((info['Id'], info['Status'])
+                               for info in docker.containers(all=True))
+        statuses = {}
+        for container in containers:
+            docker_id = self._find_docker_id(docker, container)
+            docker_status = docker_statuses.get(docker_id)
+            if docker_status is None:
+                statuses[container.uuid] = obj_container.ERROR
+            else:
+                statuses[container.uuid] = self._status_from_docker(
+                    docker_status)
+        return statuses
+
+    def container_sync_status(self, context, containers):
+        """Refresh the status of a page of containers.
+
+        The Docker containers are listed once per bay, and the statuses
+        which changed are saved with a single DB write.  The containers of a
+        bay which cannot be reached keep their last known status.
+
+        :param containers: a list of containers.
+        :returns: the containers with their current status.
+        """
+        LOG.debug("container_sync_status of %d containers" % len(containers))
+        containers_by_bay = {}
+        for container in containers:
+            containers_by_bay.setdefault(container.bay_uuid,
+                                         []).append(container)
+
+        statuses = {}
+        for bay_uuid, bay_containers in containers_by_bay.items():
+            try:
+                statuses.update(self._sync_bay_statuses(context, bay_uuid,
+                                                        bay_containers))
+            except Exception as e:
+                LOG.warning(_LW("Unable to sync the status of the containers "
+                                "of bay %(bay)s: %(error)s"),
+                            {'bay': bay_uuid, 'error': e})
+
+        changed = {}
+        for container in containers:
+            status = statuses.get(container.uuid)
+            if status is not None and status != container.status:
+                changed[container.uuid] = status
+                container.status = status
+                container.obj_reset_changes(['status'])
+        if changed:
+            objects.Container.update_statuses(context, changed)
+        return containers
+
     @wrap_container_exception
     def _container_action(self, context, container_uuid, status, docker_func):
         LOG.debug("container_%s %s" % (status, container_uuid))
-        docker = self.get_docker_client(context, container_uuid)
+        container = objects.Container.get_by_uuid(context, container_uuid)
+        docker = self.get_docker_client(context, container)
         try:
-            docker_id = self._find_container_by_name(docker, container_uuid)
+            docker_id = self._find_docker_id(docker, container)
             result = getattr(docker, docker_func)(docker_id)
-            container = objects.Container.get_by_uuid(context, container_uuid)
             container.status = status
             container.save()
             return result
@@ -210,12 +435,175 @@ class Handler(object):
         return self._container_action(context, container_uuid,
                                       obj_container.RUNNING, 'unpause')
 
+    def _bulk_action(self, docker, container, action):
+        """Run an action of a bulk on the Docker container of a container.
+
+        :returns: the status of the container after the action.
+        """
+        docker_func, status = BULK_ACTIONS[action]
+        docker_id = self._find_docker_id(docker, container)
+        if action == 'delete':
+            if docker_id:
+                try:
+                    docker.remove_container(docker_id)
+                except errors.APIError as api_error:
+                    if '404' not in str(api_error):
+                        raise
+            container.destroy()
+            return None
+        getattr(docker, docker_func)(docker_id)
+        return status
+
+    def container_bulk_action(self, context, container_uuids, action):
+        """Run the same action on several containers.
+
+        The containers are loaded with one DB query and grouped per bay, the
+        Docker calls are made concurrently by at most
+        ``docker.max_concurrent_actions`` green threads, and the statuses
+        which changed are saved with a single DB write.
+
+        :param container_uuids: the uuids of the containers.
+        :param action: one of start, stop, reboot, pause, unpause and
+                       delete.
+        :returns: a list with the uuid, the status and the error, if any, of
+                  every container.
+        """
+        if action not in BULK_ACTIONS:
+            raise exception.InvalidParameterValue(
+                "Invalid bulk action %s" % action)
+        LOG.debug("container_bulk_action %s of %d containers"
+                  % (action, len(container_uuids)))
+        containers = objects.Container.list(context,
+                                            filters={'uuid': container_uuids})
+        results = {}
+        for uuid in container_uuids:
+            error = exception.ContainerNotFound(container=uuid)
+            results[uuid] = {'uuid': uuid, 'status': None,
+                             'error': six.text_type(error)}
+
+        def run(docker, container):
+            try:
+                status = self._bulk_action(docker, container, action)
+                results[container.uuid] = {'uuid': container.uuid,
+                                           'status': status, 'error': None}
+            except Exception as e:
+                results[container.uuid] = {'uuid': container.uuid,
+                                           'status': container.status,
+                                           'error': six.text_type(e)}
+
+        containers_by_bay = {}
+        for container in containers:
+            containers_by_bay.setdefault(container.bay_uuid,
+                                         []).append(container)
+
+        pool = greenpool.GreenPool(CONF.docker.max_concurrent_actions)
+        for bay_uuid, bay_containers in containers_by_bay.items():
+            try:
+                bay = objects.Bay.get_by_uuid(context, bay_uuid)
+                docker = self._docker_for_bay(bay)
+            except Exception as e:
+                for container in bay_containers:
+                    results[container.uuid] = {'uuid': container.uuid,
+                                               'status': container.status,
+                                               'error': six.text_type(e)}
+                continue
+            for container in bay_containers:
+                pool.spawn_n(run, docker, container)
+        pool.waitall()
+
+        changed = {}
+        for container in containers:
+            result = results[container.uuid]
+            if (action != 'delete' and result['error'] is None and
+                    result['status'] != container.status):
+                changed[container.uuid] = result['status']
+        if changed:
+            objects.Container.update_statuses(context, changed)
+        return [results[uuid] for uuid in container_uuids]
+
+    def _container_stats(self, docker, container, window):
+        """Aggregate the Docker stats stream of a container over a window.
+
+        :returns: the statistics snapshot of the container.
+        """
+        docker_id = self._find_docker_id(docker, container)
+        aggregator = docker_utils.StatsAggregator()
+        stream = docker.stats_stream(docker_id)
+        try:
+            # The first sample is only a starting point for the CPU usage.
+            for sample in stream:
+                aggregator.add(sample)
+                if aggregator.samples > window:
+                    break
+        finally:
+            stream.close()
+        snapshot = aggregator.snapshot()
+        snapshot['uuid'] = container.uuid
+        return snapshot
+
+    @wrap_container_exception
+    def container_stats(self, context, container_uuid, window):
+        """Return the resource usage of a container over a window.
+
+        :param container_uuid: the uuid of the container.
+        :param window: the number of seconds to aggregate the usage over.
+        """
+        LOG.debug("container_stats %s" % container_uuid)
+        container = objects.Container.get_by_uuid(context, container_uuid)
+        docker = self.get_docker_client(context, container)
+        try:
+            return self._container_stats(docker, container, window)
+        except errors.APIError as api_error:
+            raise exception.ContainerException(
+                "Docker API Error : %s" % str(api_error))
+
+    def bay_container_stats(self, context, bay_uuid, window):
+        """Return the resource usage of the running containers of a bay.
+
+        The Docker stats streams of at most ``docker.stats_max_containers``
+        containers are read concurrently by at most
+        ``docker.max_concurrent_actions`` green threads, and a container
+        whose stats cannot be read is left out.
+
+        :param bay_uuid: the uuid of the bay.
+        :param window: the number of seconds to aggregate the usage over.
+        :returns: the snapshots of the containers, busiest first, their
+                  total and the number of running containers not sampled.
+        """
+        LOG.debug("bay_container_stats %s" % bay_uuid)
+        bay = objects.Bay.get_by_uuid(context, bay_uuid)
+        docker = self._docker_for_bay(bay)
+        containers = objects.Container.list(context,
+                                            filters={'bay_uuid': bay.uuid})
+
+        def stats(container):
+            try:
+                return self._container_stats(docker, container, window)
+            except Exception as e:
+                LOG.warning(_LW("Unable to read the stats of container "
+                                "%(container)s: %(error)s"),
+                            {'container': container.uuid, 'error': e})
+
+        pool = greenpool.GreenPool(CONF.docker.max_concurrent_actions)
+        running = [container for container in containers
+                   if container.status == obj_container.RUNNING]
+        sampled = running[:CONF.docker.stats_max_containers]
+        snapshots = [snapshot for snapshot in pool.imap(stats, sampled)
+                     if snapshot is not None]
+        snapshots.sort(key=lambda snapshot: snapshot['cpu_percent'],
+                       reverse=True)
+        return {'bay_uuid': bay.uuid,
+                'containers': snapshots,
+                'total': docker_utils.sum_stats(snapshots),
+                'unsampled': len(running) - len(sampled)}
+
     @wrap_container_exception
     def container_logs(self, context, container_uuid):
         LOG.debug("container_logs %s" % container_uuid)
-        docker = self.get_docker_client(context, container_uuid)
+        container = objects.Container.get_by_uuid(context, container_uuid)
+        docker = self.get_docker_client(context, container)
         try:
-            docker_id = self._find_container_by_name(docker, container_uuid)
+            docker_id = self._find_docker_id(docker, container)
             return {'output': docker.get_container_logs(docker_id)}
         except errors.APIError as api_error:
             raise exception.ContainerException(
@@ -225,9 +613,10 @@ class Handler(object):
     def container_execute(self, context, container_uuid, command):
         LOG.debug("container_execute %s command %s" %
                   (container_uuid, command))
-        docker = self.get_docker_client(context, container_uuid)
+        container = objects.Container.get_by_uuid(context, container_uuid)
+        docker = self.get_docker_client(context, container)
         try:
-            docker_id = self._find_container_by_name(docker, container_uuid)
+            docker_id = self._find_docker_id(docker, container)
             create_res = docker.exec_create(docker_id, command, True,
                                             True, False)
             return {'output': docker.exec_start(create_res, False,
@@ -0,0 +1,89 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from oslo_config import cfg
+from oslo_log import log as logging
+import oslo_messaging as messaging
+
+from magnum.common import clients
+from magnum.common import context
+from magnum.common import rpc_service
+from magnum.conductor.handlers import bay_conductor
+from magnum.i18n import _LE
+from magnum import objects
+from magnum.objects.bay import Status as bay_status
+from magnum.openstack.common import loopingcall
+
+
+LOG = logging.getLogger(__name__)
+
+STACK_EVENT_PREFIX = 'orchestration.stack.'
+
+
+class NotifiedStack(object):
+    """The stack status carried by a Heat notification."""
+
+    def __init__(self, payload):
+        # stack_identity is an ARN ending with the stack id, e.g.
+        # arn:openstack:heat::<tenant>:stacks/<stack name>/<stack id>
+        self.id = payload['stack_identity'].rsplit('/', 1)[-1]
+        self.stack_status = payload['state']
+        self.stack_status_reason = payload.get('state_reason')
+
+
+class Handler(object):
+    """Update bays from the orchestration.stack.* notifications of Heat.
+
+    The notification only carries the status of the stack, so the stack
+    itself is only fetched from Heat when its outputs are needed.
+    """
+
+    def info(self, ctxt, publisher_id, event_type, payload, metadata):
+        if event_type.startswith(STACK_EVENT_PREFIX):
+            self._sync_bay(NotifiedStack(payload))
+
+    def error(self, ctxt, publisher_id, event_type, payload, metadata):
+        if event_type.startswith(STACK_EVENT_PREFIX):
+            self._sync_bay(NotifiedStack(payload))
+
+    def _sync_bay(self, stack):
+        ctx = context.make_admin_context(all_tenants=True)
+        bays = objects.Bay.list(ctx, filters={'stack_id': stack.id})
+        if not bays:
+            # Not the stack of a bay.
+            return
+
+        poller = bay_conductor.HeatPoller(clients.OpenStackClients(ctx),
+                                          bays[0])
+        try:
+            if stack.stack_status in [bay_status.CREATE_COMPLETE,
+                                      bay_status.UPDATE_COMPLETE]:
+                poller.poll_and_check()
+            else:
+                poller.check(stack)
+        except loopingcall.LoopingCallDone:
+            pass
+        except Exception:
+            LOG.exception(_LE('Unable to update bay on notification, '
+                              'stack_id: %(id)s, stack_status: %(status)s'),
+                          {'id': stack.id, 'status': stack.stack_status})
+
+
+def get_notification_listener(transport=None):
+    """Return a listener of the Heat notifications for the conductor."""
+    if transport is None:
+        transport = messaging.get_transport(
+            cfg.CONF, aliases=rpc_service.TRANSPORT_ALIASES)
+    targets = [messaging.Target(topic=cfg.CONF.bay_heat.notification_topic)]
+    return messaging.get_notification_listener(
+        transport, targets, [Handler()], executor='eventlet',
+        pool=cfg.CONF.bay_heat.notification_pool)
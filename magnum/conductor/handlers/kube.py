@@ -12,6 +12,11 @@
 
 """Magnum Kubernetes RPC handler."""
 
+import collections
+import functools
+import time
+
+from eventlet import greenpool
 from oslo_config import cfg
 from oslo_log import log as logging
 
@@ -24,6 +29,7 @@ from magnum.i18n import _
 from magnum import objects
 
 import ast
+import six
 from six.moves.urllib import error
 
 LOG = logging.getLogger(__name__)
@@ -37,6 +43,44 @@ kubernetes_opts = [
     cfg.IntOpt('k8s_port',
                default=8080,
                help=_('Default port of the k8s master endpoint.')),
+    cfg.IntOpt('k8s_client_cache_size',
+               default=64,
+               help=_('Maximum number of k8s master endpoints to keep '
+                      'clients and connections open for.')),
+    cfg.IntOpt('k8s_client_idle_timeout',
+               default=300,
+               help=_('Number of seconds after which the client and the '
+                      'connections of an unused k8s master endpoint are '
+                      'closed.')),
+    cfg.IntOpt('k8s_pool_size',
+               default=10,
+               help=_('Maximum number of keep-alive connections kept open '
+                      'to each k8s master endpoint.')),
+    cfg.BoolOpt('k8s_watch',
+                default=False,
+                help=_('Keep the pods, services and replication controllers '
+                       'of the bays in sync with their k8s master by '
+                       'watching it.')),
+    cfg.IntOpt('k8s_watch_flush_interval',
+               default=5,
+               help=_('Number of seconds between the DB writes of the '
+                      'changes watched on the k8s masters.')),
+    cfg.IntOpt('k8s_watch_timeout',
+               default=300,
+               help=_('Number of seconds without any change after which a '
+                      'watch of a k8s master is opened again.')),
+    cfg.IntOpt('k8s_watch_retry_interval',
+               default=10,
+               help=_('Number of seconds to wait before watching a k8s '
+                      'master again after an error.')),
+    cfg.IntOpt('bay_endpoint_cache_ttl',
+               default=30,
+               help=_('Number of seconds the k8s master URL of a bay is '
+                      'cached for.')),
+    cfg.IntOpt('bay_stack_cache_ttl',
+               default=10,
+               help=_('Number of seconds whether the Heat stack of a bay '
+                      'is alive is cached for.')),
 ]
 
 cfg.CONF.register_opts(kubernetes_opts, group='kubernetes')
@@ -51,23 +95,28 @@ def _retrieve_baymodel(context, obj):
     return objects.BayModel.get_by_uuid(context, obj.baymodel_id)
 
 
-def _retrieve_k8s_master_url(context, obj):
+def get_k8s_master_url(bay, baymodel):
+    """Return the URL of the k8s master of a bay."""
     apiserver_port = cfg.CONF.kubernetes.k8s_port
-    if hasattr(obj, 'bay_uuid'):
-        obj = _retrieve_bay(context, obj)
-
-    baymodel = _retrieve_baymodel(context, obj)
     if baymodel.apiserver_port is not None:
         apiserver_port = baymodel.apiserver_port
 
     params = {
         'k8s_protocol': cfg.CONF.kubernetes.k8s_protocol,
         'k8s_port': apiserver_port,
-        'api_address': obj.api_address
+        'api_address': bay.api_address
     }
     return "%(k8s_protocol)s://%(api_address)s:%(k8s_port)s" % params
 
 
+def _retrieve_k8s_master_url(context, obj):
+    if hasattr(obj, 'bay_uuid'):
+        obj = _retrieve_bay(context, obj)
+
+    baymodel = _retrieve_baymodel(context, obj)
+    return get_k8s_master_url(obj, baymodel)
+
+
 def _object_has_stack(context, obj):
     osc = clients.OpenStackClients(context)
     if hasattr(obj, 'bay_uuid'):
@@ -81,6 +130,128 @@ def _object_has_stack(context, obj):
         return True
 
 
+class BayEndpointCache(object):
+    """Cache of the k8s master URL and the stack liveness of the bays.
+
+    Resolving the master URL of a bay reads the bay and its baymodel from
+    the DB, and checking that its stack is alive calls Heat.  Both are
+    cached per bay for ``kubernetes.bay_endpoint_cache_ttl`` and
+    ``kubernetes.bay_stack_cache_ttl`` seconds, and dropped as soon as the
+    bay poller of this conductor changes the status or the outputs of the
+    bay.  The entries are also keyed by the tenant of the request context,
+    so a bay is never resolved for a context which could not read it.
+    """
+
+    def __init__(self):
+        # Ordered from the least to the most recently resolved entry.
+        self._urls = collections.OrderedDict()
+        self._stacks = collections.OrderedDict()
+
+    @staticmethod
+    def _key(context, obj):
+        return (obj.bay_uuid, context.project_id, context.user_id,
+                context.is_admin and context.all_tenants)
+
+    @staticmethod
+    def _lookup(entries, key, ttl, resolve):
+        now = time.time()
+        deadline = now - ttl
+        while entries:
+            oldest = next(iter(entries))
+            if entries[oldest][1] > deadline:
+                break
+            del entries[oldest]
+
+        entry = entries.get(key)
+        if entry is None:
+            entry = entries[key] = (resolve(), now)
+        return entry[0]
+
+    def k8s_master_url(self, context, obj):
+        """Return the k8s master URL of the bay of a k8s resource."""
+        return self._lookup(
+            self._urls, self._key(context, obj),
+            cfg.CONF.kubernetes.bay_endpoint_cache_ttl,
+            functools.partial(_retrieve_k8s_master_url, context, obj))
+
+    def has_stack(self, context, obj):
+        """Return whether the stack of the bay of a k8s resource is alive."""
+        return self._lookup(
+            self._stacks, self._key(context, obj),
+            cfg.CONF.kubernetes.bay_stack_cache_ttl,
+            functools.partial(_object_has_stack, context, obj))
+
+    def invalidate(self, bay_uuid):
+        for entries in (self._urls, self._stacks):
+            for key in list(entries):
+                if key[0] == bay_uuid:
+                    del entries[key]
+
+    def clear(self):
+        self._urls.clear()
+        self._stacks.clear()
+
+
+# The bay endpoints resolved by the handler, invalidated by the bay poller.
+bay_endpoints = BayEndpointCache()
+
+
+class K8sClientCache(object):
+    """LRU cache of Kubernetes API clients keyed by master URL.
+
+    Each client keeps a pool of keep-alive connections to its master, so
+    calls to the same bay do not open a new connection every time.  Clients
+    which are least recently used or idle for more than
+    ``kubernetes.k8s_client_idle_timeout`` seconds are closed.
+    """
+
+    def __init__(self):
+        # Ordered from the least to the most recently used client.
+        self._clients = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._clients)
+
+    def __contains__(self, k8s_master_url):
+        return k8s_master_url in self._clients
+
+    def get(self, k8s_master_url):
+        """Return the ApivbetaApi instance of a Kubernetes master.
+
+        :param k8s_master_url: Kubernetes master URL
+        """
+        now = time.time()
+        self._expire(now)
+
+        entry = self._clients.pop(k8s_master_url, None)
+        if entry is None:
+            client = swagger.ApiClient(
+                k8s_master_url, poolSize=cfg.CONF.kubernetes.k8s_pool_size)
+            k8s_api = ApivbetaApi.ApivbetaApi(client)
+        else:
+            k8s_api = entry[0]
+        self._clients[k8s_master_url] = (k8s_api, now)
+
+        while len(self._clients) > cfg.CONF.kubernetes.k8s_client_cache_size:
+            url, (lru_api, last_used) = self._clients.popitem(last=False)
+            lru_api.apiClient.close()
+        return k8s_api
+
+    def clear(self):
+        while self._clients:
+            url, (k8s_api, last_used) = self._clients.popitem()
+            k8s_api.apiClient.close()
+
+    def _expire(self, now):
+        deadline = now - cfg.CONF.kubernetes.k8s_client_idle_timeout
+        for url, (k8s_api, last_used) in list(self._clients.items()):
+            if last_used > deadline:
+                break
+            LOG.debug('Closing idle k8s client of %s', url)
+            del self._clients[url]
+            k8s_api.apiClient.close()
+
+
 class Handler(object):
     """These are the backend operations.  They are executed by the backend
          service.  API calls via AMQP (within the ReST API) trigger the
@@ -90,35 +261,25 @@ class Handler(object):
 
     def __init__(self):
         super(Handler, self).__init__()
-        self._k8s_api = None
-
-    @property
-    def k8s_api(self):
-        return self._k8s_api
+        self._k8s_clients = K8sClientCache()
 
-    @k8s_api.setter
-    def k8s_api(self, k8s_master_url):
-        """Creates connection with Kubernetes master and
-            creates ApivbetaApi instance to call Kubernetes
-            APIs.
+    def _get_k8s_api(self, k8s_master_url):
+        """Returns the ApivbetaApi instance to call the Kubernetes APIs
+            of a Kubernetes master.
 
             :param k8s_master_url: Kubernetes master URL
         """
-        if self._k8s_api is None:
-            # build a connection with Kubernetes master
-            client = swagger.ApiClient(k8s_master_url)
+        return self._k8s_clients.get(k8s_master_url)
 
-            # create the ApivbetaApi class instance
-            self._k8s_api = ApivbetaApi.ApivbetaApi(client)
-
-    def service_create(self, context, service):
+    def service_create(self, context, service, manifest=None):
         LOG.debug("service_create")
-        k8s_master_url = _retrieve_k8s_master_url(context, service)
-        self.k8s_api = k8s_master_url
-        manifest = k8s_manifest.parse(service.manifest)
+        k8s_master_url = bay_endpoints.k8s_master_url(context, service)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if manifest is None:
+            manifest = k8s_manifest.parse(service.manifest)
         try:
-            self.k8s_api.createService(body=manifest,
-                                       namespaces='default')
+            k8s_api.createService(body=manifest,
+                                  namespaces='default')
         except error.HTTPError as err:
             message = ast.literal_eval(err.read())['message']
             raise exception.KubernetesAPIFailed(code=err.code, message=message)
@@ -126,15 +287,16 @@ class Handler(object):
         service.create(context)
         return service
 
-    def service_update(self, context, service):
+    def service_update(self, context, service, manifest=None):
         LOG.debug("service_update %s", service.uuid)
-        k8s_master_url = _retrieve_k8s_master_url(context, service)
-        self.k8s_api = k8s_master_url
-        manifest = k8s_manifest.parse(service.manifest)
+        k8s_master_url = bay_endpoints.k8s_master_url(context, service)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if manifest is None:
+            manifest = k8s_manifest.parse(service.manifest)
         try:
-            self.k8s_api.replaceService(name=service.name,
-                                        body=manifest,
-                                        namespaces='default')
+            k8s_api.replaceService(name=service.name,
+                                   body=manifest,
+                                   namespaces='default')
         except error.HTTPError as err:
             message = ast.literal_eval(err.read())['message']
             raise exception.KubernetesAPIFailed(code=err.code, message=message)
@@ -146,12 +308,12 @@ class Handler(object):
     def service_delete(self, context, uuid):
         LOG.debug("service_delete %s", uuid)
         service = objects.Service.get_by_uuid(context, uuid)
-        k8s_master_url = _retrieve_k8s_master_url(context, service)
-        self.k8s_api = k8s_master_url
-        if _object_has_stack(context, service):
+        k8s_master_url = bay_endpoints.k8s_master_url(context, service)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if bay_endpoints.has_stack(context, service):
             try:
-                self.k8s_api.deleteService(name=service.name,
-                                           namespaces='default')
+                k8s_api.deleteService(name=service.name,
+                                      namespaces='default')
             except error.HTTPError as err:
                 if err.code == 404:
                     pass
@@ -163,13 +325,14 @@ class Handler(object):
         service.destroy(context)
 
     # Pod Operations
-    def pod_create(self, context, pod):
+    def pod_create(self, context, pod, manifest=None):
         LOG.debug("pod_create")
-        k8s_master_url = _retrieve_k8s_master_url(context, pod)
-        self.k8s_api = k8s_master_url
-        manifest = k8s_manifest.parse(pod.manifest)
+        k8s_master_url = bay_endpoints.k8s_master_url(context, pod)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if manifest is None:
+            manifest = k8s_manifest.parse(pod.manifest)
         try:
-            resp = self.k8s_api.createPod(body=manifest, namespaces='default')
+            resp = k8s_api.createPod(body=manifest, namespaces='default')
         except error.HTTPError as err:
             pod.status = 'failed'
             if err.code != 409:
@@ -186,14 +349,15 @@ class Handler(object):
         pod.create(context)
         return pod
 
-    def pod_update(self, context, pod):
+    def pod_update(self, context, pod, manifest=None):
         LOG.debug("pod_update %s", pod.uuid)
-        k8s_master_url = _retrieve_k8s_master_url(context, pod)
-        self.k8s_api = k8s_master_url
-        manifest = k8s_manifest.parse(pod.manifest)
+        k8s_master_url = bay_endpoints.k8s_master_url(context, pod)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if manifest is None:
+            manifest = k8s_manifest.parse(pod.manifest)
         try:
-            self.k8s_api.replacePod(name=pod.name, body=manifest,
-                                    namespaces='default')
+            k8s_api.replacePod(name=pod.name, body=manifest,
+                               namespaces='default')
         except error.HTTPError as err:
             message = ast.literal_eval(err.read())['message']
             raise exception.KubernetesAPIFailed(code=err.code, message=message)
@@ -205,12 +369,12 @@ class Handler(object):
     def pod_delete(self, context, uuid):
         LOG.debug("pod_delete %s", uuid)
         pod = objects.Pod.get_by_uuid(context, uuid)
-        k8s_master_url = _retrieve_k8s_master_url(context, pod)
-        self.k8s_api = k8s_master_url
-        if _object_has_stack(context, pod):
+        k8s_master_url = bay_endpoints.k8s_master_url(context, pod)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if bay_endpoints.has_stack(context, pod):
             try:
-                self.k8s_api.deletePod(name=pod.name,
-                                       namespaces='default')
+                k8s_api.deletePod(name=pod.name,
+                                  namespaces='default')
             except error.HTTPError as err:
                 if err.code == 404:
                     pass
@@ -222,14 +386,15 @@ class Handler(object):
         pod.destroy(context)
 
     # Replication Controller Operations
-    def rc_create(self, context, rc):
+    def rc_create(self, context, rc, manifest=None):
         LOG.debug("rc_create")
-        k8s_master_url = _retrieve_k8s_master_url(context, rc)
-        self.k8s_api = k8s_master_url
-        manifest = k8s_manifest.parse(rc.manifest)
+        k8s_master_url = bay_endpoints.k8s_master_url(context, rc)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if manifest is None:
+            manifest = k8s_manifest.parse(rc.manifest)
         try:
-            self.k8s_api.createReplicationController(body=manifest,
-                                                     namespaces='default')
+            k8s_api.createReplicationController(body=manifest,
+                                                namespaces='default')
         except error.HTTPError as err:
             message = ast.literal_eval(err.read())['message']
             raise exception.KubernetesAPIFailed(code=err.code, message=message)
@@ -237,15 +402,16 @@ class Handler(object):
         rc.create(context)
         return rc
 
-    def rc_update(self, context, rc):
+    def rc_update(self, context, rc, manifest=None):
         LOG.debug("rc_update %s", rc.uuid)
-        k8s_master_url = _retrieve_k8s_master_url(context, rc)
-        self.k8s_api = k8s_master_url
-        manifest = k8s_manifest.parse(rc.manifest)
+        k8s_master_url = bay_endpoints.k8s_master_url(context, rc)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if manifest is None:
+            manifest = k8s_manifest.parse(rc.manifest)
         try:
-            self.k8s_api.replaceReplicationController(name=rc.name,
-                                                      body=manifest,
-                                                      namespaces='default')
+            k8s_api.replaceReplicationController(name=rc.name,
+                                                 body=manifest,
+                                                 namespaces='default')
         except error.HTTPError as err:
             message = ast.literal_eval(err.read())['message']
             raise exception.KubernetesAPIFailed(code=err.code, message=message)
@@ -257,12 +423,12 @@ class Handler(object):
     def rc_delete(self, context, uuid):
         LOG.debug("rc_delete %s", uuid)
         rc = objects.ReplicationController.get_by_uuid(context, uuid)
-        k8s_master_url = _retrieve_k8s_master_url(context, rc)
-        self.k8s_api = k8s_master_url
-        if _object_has_stack(context, rc):
+        k8s_master_url = bay_endpoints.k8s_master_url(context, rc)
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        if bay_endpoints.has_stack(context, rc):
             try:
-                self.k8s_api.deleteReplicationController(name=rc.name,
-                                                         namespaces='default')
+                k8s_api.deleteReplicationController(name=rc.name,
+                                                    namespaces='default')
             except error.HTTPError as err:
                 if err.code == 404:
                     pass
@@ -272,3 +438,76 @@ class Handler(object):
                                                         message=message)
         # call the rc object to persist in db
         rc.destroy(context)
+
+    # Manifest Operations
+    @staticmethod
+    def _create_in_k8s(k8s_api, obj, manifest=None):
+        """Create a k8s resource, and return the HTTPError if it fails."""
+        if manifest is None:
+            manifest = k8s_manifest.parse(obj.manifest)
+        try:
+            if isinstance(obj, objects.Service):
+                k8s_api.createService(body=manifest, namespaces='default')
+            elif isinstance(obj, objects.ReplicationController):
+                k8s_api.createReplicationController(body=manifest,
+                                                    namespaces='default')
+            else:
+                resp = k8s_api.createPod(body=manifest, namespaces='default')
+                obj.status = resp['status']['phase']
+        except error.HTTPError as err:
+            return err
+
+    def manifest_apply(self, context, pods, services, rcs, manifests=None):
+        """Create the resources of a manifest in their bay.
+
+        The services are created first, so that they exist when the pods
+        of the rcs start, then the rcs and the pods.  The resources of each
+        step are created concurrently, and no step is started after one
+        which failed.  The records of the created resources are written in
+        a single transaction, whether a resource failed or not.
+
+        :param manifests: the parsed manifests of the resources, as a dict
+                          of lists keyed like the resources.  The manifest
+                          of a resource is parsed when it is missing.
+        """
+        LOG.debug("manifest_apply")
+        k8s_master_url = bay_endpoints.k8s_master_url(
+            context, (services + rcs + pods)[0])
+        k8s_api = self._get_k8s_api(k8s_master_url)
+        manifests = manifests or {}
+
+        def with_manifests(objs, key):
+            return list(six.moves.zip_longest(objs, manifests.get(key, [])))
+
+        def create(obj_manifest):
+            return self._create_in_k8s(k8s_api, *obj_manifest)
+
+        pool = greenpool.GreenPool(cfg.CONF.kubernetes.k8s_pool_size)
+
+        created = []
+        failure = None
+        steps = (with_manifests(services, 'services'),
+                 with_manifests(rcs, 'rcs') + with_manifests(pods, 'pods'))
+        for step in steps:
+            for (obj, manifest), err in zip(step, pool.imap(create, step)):
+                if err is None:
+                    created.append(obj)
+                elif failure is None:
+                    failure = (obj, err)
+            if failure is not None:
+                break
+
+        created_pods = [obj for obj in pods if obj in created]
+        created_services = [obj for obj in services if obj in created]
+        created_rcs = [obj for obj in rcs if obj in created]
+        if created:
+            objects.Manifest.create_resources(context, created_pods,
+                                              created_services, created_rcs)
+
+        if failure is not None:
+            obj, err = failure
+            message = ast.literal_eval(err.read())['message']
+            raise exception.KubernetesAPIFailed(
+                code=err.code, message='%s: %s' % (obj.name, message))
+        return {'pods': created_pods, 'services': created_services,
+                'rcs': created_rcs}
@@ -0,0 +1,132 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Distribution of the bays among the live conductors."""
+
+import bisect
+import hashlib
+import time
+
+from oslo_config import cfg
+from oslo_log import log as logging
+
+from magnum.common import context
+from magnum.conductor import api as conductor_api
+from magnum.i18n import _LE
+from magnum.i18n import _LI
+from magnum.openstack.common import loopingcall
+
+
+cfg.CONF.import_opt('topic', 'magnum.conductor.config', group='conductor')
+cfg.CONF.import_opt('heartbeat_interval', 'magnum.conductor.config',
+                    group='conductor')
+cfg.CONF.import_opt('heartbeat_timeout', 'magnum.conductor.config',
+                    group='conductor')
+
+LOG = logging.getLogger(__name__)
+
+
+class HashRing(object):
+    """A consistent hash ring of hosts.
+
+    Each host is placed on the ring several times, so that the keys are
+    spread evenly and only the keys of a joining or leaving host move to
+    another host.
+    """
+
+    def __init__(self, hosts, replicas=64):
+        self.hosts = set(hosts)
+        ring = sorted((self._hash('%s-%d' % (host, i)), host)
+                      for host in self.hosts for i in range(replicas))
+        self._hashes = [h for h, host in ring]
+        self._hosts = [host for h, host in ring]
+
+    @staticmethod
+    def _hash(key):
+        return int(hashlib.md5(key.encode('utf-8')).hexdigest(), 16)
+
+    def get_host(self, key):
+        """Return the host a key is mapped to."""
+        if not self._hosts:
+            return None
+        index = bisect.bisect(self._hashes, self._hash(key))
+        return self._hosts[index % len(self._hosts)]
+
+
+class ConductorRing(object):
+    """Map each bay to one of the live conductors.
+
+    The conductors send each other heartbeats through their
+    conductor_listener endpoint.  A conductor joins the ring on its first
+    heartbeat and leaves it after ``conductor.heartbeat_timeout`` seconds
+    without one.  ``version`` changes each time the ring is rebalanced.
+    """
+
+    def __init__(self, conductor_id):
+        self.conductor_id = conductor_id
+        self.version = 0
+        self._last_seen = {}
+        self._ring = HashRing([])
+        self.heartbeat(conductor_id)
+
+    @property
+    def conductors(self):
+        return sorted(self._last_seen)
+
+    def heartbeat(self, conductor_id):
+        """Record that a conductor is alive."""
+        joined = conductor_id not in self._last_seen
+        self._last_seen[conductor_id] = time.time()
+        if joined:
+            LOG.info(_LI('Conductor %s joined the hash ring'), conductor_id)
+            self._rebalance()
+
+    def expire(self):
+        """Remove the conductors that stopped sending heartbeats."""
+        deadline = time.time() - cfg.CONF.conductor.heartbeat_timeout
+        left = [conductor_id
+                for conductor_id, last_seen in self._last_seen.items()
+                if conductor_id != self.conductor_id and last_seen < deadline]
+        for conductor_id in left:
+            LOG.info(_LI('Conductor %s left the hash ring'), conductor_id)
+            del self._last_seen[conductor_id]
+        if left:
+            self._rebalance()
+
+    def _rebalance(self):
+        self._ring = HashRing(self._last_seen)
+        self.version += 1
+
+    def get_owner(self, bay_uuid):
+        """Return the id of the conductor owning a bay."""
+        return self._ring.get_host(bay_uuid)
+
+    def is_owner(self, bay_uuid):
+        return self.get_owner(bay_uuid) == self.conductor_id
+
+    def start(self):
+        """Start sending heartbeats to the other conductors."""
+        timer = loopingcall.FixedIntervalLoopingCall(f=self._send_heartbeat)
+        timer.start(cfg.CONF.conductor.heartbeat_interval, True)
+        return timer
+
+    def _send_heartbeat(self):
+        self.heartbeat(self.conductor_id)
+        self.expire()
+        try:
+            listener_api = conductor_api.ListenerAPI(
+                context=context.make_admin_context(),
+                topic=cfg.CONF.conductor.topic)
+            listener_api.conductor_heartbeat(self.conductor_id)
+        except Exception:
+            LOG.exception(_LE('Unable to send the heartbeat of conductor '
+                              '%s'), self.conductor_id)
@@ -0,0 +1,270 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Live sync of the Kubernetes resources of the bays."""
+
+import time
+
+import eventlet
+from oslo_config import cfg
+from oslo_log import log as logging
+from six.moves.urllib import error
+
+from magnum.common import context
+from magnum.common.pythonk8sclient.client import swagger
+from magnum.conductor.handlers import kube
+from magnum.i18n import _LE
+from magnum.i18n import _LW
+from magnum import objects
+from magnum.objects.bay import Status as bay_status
+from magnum.openstack.common import loopingcall
+
+
+LOG = logging.getLogger(__name__)
+
+WATCHED_STATUSES = [bay_status.CREATE_COMPLETE,
+                    bay_status.UPDATE_IN_PROGRESS,
+                    bay_status.UPDATE_COMPLETE,
+                    bay_status.UPDATE_FAILED]
+
+
+def _pod_values(pod):
+    return {'status': (pod.get('status') or {}).get('phase')}
+
+
+def _service_values(service):
+    spec = service.get('spec') or {}
+    # The portal IP was renamed cluster IP in Kubernetes v1.
+    return {'ip': spec.get('portalIP') or spec.get('clusterIP'),
+            'ports': spec.get('ports')}
+
+
+def _rc_values(rc):
+    return {'replicas': (rc.get('spec') or {}).get('replicas')}
+
+
+# The objects synced for each kind of resource, and their changed fields.
+RESOURCES = {
+    'pods': ('Pod', _pod_values),
+    'services': ('Service', _service_values),
+    'replicationcontrollers': ('ReplicationController', _rc_values),
+}
+
+
+class BayWatcher(object):
+    """Watch the pods, services and replication controllers of a bay.
+
+    Each kind of resource is listed once, then watched from the resource
+    version of the list by a green thread.  A watch which ends or fails is
+    opened again from the last resource version seen, and the resources are
+    listed again when the k8s master no longer has that version.  The
+    changes are kept by name until they are flushed, so a resource changing
+    several times between two flushes is written once.  The records of the
+    deleted resources, and of the resources missing from a list, are
+    deleted when flushed.
+    """
+
+    def __init__(self, bay_uuid, k8s_master_url):
+        self.bay_uuid = bay_uuid
+        self.k8s_master_url = k8s_master_url
+        self._client = swagger.ApiClient(k8s_master_url,
+                                         poolSize=len(RESOURCES))
+        self._pending = dict((kind, {}) for kind in RESOURCES)
+        # The names of the resources of each kind, when they were listed
+        # since the last flush.
+        self._listed = dict((kind, None) for kind in RESOURCES)
+        self._threads = []
+        self._stopped = False
+
+    def start(self):
+        for kind in RESOURCES:
+            self._threads.append(eventlet.spawn(self._watch, kind))
+
+    def stop(self):
+        self._stopped = True
+        for thread in self._threads:
+            thread.kill()
+        self._threads = []
+        self._client.close()
+
+    @staticmethod
+    def _path(kind):
+        return '/api/v1beta3/namespaces/default/%s' % kind
+
+    def _record(self, kind, resource, deleted=False):
+        name = resource['metadata']['name']
+        if deleted:
+            self._pending[kind][name] = None
+        else:
+            self._pending[kind][name] = RESOURCES[kind][1](resource)
+        return name
+
+    def _relist(self, kind):
+        # The resources are decoded one by one while the list is received,
+        # so the list of a large bay is never held whole in memory.
+        resources = self._client.listAPI(self._path(kind), None)
+        self._pending[kind] = {}
+        names = set()
+        for resource in resources:
+            names.add(self._record(kind, resource))
+        self._listed[kind] = names
+        return resources.fields['metadata']['resourceVersion']
+
+    def _watch(self, kind):
+        resource_version = None
+        while not self._stopped:
+            resource_version = self._watch_once(kind, resource_version)
+
+    def _watch_once(self, kind, resource_version):
+        """Watch a kind of resource of the bay until the watch ends.
+
+        :param resource_version: the resource version to watch from, or None
+                                 to list the resources first.
+        :returns: the resource version to watch from next, or None.
+        """
+        events = None
+        timeout = cfg.CONF.kubernetes.k8s_watch_timeout
+        try:
+            if resource_version is None:
+                resource_version = self._relist(kind)
+            started = time.time()
+            events = self._client.streamAPI(
+                self._path(kind),
+                {'watch': 'true', 'resourceVersion': resource_version},
+                timeout=timeout)
+            for event in events:
+                if event.get('type') == 'ERROR':
+                    # The resource version is too old to watch from.
+                    LOG.debug('Listing the %(kind)s of bay %(bay)s again: '
+                              '%(error)s' % {'kind': kind,
+                                             'bay': self.bay_uuid,
+                                             'error': event.get('object')})
+                    return None
+                resource = event['object']
+                resource_version = resource['metadata']['resourceVersion']
+                if event.get('type') in ('ADDED', 'MODIFIED'):
+                    self._record(kind, resource)
+                elif event.get('type') == 'DELETED':
+                    self._record(kind, resource, deleted=True)
+            return resource_version
+        except Exception as e:
+            if (resource_version is not None and
+                    not isinstance(e, error.HTTPError) and
+                    time.time() - started >= timeout):
+                # The watch timed out without any change.
+                return resource_version
+            LOG.warning(_LW("Unable to watch the %(kind)s of bay %(bay)s: "
+                            "%(error)s"),
+                        {'kind': kind, 'bay': self.bay_uuid, 'error': e})
+            eventlet.sleep(cfg.CONF.kubernetes.k8s_watch_retry_interval)
+            if isinstance(e, error.HTTPError):
+                return None
+            return resource_version
+        finally:
+            if events is not None:
+                events.close()
+
+    def flush(self, context):
+        """Write the changes watched since the last flush.
+
+        The changes of each kind of resource are written with one DB
+        transaction.
+        """
+        for kind, pending in self._pending.items():
+            listed = self._listed[kind]
+            if not pending and listed is None:
+                continue
+            self._pending[kind] = {}
+            self._listed[kind] = None
+            names = None
+            if listed is not None:
+                # The resources added since the list are kept as well.
+                names = listed.union(name for name, values in pending.items()
+                                     if values is not None)
+            obj_class = getattr(objects, RESOURCES[kind][0])
+            try:
+                obj_class.update_by_names(context, self.bay_uuid, pending,
+                                          names)
+            except Exception:
+                LOG.exception(_LE('Unable to save the %(kind)s of bay '
+                                  '%(bay)s'),
+                              {'kind': kind, 'bay': self.bay_uuid})
+
+
+class K8sWatchService(object):
+    """Keep the Kubernetes resources of the bays in sync with their master.
+
+    A :class:`BayWatcher` watches each Kubernetes bay of this conductor, so
+    the status of the pods, services and replication controllers read
+    through the API is fresh without calling Kubernetes on each request.
+    The watched changes of all the bays are written every
+    ``kubernetes.k8s_watch_flush_interval`` seconds by a single looping
+    call.  When created with a ConductorRing, only the bays this conductor
+    owns on the ring are watched.
+    """
+
+    def __init__(self, ring=None):
+        self._ring = ring
+        self._watchers = {}
+        self._timer = None
+        self._context = context.make_admin_context(all_tenants=True)
+
+    def is_watching(self, bay):
+        return bay.uuid in self._watchers
+
+    def owns(self, bay):
+        return self._ring is None or self._ring.is_owner(bay.uuid)
+
+    def sync(self, ctx):
+        """Watch the Kubernetes bays of this conductor, and only those.
+
+        The watch of a bay is opened again when the URL of its master
+        changes.
+        """
+        bays = objects.Bay.list(ctx, filters={'status': WATCHED_STATUSES})
+        baymodels = dict((baymodel.uuid, baymodel)
+                         for baymodel in objects.BayModel.list(ctx))
+        urls = {}
+        for bay in bays:
+            baymodel = baymodels.get(bay.baymodel_id)
+            if (baymodel is not None and baymodel.coe == 'kubernetes' and
+                    bay.api_address and self.owns(bay)):
+                urls[bay.uuid] = kube.get_k8s_master_url(bay, baymodel)
+
+        for bay_uuid, watcher in list(self._watchers.items()):
+            if urls.get(bay_uuid) != watcher.k8s_master_url:
+                self._unwatch(bay_uuid)
+
+        for bay_uuid, url in urls.items():
+            if bay_uuid not in self._watchers:
+                LOG.debug("Watching the k8s master of bay %s" % bay_uuid)
+                watcher = BayWatcher(bay_uuid, url)
+                watcher.start()
+                self._watchers[bay_uuid] = watcher
+
+        if self._watchers and self._timer is None:
+            self._timer = loopingcall.FixedIntervalLoopingCall(f=self.flush)
+            self._timer.start(cfg.CONF.kubernetes.k8s_watch_flush_interval)
+
+    def _unwatch(self, bay_uuid):
+        LOG.debug("Stopped watching the k8s master of bay %s" % bay_uuid)
+        watcher = self._watchers.pop(bay_uuid)
+        watcher.flush(self._context)
+        watcher.stop()
+
+    def flush(self):
+        if not self._watchers:
+            self._timer = None
+            raise loopingcall.LoopingCallDone()
+
+        for watcher in list(self._watchers.values()):
+            watcher.flush(self._context)
@@ -0,0 +1,139 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Periodic tasks of the Magnum conductor."""
+
+from oslo_config import cfg
+from oslo_log import log as logging
+from oslo_utils import timeutils
+
+from magnum.common import clients
+from magnum.common import context
+from magnum.common import exception
+from magnum.i18n import _
+from magnum.i18n import _LI
+from magnum.i18n import _LW
+from magnum import objects
+from magnum.objects.bay import Status as bay_status
+from magnum.openstack.common import loopingcall
+from magnum.openstack.common import periodic_task
+
+
+cfg.CONF.import_opt('bay_create_timeout',
+                    'magnum.conductor.handlers.bay_conductor',
+                    group='bay_heat')
+
+LOG = logging.getLogger(__name__)
+
+# Minutes after which a bay whose stack was never created is failed, when
+# bay_heat.bay_create_timeout is not set, and after which a bay deleted
+# without a stack is removed.
+STACKLESS_BAY_TIMEOUT = 60
+
+IN_PROGRESS_STATUSES = [bay_status.CREATE_IN_PROGRESS,
+                        bay_status.UPDATE_IN_PROGRESS,
+                        bay_status.DELETE_IN_PROGRESS]
+
+
+class ConductorPeriodicTasks(periodic_task.PeriodicTasks):
+    """Magnum periodic tasks.
+
+    :param heat_poller: the HeatPollerService of the conductor.
+    :param k8s_watcher: the K8sWatchService of the conductor, if any.
+    """
+
+    def __init__(self, heat_poller, k8s_watcher=None):
+        super(ConductorPeriodicTasks, self).__init__()
+        self.heat_poller = heat_poller
+        self.k8s_watcher = k8s_watcher
+
+    @periodic_task.periodic_task(run_immediately=True)
+    def sync_bay_status(self, ctx):
+        """Resume polling the bays that no conductor is polling.
+
+        Bays are left in progress when the conductor polling them stops,
+        e.g. on a restart.  Each conductor only takes over the bays it
+        owns on the hash ring, and each bay is locked before it is polled,
+        so that it is only taken over by one conductor.
+
+        A bay which is still creating without a stack after
+        ``bay_heat.bay_create_timeout`` minutes, e.g. because the request
+        to create its stack was lost, is failed.  A bay which is still
+        deleting without a stack after STACKLESS_BAY_TIMEOUT minutes has
+        nothing left to delete in Heat, and is removed.
+        """
+        bays = objects.Bay.list(ctx,
+                                filters={'status': IN_PROGRESS_STATUSES})
+        bays = [bay for bay in bays if self.heat_poller.owns(bay)]
+        for bay in bays:
+            if not bay.stack_id:
+                self._sync_stackless_bay(bay)
+
+        bays = [bay for bay in bays
+                if bay.stack_id and not self.heat_poller.is_polling(bay)]
+        if not bays:
+            return
+
+        osc = clients.OpenStackClients(ctx)
+        for bay in bays:
+            if self.heat_poller.add(osc, bay):
+                LOG.info(_LI('Resumed polling bay %(bay)s with status '
+                             '%(status)s'),
+                         {'bay': bay.uuid, 'status': bay.status})
+
+    @staticmethod
+    def _sync_stackless_bay(bay):
+        if bay.status == bay_status.CREATE_IN_PROGRESS:
+            timeout = (cfg.CONF.bay_heat.bay_create_timeout or
+                       STACKLESS_BAY_TIMEOUT)
+            if (bay.created_at is None or
+                    not timeutils.is_older_than(bay.created_at,
+                                                timeout * 60)):
+                return
+            LOG.warning(_LW('The stack of bay %s was not created in time'),
+                        bay.uuid)
+            bay.status = bay_status.CREATE_FAILED
+            bay.status_reason = _('The stack of the bay was not created '
+                                  'within %s minutes.') % timeout
+            bay.save()
+        elif bay.status == bay_status.DELETE_IN_PROGRESS:
+            # The bay is saved when its deletion starts.
+            deleted_at = bay.updated_at or bay.created_at
+            if (deleted_at is None or
+                    not timeutils.is_older_than(deleted_at,
+                                                STACKLESS_BAY_TIMEOUT * 60)):
+                return
+            LOG.warning(_LW('Removing bay %s, deleted without a stack'),
+                        bay.uuid)
+            try:
+                bay.destroy()
+            except exception.BayNotFound:
+                pass
+
+    @periodic_task.periodic_task(run_immediately=True)
+    def sync_k8s_watches(self, ctx):
+        """Watch the Kubernetes bays created or moved to this conductor.
+
+        The watches of the bays which were deleted, or which this conductor
+        no longer owns on the hash ring, are stopped.
+        """
+        if self.k8s_watcher is not None:
+            self.k8s_watcher.sync(ctx)
+
+
+def setup(heat_poller, k8s_watcher=None):
+    """Start running the periodic tasks of the conductor."""
+    tasks = ConductorPeriodicTasks(heat_poller, k8s_watcher)
+    ctx = context.make_admin_context(all_tenants=True)
+    timer = loopingcall.DynamicLoopingCall(tasks.run_periodic_tasks, ctx)
+    timer.start(periodic_interval_max=periodic_task.DEFAULT_INTERVAL)
+    return timer
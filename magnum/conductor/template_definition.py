@@ -12,15 +12,19 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 import abc
+import collections
 import uuid
 
+import eventlet
 from oslo_config import cfg
+from oslo_log import log as logging
 from pkg_resources import iter_entry_points
 import requests
 import six
 
 from magnum.common import exception
 from magnum.i18n import _
+from magnum.i18n import _LE
 
 from magnum.common import paths
 
@@ -60,6 +64,14 @@ template_def_opts = [
     cfg.StrOpt('public_swarm_discovery_url',
                default='https://discovery-stage.hub.docker.com/v1/clusters',
                help=_('Url for swarm public discovery endpoint.')),
+    cfg.IntOpt('discovery_token_pool_size',
+               default=0,
+               help=_('Number of discovery tokens fetched ahead of bay '
+                      'creation from each discovery service, so that '
+                      'creating a bay does not wait on the discovery '
+                      'service. The pools are filled when the conductor '
+                      'starts. Fetching tokens ahead is opt-in: 0, the '
+                      'default, fetches each token on bay creation.')),
     cfg.ListOpt('enabled_definitions',
                 default=['magnum_vm_atomic_k8s', 'magnum_vm_coreos_k8s',
                          'magnum_vm_atomic_swarm'],
@@ -68,6 +80,65 @@ template_def_opts = [
 
 cfg.CONF.register_opts(template_def_opts, group='bay')
 
+LOG = logging.getLogger(__name__)
+
+
+class DiscoveryTokenPool(object):
+    """A pool of discovery tokens fetched ahead of the bays using them.
+
+    Each token is handed out once.  The pool is refilled in the background
+    up to ``bay.discovery_token_pool_size`` tokens, and a token is fetched
+    right away when the pool is empty.
+
+    :param name: the name of the pool in the logs.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._tokens = collections.deque()
+        self._refilling = False
+
+    @property
+    def depth(self):
+        """The number of tokens in the pool."""
+        return len(self._tokens)
+
+    def get(self, fetch_token):
+        """Take a token from the pool.
+
+        :param fetch_token: a function fetching a new token from the
+                            discovery service.
+        """
+        if self._tokens:
+            token = self._tokens.popleft()
+        else:
+            token = fetch_token()
+        self.fill(fetch_token)
+        return token
+
+    def fill(self, fetch_token):
+        """Fill the pool in the background, unless it is being filled.
+
+        :param fetch_token: a function fetching a new token from the
+                            discovery service.
+        """
+        size = cfg.CONF.bay.discovery_token_pool_size
+        if size > 0 and not self._refilling:
+            self._refilling = True
+            eventlet.spawn_n(self._refill, fetch_token, size)
+
+    def _refill(self, fetch_token, size):
+        try:
+            while len(self._tokens) < size:
+                self._tokens.append(fetch_token())
+        except Exception:
+            LOG.exception(_LE('Unable to refill the %s discovery token '
+                              'pool'), self.name)
+        finally:
+            self._refilling = False
+        LOG.debug("Discovery token pool %(name)s holds %(depth)d tokens" %
+                  {'name': self.name, 'depth': self.depth})
+
 
 class ParameterMapping(object):
     """A ParameterMapping is an association of a Heat parameter name with
@@ -235,6 +306,18 @@ class TemplateDefinition(object):
 
         raise exception.BayTypeNotEnabled(platform=platform, os=os, coe=coe)
 
+    @classmethod
+    def fill_token_pools(cls):
+        """Fill the discovery token pools of the enabled definitions."""
+        for type_definitions in cls.get_template_definitions().values():
+            for name, def_class in type_definitions.items():
+                if name in cfg.CONF.bay.enabled_definitions:
+                    def_class.fill_token_pool()
+
+    @classmethod
+    def fill_token_pool(cls):
+        """Fill the discovery token pool of the definition, if it has one."""
+
     def add_parameter(self, *args, **kwargs):
         param = ParameterMapping(*args, **kwargs)
         self.param_mappings.append(param)
@@ -333,17 +416,28 @@ class CoreOSK8sTemplateDefinition(AtomicK8sTemplateDefinition):
         {'platform': 'vm', 'os': 'coreos', 'coe': 'kubernetes'},
     ]
 
+    token_pool = DiscoveryTokenPool('coreos')
+
     def __init__(self):
         super(CoreOSK8sTemplateDefinition, self).__init__()
         self.add_parameter('ssh_authorized_key',
                            baymodel_attr='ssh_authorized_key')
 
     @staticmethod
-    def get_token():
+    def fetch_token():
         discovery_url = cfg.CONF.bay.coreos_discovery_token_url
-        if discovery_url:
-            coreos_token_url = requests.get(discovery_url)
-            token = str(coreos_token_url.text.split('/')[3])
+        coreos_token_url = requests.get(discovery_url)
+        return str(coreos_token_url.text.split('/')[3])
+
+    @classmethod
+    def fill_token_pool(cls):
+        if cfg.CONF.bay.coreos_discovery_token_url:
+            cls.token_pool.fill(cls.fetch_token)
+
+    @classmethod
+    def get_token(cls):
+        if cfg.CONF.bay.coreos_discovery_token_url:
+            token = cls.token_pool.get(cls.fetch_token)
         else:
             token = uuid.uuid4().hex
         return token
@@ -367,6 +461,8 @@ class AtomicSwarmTemplateDefinition(BaseTemplateDefinition):
         {'platform': 'vm', 'os': 'fedora-atomic', 'coe': 'swarm'},
     ]
 
+    token_pool = DiscoveryTokenPool('swarm')
+
     def __init__(self):
         super(AtomicSwarmTemplateDefinition, self).__init__()
         self.add_parameter('number_of_nodes',
@@ -383,10 +479,19 @@ class AtomicSwarmTemplateDefinition(BaseTemplateDefinition):
                         bay_attr='discovery_url')
 
     @staticmethod
-    def get_public_token():
+    def fetch_public_token():
         token_id = requests.post(cfg.CONF.bay.public_swarm_discovery_url).text
         return 'token://%s' % token_id
 
+    @classmethod
+    def fill_token_pool(cls):
+        if cfg.CONF.bay.public_swarm_discovery:
+            cls.token_pool.fill(cls.fetch_public_token)
+
+    @classmethod
+    def get_public_token(cls):
+        return cls.token_pool.get(cls.fetch_public_token)
+
     @staticmethod
     def parse_discovery_url(bay):
         strings = dict(bay_id=bay.id, bay_uuid=bay.uuid)
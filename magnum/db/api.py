@@ -127,7 +127,8 @@ class Connection(object):
     def create_bay_lock(self, bay_uuid, conductor_id):
         """Create a new baylock.
 
-        This method will fail if the bay has already been locked.
+        This method will fail if the bay has already been locked.  The lock
+        is leased for ``conductor.lock_lease_timeout`` seconds.
 
         :param bay_uuid: The uuid of a bay.
         :param conductor_id: The id of a conductor.
@@ -140,7 +141,7 @@ class Connection(object):
         """Steal lock of a bay.
 
         Lock the bay with new_conductor_id if the bay is currently locked by
-        old_conductor_id.
+        old_conductor_id and the lease on the lock has expired.
 
         :param bay_uuid: The uuid of a bay.
         :param old_conductor_id: The id of the old conductor.
@@ -158,6 +159,13 @@ class Connection(object):
         :returns: None if success. True otherwise.
         """
 
+    @abc.abstractmethod
+    def renew_bay_locks(self, conductor_id):
+        """Renew the leases on all the bay locks of a conductor.
+
+        :param conductor_id: The id of a conductor.
+        """
+
     @abc.abstractmethod
     def get_baymodel_list(self, context, columns=None, filters=None,
                           limit=None, marker=None, sort_key=None,
@@ -329,6 +337,14 @@ class Connection(object):
         :raises: BayNotFound
         """
 
+    @abc.abstractmethod
+    def update_container_statuses(self, statuses):
+        """Update the status of several containers at once.
+
+        :param statuses: A dict mapping the uuid of each container to its
+                         new status.
+        """
+
     @abc.abstractmethod
     def get_node_list(self, context, columns=None, filters=None, limit=None,
                       marker=None, sort_key=None, sort_dir=None):
@@ -493,6 +509,17 @@ class Connection(object):
         :raises: BayNotFound
         """
 
+    @abc.abstractmethod
+    def update_pods_by_name(self, bay_uuid, values, names=None):
+        """Update properties of several pods of a bay at once.
+
+        :param bay_uuid: The uuid of the bay of the pods.
+        :param values: A dict mapping the name of each pod to the dict of
+                       its new properties, or to None to delete it.
+        :param names: The names of all the pods of the bay, when they
+                      were listed.  The other pods are deleted.
+        """
+
     @abc.abstractmethod
     def get_service_list(self, context, columns=None, filters=None, limit=None,
                          marker=None, sort_key=None, sort_dir=None):
@@ -585,6 +612,17 @@ class Connection(object):
         :raises: BayNotFound
         """
 
+    @abc.abstractmethod
+    def update_services_by_name(self, bay_uuid, values, names=None):
+        """Update properties of several services of a bay at once.
+
+        :param bay_uuid: The uuid of the bay of the services.
+        :param values: A dict mapping the name of each service to the dict
+                       of its new properties, or to None to delete it.
+        :param names: The names of all the services of the bay, when they
+                      were listed.  The other services are deleted.
+        """
+
     @abc.abstractmethod
     def get_rc_list(self, context, columns=None, filters=None, limit=None,
                     marker=None, sort_key=None, sort_dir=None):
@@ -673,3 +711,32 @@ class Connection(object):
         :param rc_id: The id or uuid of a ReplicationController.
         :returns: A ReplicationController.
         """
+
+    @abc.abstractmethod
+    def update_rcs_by_name(self, bay_uuid, values, names=None):
+        """Update properties of several ReplicationControllers of a bay.
+
+        :param bay_uuid: The uuid of the bay of the ReplicationControllers.
+        :param values: A dict mapping the name of each ReplicationController
+                       to the dict of its new properties, or to None to
+                       delete it.
+        :param names: The names of all the ReplicationControllers of the
+                      bay, when they were listed.  The other
+                      ReplicationControllers are deleted.
+        """
+
+    @abc.abstractmethod
+    def create_k8s_resources(self, pods, services, rcs):
+        """Create pods, services and ReplicationControllers at once.
+
+        All the resources are created in a single transaction, so either
+        all or none of them are.
+
+        :param pods: A list of dicts, each with the properties of a pod.
+        :param services: A list of dicts, each with the properties of a
+                         service.
+        :param rcs: A list of dicts, each with the properties of a
+                    ReplicationController.
+        :returns: The created pods, services and ReplicationControllers,
+                  as a tuple of three lists.
+        """
@@ -0,0 +1,30 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""add container docker_id
+
+Revision ID: 3f2c8b1d0e6a
+Revises: 4e263f236334
+Create Date: 2015-06-10 14:02:11.384215
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '3f2c8b1d0e6a'
+down_revision = '4e263f236334'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.add_column('container',
+                  sa.Column('docker_id', sa.String(length=64), nullable=True))
@@ -0,0 +1,31 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""add baylock lease
+
+Revision ID: 4e263f236334
+Revises: 156ceb17fb0a
+Create Date: 2015-06-08 10:21:37.206432
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '4e263f236334'
+down_revision = '156ceb17fb0a'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.add_column('baylock',
+                  sa.Column('expires_at', sa.DateTime(), nullable=True))
+    op.create_index('baylock_conductor_id_idx', 'baylock', ['conductor_id'])
@@ -14,6 +14,9 @@
 
 """SQLAlchemy storage backend."""
 
+import collections
+import datetime
+
 from oslo_config import cfg
 from oslo_db import exception as db_exc
 from oslo_db.sqlalchemy import session as db_session
@@ -30,6 +33,8 @@ from magnum.db.sqlalchemy import models
 from magnum.i18n import _
 
 CONF = cfg.CONF
+CONF.import_opt('lock_lease_timeout', 'magnum.conductor.config',
+                group='conductor')
 
 LOG = log.getLogger(__name__)
 
@@ -100,6 +105,29 @@ def _paginate_query(model, limit=None, marker=None, sort_key=None,
     return query.all()
 
 
+def _update_by_name(model, bay_uuid, values, names=None):
+    """Update the rows of a bay by name, in a single transaction.
+
+    The rows whose values are None are deleted, and so are the rows whose
+    name is not in ``names`` when it is given.
+    """
+    session = get_session()
+    with session.begin():
+        if names is not None:
+            query = model_query(model, session=session)
+            query = query.filter_by(bay_uuid=bay_uuid)
+            if names:
+                query = query.filter(~model.name.in_(names))
+            query.delete(synchronize_session=False)
+        for name, row_values in values.items():
+            query = model_query(model, session=session)
+            query = query.filter_by(bay_uuid=bay_uuid, name=name)
+            if row_values is None:
+                query.delete(synchronize_session=False)
+            else:
+                query.update(row_values, synchronize_session=False)
+
+
 class Connection(api.Connection):
     """SqlAlchemy connection."""
 
@@ -107,6 +135,9 @@ class Connection(api.Connection):
         pass
 
     def _add_tenant_filters(self, context, query):
+        if context.is_admin and context.all_tenants:
+            return query
+
         if context.project_id:
             query = query.filter_by(project_id=context.project_id)
         else:
@@ -134,6 +165,8 @@ class Connection(api.Connection):
             query = query.filter_by(project_id=filters['project_id'])
         if 'user_id' in filters:
             query = query.filter_by(user_id=filters['user_id'])
+        if 'status' in filters:
+            query = query.filter(models.Bay.status.in_(filters['status']))
 
         return query
 
@@ -248,6 +281,11 @@ class Connection(api.Connection):
             ref.update(values)
         return ref
 
+    @staticmethod
+    def _bay_lock_expires_at():
+        lease = datetime.timedelta(seconds=CONF.conductor.lock_lease_timeout)
+        return timeutils.utcnow() + lease
+
     def create_bay_lock(self, bay_uuid, conductor_id):
         session = get_session()
         with session.begin():
@@ -255,8 +293,9 @@ class Connection(api.Connection):
             lock = query.filter_by(bay_uuid=bay_uuid).first()
             if lock is not None:
                 return lock.conductor_id
-            session.add(models.BayLock(bay_uuid=bay_uuid,
-                                       conductor_id=conductor_id))
+            session.add(models.BayLock(
+                bay_uuid=bay_uuid, conductor_id=conductor_id,
+                expires_at=self._bay_lock_expires_at()))
 
     def steal_bay_lock(self, bay_uuid, old_conductor_id, new_conductor_id):
         session = get_session()
@@ -265,10 +304,13 @@ class Connection(api.Connection):
             lock = query.filter_by(bay_uuid=bay_uuid).first()
             if lock is None:
                 return True
-            elif lock.conductor_id != old_conductor_id:
+            elif (lock.conductor_id != old_conductor_id or
+                    (lock.expires_at is not None and
+                     lock.expires_at > timeutils.utcnow())):
                 return lock.conductor_id
             else:
-                lock.update({'conductor_id': new_conductor_id})
+                lock.update({'conductor_id': new_conductor_id,
+                             'expires_at': self._bay_lock_expires_at()})
 
     def release_bay_lock(self, bay_uuid, conductor_id):
         session = get_session()
@@ -280,6 +322,14 @@ class Connection(api.Connection):
             if count == 0:
                 return True
 
+    def renew_bay_locks(self, conductor_id):
+        session = get_session()
+        with session.begin():
+            query = model_query(models.BayLock, session=session)
+            query = query.filter_by(conductor_id=conductor_id)
+            query.update({'expires_at': self._bay_lock_expires_at()},
+                         synchronize_session=False)
+
     def _add_baymodels_filters(self, query, filters):
         if filters is None:
             filters = []
@@ -408,6 +458,10 @@ class Connection(api.Connection):
 
         if 'name' in filters:
             query = query.filter_by(name=filters['name'])
+        if 'uuid' in filters:
+            query = query.filter(models.Container.uuid.in_(filters['uuid']))
+        if 'bay_uuid' in filters:
+            query = query.filter_by(bay_uuid=filters['bay_uuid'])
         if 'image_id' in filters:
             query = query.filter_by(image_id=filters['image_id'])
         if 'project_id' in filters:
@@ -502,6 +556,18 @@ class Connection(api.Connection):
             ref.update(values)
         return ref
 
+    def update_container_statuses(self, statuses):
+        uuids_by_status = collections.defaultdict(list)
+        for uuid, status in statuses.items():
+            uuids_by_status[status].append(uuid)
+
+        session = get_session()
+        with session.begin():
+            for status, uuids in uuids_by_status.items():
+                query = model_query(models.Container, session=session)
+                query = query.filter(models.Container.uuid.in_(uuids))
+                query.update({'status': status}, synchronize_session=False)
+
     def _add_nodes_filters(self, query, filters):
         if filters is None:
             filters = []
@@ -708,6 +774,9 @@ class Connection(api.Connection):
             ref.update(values)
         return ref
 
+    def update_pods_by_name(self, bay_uuid, values, names=None):
+        _update_by_name(models.Pod, bay_uuid, values, names)
+
     def _add_services_filters(self, query, filters):
         if filters is None:
             filters = []
@@ -814,6 +883,9 @@ class Connection(api.Connection):
             ref.update(values)
         return ref
 
+    def update_services_by_name(self, bay_uuid, values, names=None):
+        _update_by_name(models.Service, bay_uuid, values, names)
+
     def _add_rcs_filters(self, query, filters):
         if filters is None:
             filters = []
@@ -914,3 +986,31 @@ class Connection(api.Connection):
 
             ref.update(values)
         return ref
+
+    def update_rcs_by_name(self, bay_uuid, values, names=None):
+        _update_by_name(models.ReplicationController, bay_uuid, values, names)
+
+    def create_k8s_resources(self, pods, services, rcs):
+        session = get_session()
+        created = ([], [], [])
+        with session.begin():
+            for refs, model, already_exists, values_list in (
+                    (created[0], models.Pod,
+                     exception.PodAlreadyExists, pods),
+                    (created[1], models.Service,
+                     exception.ServiceAlreadyExists, services),
+                    (created[2], models.ReplicationController,
+                     exception.ReplicationControllerAlreadyExists, rcs)):
+                for values in values_list:
+                    # ensure defaults are present for new resources
+                    if not values.get('uuid'):
+                        values['uuid'] = utils.generate_uuid()
+
+                    ref = model()
+                    ref.update(values)
+                    try:
+                        ref.save(session=session)
+                    except db_exc.DBDuplicateEntry:
+                        raise already_exists(uuid=values['uuid'])
+                    refs.append(ref)
+        return created
@@ -23,6 +23,7 @@ from oslo_db import options as db_options
 from oslo_db.sqlalchemy import models
 import six.moves.urllib.parse as urlparse
 from sqlalchemy import Column
+from sqlalchemy import DateTime
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Integer
 from sqlalchemy import schema
@@ -139,11 +140,13 @@ class BayLock(Base):
     __tablename__ = 'baylock'
     __table_args__ = (
         schema.UniqueConstraint('bay_uuid', name='uniq_baylock0bay_uuid'),
+        schema.Index('baylock_conductor_id_idx', 'conductor_id'),
         table_args()
         )
     id = Column(Integer, primary_key=True)
     bay_uuid = Column(String(36))
     conductor_id = Column(String(64))
+    expires_at = Column(DateTime)
 
 
 class BayModel(Base):
@@ -190,6 +193,7 @@ class Container(Base):
     command = Column(String(255))
     bay_uuid = Column(String(36))
     status = Column(String(20))
+    docker_id = Column(String(64))
 
 
 class Node(Base):
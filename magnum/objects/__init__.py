@@ -16,6 +16,7 @@ from magnum.objects import bay
 from magnum.objects import baylock
 from magnum.objects import baymodel
 from magnum.objects import container
+from magnum.objects import manifest
 from magnum.objects import node
 from magnum.objects import pod
 from magnum.objects import replicationcontroller as rc
@@ -26,6 +27,7 @@ Container = container.Container
 Bay = bay.Bay
 BayLock = baylock.BayLock
 BayModel = baymodel.BayModel
+Manifest = manifest.Manifest
 Node = node.Node
 Pod = pod.Pod
 ReplicationController = rc.ReplicationController
@@ -35,6 +37,7 @@ __all__ = (Bay,
            BayLock,
            BayModel,
            Container,
+           Manifest,
            Node,
            Pod,
            ReplicationController,
@@ -21,7 +21,8 @@ from magnum.objects import base
 class BayLock(base.MagnumPersistentObject, base.MagnumObject,
               base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
-    VERSION = '1.0'
+    # Version 1.1: Add expires_at field
+    VERSION = '1.1'
 
     dbapi = dbapi.get_instance()
 
@@ -29,6 +30,7 @@ class BayLock(base.MagnumPersistentObject, base.MagnumObject,
         'id': fields.IntegerField(),
         'bay_uuid': fields.StringField(nullable=True),
         'conductor_id': fields.StringField(nullable=True),
+        'expires_at': fields.DateTimeField(nullable=True),
     }
 
     @base.remotable_classmethod
@@ -43,3 +45,7 @@ class BayLock(base.MagnumPersistentObject, base.MagnumObject,
     @base.remotable_classmethod
     def release(cls, bay_uuid, conductor_id):
         return cls.dbapi.release_bay_lock(bay_uuid, conductor_id)
+
+    @base.remotable_classmethod
+    def renew(cls, conductor_id):
+        return cls.dbapi.renew_bay_locks(conductor_id)
@@ -30,7 +30,10 @@ PAUSED = 'Paused'
 class Container(base.MagnumPersistentObject, base.MagnumObject,
                 base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
-    VERSION = '1.0'
+    # Version 1.1: Add docker_id field
+    # Version 1.2: Add update_statuses method
+    # Version 1.3: Add filters to list method
+    VERSION = '1.3'
 
     dbapi = dbapi.get_instance()
 
@@ -44,6 +47,7 @@ class Container(base.MagnumPersistentObject, base.MagnumObject,
         'command': fields.StringField(nullable=True),
         'bay_uuid': fields.StringField(nullable=True),
         'status': fields.StringField(nullable=True),
+        'docker_id': fields.StringField(nullable=True),
     }
 
     @staticmethod
@@ -98,7 +102,7 @@ class Container(base.MagnumPersistentObject, base.MagnumObject,
 
     @base.remotable_classmethod
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, filters=None):
         """Return a list of Container objects.
 
         :param context: Security context.
@@ -106,15 +110,27 @@ class Container(base.MagnumPersistentObject, base.MagnumObject,
         :param marker: pagination marker for large data sets.
         :param sort_key: column to sort results by.
         :param sort_dir: direction to sort. "asc" or "desc".
+        :param filters: filters when listing containers, e.g. a list of
+                        uuids as {'uuid': [...]}.
         :returns: a list of :class:`Container` object.
 
         """
         db_containers = cls.dbapi.get_container_list(context, limit=limit,
                                                      marker=marker,
                                                      sort_key=sort_key,
-                                                     sort_dir=sort_dir)
+                                                     sort_dir=sort_dir,
+                                                     filters=filters)
         return Container._from_db_object_list(db_containers, cls, context)
 
+    @base.remotable_classmethod
+    def update_statuses(cls, context, statuses):
+        """Update the status of several containers with one DB write.
+
+        :param context: Security context.
+        :param statuses: a dict mapping container uuids to their status.
+        """
+        cls.dbapi.update_container_statuses(statuses)
+
     @base.remotable
     def create(self, context=None):
         """Create a Container record in the DB.
@@ -0,0 +1,44 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from magnum.db import api as dbapi
+from magnum.objects import base
+
+
+@base.MagnumObjectRegistry.register
+class Manifest(base.MagnumObject):
+    """The Kubernetes resources of a manifest, saved together."""
+    # Version 1.0: Initial version
+    VERSION = '1.0'
+
+    dbapi = dbapi.get_instance()
+
+    fields = {}
+
+    @base.remotable_classmethod
+    def create_resources(cls, context, pods, services, rcs):
+        """Create pods, services and rcs records in one DB transaction.
+
+        Either all the records or none of them are created, and each object
+        is updated from its record.
+
+        :param context: Security context.
+        :param pods: a list of Pod objects.
+        :param services: a list of Service objects.
+        :param rcs: a list of ReplicationController objects.
+        """
+        resources = (pods, services, rcs)
+        db_resources = cls.dbapi.create_k8s_resources(
+            *[[obj.obj_get_changes() for obj in objs] for objs in resources])
+        for objs, db_objs in zip(resources, db_resources):
+            for obj, db_obj in zip(objs, db_objs):
+                obj._from_db_object(obj, db_obj)
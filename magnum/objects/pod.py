@@ -23,7 +23,9 @@ from magnum.objects import base
 class Pod(base.MagnumPersistentObject, base.MagnumObject,
           base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
-    VERSION = '1.0'
+    # Version 1.1: Add update_by_names method
+    # Version 1.2: Delete resources in update_by_names
+    VERSION = '1.2'
 
     dbapi = dbapi.get_instance()
 
@@ -126,6 +128,19 @@ class Pod(base.MagnumPersistentObject, base.MagnumObject,
                                          sort_dir=sort_dir)
         return Pod._from_db_object_list(db_pods, cls, context)
 
+    @base.remotable_classmethod
+    def update_by_names(cls, context, bay_uuid, values, names=None):
+        """Update several pods of a bay with one DB transaction.
+
+        :param context: Security context.
+        :param bay_uuid: the uuid of the bay of the pods.
+        :param values: a dict mapping the name of each pod to the dict of
+                       its changed fields, or to None to delete it.
+        :param names: the names of all the pods of the bay, when they were
+                      listed.  The other pods of the bay are deleted.
+        """
+        cls.dbapi.update_pods_by_name(bay_uuid, values, names)
+
     @base.remotable
     def create(self, context=None):
         """Create a Pod record in the DB.
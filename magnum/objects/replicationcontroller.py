@@ -22,7 +22,9 @@ from magnum.objects import base
 class ReplicationController(base.MagnumPersistentObject, base.MagnumObject,
                             base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
-    VERSION = '1.0'
+    # Version 1.1: Add update_by_names method
+    # Version 1.2: Delete resources in update_by_names
+    VERSION = '1.2'
 
     dbapi = dbapi.get_instance()
 
@@ -118,6 +120,19 @@ class ReplicationController(base.MagnumPersistentObject, base.MagnumObject,
                                        sort_dir=sort_dir)
         return ReplicationController._from_db_object_list(db_rcs, cls, context)
 
+    @base.remotable_classmethod
+    def update_by_names(cls, context, bay_uuid, values, names=None):
+        """Update several rcs of a bay with one DB transaction.
+
+        :param context: Security context.
+        :param bay_uuid: the uuid of the bay of the rcs.
+        :param values: a dict mapping the name of each rc to the dict of
+                       its changed fields, or to None to delete it.
+        :param names: the names of all the rcs of the bay, when they were
+                      listed.  The other rcs of the bay are deleted.
+        """
+        cls.dbapi.update_rcs_by_name(bay_uuid, values, names)
+
     @base.remotable
     def create(self, context=None):
         """Create a ReplicationController record in the DB.
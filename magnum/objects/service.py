@@ -24,7 +24,9 @@ from magnum.objects import fields as magnum_fields
 class Service(base.MagnumPersistentObject, base.MagnumObject,
               base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
-    VERSION = '1.0'
+    # Version 1.1: Add update_by_names method
+    # Version 1.2: Delete resources in update_by_names
+    VERSION = '1.2'
 
     dbapi = dbapi.get_instance()
 
@@ -129,6 +131,19 @@ class Service(base.MagnumPersistentObject, base.MagnumObject,
                                                  sort_dir=sort_dir)
         return Service._from_db_object_list(db_services, cls, context)
 
+    @base.remotable_classmethod
+    def update_by_names(cls, context, bay_uuid, values, names=None):
+        """Update several services of a bay with one DB transaction.
+
+        :param context: Security context.
+        :param bay_uuid: the uuid of the bay of the services.
+        :param values: a dict mapping the name of each service to the dict of
+                       its changed fields, or to None to delete it.
+        :param names: the names of all the services of the bay, when they were
+                      listed.  The other services of the bay are deleted.
+        """
+        cls.dbapi.update_services_by_name(bay_uuid, values, names)
+
     @base.remotable
     def create(self, context=None):
         """Create a Service record in the DB.
@@ -184,7 +184,7 @@ class TestPatch(api_base.FunctionalTest):
                                    [{'path': '/name', 'value': name,
                                      'op': 'replace'}])
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(200, response.status_code)
+        self.assertEqual(202, response.status_code)
 
         response = self.get_json('/bays/%s' % self.bay.uuid)
         self.assertEqual(name, response['name'])
@@ -206,7 +206,7 @@ class TestPatch(api_base.FunctionalTest):
                                    [{'path': '/name', 'value': name,
                                      'op': 'replace'}])
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(200, response.status_code)
+        self.assertEqual(202, response.status_code)
 
         response = self.get_json('/bays/%s' % self.bay.uuid)
         self.assertEqual(name, response['name'])
@@ -257,7 +257,20 @@ class TestPatch(api_base.FunctionalTest):
                                      'op': 'replace'}],
                                    expect_errors=True)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(200, response.status_code)
+        self.assertEqual(400, response.status_code)
+        self.assertIn('baymodel_id', response.json['error_message'])
+        self.assertFalse(self.mock_bay_update.called)
+        bay = objects.Bay.get_by_uuid(self.context, self.bay.uuid)
+        self.assertEqual(self.bay.baymodel_id, bay.baymodel_id)
+
+    def test_replace_name_not_cast(self):
+        response = self.patch_json('/bays/%s' % self.bay.uuid,
+                                   [{'path': '/name', 'value': 'bay_B',
+                                     'op': 'replace'}])
+        self.assertEqual(202, response.status_code)
+        self.assertFalse(self.mock_bay_update.called)
+        bay = objects.Bay.get_by_uuid(self.context, self.bay.uuid)
+        self.assertEqual('bay_B', bay.name)
 
     def test_replace_non_existent_baymodel_id(self):
         response = self.patch_json('/bays/%s' % self.bay.uuid,
@@ -294,7 +307,7 @@ class TestPatch(api_base.FunctionalTest):
             '/bays/%s' % self.bay.uuid,
             [{'path': '/name', 'value': name, 'op': 'add'}])
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(200, response.status_int)
+        self.assertEqual(202, response.status_int)
 
         response = self.get_json('/bays/%s' % self.bay.uuid)
         self.assertEqual(name, response['name'])
@@ -318,7 +331,7 @@ class TestPatch(api_base.FunctionalTest):
         ]
         response = self.patch_json('/bays/%s' % self.bay.uuid, json)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(200, response.status_code)
+        self.assertEqual(202, response.status_code)
 
         response = self.get_json('/bays/%s' % self.bay.uuid)
         self.assertEqual('bay_example_B', response['name'])
@@ -336,6 +349,16 @@ class TestPatch(api_base.FunctionalTest):
         self.assertEqual(400, response.status_int)
         self.assertTrue(response.json['error_message'])
 
+    def test_replace_node_count_pending(self):
+        response = self.patch_json('/bays/%s' % self.bay.uuid,
+                                   [{'path': '/node_count', 'value': 4,
+                                     'op': 'replace'}])
+        self.assertEqual(202, response.status_code)
+        self.assertEqual('UPDATE_IN_PROGRESS', response.json['status'])
+        self.assertEqual(4, response.json['node_count'])
+        bay = self.mock_bay_update.call_args[0][0]
+        self.assertEqual('UPDATE_IN_PROGRESS', bay.status)
+
     def test_remove_ok(self):
         response = self.get_json('/bays/%s' % self.bay.uuid)
         self.assertIsNotNone(response['name'])
@@ -343,7 +366,7 @@ class TestPatch(api_base.FunctionalTest):
         response = self.patch_json('/bays/%s' % self.bay.uuid,
                                    [{'path': '/name', 'op': 'remove'}])
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(200, response.status_code)
+        self.assertEqual(202, response.status_code)
 
         response = self.get_json('/bays/%s' % self.bay.uuid)
         self.assertIsNone(response['name'])
@@ -389,8 +412,19 @@ class TestPost(api_base.FunctionalTest):
         self.addCleanup(p.stop)
 
     def _simulate_rpc_bay_create(self, bay, bay_create_timeout):
-        bay.create()
-        return bay
+        bay.stack_id = 'stack1'
+        bay.save()
+
+    def test_create_bay_cast_failure(self):
+        self.mock_bay_create.side_effect = Exception('AMQP is down')
+        bdict = apiutils.bay_post_data()
+
+        response = self.post_json('/bays', bdict, expect_errors=True)
+
+        self.assertEqual(500, response.status_int)
+        bay = objects.Bay.get_by_uuid(self.context, bdict['uuid'])
+        self.assertEqual('CREATE_FAILED', bay.status)
+        self.assertIn('AMQP is down', bay.status_reason)
 
     @mock.patch('oslo_utils.timeutils.utcnow')
     def test_create_bay(self, mock_utcnow):
@@ -400,7 +434,7 @@ class TestPost(api_base.FunctionalTest):
 
         response = self.post_json('/bays', bdict)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(201, response.status_int)
+        self.assertEqual(202, response.status_int)
         # Check location header
         self.assertIsNotNone(response.location)
         expected_location = '/v1/bays/%s' % bdict['uuid']
@@ -412,6 +446,18 @@ class TestPost(api_base.FunctionalTest):
             response.json['created_at']).replace(tzinfo=None)
         self.assertEqual(test_time, return_created_at)
 
+    def test_create_bay_pending(self):
+        bdict = apiutils.bay_post_data()
+        response = self.post_json('/bays', bdict)
+        self.assertEqual(202, response.status_int)
+        self.assertEqual('CREATE_IN_PROGRESS', response.json['status'])
+
+        bay = objects.Bay.get_by_uuid(self.context, bdict['uuid'])
+        self.assertEqual('CREATE_IN_PROGRESS', bay.status)
+        self.assertEqual('stack1', bay.stack_id)
+        self.assertEqual(bay.uuid,
+                         self.mock_bay_create.call_args[0][0].uuid)
+
     def test_create_bay_doesnt_contain_id(self):
         with mock.patch.object(self.dbapi, 'create_bay',
                                wraps=self.dbapi.create_bay) as cc_mock:
@@ -428,7 +474,7 @@ class TestPost(api_base.FunctionalTest):
 
         response = self.post_json('/bays', bdict)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(201, response.status_int)
+        self.assertEqual(202, response.status_int)
         self.assertEqual(bdict['name'], response.json['name'])
         self.assertTrue(utils.is_uuid_like(response.json['uuid']))
 
@@ -450,7 +496,7 @@ class TestPost(api_base.FunctionalTest):
         bdict = apiutils.bay_post_data(baymodel_id=self.baymodel.name)
         response = self.post_json('/bays', bdict, expect_errors=True)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(201, response.status_int)
+        self.assertEqual(202, response.status_int)
 
     def test_create_bay_with_node_count_zero(self):
         bdict = apiutils.bay_post_data()
@@ -487,19 +533,17 @@ class TestPost(api_base.FunctionalTest):
         bdict['bay_create_timeout'] = None
         response = self.post_json('/bays', bdict, expect_errors=True)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(201, response.status_int)
+        self.assertEqual(202, response.status_int)
 
     def test_create_bay_with_no_timeout(self):
         def _simulate_rpc_bay_create(bay, bay_create_timeout):
             self.assertEqual(0, bay_create_timeout)
-            bay.create()
-            return bay
         self.mock_bay_create.side_effect = _simulate_rpc_bay_create
         bdict = apiutils.bay_post_data()
         del bdict['bay_create_timeout']
         response = self.post_json('/bays', bdict, expect_errors=True)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(201, response.status_int)
+        self.assertEqual(202, response.status_int)
 
     def test_create_bay_with_timeout_negative(self):
         bdict = apiutils.bay_post_data()
@@ -514,7 +558,125 @@ class TestPost(api_base.FunctionalTest):
         bdict['bay_create_timeout'] = 0
         response = self.post_json('/bays', bdict, expect_errors=True)
         self.assertEqual('application/json', response.content_type)
-        self.assertEqual(201, response.status_int)
+        self.assertEqual(202, response.status_int)
+
+
+class TestBulkPost(api_base.FunctionalTest):
+
+    def setUp(self):
+        super(TestBulkPost, self).setUp()
+        self.baymodel = obj_utils.create_test_baymodel(self.context)
+        p = mock.patch.object(rpcapi.API, 'bay_bulk_create')
+        self.mock_bay_bulk_create = p.start()
+        self.addCleanup(p.stop)
+
+    def _bulk_post_data(self, **kwargs):
+        bdict = apiutils.bay_post_data(name='bay')
+        del bdict['uuid']
+        data = {'bay': bdict}
+        data.update(kwargs)
+        return data
+
+    def test_create_bays_by_count(self):
+        response = self.post_json('/bays/bulk', self._bulk_post_data(count=3))
+        self.assertEqual('application/json', response.content_type)
+        self.assertEqual(202, response.status_int)
+        bays = response.json['bays']
+        self.assertEqual(['bay-0', 'bay-1', 'bay-2'],
+                         [b['name'] for b in bays])
+        self.assertEqual(['CREATE_IN_PROGRESS'] * 3,
+                         [b['status'] for b in bays])
+        self.assertEqual(3, len(set(b['uuid'] for b in bays)))
+        self.assertNotIn('next', response.json)
+
+        self.assertEqual(1, self.mock_bay_bulk_create.call_count)
+        rpc_bays, timeout = self.mock_bay_bulk_create.call_args[0]
+        self.assertEqual([b['uuid'] for b in bays],
+                         [b.uuid for b in rpc_bays])
+        self.assertEqual(15, timeout)
+        for bay in bays:
+            db_bay = objects.Bay.get_by_uuid(self.context, bay['uuid'])
+            self.assertEqual('CREATE_IN_PROGRESS', db_bay.status)
+            self.assertEqual(self.baymodel.uuid, db_bay.baymodel_id)
+
+    def test_create_bays_by_names(self):
+        response = self.post_json(
+            '/bays/bulk', self._bulk_post_data(names=['red', 'blue']))
+        self.assertEqual(202, response.status_int)
+        self.assertEqual(['red', 'blue'],
+                         [b['name'] for b in response.json['bays']])
+
+    def test_create_bays_no_timeout_specified(self):
+        data = self._bulk_post_data(count=2)
+        del data['bay']['bay_create_timeout']
+        response = self.post_json('/bays/bulk', data)
+        self.assertEqual(202, response.status_int)
+        self.assertEqual(0, self.mock_bay_bulk_create.call_args[0][1])
+
+    def test_create_bays_ignores_template_uuid(self):
+        data = self._bulk_post_data(count=2)
+        data['bay']['uuid'] = utils.generate_uuid()
+        response = self.post_json('/bays/bulk', data)
+        self.assertEqual(202, response.status_int)
+        self.assertNotIn(data['bay']['uuid'],
+                         [b['uuid'] for b in response.json['bays']])
+
+    def test_create_bays_cast_failure(self):
+        self.mock_bay_bulk_create.side_effect = Exception('AMQP is down')
+
+        response = self.post_json('/bays/bulk',
+                                  self._bulk_post_data(count=2),
+                                  expect_errors=True)
+
+        self.assertEqual(500, response.status_int)
+        bays = objects.Bay.list(self.context)
+        self.assertEqual(2, len(bays))
+        for bay in bays:
+            self.assertEqual('CREATE_FAILED', bay.status)
+            self.assertIn('AMQP is down', bay.status_reason)
+
+    def test_create_bays_without_count_or_names(self):
+        response = self.post_json('/bays/bulk', self._bulk_post_data(),
+                                  expect_errors=True)
+        self.assertEqual(400, response.status_int)
+        self.assertTrue(response.json['error_message'])
+        self.assertFalse(self.mock_bay_bulk_create.called)
+
+    def test_create_bays_with_count_and_names(self):
+        response = self.post_json(
+            '/bays/bulk', self._bulk_post_data(count=1, names=['red']),
+            expect_errors=True)
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(self.mock_bay_bulk_create.called)
+
+    def test_create_bays_with_invalid_count(self):
+        response = self.post_json('/bays/bulk', self._bulk_post_data(count=0),
+                                  expect_errors=True)
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(self.mock_bay_bulk_create.called)
+
+    def test_create_bays_over_limit(self):
+        cfg.CONF.set_override('max_bulk_bays', 2, group='api')
+        for data in [self._bulk_post_data(count=3),
+                     self._bulk_post_data(names=['red', 'blue', 'green'])]:
+            response = self.post_json('/bays/bulk', data, expect_errors=True)
+            self.assertEqual(400, response.status_int)
+            self.assertTrue(response.json['error_message'])
+
+        self.assertFalse(self.mock_bay_bulk_create.called)
+        self.assertEqual([], objects.Bay.list(self.context))
+
+    def test_create_bays_at_limit(self):
+        cfg.CONF.set_override('max_bulk_bays', 2, group='api')
+        response = self.post_json('/bays/bulk', self._bulk_post_data(count=2))
+        self.assertEqual(202, response.status_int)
+
+    def test_create_bays_with_baymodel_not_found(self):
+        data = self._bulk_post_data(count=2)
+        data['bay']['baymodel_id'] = utils.generate_uuid()
+        response = self.post_json('/bays/bulk', data, expect_errors=True)
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(self.mock_bay_bulk_create.called)
 
 
 class TestDelete(api_base.FunctionalTest):
@@ -540,6 +702,26 @@ class TestDelete(api_base.FunctionalTest):
         self.assertEqual('application/json', response.content_type)
         self.assertTrue(response.json['error_message'])
 
+    def test_delete_bay_in_progress(self):
+        self.mock_bay_delete.side_effect = None
+
+        response = self.delete('/bays/%s' % self.bay.uuid)
+
+        self.assertEqual(202, response.status_int)
+        self.mock_bay_delete.assert_called_once_with(self.bay.uuid)
+        response = self.get_json('/bays/%s' % self.bay.uuid)
+        self.assertEqual('DELETE_IN_PROGRESS', response['status'])
+
+    def test_delete_bay_cast_failure(self):
+        self.mock_bay_delete.side_effect = Exception('AMQP is down')
+
+        response = self.delete('/bays/%s' % self.bay.uuid,
+                               expect_errors=True)
+
+        self.assertEqual(500, response.status_int)
+        bay = objects.Bay.get_by_uuid(self.context, self.bay.uuid)
+        self.assertEqual(self.bay.status, bay.status)
+
     def test_delete_bay_not_found(self):
         uuid = utils.generate_uuid()
         response = self.delete('/bays/%s' % uuid, expect_errors=True)
@@ -551,19 +733,19 @@ class TestDelete(api_base.FunctionalTest):
         obj_utils.create_test_pod(self.context, bay_uuid=self.bay.uuid)
         response = self.delete('/bays/%s' % self.bay.uuid,
                                expect_errors=True)
-        self.assertEqual(204, response.status_int)
+        self.assertEqual(202, response.status_int)
 
     def test_delete_bay_with_services(self):
         obj_utils.create_test_service(self.context, bay_uuid=self.bay.uuid)
         response = self.delete('/bays/%s' % self.bay.uuid,
                                expect_errors=True)
-        self.assertEqual(204, response.status_int)
+        self.assertEqual(202, response.status_int)
 
     def test_delete_bay_with_replication_controllers(self):
         obj_utils.create_test_rc(self.context, bay_uuid=self.bay.uuid)
         response = self.delete('/bays/%s' % self.bay.uuid,
                                expect_errors=True)
-        self.assertEqual(204, response.status_int)
+        self.assertEqual(202, response.status_int)
 
     def test_delete_bay_with_name_not_found(self):
         response = self.delete('/bays/not_found', expect_errors=True)
@@ -574,7 +756,7 @@ class TestDelete(api_base.FunctionalTest):
     def test_delete_bay_with_name(self):
         response = self.delete('/bays/%s' % self.bay.name,
                                expect_errors=True)
-        self.assertEqual(204, response.status_int)
+        self.assertEqual(202, response.status_int)
 
     def test_delete_multiple_bay_by_name(self):
         obj_utils.create_test_bay(self.context, name='test_bay',
@@ -14,8 +14,10 @@ from magnum import objects
 from magnum.tests.unit.db import base as db_base
 from magnum.tests.unit.db import utils
 
+from docker import errors
 import mock
 from mock import patch
+import requests
 from webtest.app import AppError
 
 
@@ -45,13 +47,79 @@ class TestContainerController(db_base.DbTestCase):
         self.assertEqual(response.status_int, 201)
         self.assertTrue(mock_container_create.called)
 
-    @patch('magnum.conductor.api.API.container_show')
+    @patch('magnum.conductor.api.API.container_bulk_action')
+    def test_bulk_action(self, mock_container_bulk_action):
+        uuids = ['27e3153e-d5bf-4b7e-b517-fb518e17f34c',
+                 '3c8e9ee9-d4f7-4ab0-a5ed-6a1f6e0a2d6d']
+        mock_container_bulk_action.return_value = [
+            {'uuid': uuids[0], 'status': 'Stopped', 'error': None},
+            {'uuid': uuids[1], 'status': 'Running', 'error': 'hit error'}]
+        params = ('{"action": "stop", "containers": ["%s", "%s"]}'
+                  % tuple(uuids))
+        response = self.app.post('/v1/containers/actions',
+                                 params=params,
+                                 content_type='application/json')
+
+        self.assertEqual(200, response.status_int)
+        mock_container_bulk_action.assert_called_once_with(uuids, 'stop')
+        self.assertEqual(uuids, [r['uuid'] for r in response.json])
+        self.assertEqual(['Stopped', 'Running'],
+                         [r['status'] for r in response.json])
+        self.assertEqual('hit error', response.json[1]['error'])
+
+    @patch('magnum.conductor.api.API.container_bulk_action')
+    def test_bulk_action_invalid_action(self, mock_container_bulk_action):
+        params = ('{"action": "kill",'
+                  '"containers": ["27e3153e-d5bf-4b7e-b517-fb518e17f34c"]}')
+        response = self.app.post('/v1/containers/actions',
+                                 params=params,
+                                 content_type='application/json',
+                                 expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(mock_container_bulk_action.called)
+
+    @patch('magnum.conductor.api.API.container_bulk_action')
+    def test_bulk_action_without_containers(self, mock_container_bulk_action):
+        response = self.app.post('/v1/containers/actions',
+                                 params='{"action": "stop", "containers": []}',
+                                 content_type='application/json',
+                                 expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(mock_container_bulk_action.called)
+
+    @patch('magnum.conductor.api.API.image_prepull')
+    def test_prepull_images(self, mock_image_prepull):
+        params = ('{"bay_uuid": "fff114da-3bfa-4a0f-a123-c0dffad9718e",'
+                  '"images": ["ubuntu", "nginx:1.9"]}')
+        response = self.app.post('/v1/containers/prepull',
+                                 params=params,
+                                 content_type='application/json')
+
+        self.assertEqual(202, response.status_int)
+        mock_image_prepull.assert_called_once_with(
+            'fff114da-3bfa-4a0f-a123-c0dffad9718e', ['ubuntu', 'nginx:1.9'])
+
+    @patch('magnum.conductor.api.API.image_prepull')
+    def test_prepull_images_without_images(self, mock_image_prepull):
+        params = ('{"bay_uuid": "fff114da-3bfa-4a0f-a123-c0dffad9718e",'
+                  '"images": []}')
+        response = self.app.post('/v1/containers/prepull',
+                                 params=params,
+                                 content_type='application/json',
+                                 expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(mock_image_prepull.called)
+
+    @patch('magnum.conductor.api.API.container_sync_status')
     @patch('magnum.conductor.api.API.container_create')
     @patch('magnum.conductor.api.API.container_delete')
     def test_create_container_with_command(self,
                                            mock_container_delete,
                                            mock_container_create,
-                                           mock_container_show):
+                                           mock_container_sync_status):
         mock_container_create.side_effect = lambda x, y, z: z
         # Create a container with a command
         params = ('{"name": "My Docker", "image_id": "ubuntu",'
@@ -64,7 +132,7 @@ class TestContainerController(db_base.DbTestCase):
         # get all containers
         container = objects.Container.list(self.context)[0]
         container.status = 'Stopped'
-        mock_container_show.return_value = container
+        mock_container_sync_status.return_value = [container]
         response = self.app.get('/v1/containers')
         self.assertEqual(response.status_int, 200)
         self.assertEqual(1, len(response.json))
@@ -83,13 +151,13 @@ class TestContainerController(db_base.DbTestCase):
         self.assertEqual(0, len(c))
         self.assertTrue(mock_container_create.called)
 
-    @patch('magnum.conductor.api.API.container_show')
+    @patch('magnum.conductor.api.API.container_sync_status')
     @patch('magnum.conductor.api.API.container_create')
     @patch('magnum.conductor.api.API.container_delete')
     def test_create_container_with_bay_uuid(self,
                                             mock_container_delete,
                                             mock_container_create,
-                                            mock_container_show):
+                                            mock_container_sync_status):
         mock_container_create.side_effect = lambda x, y, z: z
         # Create a container with a command
         params = ('{"name": "My Docker", "image_id": "ubuntu",'
@@ -102,7 +170,7 @@ class TestContainerController(db_base.DbTestCase):
         # get all containers
         container = objects.Container.list(self.context)[0]
         container.status = 'Stopped'
-        mock_container_show.return_value = container
+        mock_container_sync_status.return_value = [container]
         response = self.app.get('/v1/containers')
         self.assertEqual(response.status_int, 200)
         self.assertEqual(1, len(response.json))
@@ -140,26 +208,39 @@ class TestContainerController(db_base.DbTestCase):
                           params=params, content_type='application/json')
         self.assertTrue(mock_container_create.not_called)
 
-    @patch('magnum.conductor.api.API.container_show')
+    @patch('magnum.conductor.api.API.container_sync_status')
     @patch('magnum.objects.Container.list')
     def test_get_all_containers(self, mock_container_list,
-                                mock_container_show):
+                                mock_container_sync_status):
         test_container = utils.get_test_container()
         containers = [objects.Container(self.context, **test_container)]
         mock_container_list.return_value = containers
-        mock_container_show.return_value = containers[0]
+        mock_container_sync_status.return_value = containers
 
         response = self.app.get('/v1/containers')
 
         mock_container_list.assert_called_once_with(mock.ANY,
                                                     1000, None, sort_dir='asc',
                                                     sort_key='id')
+        mock_container_sync_status.assert_called_once_with(containers)
         self.assertEqual(response.status_int, 200)
         actual_containers = response.json['containers']
         self.assertEqual(len(actual_containers), 1)
         self.assertEqual(actual_containers[0].get('uuid'),
                          test_container['uuid'])
 
+    @patch('magnum.conductor.api.API.container_sync_status')
+    @patch('magnum.objects.Container.list')
+    def test_get_all_containers_empty(self, mock_container_list,
+                                      mock_container_sync_status):
+        mock_container_list.return_value = []
+
+        response = self.app.get('/v1/containers')
+
+        self.assertEqual(response.status_int, 200)
+        self.assertEqual([], response.json['containers'])
+        self.assertFalse(mock_container_sync_status.called)
+
     @patch('magnum.conductor.api.API.container_show')
     @patch('magnum.objects.Container.get_by_uuid')
     def test_get_one_by_uuid(self, mock_container_get_by_uuid,
@@ -358,6 +439,246 @@ class TestContainerController(db_base.DbTestCase):
                           '/v1/containers/%s/logs' % container_uuid)
         self.assertFalse(mock_container_logs.called)
 
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_logs(self, mock_get_by_uuid, mock_docker_clients):
+        test_container = utils.get_test_container(docker_id='docker-id')
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        mock_docker = mock_docker_clients.get.return_value
+        mock_docker.logs_stream.return_value = iter(['line1\n', 'line2\n'])
+
+        container_uuid = test_container.get('uuid')
+        response = self.app.get(
+            '/v1/containers/%s/stream_logs?tail=10&since=1434000000'
+            '&timestamps=true&follow=true' % container_uuid)
+
+        self.assertEqual(200, response.status_int)
+        self.assertEqual('text/plain', response.content_type)
+        self.assertEqual('line1\nline2\n', response.body)
+        self.assertEqual(test_container.get('bay_uuid'),
+                         mock_docker_clients.get.call_args[0][0].uuid)
+        mock_docker.logs_stream.assert_called_once_with(
+            'docker-id', tail=10, since=1434000000, timestamps=True,
+            follow=True)
+
+    @patch('magnum.conductor.api.API.container_show')
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_name')
+    def test_stream_logs_without_docker_id(self, mock_get_by_name,
+                                           mock_docker_clients,
+                                           mock_container_show):
+        test_container = utils.get_test_container(docker_id=None)
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_name.return_value = test_container_obj
+        mock_container_show.return_value.docker_id = 'docker-id'
+        mock_docker = mock_docker_clients.get.return_value
+        mock_docker.logs_stream.return_value = iter(['line1\n'])
+
+        response = self.app.get('/v1/containers/%s/stream_logs'
+                                % test_container.get('name'))
+
+        self.assertEqual(200, response.status_int)
+        mock_container_show.assert_called_once_with(test_container['uuid'])
+        mock_docker.logs_stream.assert_called_once_with(
+            'docker-id', tail='all', since=None, timestamps=False,
+            follow=False)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_logs_invalid_tail(self, mock_get_by_uuid,
+                                      mock_docker_clients):
+        response = self.app.get('/v1/containers/%s/stream_logs?tail=-1'
+                                % utils.get_test_container()['uuid'],
+                                expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(mock_docker_clients.get.called)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_logs_docker_error(self, mock_get_by_uuid,
+                                      mock_docker_clients):
+        test_container = utils.get_test_container(docker_id='docker-id')
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        mock_response = mock.MagicMock(status_code=404)
+        mock_docker = mock_docker_clients.get.return_value
+        mock_docker.logs_stream.side_effect = errors.APIError(
+            'Not found', mock_response)
+
+        response = self.app.get('/v1/containers/%s/stream_logs'
+                                % test_container.get('uuid'),
+                                expect_errors=True)
+
+        self.assertEqual(404, response.status_int)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_logs_docker_unreachable(self, mock_get_by_uuid,
+                                            mock_docker_clients):
+        test_container = utils.get_test_container(docker_id='docker-id')
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        mock_docker = mock_docker_clients.get.return_value
+        mock_docker.logs_stream.side_effect = (
+            requests.exceptions.ConnectionError('refused'))
+
+        response = self.app.get('/v1/containers/%s/stream_logs'
+                                % test_container.get('uuid'),
+                                expect_errors=True)
+
+        self.assertEqual(503, response.status_int)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_execute_docker_timeout(self, mock_get_by_uuid,
+                                           mock_docker_clients):
+        test_container = utils.get_test_container(docker_id='docker-id')
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        mock_docker = mock_docker_clients.get.return_value
+        mock_docker.exec_stream.side_effect = (
+            requests.exceptions.ReadTimeout('timed out'))
+
+        response = self.app.put('/v1/containers/%s/stream_execute'
+                                '?command=ls' % test_container['uuid'],
+                                expect_errors=True)
+
+        self.assertEqual(503, response.status_int)
+
+    @patch('magnum.conductor.api.API.container_show')
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_logs_not_created(self, mock_get_by_uuid,
+                                     mock_docker_clients,
+                                     mock_container_show):
+        test_container = utils.get_test_container(docker_id=None)
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        mock_container_show.return_value.docker_id = None
+
+        response = self.app.get('/v1/containers/%s/stream_logs'
+                                % test_container.get('uuid'),
+                                expect_errors=True)
+
+        self.assertEqual(409, response.status_int)
+        self.assertFalse(mock_docker_clients.get.called)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_logs_put_fails(self, mock_get_by_uuid,
+                                   mock_docker_clients):
+        self.assertRaises(AppError, self.app.put,
+                          '/v1/containers/%s/stream_logs'
+                          % utils.get_test_container()['uuid'])
+        self.assertFalse(mock_docker_clients.get.called)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_execute(self, mock_get_by_uuid, mock_docker_clients):
+        test_container = utils.get_test_container(docker_id='docker-id')
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        mock_docker = mock_docker_clients.get.return_value
+        mock_docker.exec_stream.return_value = iter(['out\n', 'err\n'])
+
+        response = self.app.put('/v1/containers/%s/stream_execute'
+                                '?command=ls' % test_container['uuid'])
+
+        self.assertEqual(200, response.status_int)
+        self.assertEqual('out\nerr\n', response.body)
+        mock_docker.exec_stream.assert_called_once_with(
+            'docker-id', 'ls', timeout=600, max_bytes=10485760)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_execute_without_command(self, mock_get_by_uuid,
+                                            mock_docker_clients):
+        response = self.app.put('/v1/containers/%s/stream_execute'
+                                % utils.get_test_container()['uuid'],
+                                expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(mock_docker_clients.get.called)
+
+    @patch('magnum.api.controllers.v1.container._docker_clients')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_stream_execute_get_fails(self, mock_get_by_uuid,
+                                      mock_docker_clients):
+        self.assertRaises(AppError, self.app.get,
+                          '/v1/containers/%s/stream_execute?command=ls'
+                          % utils.get_test_container()['uuid'])
+        self.assertFalse(mock_docker_clients.get.called)
+
+    @patch('magnum.conductor.api.API.container_stats')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_get_stats(self, mock_get_by_uuid, mock_container_stats):
+        test_container = utils.get_test_container()
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        container_uuid = test_container.get('uuid')
+        mock_container_stats.return_value = {
+            'uuid': container_uuid, 'samples': 4, 'cpu_percent': 12.5,
+            'cpu_percent_max': 20.0, 'memory_usage': 100,
+            'memory_max_usage': 120, 'memory_limit': 1000,
+            'network_rx_bytes': 1, 'network_tx_bytes': 2,
+            'blkio_read_bytes': 3, 'blkio_write_bytes': 4}
+
+        response = self.app.get('/v1/containers/%s/stats?window=3'
+                                % container_uuid)
+
+        self.assertEqual(200, response.status_int)
+        mock_container_stats.assert_called_once_with(container_uuid, 3)
+        self.assertEqual(12.5, response.json['cpu_percent'])
+        self.assertEqual(120, response.json['memory_max_usage'])
+
+    @patch('magnum.conductor.api.API.container_stats')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_get_stats_default_window(self, mock_get_by_uuid,
+                                      mock_container_stats):
+        test_container = utils.get_test_container()
+        test_container_obj = objects.Container(self.context, **test_container)
+        mock_get_by_uuid.return_value = test_container_obj
+        mock_container_stats.return_value = {'samples': 0}
+
+        self.app.get('/v1/containers/%s/stats' % test_container['uuid'])
+
+        mock_container_stats.assert_called_once_with(test_container['uuid'],
+                                                     5)
+
+    @patch('magnum.conductor.api.API.container_stats')
+    @patch('magnum.objects.Container.get_by_uuid')
+    def test_get_stats_invalid_window(self, mock_get_by_uuid,
+                                      mock_container_stats):
+        response = self.app.get('/v1/containers/%s/stats?window=600'
+                                % utils.get_test_container()['uuid'],
+                                expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(mock_container_stats.called)
+
+    @patch('magnum.conductor.api.API.bay_container_stats')
+    def test_get_bay_stats(self, mock_bay_container_stats):
+        bay_uuid = 'fff114da-3bfa-4a0f-a123-c0dffad9718e'
+        container_uuid = utils.get_test_container()['uuid']
+        mock_bay_container_stats.return_value = {
+            'bay_uuid': bay_uuid,
+            'containers': [{'uuid': container_uuid, 'cpu_percent': 12.5}],
+            'total': {'cpu_percent': 12.5},
+            'unsampled': 2}
+
+        response = self.app.get('/v1/containers/bay_stats?bay_ident=%s'
+                                % bay_uuid)
+
+        self.assertEqual(200, response.status_int)
+        mock_bay_container_stats.assert_called_once_with(bay_uuid, 5)
+        self.assertEqual(bay_uuid, response.json['bay_uuid'])
+        self.assertEqual(container_uuid,
+                         response.json['containers'][0]['uuid'])
+        self.assertEqual(12.5, response.json['total']['cpu_percent'])
+        self.assertEqual(2, response.json['unsampled'])
+
     @patch('magnum.conductor.api.API.container_execute')
     @patch('magnum.objects.Container.get_by_uuid')
     def test_execute_command_by_uuid(self, mock_get_by_uuid,
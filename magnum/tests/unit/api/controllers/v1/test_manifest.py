@@ -0,0 +1,141 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import mock
+
+from magnum.common import utils
+from magnum.conductor import api as rpcapi
+from magnum.tests.unit.api import base as api_base
+from magnum.tests.unit.objects import utils as obj_utils
+
+
+MANIFEST = '''
+kind: Service
+metadata:
+  name: frontend
+spec:
+  ports:
+  - port: 80
+  selector:
+    name: frontend
+---
+kind: ReplicationController
+metadata:
+  name: frontend
+spec:
+  replicas: 2
+  selector:
+    name: frontend
+  template:
+    metadata:
+      labels:
+        name: frontend
+    spec:
+      containers:
+      - name: php-redis
+        image: kubernetes/example-guestbook-php-redis
+---
+kind: Pod
+metadata:
+  name: redis-master
+spec:
+  containers:
+  - name: master
+    image: redis
+'''
+
+
+class TestApply(api_base.FunctionalTest):
+
+    def setUp(self):
+        super(TestApply, self).setUp()
+        self.bay = obj_utils.create_test_bay(self.context)
+        p = mock.patch.object(rpcapi.API, 'manifest_apply')
+        self.mock_apply = p.start()
+        self.mock_apply.side_effect = self._simulate_rpc_manifest_apply
+        self.addCleanup(p.stop)
+
+    def _simulate_rpc_manifest_apply(self, pods, services, rcs, manifests):
+        for obj in pods + services + rcs:
+            obj.create()
+        return {'pods': pods, 'services': services, 'rcs': rcs}
+
+    def test_apply(self):
+        response = self.post_json('/manifests/apply',
+                                  {'bay_uuid': self.bay.uuid,
+                                   'manifest': MANIFEST})
+        self.assertEqual(201, response.status_int)
+
+        self.assertEqual(1, self.mock_apply.call_count)
+        pods, services, rcs, manifests = self.mock_apply.call_args[0]
+        self.assertEqual(['redis-master'], [pod.name for pod in pods])
+        self.assertEqual(['redis'], pods[0].images)
+        self.assertEqual([{'port': 80}], services[0].ports)
+        self.assertEqual(2, rcs[0].replicas)
+        self.assertEqual('ReplicationController',
+                         json.loads(rcs[0].manifest)['kind'])
+        self.assertEqual(json.loads(rcs[0].manifest), manifests['rcs'][0])
+        self.assertEqual('redis-master',
+                         manifests['pods'][0]['metadata']['name'])
+        for obj in pods + services + rcs:
+            self.assertEqual(self.bay.uuid, obj.bay_uuid)
+            self.assertEqual('fake_project', obj.project_id)
+
+        self.assertEqual('redis-master', response.json['pods'][0]['name'])
+        self.assertEqual('frontend', response.json['services'][0]['name'])
+        self.assertEqual('frontend', response.json['rcs'][0]['name'])
+        self.assertTrue(utils.is_uuid_like(response.json['rcs'][0]['uuid']))
+
+    def test_apply_list(self):
+        manifest = json.dumps({
+            'kind': 'List',
+            'items': [{'kind': 'Pod',
+                       'metadata': {'name': 'pod%d' % i},
+                       'spec': {'containers': [{'image': 'redis'}]}}
+                      for i in range(3)]})
+
+        response = self.post_json('/manifests/apply',
+                                  {'bay_uuid': self.bay.uuid,
+                                   'manifest': manifest})
+
+        self.assertEqual(201, response.status_int)
+        self.assertEqual(['pod0', 'pod1', 'pod2'],
+                         [pod['name'] for pod in response.json['pods']])
+
+    def _assert_invalid(self, manifest):
+        response = self.post_json('/manifests/apply',
+                                  {'bay_uuid': self.bay.uuid,
+                                   'manifest': manifest},
+                                  expect_errors=True)
+        self.assertEqual(400, response.status_int)
+        self.assertTrue(response.json['error_message'])
+        self.assertFalse(self.mock_apply.called)
+
+    def test_apply_invalid_manifest(self):
+        self._assert_invalid("}invalid: y'm'l3!")
+
+    def test_apply_unsupported_kind(self):
+        self._assert_invalid(MANIFEST + '---\nkind: Secret\n')
+
+    def test_apply_invalid_resource(self):
+        self._assert_invalid(MANIFEST + '---\nkind: Pod\nmetadata: {}\n')
+
+    def test_apply_duplicated_name(self):
+        self._assert_invalid(MANIFEST + '---\n' + MANIFEST.split('---')[0])
+
+    def test_apply_no_bay_uuid(self):
+        response = self.post_json('/manifests/apply', {'manifest': MANIFEST},
+                                  expect_errors=True)
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(self.mock_apply.called)
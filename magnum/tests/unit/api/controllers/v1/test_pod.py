@@ -371,7 +371,7 @@ class TestPost(api_base.FunctionalTest):
         self.mock_pod_create.side_effect = self._simulate_rpc_pod_create
         self.addCleanup(p.stop)
 
-    def _simulate_rpc_pod_create(self, pod):
+    def _simulate_rpc_pod_create(self, pod, manifest):
         pod.create()
         return pod
 
@@ -395,6 +395,23 @@ class TestPost(api_base.FunctionalTest):
             response.json['created_at']).replace(tzinfo=None)
         self.assertEqual(test_time, return_created_at)
 
+    def test_create_pod_keeps_manifest(self):
+        pdict = apiutils.pod_post_data()
+        pdict['manifest'] = ('metadata:\n'
+                             '  name: yaml-pod\n'
+                             'spec:\n'
+                             '  containers:\n'
+                             '  - name: test\n'
+                             '    image: test\n')
+
+        response = self.post_json('/pods', pdict)
+
+        self.assertEqual(201, response.status_int)
+        pod, manifest = self.mock_pod_create.call_args[0]
+        self.assertEqual('yaml-pod', pod.name)
+        self.assertEqual(pdict['manifest'], pod.manifest)
+        self.assertEqual('yaml-pod', manifest['metadata']['name'])
+
     def test_create_pod_doesnt_contain_id(self):
         with mock.patch.object(self.dbapi, 'create_pod',
                                wraps=self.dbapi.create_pod) as cc_mock:
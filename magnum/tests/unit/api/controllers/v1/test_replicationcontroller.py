@@ -359,7 +359,7 @@ class TestPost(api_base.FunctionalTest):
         self.mock_rc_create.side_effect = self._simulate_rpc_rc_create
         self.addCleanup(p.stop)
 
-    def _simulate_rpc_rc_create(self, rc):
+    def _simulate_rpc_rc_create(self, rc, manifest):
         rc.create(self.context)
         return rc
 
@@ -312,7 +312,7 @@ class TestPost(api_base.FunctionalTest):
             self._simulate_rpc_service_create)
         self.addCleanup(p.stop)
 
-    def _simulate_rpc_service_create(self, service):
+    def _simulate_rpc_service_create(self, service, manifest):
         service.create()
         return service
 
@@ -74,3 +74,12 @@ class ContextTestCase(base.TestCase):
         self.assertEqual(ctx.request_id, ctx2.request_id)
         self.assertEqual(ctx.trust_id, ctx2.trust_id)
         self.assertEqual(ctx.auth_token_info, ctx2.auth_token_info)
+        self.assertEqual(ctx.all_tenants, ctx2.all_tenants)
+
+    def test_make_admin_context(self):
+        ctx = magnum_context.make_admin_context(all_tenants=True)
+
+        self.assertTrue(ctx.is_admin)
+        self.assertTrue(ctx.all_tenants)
+        self.assertIsNone(ctx.auth_token)
+        self.assertIsNone(ctx.project_id)
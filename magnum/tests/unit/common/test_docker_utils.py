@@ -0,0 +1,102 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from magnum.common import docker_utils
+from magnum.tests import base
+
+
+def _sample(total_usage, system_usage, memory_usage, rx_bytes=0,
+            read_bytes=0, cpus=2):
+    return {'cpu_stats': {'cpu_usage': {'total_usage': total_usage,
+                                        'percpu_usage': [0] * cpus},
+                          'system_cpu_usage': system_usage},
+            'memory_stats': {'usage': memory_usage,
+                             'max_usage': memory_usage,
+                             'limit': 1000},
+            'network': {'rx_bytes': rx_bytes, 'tx_bytes': 0},
+            'blkio_stats': {'io_service_bytes_recursive': [
+                {'op': 'Read', 'value': read_bytes},
+                {'op': 'Write', 'value': 0},
+                {'op': 'Total', 'value': read_bytes}]}}
+
+
+class TestDockerUtils(base.BaseTestCase):
+
+    def test_parse_docker_image(self):
+        self.assertEqual(('ubuntu', None),
+                         docker_utils.parse_docker_image('ubuntu'))
+        self.assertEqual(('ubuntu', '14.04'),
+                         docker_utils.parse_docker_image('ubuntu:14.04'))
+
+    def test_sum_stats(self):
+        first = {'cpu_percent': 10.0, 'cpu_percent_max': 30.0,
+                 'memory_usage': 100, 'memory_max_usage': 150,
+                 'network_rx_bytes': 1, 'network_tx_bytes': 2,
+                 'blkio_read_bytes': 3, 'blkio_write_bytes': 4}
+        second = dict(first, cpu_percent=5.0, cpu_percent_max=50.0,
+                      memory_max_usage=120)
+
+        total = docker_utils.sum_stats([first, second])
+
+        self.assertEqual({'cpu_percent': 15.0, 'cpu_percent_max': 50.0,
+                          'memory_usage': 200, 'memory_max_usage': 150,
+                          'network_rx_bytes': 2, 'network_tx_bytes': 4,
+                          'blkio_read_bytes': 6, 'blkio_write_bytes': 8},
+                         total)
+
+
+class TestStatsAggregator(base.BaseTestCase):
+
+    def test_snapshot_without_samples(self):
+        snapshot = docker_utils.StatsAggregator().snapshot()
+
+        self.assertEqual(0, snapshot['samples'])
+        self.assertEqual(0.0, snapshot['cpu_percent'])
+        self.assertEqual(0, snapshot['network_rx_bytes'])
+
+    def test_snapshot(self):
+        aggregator = docker_utils.StatsAggregator()
+        aggregator.add(_sample(1000, 10000, 100, rx_bytes=10, read_bytes=5))
+        aggregator.add(_sample(1500, 20000, 300, rx_bytes=30, read_bytes=5))
+        aggregator.add(_sample(3500, 30000, 200, rx_bytes=70, read_bytes=25))
+
+        snapshot = aggregator.snapshot()
+
+        self.assertEqual(3, snapshot['samples'])
+        # 10% and 40% of one CPU on a 2 CPUs host
+        self.assertEqual(25.0, snapshot['cpu_percent'])
+        self.assertEqual(40.0, snapshot['cpu_percent_max'])
+        self.assertEqual(200, snapshot['memory_usage'])
+        self.assertEqual(300, snapshot['memory_max_usage'])
+        self.assertEqual(1000, snapshot['memory_limit'])
+        self.assertEqual(60, snapshot['network_rx_bytes'])
+        self.assertEqual(20, snapshot['blkio_read_bytes'])
+        self.assertEqual(0, snapshot['blkio_write_bytes'])
+
+    def test_snapshot_with_networks(self):
+        aggregator = docker_utils.StatsAggregator()
+        first = _sample(0, 0, 0)
+        del first['network']
+        first['networks'] = {'eth0': {'rx_bytes': 10, 'tx_bytes': 1},
+                             'eth1': {'rx_bytes': 20, 'tx_bytes': 2}}
+        last = _sample(0, 0, 0)
+        del last['network']
+        last['networks'] = {'eth0': {'rx_bytes': 15, 'tx_bytes': 1},
+                            'eth1': {'rx_bytes': 40, 'tx_bytes': 5}}
+        aggregator.add(first)
+        aggregator.add(last)
+
+        snapshot = aggregator.snapshot()
+
+        self.assertEqual(25, snapshot['network_rx_bytes'])
+        self.assertEqual(3, snapshot['network_tx_bytes'])
+        self.assertEqual(0.0, snapshot['cpu_percent'])
@@ -12,6 +12,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import mock
+
 from magnum.common import k8s_manifest
 from magnum.tests import base
 
@@ -80,3 +82,70 @@ class K8sManifestTestCase(base.TestCase):
         invalid_str = "}invalid: y'm'l3!"
 
         self.assertRaises(ValueError, k8s_manifest.parse, invalid_str)
+
+    def test_parse_is_cached(self):
+        yaml_str = 'id: redis-master\nlabels:\n  name: redis-master\n'
+        manifest = k8s_manifest.parse(yaml_str)
+        manifest['labels']['name'] = 'changed'
+
+        with mock.patch.object(k8s_manifest, '_load') as mock_load:
+            cached = k8s_manifest.parse(yaml_str)
+
+        self.assertFalse(mock_load.called)
+        self.assertEqual({'id': 'redis-master',
+                          'labels': {'name': 'redis-master'}}, cached)
+
+    @mock.patch.object(k8s_manifest, 'CACHE_SIZE', 2)
+    def test_parse_cache_is_bounded(self):
+        for i in range(3):
+            k8s_manifest.parse('{"id": %d}' % i)
+
+        with mock.patch.object(k8s_manifest, '_load',
+                               wraps=k8s_manifest._load) as mock_load:
+            k8s_manifest.parse('{"id": 2}')
+            k8s_manifest.parse('{"id": 0}')
+
+        mock_load.assert_called_once_with('{"id": 0}')
+
+    def test_parse_all_yaml_documents(self):
+        yaml_str = ('kind: Service\n'
+                    'metadata:\n'
+                    '  name: frontend\n'
+                    '---\n'
+                    '---\n'
+                    'kind: ReplicationController\n'
+                    'metadata:\n'
+                    '  name: frontend\n')
+
+        resources = k8s_manifest.parse_all(yaml_str)
+        self.assertEqual(['Service', 'ReplicationController'],
+                         [resource['kind'] for resource in resources])
+
+    def test_parse_all_list(self):
+        json_str = ('{"kind": "List", "items": [{"kind": "Service"}, '
+                    '{"kind": "Pod"}]}')
+
+        resources = k8s_manifest.parse_all(json_str)
+        self.assertEqual([{'kind': 'Service'}, {'kind': 'Pod'}], resources)
+
+    def test_parse_all_single_resource(self):
+        resources = k8s_manifest.parse_all('{"kind": "Pod"}')
+        self.assertEqual([{'kind': 'Pod'}], resources)
+
+    def test_parse_all_invalid_list(self):
+        self.assertRaises(ValueError, k8s_manifest.parse_all,
+                          '{"kind": "List", "items": {}}')
+
+    def test_parse_all_invalid_resource(self):
+        self.assertRaises(ValueError, k8s_manifest.parse_all,
+                          'kind: Pod\n---\n- item\n')
+
+    def test_parse_all_empty(self):
+        self.assertRaises(ValueError, k8s_manifest.parse_all, '')
+        self.assertRaises(ValueError, k8s_manifest.parse_all, '---\n')
+        self.assertRaises(ValueError, k8s_manifest.parse_all,
+                          '{"kind": "List", "items": []}')
+
+    def test_parse_all_yaml_error(self):
+        self.assertRaises(ValueError, k8s_manifest.parse_all,
+                          "}invalid: y'm'l3!")
@@ -69,6 +69,20 @@ class KeystoneClientTest(base.BaseTestCase):
         self.assertRaises(exception.AuthorizationFailure,
                           magnum_ks_client._v3_client_init)
 
+    def test_init_v3_admin_context(self, mock_ks):
+        """Test creating the client, service admin auth."""
+        self.ctx.auth_token = None
+        self.ctx.trust_id = None
+        self.ctx.is_admin = True
+        magnum_ks_client = magnum_keystoneclient.KeystoneClientV3(self.ctx)
+        magnum_ks_client.client
+        mock_ks.assert_called_once_with(username='magnum',
+                                        password='verybadpass',
+                                        project_name='service',
+                                        auth_url='http://server.test:5000/v3',
+                                        endpoint='http://server.test:5000/v3')
+        mock_ks.return_value.authenticate.assert_called_once_with()
+
     def test_init_trust_token_access(self, mock_ks):
         """Test creating the client, token auth."""
         self.ctx.project_id = 'abcd1234'
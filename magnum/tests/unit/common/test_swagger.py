@@ -0,0 +1,347 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import subprocess
+import sys
+
+import mock
+from six.moves.urllib import error
+
+from magnum.common.pythonk8sclient.client import ApivbetaApi
+from magnum.common.pythonk8sclient.client import models
+from magnum.common.pythonk8sclient.client import swagger
+from magnum.tests import base
+
+
+class ApiClientTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ApiClientTestCase, self).setUp()
+        self.client = swagger.ApiClient('http://10.0.0.1:8080')
+        p = mock.patch.object(self.client.session, 'request')
+        self.mock_request = p.start()
+        self.addCleanup(p.stop)
+
+    def _response(self, status_code=200, content='', headers=None):
+        response = mock.MagicMock()
+        response.status_code = status_code
+        response.reason = 'reason'
+        response.content = content
+        response.headers = headers or {}
+        return response
+
+    def test_call_api(self):
+        self.mock_request.return_value = self._response(
+            content='{"kind": "Pod"}')
+
+        data = self.client.callAPI('/api/v1beta3/pods', 'POST', {'a': None},
+                                   {'kind': 'Pod'}, {})
+
+        self.assertEqual({'kind': 'Pod'}, data)
+        self.mock_request.assert_called_once_with(
+            'POST', 'http://10.0.0.1:8080/api/v1beta3/pods?',
+            headers={'User-Agent': 'Python-Swagger',
+                     'Content-type': 'application/json'},
+            data='{"kind": "Pod"}')
+
+    def test_call_api_reuses_session(self):
+        self.mock_request.return_value = self._response()
+
+        self.assertIsNone(self.client.callAPI('/api', 'GET', None, None, {}))
+        self.assertIsNone(self.client.callAPI('/api', 'GET', None, None, {}))
+
+        self.assertEqual(2, self.mock_request.call_count)
+
+    def test_call_api_http_error(self):
+        self.mock_request.return_value = self._response(
+            status_code=404, content='{"message": "not found"}')
+
+        err = self.assertRaises(error.HTTPError, self.client.callAPI,
+                                '/api', 'GET', None, None, {})
+        self.assertEqual(404, err.code)
+        self.assertEqual('{"message": "not found"}', err.read())
+
+    def test_stream_api(self):
+        response = self._response()
+        response.iter_lines.return_value = iter(
+            ['{"type": "ADDED"}', '', '{"type": "DELETED"}'])
+        with mock.patch.object(self.client.session, 'get',
+                               return_value=response) as mock_get:
+            events = list(self.client.streamAPI(
+                '/api/v1beta3/pods', {'watch': 'true'}, timeout=30))
+
+        self.assertEqual([{'type': 'ADDED'}, {'type': 'DELETED'}], events)
+        mock_get.assert_called_once_with(
+            'http://10.0.0.1:8080/api/v1beta3/pods?watch=true',
+            headers={'User-Agent': 'Python-Swagger'}, stream=True,
+            timeout=30)
+        response.close.assert_called_once_with()
+
+    def test_stream_api_closed_early(self):
+        response = self._response()
+        response.iter_lines.return_value = iter(['{"type": "ADDED"}'] * 3)
+        with mock.patch.object(self.client.session, 'get',
+                               return_value=response):
+            events = self.client.streamAPI('/api', None)
+            self.assertEqual({'type': 'ADDED'}, next(events))
+            events.close()
+
+        response.close.assert_called_once_with()
+
+    def test_stream_api_http_error(self):
+        response = self._response(status_code=410,
+                                  content='{"message": "too old"}')
+        with mock.patch.object(self.client.session, 'get',
+                               return_value=response):
+            err = self.assertRaises(error.HTTPError, list,
+                                    self.client.streamAPI('/api', None))
+
+        self.assertEqual(410, err.code)
+        response.close.assert_called_once_with()
+
+    def test_list_api(self):
+        response = self._response()
+        response.iter_content.return_value = iter(
+            ['{"metadata": {"resourceVersion": "1"}, "items": [{"a"',
+             ': 1}, {"b": 2}]}'])
+        with mock.patch.object(self.client.session, 'get',
+                               return_value=response) as mock_get:
+            resources = self.client.listAPI('/api/v1beta3/pods', None)
+            self.assertEqual([{'a': 1}, {'b': 2}], list(resources))
+
+        self.assertEqual({'resourceVersion': '1'},
+                         resources.fields['metadata'])
+        mock_get.assert_called_once_with(
+            'http://10.0.0.1:8080/api/v1beta3/pods',
+            headers={'User-Agent': 'Python-Swagger'}, stream=True)
+        response.iter_content.assert_called_once_with(swagger.CHUNK_SIZE)
+        response.close.assert_called_once_with()
+
+    def test_list_api_http_error(self):
+        response = self._response(status_code=404,
+                                  content='{"message": "not found"}')
+        with mock.patch.object(self.client.session, 'get',
+                               return_value=response):
+            err = self.assertRaises(error.HTTPError, self.client.listAPI,
+                                    '/api', None)
+
+        self.assertEqual(404, err.code)
+        response.close.assert_called_once_with()
+
+    def test_close(self):
+        with mock.patch.object(self.client.session, 'close') as mock_close:
+            self.client.close()
+        mock_close.assert_called_once_with()
+
+
+class JSONListStreamTestCase(base.TestCase):
+
+    LIST = ('{"kind": "PodList", "items": [{"metadata": {"name": "pod1"}}, '
+            '{"metadata": {"name": "pod2"}, "replicas": 12}], '
+            '"metadata": {"resourceVersion": "10"}, "count": 123}')
+
+    def test_iterate(self):
+        stream = swagger.JSONListStream([self.LIST])
+
+        self.assertEqual([{'metadata': {'name': 'pod1'}},
+                          {'metadata': {'name': 'pod2'}, 'replicas': 12}],
+                         list(stream))
+        self.assertEqual({'kind': 'PodList',
+                          'metadata': {'resourceVersion': '10'},
+                          'count': 123}, stream.fields)
+
+    def test_iterate_chunks(self):
+        # Every split of the text, inside strings and numbers included.
+        for size in range(1, 8):
+            chunks = [self.LIST[i:i + size]
+                      for i in range(0, len(self.LIST), size)]
+            stream = swagger.JSONListStream(chunks)
+
+            self.assertEqual(2, len(list(stream)))
+            self.assertEqual(123, stream.fields['count'])
+
+    def test_iterate_lazily(self):
+        chunks = mock.MagicMock()
+        chunks.__iter__.return_value = iter(['{"items": [{"a": 1}, ',
+                                             '{"b": 2}]}'])
+        items = iter(swagger.JSONListStream(chunks))
+
+        self.assertEqual({'a': 1}, next(items))
+        # The second chunk is not read yet.
+        self.assertEqual('{"b": 2}]}', next(chunks.__iter__.return_value))
+
+    def test_iterate_empty(self):
+        for text in ['{}', '{"items": []}', ' { "items" : [ ] } ']:
+            self.assertEqual([], list(swagger.JSONListStream([text])))
+
+    def test_iterate_invalid(self):
+        for text in ['', '[]', '{"items": [{"a": 1}', '{"items": [1 2]}',
+                     '{"items": [{"a": 1}]']:
+            self.assertRaises(ValueError, list,
+                              swagger.JSONListStream([text]))
+
+    def test_close(self):
+        on_close = mock.MagicMock()
+        items = iter(swagger.JSONListStream(['{"items": [1, 2]}'],
+                                            onClose=on_close))
+
+        self.assertEqual(1, next(items))
+        items.close()
+
+        on_close.assert_called_once_with()
+
+
+class ResponseModeTestCase(base.TestCase):
+
+    POD_LIST = {'kind': 'PodList',
+                'items': [{'status': {'phase': 'Running'}}]}
+
+    def test_views(self):
+        client = swagger.ApiClient('http://10.0.0.1:8080',
+                                   responseMode=swagger.VIEWS)
+        with mock.patch.object(client, 'deserialize') as mock_deserialize:
+            pods = client.loadResponse(self.POD_LIST, 'V1beta3_PodList')
+
+            self.assertEqual('PodList', pods.kind)
+            self.assertEqual(1, len(pods.items))
+            self.assertEqual('Running', pods.items[0].status.phase)
+            self.assertEqual('Running', pods.items[:1][0].status.phase)
+            self.assertIsNone(pods.items[0].spec)
+            self.assertIs(self.POD_LIST, pods.raw)
+            self.assertRaises(AttributeError, getattr, pods, 'unknown')
+            self.assertFalse(mock_deserialize.called)
+
+    def test_view_to_model(self):
+        client = swagger.ApiClient('http://10.0.0.1:8080',
+                                   responseMode=swagger.VIEWS)
+        pods = client.loadResponse(self.POD_LIST, 'V1beta3_PodList')
+
+        pod = pods.items[0].toModel()
+
+        self.assertIsInstance(pod, models.get('V1beta3_Pod'))
+        self.assertEqual('Running', pod.status.phase)
+
+    def test_dicts(self):
+        client = swagger.ApiClient('http://10.0.0.1:8080',
+                                   responseMode=swagger.DICTS)
+
+        self.assertIs(self.POD_LIST,
+                      client.loadResponse(self.POD_LIST, 'V1beta3_PodList'))
+
+    def test_models(self):
+        client = swagger.ApiClient('http://10.0.0.1:8080')
+
+        pods = client.loadResponse(self.POD_LIST, 'V1beta3_PodList')
+
+        self.assertIsInstance(pods, models.get('V1beta3_PodList'))
+
+
+class DeserializeTestCase(base.TestCase):
+
+    def setUp(self):
+        super(DeserializeTestCase, self).setUp()
+        self.client = swagger.ApiClient('http://10.0.0.1:8080')
+
+    def test_deserialize_model(self):
+        pods = self.client.deserialize(
+            {'kind': 'PodList',
+             'items': [{'metadata': {'name': 'pod1'},
+                        'status': {'phase': 'Running'}}]},
+            'V1beta3_PodList')
+
+        self.assertIsInstance(pods, models.get('V1beta3_PodList'))
+        self.assertEqual('PodList', pods.kind)
+        self.assertEqual('Running', pods.items[0].status.phase)
+
+    def test_deserialize_native_types(self):
+        self.assertEqual(1, self.client.deserialize('1', 'int'))
+        self.assertEqual(['a'], self.client.deserialize(['a'], 'list[str]'))
+        self.assertEqual({'a': 1}, self.client.deserialize({'a': 1}, 'any'))
+
+    def test_models_get(self):
+        pod_class = models.get('V1beta3_Pod')
+
+        self.assertEqual('V1beta3_Pod', pod_class.__name__)
+        self.assertIs(pod_class, models.get('V1beta3_Pod'))
+        self.assertRaises(KeyError, models.get, 'V1beta3_Unknown')
+
+    def test_import_loads_no_models(self):
+        # Importing the client must not import its hundreds of models.
+        code = ('import sys\n'
+                'import magnum.conductor.handlers.kube\n'
+                'from magnum.common.pythonk8sclient.client import models\n'
+                'print(len([name for name in sys.modules\n'
+                '           if name.startswith(models.__name__ + ".")\n'
+                '           and sys.modules[name] is not None]))\n')
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual('0', output.strip())
+
+
+class ApivbetaApiTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ApivbetaApiTestCase, self).setUp()
+        self.client = mock.MagicMock()
+        self.client.toPathValue.side_effect = lambda value: value
+        self.api = ApivbetaApi.ApivbetaApi(self.client)
+
+    def test_read(self):
+        pod = self.api.readPod(name='pod 1', namespaces='default')
+
+        self.client.callAPI.assert_called_once_with(
+            '/api/v1beta3/namespaces/default/pods/pod%201', 'GET', {}, None,
+            {'Accept': 'application/json', 'Content-Type': '*/*,'},
+            files={})
+        self.client.loadResponse.assert_called_once_with(
+            self.client.callAPI.return_value, 'V1beta3_Pod')
+        self.assertEqual(self.client.loadResponse.return_value, pod)
+
+    def test_list_query(self):
+        self.api.listPod(labelSelector='name=redis')
+
+        self.client.callAPI.assert_called_once_with(
+            '/api/v1beta3/pods', 'GET', {'labelSelector': 'name=redis'},
+            None, mock.ANY, files={})
+
+    def test_create(self):
+        self.assertIsNone(self.api.createEndpoints(namespaces='default',
+                                                   body={}))
+
+        self.client.callAPI.assert_called_once_with(
+            '/api/v1beta3/namespaces/default/endpoints', 'POST', {}, {},
+            mock.ANY, files={})
+        self.assertFalse(self.client.loadResponse.called)
+
+    def test_create_raw(self):
+        pod = self.api.createPod(namespaces='default', body={'kind': 'Pod'})
+
+        self.assertEqual(self.client.callAPI.return_value, pod)
+        self.assertFalse(self.client.loadResponse.called)
+
+    def test_patch(self):
+        self.api.patchPod(name='pod1', namespaces='default', body=[])
+
+        headers = self.client.callAPI.call_args[0][4]
+        self.assertEqual(ApivbetaApi.PATCH_CONTENT_TYPE,
+                         headers['Content-Type'])
+
+    def test_empty_response(self):
+        self.client.callAPI.return_value = None
+
+        self.assertIsNone(self.api.readPod(name='pod1',
+                                           namespaces='default'))
+        self.assertFalse(self.client.loadResponse.called)
+
+    def test_unexpected_argument(self):
+        self.assertRaises(TypeError, self.api.readPod, name='pod1',
+                          namespace='default')
+        self.assertFalse(self.client.callAPI.called)
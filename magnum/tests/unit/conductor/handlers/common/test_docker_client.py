@@ -13,11 +13,17 @@
 # under the License.
 
 from docker import client as docker_py_client
+import eventlet
 import mock
+from oslo_config import cfg
 
 from magnum.conductor.handlers.common import docker_client
 from magnum.tests import base
 
+CONF = cfg.CONF
+CONF.import_opt('client_cache_size',
+                'magnum.conductor.handlers.docker_conductor', group='docker')
+
 
 class DockerClientTestCase(base.BaseTestCase):
     def test_docker_client_init(self):
@@ -152,3 +158,197 @@ class DockerClientTestCase(base.BaseTestCase):
 
         mock_attach.assert_called_once_with('someid',
                                             1, 1, 0, 1)
+
+    @mock.patch.object(docker_py_client.Client,
+                       '_multiplexed_response_stream_helper')
+    @mock.patch.object(docker_py_client.Client, '_raise_for_status')
+    @mock.patch.object(docker_py_client.Client, '_get')
+    @mock.patch.object(docker_py_client.Client, '_url')
+    def test_logs_stream(self, mock_url, mock_get, mock_raise_for_status,
+                         mock_stream_helper):
+        client = docker_client.DockerHTTPClient()
+        mock_stream_helper.return_value = iter(['line1\n', 'line2\n'])
+
+        stream = client.logs_stream('someid', tail=10, since=1434000000,
+                                    timestamps=True, follow=True)
+
+        mock_url.assert_called_once_with('/containers/someid/logs')
+        mock_get.assert_called_once_with(
+            mock_url.return_value,
+            params={'stdout': 1, 'stderr': 1, 'timestamps': 1, 'follow': 1,
+                    'tail': 10, 'since': 1434000000},
+            stream=True)
+        mock_raise_for_status.assert_called_once_with(mock_get.return_value)
+        self.assertFalse(mock_get.return_value.close.called)
+        self.assertEqual(['line1\n', 'line2\n'], list(stream))
+        mock_stream_helper.assert_called_once_with(mock_get.return_value)
+        mock_get.return_value.close.assert_called_once_with()
+
+    @mock.patch.object(docker_py_client.Client, '_raise_for_status')
+    @mock.patch.object(docker_py_client.Client, '_get')
+    @mock.patch.object(docker_py_client.Client, '_url')
+    def test_logs_stream_defaults(self, mock_url, mock_get,
+                                  mock_raise_for_status):
+        client = docker_client.DockerHTTPClient()
+
+        client.logs_stream('someid')
+
+        mock_get.assert_called_once_with(
+            mock_url.return_value,
+            params={'stdout': 1, 'stderr': 1, 'timestamps': 0, 'follow': 0,
+                    'tail': 'all'},
+            stream=True)
+
+    @mock.patch.object(docker_py_client.Client, '_stream_helper')
+    @mock.patch.object(docker_py_client.Client, '_raise_for_status')
+    @mock.patch.object(docker_py_client.Client, '_get')
+    @mock.patch.object(docker_py_client.Client, '_url')
+    def test_stats_stream(self, mock_url, mock_get, mock_raise_for_status,
+                          mock_stream_helper):
+        client = docker_client.DockerHTTPClient()
+        mock_stream_helper.return_value = iter([{'read': 1}, {'read': 2}])
+
+        stream = client.stats_stream('someid')
+
+        mock_url.assert_called_once_with('/containers/someid/stats')
+        mock_get.assert_called_once_with(mock_url.return_value, stream=True)
+        mock_raise_for_status.assert_called_once_with(mock_get.return_value)
+        self.assertEqual([{'read': 1}, {'read': 2}], list(stream))
+        mock_stream_helper.assert_called_once_with(mock_get.return_value,
+                                                   decode=True)
+        mock_get.return_value.close.assert_called_once_with()
+
+    @mock.patch.object(docker_py_client.Client, '_raise_for_status')
+    @mock.patch.object(docker_py_client.Client, '_post_json')
+    @mock.patch.object(docker_py_client.Client, '_url')
+    @mock.patch.object(docker_py_client.Client, 'exec_create')
+    def test_exec_stream(self, mock_exec_create, mock_url, mock_post_json,
+                         mock_raise_for_status):
+        client = docker_client.DockerHTTPClient()
+        mock_exec_create.return_value = {'Id': 'execid'}
+
+        stream = client.exec_stream('someid', 'ls', timeout=10, max_bytes=5)
+
+        mock_exec_create.assert_called_once_with('someid', 'ls', True, True,
+                                                 False)
+        mock_url.assert_called_once_with('/exec/execid/start')
+        mock_post_json.assert_called_once_with(
+            mock_url.return_value, data={'Tty': False, 'Detach': False},
+            stream=True)
+        mock_raise_for_status.assert_called_once_with(
+            mock_post_json.return_value)
+        self.assertIsInstance(stream, docker_client.ExecStream)
+
+
+class ExecStreamTestCase(base.BaseTestCase):
+    def _stream(self, chunks, timeout=None, max_bytes=None):
+        docker = mock.MagicMock()
+        docker._multiplexed_response_stream_helper.return_value = iter(
+            chunks)
+        self.response = mock.MagicMock()
+        return docker_client.ExecStream(docker, self.response,
+                                        timeout=timeout, max_bytes=max_bytes)
+
+    def test_stream(self):
+        stream = self._stream(['abc', 'def'])
+
+        self.assertEqual(['abc', 'def'], list(stream))
+        self.response.close.assert_called_once_with()
+
+    def test_stream_max_bytes(self):
+        stream = self._stream(['abc', 'def', 'ghi'], max_bytes=5)
+
+        self.assertEqual(['abc', 'de'], list(stream))
+        self.response.close.assert_called_once_with()
+
+    @mock.patch('time.time')
+    def test_stream_timeout(self, mock_time):
+        mock_time.side_effect = [1000, 1003, 1006, 1010]
+        stream = self._stream(['abc', 'def', 'ghi'], timeout=10)
+
+        self.assertEqual(['abc', 'def'], list(stream))
+        self.response.close.assert_called_once_with()
+
+    def test_stream_timeout_without_chunk(self):
+        def blocking_chunks():
+            yield 'abc'
+            eventlet.sleep(60)
+            yield 'def'
+
+        stream = self._stream(blocking_chunks(), timeout=0.1)
+
+        self.assertEqual(['abc'], list(stream))
+        self.response.close.assert_called_once_with()
+
+
+class TestDockerClientCache(base.BaseTestCase):
+    def setUp(self):
+        super(TestDockerClientCache, self).setUp()
+        self.cache = docker_client.DockerClientCache()
+        p = mock.patch.object(docker_client, 'DockerHTTPClient')
+        self.mock_docker_client = p.start()
+        self.mock_docker_client.side_effect = (
+            lambda *args: mock.MagicMock(args=args))
+        self.addCleanup(p.stop)
+
+    def _bay(self, uuid, api_address):
+        bay = mock.MagicMock()
+        bay.uuid = uuid
+        bay.api_address = api_address
+        return bay
+
+    def test_get_reuses_client(self):
+        bay = self._bay('bay1', '1.1.1.1')
+        docker = self.cache.get(bay)
+        self.assertIs(docker, self.cache.get(bay))
+        self.mock_docker_client.assert_called_once_with(
+            'tcp://1.1.1.1:2376', CONF.docker.docker_remote_api_version,
+            CONF.docker.default_timeout)
+
+    def test_get_new_client_on_tls_change(self):
+        bay = self._bay('bay1', '1.1.1.1')
+        docker = self.cache.get(bay)
+        CONF.set_override('ca_file', '/etc/ca.pem', group='docker')
+
+        self.assertIsNot(docker, self.cache.get(bay))
+        docker.close.assert_called_once_with()
+
+    def test_get_closes_client_on_address_change(self):
+        docker = self.cache.get(self._bay('bay1', '1.1.1.1'))
+        new_docker = self.cache.get(self._bay('bay1', '2.2.2.2'))
+
+        self.assertIsNot(docker, new_docker)
+        docker.close.assert_called_once_with()
+        self.assertEqual(('tcp://2.2.2.2:2376',), new_docker.args[:1])
+        self.assertEqual(1, len(self.cache))
+
+    def test_get_evicts_least_recently_used(self):
+        CONF.set_override('client_cache_size', 2, group='docker')
+        docker_1 = self.cache.get(self._bay('bay1', '1.1.1.1'))
+        docker_2 = self.cache.get(self._bay('bay2', '2.2.2.2'))
+        self.cache.get(self._bay('bay1', '1.1.1.1'))
+        self.cache.get(self._bay('bay3', '3.3.3.3'))
+
+        self.assertFalse(docker_1.close.called)
+        docker_2.close.assert_called_once_with()
+        self.assertEqual(2, len(self.cache))
+
+    @mock.patch('time.time')
+    def test_get_closes_idle_clients(self, mock_time):
+        CONF.set_override('client_idle_timeout', 60, group='docker')
+        mock_time.return_value = 1000
+        docker_1 = self.cache.get(self._bay('bay1', '1.1.1.1'))
+        mock_time.return_value = 1030
+        docker_2 = self.cache.get(self._bay('bay2', '2.2.2.2'))
+
+        mock_time.return_value = 1070
+        self.assertIs(docker_2, self.cache.get(self._bay('bay2', '2.2.2.2')))
+
+        docker_1.close.assert_called_once_with()
+        self.assertEqual(1, len(self.cache))
+
+    def test_clear(self):
+        docker = self.cache.get(self._bay('bay1', '1.1.1.1'))
+        self.cache.clear()
+        docker.close.assert_called_once_with()
+        self.assertEqual(0, len(self.cache))
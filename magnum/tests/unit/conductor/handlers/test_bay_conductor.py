@@ -12,9 +12,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
+import shutil
+import tempfile
+
 from heatclient import exc
 
+from magnum.common import context
 from magnum.common import exception
+from magnum.common import utils as magnum_utils
 from magnum.conductor.handlers import bay_conductor
 from magnum import objects
 from magnum.objects.bay import Status as bay_status
@@ -446,8 +452,7 @@ class TestBayConductorWithK8s(base.TestCase):
         dummy_bay_name = 'expected_stack_name'
         expected_timeout = 15
 
-        mock_tpl_files = mock.MagicMock()
-        mock_tpl_files.items.return_value = exptected_files
+        mock_tpl_files = dict(exptected_files)
         mock_get_template_contents.return_value = [
             mock_tpl_files, expected_template_contents]
         mock_extract_template_definition.return_value = ('template/path',
@@ -487,8 +492,7 @@ class TestBayConductorWithK8s(base.TestCase):
         dummy_bay_name = 'expected_stack_name'
         expected_timeout = cfg.CONF.bay_heat.bay_create_timeout
 
-        mock_tpl_files = mock.MagicMock()
-        mock_tpl_files.items.return_value = exptected_files
+        mock_tpl_files = dict(exptected_files)
         mock_get_template_contents.return_value = [
             mock_tpl_files, expected_template_contents]
         mock_extract_template_definition.return_value = ('template/path',
@@ -529,8 +533,7 @@ class TestBayConductorWithK8s(base.TestCase):
         bay_timeout = 0
         expected_timeout = None
 
-        mock_tpl_files = mock.MagicMock()
-        mock_tpl_files.items.return_value = exptected_files
+        mock_tpl_files = dict(exptected_files)
         mock_get_template_contents.return_value = [
             mock_tpl_files, expected_template_contents]
         mock_extract_template_definition.return_value = ('template/path',
@@ -564,8 +567,7 @@ class TestBayConductorWithK8s(base.TestCase):
         expected_template_contents = 'template_contents'
         exptected_files = []
 
-        mock_tpl_files = mock.MagicMock()
-        mock_tpl_files.items.return_value = exptected_files
+        mock_tpl_files = dict(exptected_files)
         mock_get_template_contents.return_value = [
             mock_tpl_files, expected_template_contents]
         mock_extract_template_definition.return_value = ('template/path',
@@ -595,6 +597,7 @@ class TestBayConductorWithK8s(base.TestCase):
         mock_heat_client = mock.MagicMock()
         mock_heat_client.stacks.get.return_value = mock_heat_stack
         mock_openstack_client.heat.return_value = mock_heat_client
+        mock_openstack_client.context = self.context
         poller = bay_conductor.HeatPoller(mock_openstack_client, bay)
         return (mock_heat_stack, bay, poller)
 
@@ -621,6 +624,19 @@ class TestBayConductorWithK8s(base.TestCase):
         self.assertEqual(bay.status_reason, 'Create failed')
         self.assertEqual(poller.attempts, 1)
 
+    @patch('magnum.conductor.handlers.kube.bay_endpoints')
+    def test_poll_invalidates_bay_endpoints(self, mock_bay_endpoints):
+        mock_heat_stack, bay, poller = self.setup_poll_test()
+
+        bay.status = bay_status.CREATE_IN_PROGRESS
+        mock_heat_stack.stack_status = bay_status.CREATE_IN_PROGRESS
+        poller.poll_and_check()
+        self.assertFalse(mock_bay_endpoints.invalidate.called)
+
+        mock_heat_stack.stack_status = bay_status.DELETE_IN_PROGRESS
+        poller.poll_and_check()
+        mock_bay_endpoints.invalidate.assert_called_once_with(bay.uuid)
+
     def test_poll_done(self):
         mock_heat_stack, bay, poller = self.setup_poll_test()
 
@@ -722,6 +738,418 @@ class TestBayConductorWithK8s(base.TestCase):
         mock_heat_stack.timeout_mins = 60
         self.assertRaises(loopingcall.LoopingCallDone, poller.poll_and_check)
 
+    def test_poll_backs_off_while_status_unchanged(self):
+        cfg.CONF.set_override('wait_interval', 1, group='bay_heat')
+        cfg.CONF.set_override('max_wait_interval', 5, group='bay_heat')
+        mock_heat_stack, bay, poller = self.setup_poll_test()
+        mock_heat_stack.stack_status = bay_status.CREATE_IN_PROGRESS
+
+        intervals = []
+        for i in range(5):
+            poller.poll_and_check()
+            intervals.append(poller.interval)
+
+        self.assertEqual([1, 2, 4, 5, 5], intervals)
+
+    def test_poll_backoff_reset_on_status_change(self):
+        cfg.CONF.set_override('wait_interval', 1, group='bay_heat')
+        mock_heat_stack, bay, poller = self.setup_poll_test()
+        mock_heat_stack.stack_status = bay_status.UPDATE_IN_PROGRESS
+        poller.poll_and_check()
+        poller.poll_and_check()
+        self.assertEqual(2, poller.interval)
+
+        mock_heat_stack.stack_status = bay_status.DELETE_IN_PROGRESS
+        poller.poll_and_check()
+        self.assertEqual(1, poller.interval)
+
+    @patch('time.time')
+    def test_poll_slowly_with_notifications(self, mock_time):
+        cfg.CONF.set_override('use_notifications', True, group='bay_heat')
+        cfg.CONF.set_override('max_wait_interval', 60, group='bay_heat')
+        mock_time.return_value = 1000
+        mock_heat_stack, bay, poller = self.setup_poll_test()
+        mock_heat_stack.stack_status = bay_status.CREATE_IN_PROGRESS
+
+        poller.poll_and_check()
+
+        self.assertEqual(1060, poller.next_poll)
+
+    def test_poll_bay_already_destroyed(self):
+        mock_heat_stack, bay, poller = self.setup_poll_test()
+        mock_heat_stack.stack_status = bay_status.DELETE_COMPLETE
+        bay.destroy.side_effect = exception.BayNotFound(bay='bay1')
+
+        self.assertRaises(loopingcall.LoopingCallDone, poller.poll_and_check)
+
+    @patch('time.time')
+    def test_poll_around_expected_duration(self, mock_time):
+        cfg.CONF.set_override('wait_interval', 1, group='bay_heat')
+        cfg.CONF.set_override('max_wait_interval', 60, group='bay_heat')
+        mock_time.return_value = 1000
+        estimator = bay_conductor.StackDurationEstimator()
+        mock_heat_stack, bay, poller = self.setup_poll_test()
+        poller = bay_conductor.HeatPoller(poller.openstack_client, bay,
+                                          estimator)
+        estimator.record((bay.baymodel_id, 'CREATE'), 10)
+        mock_heat_stack.stack_status = bay_status.CREATE_IN_PROGRESS
+
+        for now in (1000, 1001, 1003, 1007):
+            mock_time.return_value = now
+            poller.poll_and_check()
+
+        # the backoff would poll at 1015, the estimate pulls it to 1010
+        self.assertEqual(1010, poller.next_poll)
+        self.assertEqual(1, poller.interval)
+
+    @patch('time.time')
+    def test_poll_records_duration(self, mock_time):
+        mock_time.return_value = 1000
+        estimator = bay_conductor.StackDurationEstimator()
+        mock_heat_stack, bay, poller = self.setup_poll_test()
+        poller = bay_conductor.HeatPoller(poller.openstack_client, bay,
+                                          estimator)
+        mock_heat_stack.stack_status = bay_status.DELETE_IN_PROGRESS
+        poller.poll_and_check()
+
+        mock_time.return_value = 1042
+        mock_heat_stack.stack_status = bay_status.DELETE_COMPLETE
+        self.assertRaises(loopingcall.LoopingCallDone, poller.poll_and_check)
+
+        self.assertEqual(42, estimator.estimate((bay.baymodel_id, 'DELETE')))
+
+    def test_estimator_moving_average(self):
+        estimator = bay_conductor.StackDurationEstimator(weight=0.5)
+        self.assertIsNone(estimator.estimate('key'))
+        estimator.record('key', 100)
+        self.assertEqual(100, estimator.estimate('key'))
+        estimator.record('key', 200)
+        self.assertEqual(150, estimator.estimate('key'))
+
+
+class TestHeatPollerService(base.TestCase):
+
+    def setUp(self):
+        super(TestHeatPollerService, self).setUp()
+        self.service = bay_conductor.HeatPollerService()
+        self.mock_heat_client = mock.MagicMock()
+        self.osc = mock.MagicMock()
+        self.osc.context = self.context
+        self.osc.heat.return_value = self.mock_heat_client
+
+    def _add_bay(self, stack_id, status=bay_status.CREATE_IN_PROGRESS):
+        bay = mock.MagicMock(stack_id=stack_id, status=status)
+        self.service.add(self.osc, bay)
+        return bay
+
+    def _stack(self, stack_id, status, reason=None):
+        return mock.MagicMock(id=stack_id, stack_status=status,
+                              stack_status_reason=reason)
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_add_starts_one_looping_call(self, mock_looping_call):
+        self._add_bay('stack1')
+        self._add_bay('stack2')
+
+        mock_looping_call.assert_called_once_with(f=self.service.poll)
+        self.assertEqual(1, mock_looping_call.return_value.start.call_count)
+
+    @patch('magnum.conductor.bay_lock.BayLock')
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_add_locks_bay(self, mock_looping_call, mock_bay_lock):
+        self.service = bay_conductor.HeatPollerService('conductor1')
+        bay = self._add_bay('stack1')
+        self.assertTrue(self.service.is_polling(bay))
+        mock_bay_lock.assert_called_once_with(self.context, bay,
+                                              'conductor1')
+        mock_bay_lock.return_value.acquire.assert_called_once_with()
+
+        # polling the bay again keeps the lock
+        bay = self._add_bay('stack1')
+        self.assertEqual(1, mock_bay_lock.call_count)
+
+        self.mock_heat_client.stacks.list.return_value = [
+            self._stack('stack1', bay_status.CREATE_FAILED)]
+        self.service.poll()
+        self.assertFalse(self.service.is_polling(bay))
+        mock_bay_lock.return_value.release.assert_called_once_with(bay.uuid)
+
+    @patch('magnum.conductor.bay_lock.BayLock')
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_add_bay_locked_by_other_conductor(self, mock_looping_call,
+                                               mock_bay_lock):
+        self.service = bay_conductor.HeatPollerService('conductor1')
+        mock_bay_lock.return_value.acquire.side_effect = (
+            exception.OperationInProgress(bay_name='bay1'))
+        bay = mock.MagicMock(stack_id='stack1')
+
+        self.assertFalse(self.service.add(self.osc, bay))
+        self.assertFalse(self.service.is_polling(bay))
+        self.assertFalse(mock_looping_call.called)
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_stops_when_no_bays(self, mock_looping_call):
+        self.assertRaises(loopingcall.LoopingCallDone, self.service.poll)
+
+        self._add_bay('stack1')
+        self.assertEqual(1, mock_looping_call.call_count)
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_lists_stacks_in_batches(self, mock_looping_call):
+        cfg.CONF.set_override('max_stacks_per_poll', 2, group='bay_heat')
+        for i in range(3):
+            self._add_bay('stack%d' % i)
+        self.mock_heat_client.stacks.list.return_value = []
+
+        self.service.poll()
+
+        self.assertEqual(2, self.mock_heat_client.stacks.list.call_count)
+        listed = []
+        for call in self.mock_heat_client.stacks.list.call_args_list:
+            self.assertTrue(call[1]['show_deleted'])
+            listed.extend(call[1]['filters']['id'])
+        self.assertEqual(['stack0', 'stack1', 'stack2'], sorted(listed))
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_in_progress_does_not_get_stack(self, mock_looping_call):
+        bay = self._add_bay('stack1')
+        self.mock_heat_client.stacks.list.return_value = [
+            self._stack('stack1', bay_status.CREATE_IN_PROGRESS)]
+
+        self.service.poll()
+
+        self.assertFalse(self.mock_heat_client.stacks.get.called)
+        self.assertEqual(0, bay.save.call_count)
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_skips_bays_not_due(self, mock_looping_call):
+        bay = self._add_bay('stack1')
+        self.mock_heat_client.stacks.list.return_value = [
+            self._stack('stack1', bay_status.CREATE_IN_PROGRESS)]
+        self.service.poll()
+        self.assertEqual(1, self.mock_heat_client.stacks.list.call_count)
+
+        # the next poll of the bay is wait_interval seconds away
+        self.service.poll()
+        self.assertEqual(1, self.mock_heat_client.stacks.list.call_count)
+        self.assertEqual(0, bay.save.call_count)
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_failed_stack_stops_polling(self, mock_looping_call):
+        bay = self._add_bay('stack1')
+        self.mock_heat_client.stacks.list.return_value = [
+            self._stack('stack1', bay_status.CREATE_FAILED, 'failed')]
+
+        self.service.poll()
+
+        self.assertFalse(self.mock_heat_client.stacks.get.called)
+        self.assertEqual(bay_status.CREATE_FAILED, bay.status)
+        self.assertEqual('failed', bay.status_reason)
+        self.assertEqual(1, bay.save.call_count)
+        self.assertRaises(loopingcall.LoopingCallDone, self.service.poll)
+
+    @patch('magnum.conductor.handlers.bay_conductor._update_stack_outputs')
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_complete_gets_stack_outputs(self, mock_looping_call,
+                                              mock_update_stack_outputs):
+        bay = self._add_bay('stack1')
+        self.mock_heat_client.stacks.list.return_value = [
+            self._stack('stack1', bay_status.CREATE_COMPLETE)]
+        stack = self._stack('stack1', bay_status.CREATE_COMPLETE)
+        self.mock_heat_client.stacks.get.return_value = stack
+
+        self.service.poll()
+
+        self.mock_heat_client.stacks.get.assert_called_once_with('stack1')
+        mock_update_stack_outputs.assert_called_once_with(self.context,
+                                                          stack, bay)
+        self.assertEqual(bay_status.CREATE_COMPLETE, bay.status)
+        self.assertRaises(loopingcall.LoopingCallDone, self.service.poll)
+
+    @patch('magnum.conductor.handlers.bay_conductor._update_stack_outputs')
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_resumed_bay_of_other_project(self, mock_looping_call,
+                                               mock_update_stack_outputs):
+        self.osc.context = context.make_admin_context(all_tenants=True)
+        bay = mock.MagicMock(stack_id='stack1', project_id='project2',
+                             status=bay_status.CREATE_IN_PROGRESS)
+        self.service.add(self.osc, bay)
+        self.mock_heat_client.stacks.list.return_value = [
+            self._stack('stack1', bay_status.CREATE_COMPLETE)]
+        self.mock_heat_client.stacks.get.side_effect = exc.HTTPNotFound()
+
+        self.service.poll()
+
+        self.mock_heat_client.stacks.get.assert_called_once_with('stack1')
+        self.mock_heat_client.stacks.list.assert_called_with(
+            filters={'id': 'stack1'}, show_deleted=True, global_tenant=True)
+        self.assertFalse(mock_update_stack_outputs.called)
+        self.assertEqual(bay_status.CREATE_COMPLETE, bay.status)
+        self.assertFalse(self.service.is_polling(bay))
+        self.assertRaises(loopingcall.LoopingCallDone, self.service.poll)
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_unlisted_stack_of_other_project(self, mock_looping_call):
+        self.osc.context = context.make_admin_context(all_tenants=True)
+        bay = mock.MagicMock(stack_id='stack1', project_id='project2',
+                             status=bay_status.DELETE_IN_PROGRESS)
+        self.service.add(self.osc, bay)
+        self.mock_heat_client.stacks.list.return_value = []
+        self.mock_heat_client.stacks.get.side_effect = exc.HTTPNotFound()
+
+        self.service.poll()
+
+        self.assertEqual(2, self.mock_heat_client.stacks.list.call_count)
+        self.assertEqual(bay_status.DELETE_IN_PROGRESS, bay.status)
+        self.assertFalse(self.service.is_polling(bay))
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_unlisted_stack_gets_stack(self, mock_looping_call):
+        bay = self._add_bay('stack1', bay_status.DELETE_IN_PROGRESS)
+        self.mock_heat_client.stacks.list.return_value = []
+        self.mock_heat_client.stacks.get.return_value = self._stack(
+            'stack1', bay_status.DELETE_COMPLETE)
+
+        self.service.poll()
+
+        self.mock_heat_client.stacks.get.assert_called_once_with('stack1')
+        self.assertEqual(1, bay.destroy.call_count)
+
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_list_failure_keeps_polling(self, mock_looping_call):
+        self._add_bay('stack1')
+        self.mock_heat_client.stacks.list.side_effect = exc.HTTPNotFound
+
+        self.service.poll()
+        self.service.poll()
+
+        self.assertEqual(2, self.mock_heat_client.stacks.list.call_count)
+
+    def _owned_by(self, owners):
+        ring = mock.MagicMock(version=1)
+        ring.get_owner.side_effect = lambda uuid: owners[uuid]
+        ring.is_owner.side_effect = lambda uuid: owners[uuid] == 'conductor1'
+        return ring
+
+    @patch('magnum.conductor.handlers.bay_conductor.ListenerAPI')
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_add_hands_bay_over_to_owner(self, mock_looping_call,
+                                         mock_listener_api):
+        ring = self._owned_by({'uuid1': 'conductor2'})
+        self.service = bay_conductor.HeatPollerService(ring=ring)
+        bay = mock.MagicMock(stack_id='stack1', uuid='uuid1')
+
+        self.assertTrue(self.service.add(self.osc, bay))
+
+        self.assertFalse(self.service.is_polling(bay))
+        self.assertEqual('conductor2',
+                         mock_listener_api.call_args[1]['server'])
+        mock_listener_api.return_value.poll_bay.assert_called_once_with(
+            'uuid1')
+
+    @patch('magnum.conductor.handlers.bay_conductor.ListenerAPI')
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_add_without_hand_over(self, mock_looping_call,
+                                   mock_listener_api):
+        ring = self._owned_by({'uuid1': 'conductor2'})
+        self.service = bay_conductor.HeatPollerService(ring=ring)
+        bay = mock.MagicMock(stack_id='stack1', uuid='uuid1')
+
+        self.assertTrue(self.service.add(self.osc, bay, hand_over=False))
+
+        self.assertTrue(self.service.is_polling(bay))
+        self.assertFalse(mock_listener_api.called)
+
+    @patch('magnum.conductor.handlers.bay_conductor.ListenerAPI')
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    def test_poll_hands_bays_over_on_rebalance(self, mock_looping_call,
+                                               mock_listener_api):
+        owners = {'uuid1': 'conductor1', 'uuid2': 'conductor1'}
+        ring = self._owned_by(owners)
+        self.service = bay_conductor.HeatPollerService(ring=ring)
+        bay1 = mock.MagicMock(stack_id='stack1', uuid='uuid1')
+        bay2 = mock.MagicMock(stack_id='stack2', uuid='uuid2')
+        self.service.add(self.osc, bay1)
+        self.service.add(self.osc, bay2)
+        self.mock_heat_client.stacks.list.return_value = []
+
+        # conductor2 joins the ring and owns the second bay
+        owners['uuid2'] = 'conductor2'
+        self.service.poll()
+        self.assertFalse(mock_listener_api.called)
+
+        ring.version = 2
+        self.service.poll()
+
+        self.assertTrue(self.service.is_polling(bay1))
+        self.assertFalse(self.service.is_polling(bay2))
+        mock_listener_api.return_value.poll_bay.assert_called_once_with(
+            'uuid2')
+
+
+class TestTemplateCache(base.TestCase):
+
+    def setUp(self):
+        super(TestTemplateCache, self).setUp()
+        self.cache = bay_conductor.TemplateCache()
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.template_path = self._write(
+            'bay.yaml',
+            'heat_template_version: 2013-05-23\n'
+            'resources:\n'
+            '  config:\n'
+            '    type: OS::Heat::SoftwareConfig\n'
+            '    properties:\n'
+            '      config: {get_file: fragment.sh}\n')
+        self.fragment_path = self._write('fragment.sh', 'echo 1\n')
+
+    def _write(self, name, content, mtime=None):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def _get(self):
+        return self.cache.get_template_contents(self.template_path)
+
+    @patch('heatclient.common.template_utils.get_template_contents',
+           wraps=bay_conductor.template_utils.get_template_contents)
+    def test_get_template_contents_cached(self, mock_get_template_contents):
+        tpl_files, template = self._get()
+        template['resources'] = {}
+        tpl_files.clear()
+
+        tpl_files, template = self._get()
+
+        self.assertEqual(1, mock_get_template_contents.call_count)
+        self.assertIn('config', template['resources'])
+        self.assertEqual(['echo 1\n'], list(tpl_files.values()))
+
+    @patch('heatclient.common.template_utils.get_template_contents',
+           wraps=bay_conductor.template_utils.get_template_contents)
+    def test_get_template_contents_fragment_changed(
+            self, mock_get_template_contents):
+        self._get()
+        self._write('fragment.sh', 'echo 2\n',
+                    mtime=os.path.getmtime(self.fragment_path) + 10)
+
+        tpl_files, template = self._get()
+
+        self.assertEqual(2, mock_get_template_contents.call_count)
+        self.assertEqual(['echo 2\n'], list(tpl_files.values()))
+
+    @patch('heatclient.common.template_utils.get_template_contents')
+    def test_get_template_contents_missing_file(self,
+                                                mock_get_template_contents):
+        mock_get_template_contents.return_value = (
+            {'file:///missing.sh': 'echo 1'}, {})
+        self._get()
+        self._get()
+        self.assertEqual(2, mock_get_template_contents.call_count)
+
 
 class TestHandler(db_base.DbTestCase):
 
@@ -776,6 +1204,28 @@ class TestHandler(db_base.DbTestCase):
 
         bay = objects.Bay.get(self.context, self.bay.uuid)
         self.assertEqual(bay.node_count, 1)
+        self.assertIn('CREATE_FAILED', bay.status_reason)
+
+    @patch('magnum.conductor.handlers.bay_conductor.Handler._poll_and_check')
+    @patch('magnum.conductor.handlers.bay_conductor._update_stack')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_update_stack_failure(
+            self, mock_openstack_client_class,
+            mock_update_stack, mock_poll_and_check):
+        mock_heat_client = mock_openstack_client_class.return_value.heat()
+        mock_heat_client.stacks.get.return_value.stack_status = (
+            bay_status.CREATE_COMPLETE)
+        mock_update_stack.side_effect = exc.HTTPBadRequest('bad request')
+
+        self.bay.node_count = 2
+        self.assertRaises(exc.HTTPBadRequest, self.handler.bay_update,
+                          self.context, self.bay)
+
+        bay = objects.Bay.get(self.context, self.bay.uuid)
+        self.assertEqual(1, bay.node_count)
+        self.assertEqual(bay_status.UPDATE_FAILED, bay.status)
+        self.assertIn('bad request', bay.status_reason)
+        self.assertFalse(mock_poll_and_check.called)
 
     @patch('magnum.conductor.handlers.bay_conductor._create_stack')
     @patch('magnum.common.clients.OpenStackClients')
@@ -786,6 +1236,130 @@ class TestHandler(db_base.DbTestCase):
                           self.handler.bay_create, self.context,
                           self.bay, timeout)
 
+        bay = objects.Bay.get(self.context, self.bay.uuid)
+        self.assertEqual(bay_status.CREATE_FAILED, bay.status)
+        self.assertIsNotNone(bay.status_reason)
+
+    @patch('magnum.conductor.handlers.bay_conductor.Handler._poll_and_check')
+    @patch('magnum.conductor.handlers.bay_conductor._create_stack')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_create_saves_stack_id(self, mock_openstack_client_class,
+                                   mock_create_stack, mock_poll_and_check):
+        mock_create_stack.return_value = {'stack': {'id': 'stack1'}}
+
+        self.handler.bay_create(self.context, self.bay, 15)
+
+        bay = objects.Bay.get(self.context, self.bay.uuid)
+        self.assertEqual('stack1', bay.stack_id)
+        self.assertEqual(1, mock_poll_and_check.call_count)
+
+    def _create_bays(self, count):
+        bays = []
+        for i in range(count):
+            bay_dict = utils.get_test_bay(id=i + 10,
+                                          uuid=magnum_utils.generate_uuid(),
+                                          name='bay-%d' % i,
+                                          stack_id=None)
+            bay = objects.Bay(self.context, **bay_dict)
+            bay.create()
+            bays.append(bay)
+        return bays
+
+    @patch('magnum.conductor.handlers.bay_conductor.Handler._poll_and_check')
+    @patch('magnum.conductor.handlers.bay_conductor._get_template_definition')
+    @patch('magnum.conductor.handlers.bay_conductor._get_baymodel')
+    @patch('magnum.conductor.handlers.bay_conductor._create_stack')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_bulk_create(self, mock_openstack_client_class,
+                         mock_create_stack, mock_get_baymodel,
+                         mock_get_template_definition, mock_poll_and_check):
+        bays = self._create_bays(3)
+        mock_create_stack.side_effect = (
+            lambda context, osc, bay, timeout, **kwargs:
+                {'stack': {'id': 'stack-%s' % bay.name}})
+
+        self.handler.bay_bulk_create(self.context, bays, 15)
+
+        mock_get_baymodel.assert_called_once_with(self.context, bays[0])
+        mock_get_template_definition.assert_called_once_with(
+            mock_get_baymodel.return_value)
+        self.assertEqual(1, mock_openstack_client_class.call_count)
+        osc = mock_openstack_client_class.return_value
+        for bay in bays:
+            mock_create_stack.assert_any_call(
+                self.context, osc, bay, 15,
+                baymodel=mock_get_baymodel.return_value,
+                definition=mock_get_template_definition.return_value)
+            db_bay = objects.Bay.get(self.context, bay.uuid)
+            self.assertEqual('stack-%s' % bay.name, db_bay.stack_id)
+        self.assertEqual(3, mock_poll_and_check.call_count)
+
+    @patch('magnum.conductor.handlers.bay_conductor.Handler._poll_and_check')
+    @patch('magnum.conductor.handlers.bay_conductor._get_template_definition')
+    @patch('magnum.conductor.handlers.bay_conductor._get_baymodel')
+    @patch('magnum.conductor.handlers.bay_conductor._create_stack')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_bulk_create_records_failures(self, mock_openstack_client_class,
+                                          mock_create_stack,
+                                          mock_get_baymodel,
+                                          mock_get_template_definition,
+                                          mock_poll_and_check):
+        bays = self._create_bays(2)
+
+        def create_stack(context, osc, bay, timeout, **kwargs):
+            if bay.uuid == bays[0].uuid:
+                raise exc.HTTPBadRequest('bad request')
+            return {'stack': {'id': 'stack1'}}
+        mock_create_stack.side_effect = create_stack
+
+        self.handler.bay_bulk_create(self.context, bays, 15)
+
+        failed = objects.Bay.get(self.context, bays[0].uuid)
+        self.assertEqual(bay_status.CREATE_FAILED, failed.status)
+        self.assertIn('bad request', failed.status_reason)
+        self.assertIsNone(failed.stack_id)
+        created = objects.Bay.get(self.context, bays[1].uuid)
+        self.assertEqual('stack1', created.stack_id)
+        mock_poll_and_check.assert_called_once_with(
+            mock_openstack_client_class.return_value, mock.ANY)
+
+    @patch('magnum.conductor.handlers.bay_conductor._create_stack')
+    @patch('magnum.conductor.handlers.bay_conductor._get_baymodel')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_bulk_create_baymodel_not_found(self, mock_openstack_client_class,
+                                            mock_get_baymodel,
+                                            mock_create_stack):
+        bays = self._create_bays(2)
+        mock_get_baymodel.side_effect = exception.BayModelNotFound(
+            baymodel='fake')
+
+        self.assertRaises(exception.BayModelNotFound,
+                          self.handler.bay_bulk_create, self.context, bays,
+                          15)
+
+        self.assertFalse(mock_create_stack.called)
+        for bay in bays:
+            db_bay = objects.Bay.get(self.context, bay.uuid)
+            self.assertEqual(bay_status.CREATE_FAILED, db_bay.status)
+
+    @patch('magnum.conductor.handlers.bay_conductor.greenpool.GreenPool')
+    @patch('magnum.conductor.handlers.bay_conductor._get_template_definition')
+    @patch('magnum.conductor.handlers.bay_conductor._get_baymodel')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_bulk_create_pool_size(self, mock_openstack_client_class,
+                                   mock_get_baymodel,
+                                   mock_get_template_definition,
+                                   mock_pool_class):
+        cfg.CONF.set_override('max_concurrent_stacks', 4, group='bay_heat')
+        bays = self._create_bays(2)
+
+        self.handler.bay_bulk_create(self.context, bays, 15)
+
+        mock_pool_class.assert_called_once_with(4)
+        pool = mock_pool_class.return_value
+        self.assertEqual(2, pool.spawn_n.call_count)
+        pool.waitall.assert_called_once_with()
+
     @patch('magnum.common.clients.OpenStackClients')
     def test_bay_delete(self, mock_openstack_client_class):
         osc = mock.MagicMock()
@@ -796,6 +1370,39 @@ class TestHandler(db_base.DbTestCase):
         self.assertRaises(exception.BayNotFound,
                           objects.Bay.get, self.context, self.bay.uuid)
 
+    @patch('magnum.conductor.handlers.kube.bay_endpoints')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_bay_delete_invalidates_bay_endpoints(
+            self, mock_openstack_client_class, mock_bay_endpoints):
+        with patch.object(self.handler, '_poll_and_check'):
+            self.handler.bay_delete(self.context, self.bay.uuid)
+
+        mock_bay_endpoints.invalidate.assert_called_once_with(self.bay.uuid)
+
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_bay_delete_without_stack(self, mock_openstack_client_class):
+        self.bay.stack_id = None
+        self.bay.save()
+
+        self.handler.bay_delete(self.context, self.bay.uuid)
+
+        self.assertFalse(mock_openstack_client_class.return_value.heat.called)
+        self.assertRaises(exception.BayNotFound,
+                          objects.Bay.get, self.context, self.bay.uuid)
+
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_bay_delete_failure(self, mock_openstack_client_class):
+        mock_heat_client = mock_openstack_client_class.return_value.heat()
+        mock_heat_client.stacks.delete.side_effect = exc.HTTPForbidden(
+            'forbidden')
+
+        self.assertRaises(exc.HTTPForbidden, self.handler.bay_delete,
+                          self.context, self.bay.uuid)
+
+        bay = objects.Bay.get(self.context, self.bay.uuid)
+        self.assertEqual(bay_status.DELETE_FAILED, bay.status)
+        self.assertIn('forbidden', bay.status_reason)
+
 
 class TestBayConductorWithSwarm(base.TestCase):
     def setUp(self):
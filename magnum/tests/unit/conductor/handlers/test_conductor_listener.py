@@ -10,6 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import mock
+
+from magnum.common import exception
 from magnum.conductor.handlers import conductor_listener
 from magnum.tests import base
 
@@ -22,3 +25,35 @@ class TestHandler(base.BaseTestCase):
 
     def test_ping_conductor(self):
         self.assertEqual(self.handler.ping_conductor({}), True)
+
+    def test_conductor_heartbeat(self):
+        ring = mock.MagicMock()
+        handler = conductor_listener.Handler(ring)
+        handler.conductor_heartbeat({}, 'conductor2')
+        ring.heartbeat.assert_called_once_with('conductor2')
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    @mock.patch('magnum.objects.Bay.get_by_uuid')
+    def test_poll_bay(self, mock_get_by_uuid, mock_osc):
+        heat_poller = mock.MagicMock()
+        handler = conductor_listener.Handler(heat_poller=heat_poller)
+
+        handler.poll_bay({}, 'uuid1')
+
+        ctx = mock_get_by_uuid.call_args[0][0]
+        self.assertTrue(ctx.is_admin)
+        self.assertTrue(ctx.all_tenants)
+        mock_get_by_uuid.assert_called_once_with(ctx, 'uuid1')
+        heat_poller.add.assert_called_once_with(
+            mock_osc.return_value, mock_get_by_uuid.return_value,
+            hand_over=False)
+
+    @mock.patch('magnum.objects.Bay.get_by_uuid')
+    def test_poll_bay_not_found(self, mock_get_by_uuid):
+        heat_poller = mock.MagicMock()
+        handler = conductor_listener.Handler(heat_poller=heat_poller)
+        mock_get_by_uuid.side_effect = exception.BayNotFound(bay='uuid1')
+
+        handler.poll_bay({}, 'uuid1')
+
+        self.assertFalse(heat_poller.add.called)
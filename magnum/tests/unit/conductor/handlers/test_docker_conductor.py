@@ -12,6 +12,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from docker import errors
+import eventlet
+from eventlet import event
 import mock
 from oslo_config import cfg
 
@@ -29,11 +31,14 @@ class TestDockerConductor(base.BaseTestCase):
     def setUp(self):
         super(TestDockerConductor, self).setUp()
         self.conductor = docker_conductor.Handler()
+        p = mock.patch.object(objects.Container, 'get_by_uuid')
+        self.mock_get_container = p.start()
+        self.addCleanup(p.stop)
 
-    @mock.patch.object(docker_conductor, 'docker_client')
+    @mock.patch.object(docker_conductor.docker_client, 'DockerHTTPClient')
     def test_docker_for_bay(self, mock_docker_client):
         mock_docker = mock.MagicMock()
-        mock_docker_client.DockerHTTPClient.return_value = mock_docker
+        mock_docker_client.return_value = mock_docker
         mock_bay = mock.MagicMock()
         mock_bay.api_address = '1.1.1.1'
 
@@ -43,14 +48,14 @@ class TestDockerConductor(base.BaseTestCase):
 
         args = ('tcp://1.1.1.1:2376', CONF.docker.docker_remote_api_version,
                 CONF.docker.default_timeout)
-        mock_docker_client.DockerHTTPClient.assert_called_once_with(*args)
+        mock_docker_client.assert_called_once_with(*args)
 
-    @mock.patch.object(docker_conductor, 'docker_client')
+    @mock.patch.object(docker_conductor.docker_client, 'DockerHTTPClient')
     @mock.patch.object(docker_conductor.objects.Bay, 'get_by_uuid')
     def test_get_docker_client(self, mock_bay_get_by_uuid,
                                mock_docker_client):
         mock_docker = mock.MagicMock()
-        mock_docker_client.DockerHTTPClient.return_value = mock_docker
+        mock_docker_client.return_value = mock_docker
 
         mock_bay = mock.MagicMock()
         mock_bay.api_address = '1.1.1.1'
@@ -69,9 +74,9 @@ class TestDockerConductor(base.BaseTestCase):
                 CONF.docker.default_timeout)
         mock_bay_get_by_uuid.assert_called_once_with(mock.sentinel.context,
                                                      mock_container.bay_uuid)
-        mock_docker_client.DockerHTTPClient.assert_called_once_with(*args)
+        mock_docker_client.assert_called_once_with(*args)
 
-    @mock.patch.object(docker_conductor, 'docker_client')
+    @mock.patch.object(docker_conductor.docker_client, 'DockerHTTPClient')
     @mock.patch.object(docker_conductor.objects.Bay, 'get_by_uuid')
     @mock.patch.object(docker_conductor.objects.Container, 'get_by_uuid')
     def test_get_docker_client_container_uuid(self,
@@ -79,7 +84,7 @@ class TestDockerConductor(base.BaseTestCase):
                                               mock_bay_get_by_uuid,
                                               mock_docker_client):
         mock_docker = mock.MagicMock()
-        mock_docker_client.DockerHTTPClient.return_value = mock_docker
+        mock_docker_client.return_value = mock_docker
 
         mock_bay = mock.MagicMock()
         mock_bay.api_address = '1.1.1.1'
@@ -102,13 +107,15 @@ class TestDockerConductor(base.BaseTestCase):
             mock_container.uuid)
         mock_bay_get_by_uuid.assert_called_once_with(mock.sentinel.context,
                                                      mock_container.bay_uuid)
-        mock_docker_client.DockerHTTPClient.assert_called_once_with(*args)
+        mock_docker_client.assert_called_once_with(*args)
 
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_create(self, mock_get_docker_client):
         mock_docker = mock.MagicMock()
         mock_get_docker_client.return_value = mock_docker
 
+        mock_docker.create_container.return_value = {'Id': '2703ef2b705d'}
+
         mock_container = mock.MagicMock()
         mock_container.image_id = 'test_image:some_tag'
         mock_container.command = None
@@ -117,16 +124,17 @@ class TestDockerConductor(base.BaseTestCase):
             None, 'some-name',
             'some-uuid', mock_container)
 
-        utf8_image_id = self.conductor._encode_utf8(mock_container.image_id)
         mock_docker.pull.assert_called_once_with('test_image',
                                                  tag='some_tag')
-        mock_docker.inspect_image.assert_called_once_with(utf8_image_id)
+        self.assertFalse(mock_docker.inspect_image.called)
         mock_docker.create_container.assert_called_once_with(
             mock_container.image_id,
             name='some-name',
             hostname='some-uuid',
             command=None)
         self.assertEqual(obj_container.STOPPED, container.status)
+        self.assertEqual('2703ef2b705d', container.docker_id)
+        mock_container.save.assert_called_once_with()
 
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_create_with_command(self, mock_get_docker_client):
@@ -141,10 +149,9 @@ class TestDockerConductor(base.BaseTestCase):
             None, 'some-name',
             'some-uuid', mock_container)
 
-        utf8_image_id = self.conductor._encode_utf8(mock_container.image_id)
         mock_docker.pull.assert_called_once_with('test_image',
                                                  tag='some_tag')
-        mock_docker.inspect_image.assert_called_once_with(utf8_image_id)
+        self.assertFalse(mock_docker.inspect_image.called)
         mock_docker.create_container.assert_called_once_with(
             mock_container.image_id,
             name='some-name',
@@ -152,6 +159,26 @@ class TestDockerConductor(base.BaseTestCase):
             command='env')
         self.assertEqual(obj_container.STOPPED, container.status)
 
+    @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
+    def test_container_create_with_image_present(self,
+                                                 mock_get_docker_client):
+        mock_docker = mock.MagicMock()
+        mock_get_docker_client.return_value = mock_docker
+        mock_docker.images.return_value = [
+            {'RepoTags': ['test_image:some_tag']}]
+        mock_docker.create_container.return_value = {'Id': '2703ef2b705d'}
+        mock_container = mock.MagicMock()
+        mock_container.image_id = 'test_image:some_tag'
+
+        self.conductor.container_create(None, 'some-name', 'some-uuid',
+                                        mock_container)
+        self.conductor.container_create(None, 'some-name', 'some-uuid',
+                                        mock_container)
+
+        mock_docker.images.assert_called_once_with()
+        self.assertFalse(mock_docker.pull.called)
+        self.assertEqual(2, mock_docker.create_container.call_count)
+
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_create_with_failure(self, mock_get_docker_client):
         mock_docker = mock.MagicMock()
@@ -173,17 +200,126 @@ class TestDockerConductor(base.BaseTestCase):
             mock_init.assert_called_once_with()
             self.assertEqual(obj_container.ERROR, mock_container.status)
 
+    @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
+    def test_container_create_with_failure_lists_images_again(
+            self, mock_get_docker_client):
+        mock_docker = mock.MagicMock()
+        mock_get_docker_client.return_value = mock_docker
+        mock_docker.images.return_value = [
+            {'RepoTags': ['test_image:some_tag']}]
+        mock_docker.create_container.side_effect = errors.APIError(
+            'Not found', mock.MagicMock(status_code=404))
+        mock_container = mock.MagicMock()
+        mock_container.image_id = 'test_image:some_tag'
+
+        for i in range(2):
+            self.assertRaises(exception.ContainerException,
+                              self.conductor.container_create,
+                              None, 'some-name', 'some-uuid', mock_container)
+
+        self.assertEqual(2, mock_docker.images.call_count)
+
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    def test_image_prepull(self, mock_bay_get_by_uuid, mock_docker_for_bay):
+        mock_bay_get_by_uuid.return_value.uuid = 'bay-uuid'
+        mock_docker = mock_docker_for_bay.return_value
+        mock_docker.images.return_value = [{'RepoTags': ['ubuntu:latest']}]
+        mock_docker.pull.side_effect = [
+            errors.APIError('Error', mock.MagicMock(status_code=500)), None]
+
+        self.conductor.image_prepull(mock.sentinel.context, 'bay-uuid',
+                                     ['ubuntu', 'fedora', 'nginx:1.9'])
+
+        mock_bay_get_by_uuid.assert_called_once_with(mock.sentinel.context,
+                                                     'bay-uuid')
+        self.assertEqual([mock.call('fedora', tag=None),
+                          mock.call('nginx', tag='1.9')],
+                         mock_docker.pull.call_args_list)
+
     def test_find_container_by_name_not_found(self):
         mock_docker = mock.MagicMock()
         fake_response = mock.MagicMock()
         fake_response.content = 'not_found'
         fake_response.status_code = 404
-        mock_docker.list_instances.side_effect = errors.APIError(
+        mock_docker.containers.side_effect = errors.APIError(
             'not_found', fake_response)
-        ret = self.conductor._find_container_by_name(mock_docker, '1')
+        mock_container = mock.MagicMock()
+        ret = self.conductor._find_container_by_name(mock_docker,
+                                                     mock_container)
         self.assertEqual({}, ret)
 
+    def test_find_container_by_name(self):
+        mock_docker = mock.MagicMock()
+        mock_docker.containers.return_value = [{'Id': 'id1'}, {'Id': 'id2'}]
+        infos = {'id1': {'Id': 'id1', 'Config': {'Hostname': 'other'}},
+                 'id2': {'Id': 'id2', 'Config': {'Hostname': 'some-uuid'}}}
+        mock_docker.inspect_container.side_effect = infos.get
+        mock_container = mock.MagicMock()
+        mock_container.name = 'some-name'
+        mock_container.uuid = 'some-uuid'
+
+        ret = self.conductor._find_container_by_name(mock_docker,
+                                                     mock_container)
+
+        self.assertEqual(infos['id2'], ret)
+        mock_docker.containers.assert_called_once_with(
+            all=True, filters={'name': 'some-name'})
+        self.assertFalse(mock_docker.list_instances.called)
+
+    def test_find_container_by_name_without_name(self):
+        mock_docker = mock.MagicMock()
+        mock_docker.containers.return_value = []
+        mock_container = mock.MagicMock()
+        mock_container.name = None
+
+        ret = self.conductor._find_container_by_name(mock_docker,
+                                                     mock_container)
+
+        self.assertEqual({}, ret)
+        mock_docker.containers.assert_called_once_with(all=True,
+                                                       filters=None)
+
     @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    def test_find_docker_id_saved(self, mock_find_container):
+        mock_docker = mock.MagicMock()
+        mock_container = mock.MagicMock()
+        mock_container.docker_id = '2703ef2b705d'
+
+        ret = self.conductor._find_docker_id(mock_docker, mock_container)
+
+        self.assertEqual('2703ef2b705d', ret)
+        self.assertFalse(mock_find_container.called)
+        self.assertFalse(mock_docker.method_calls)
+
+    @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    def test_find_docker_id_looked_up(self, mock_find_container):
+        mock_docker = mock.MagicMock()
+        mock_container = mock.MagicMock()
+        mock_container.docker_id = None
+        mock_find_container.return_value = {'Id': '2703ef2b705d'}
+
+        ret = self.conductor._find_docker_id(mock_docker, mock_container)
+
+        self.assertEqual('2703ef2b705d', ret)
+        self.assertEqual('2703ef2b705d', mock_container.docker_id)
+        mock_container.save.assert_called_once_with()
+        mock_find_container.assert_called_once_with(mock_docker,
+                                                    mock_container)
+
+    @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    def test_find_docker_id_not_found(self, mock_find_container):
+        mock_docker = mock.MagicMock()
+        mock_container = mock.MagicMock()
+        mock_container.docker_id = None
+        mock_find_container.return_value = {}
+
+        ret = self.conductor._find_docker_id(mock_docker, mock_container)
+
+        self.assertIsNone(ret)
+        self.assertFalse(mock_container.save.called)
+
+    @mock.patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_delete(self, mock_get_docker_client,
                               mock_find_container):
@@ -195,10 +331,10 @@ class TestDockerConductor(base.BaseTestCase):
         self.conductor.container_delete(None, mock_container_uuid)
         mock_docker.remove_container.assert_called_once_with(
             mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, self.mock_get_container.return_value)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_delete_with_container_not_exist(
             self,
@@ -212,10 +348,10 @@ class TestDockerConductor(base.BaseTestCase):
         res = self.conductor.container_delete(None, mock_container_uuid)
         self.assertIsNone(res)
         self.assertFalse(mock_docker.remove_container.called)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, self.mock_get_container.return_value)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_delete_with_failure(
             self,
@@ -235,12 +371,30 @@ class TestDockerConductor(base.BaseTestCase):
                               None, mock_container_uuid)
             mock_docker.remove_container.assert_called_once_with(
                 mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
+    @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
+    def test_container_delete_with_docker_container_gone(
+            self,
+            mock_get_docker_client,
+            mock_find_container):
+        mock_docker = mock.MagicMock()
+        mock_get_docker_client.return_value = mock_docker
+        mock_container_uuid = 'd545a92d-609a-428f-8edb-16b02ad20ca1'
+        mock_find_container.return_value = '2703ef2b705d'
+        with patch.object(errors.APIError, '__str__',
+                          return_value='404 Client Error'):
+            mock_docker.remove_container = mock.Mock(
+                side_effect=errors.APIError('Error', '', ''))
+            res = self.conductor.container_delete(None, mock_container_uuid)
+        self.assertIsNone(res)
+        mock_docker.remove_container.assert_called_once_with('2703ef2b705d')
+
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_action(self, mock_get_docker_client,
                               mock_find_container, mock_get_by_uuid):
@@ -257,7 +411,7 @@ class TestDockerConductor(base.BaseTestCase):
         self.assertEqual('fake-status', mock_container.status)
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_reboot(self, mock_get_docker_client,
                               mock_find_container, mock_get_by_uuid):
@@ -270,11 +424,11 @@ class TestDockerConductor(base.BaseTestCase):
         mock_find_container.return_value = mock_docker_id
         self.conductor.container_reboot(None, mock_container_uuid)
         mock_docker.restart.assert_called_once_with(mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, mock_get_by_uuid.return_value)
         self.assertEqual(obj_container.RUNNING, mock_container.status)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_reboot_with_failure(self,
                                            mock_get_docker_client,
@@ -293,12 +447,12 @@ class TestDockerConductor(base.BaseTestCase):
                               self.conductor.container_reboot,
                               None, mock_container_uuid)
             mock_docker.restart.assert_called_once_with(mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_start(self, mock_get_docker_client,
                              mock_find_container, mock_get_by_uuid):
@@ -311,11 +465,11 @@ class TestDockerConductor(base.BaseTestCase):
         mock_find_container.return_value = mock_docker_id
         self.conductor.container_start(None, mock_container_uuid)
         mock_docker.start.assert_called_once_with(mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, mock_get_by_uuid.return_value)
         self.assertEqual(obj_container.RUNNING, mock_container.status)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_start_with_failure(self,
                                           mock_get_docker_client,
@@ -334,12 +488,12 @@ class TestDockerConductor(base.BaseTestCase):
                               self.conductor.container_start,
                               None, mock_container_uuid)
             mock_docker.start.assert_called_once_with(mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_stop(self, mock_get_docker_client,
                             mock_find_container, mock_get_by_uuid):
@@ -352,11 +506,11 @@ class TestDockerConductor(base.BaseTestCase):
         mock_find_container.return_value = mock_docker_id
         self.conductor.container_stop(None, mock_container_uuid)
         mock_docker.stop.assert_called_once_with(mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, mock_get_by_uuid.return_value)
         self.assertEqual(obj_container.STOPPED, mock_container.status)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_stop_with_failure(self, mock_get_docker_client,
                                          mock_find_container):
@@ -374,12 +528,12 @@ class TestDockerConductor(base.BaseTestCase):
                               self.conductor.container_stop,
                               None, mock_container_uuid)
             mock_docker.stop.assert_called_once_with(mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_pause(self, mock_get_docker_client,
                              mock_find_container, mock_get_by_uuid):
@@ -392,11 +546,11 @@ class TestDockerConductor(base.BaseTestCase):
         mock_find_container.return_value = mock_docker_id
         self.conductor.container_pause(None, mock_container_uuid)
         mock_docker.pause.assert_called_once_with(mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, mock_get_by_uuid.return_value)
         self.assertEqual(obj_container.PAUSED, mock_container.status)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_pause_with_failure(self, mock_get_docker_client,
                                           mock_find_container):
@@ -414,12 +568,12 @@ class TestDockerConductor(base.BaseTestCase):
                               self.conductor.container_pause,
                               None, mock_container_uuid)
             mock_docker.pause.assert_called_once_with(mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_unpause(self, mock_get_docker_client,
                                mock_find_container, mock_get_by_uuid):
@@ -432,11 +586,11 @@ class TestDockerConductor(base.BaseTestCase):
         mock_find_container.return_value = mock_docker_id
         self.conductor.container_unpause(None, mock_container_uuid)
         mock_docker.unpause.assert_called_once_with(mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, mock_get_by_uuid.return_value)
         self.assertEqual(obj_container.RUNNING, mock_container.status)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_unpause_with_failure(self,
                                             mock_get_docker_client,
@@ -455,12 +609,12 @@ class TestDockerConductor(base.BaseTestCase):
                               self.conductor.container_unpause,
                               None, mock_container_uuid)
             mock_docker.unpause.assert_called_once_with(mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_show(self, mock_get_docker_client,
                             mock_find_container, mock_get_by_uuid):
@@ -474,11 +628,11 @@ class TestDockerConductor(base.BaseTestCase):
         self.conductor.container_show(None, mock_container_uuid)
         mock_docker.inspect_container.assert_called_once_with(
             mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, mock_get_by_uuid.return_value)
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @mock.patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_show_with_running_state(self, mock_get_docker_client,
                                                mock_find_container,
@@ -498,7 +652,7 @@ class TestDockerConductor(base.BaseTestCase):
         self.assertEqual(obj_container.RUNNING, mock_container.status)
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @mock.patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_show_with_stop_state(self, mock_get_docker_client,
                                             mock_find_container,
@@ -518,7 +672,7 @@ class TestDockerConductor(base.BaseTestCase):
         self.assertEqual(obj_container.STOPPED, mock_container.status)
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @mock.patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_show_with_pause_state(self, mock_get_docker_client,
                                              mock_find_container,
@@ -538,7 +692,7 @@ class TestDockerConductor(base.BaseTestCase):
         self.assertEqual(obj_container.PAUSED, mock_container.status)
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @mock.patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_show_with_error_status(self, mock_get_docker_client,
                                               mock_find_container,
@@ -558,7 +712,7 @@ class TestDockerConductor(base.BaseTestCase):
         self.assertEqual(obj_container.ERROR, mock_container.status)
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_show_with_failure(self, mock_get_docker_client,
                                          mock_find_container,
@@ -578,12 +732,12 @@ class TestDockerConductor(base.BaseTestCase):
                               None, mock_container_uuid)
             mock_docker.inspect_container.assert_called_once_with(
                 mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, mock_get_by_uuid.return_value)
             mock_init.assert_called_once_with()
 
     @mock.patch.object(objects.Container, 'get_by_uuid')
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_show_with_not_found(self, mock_get_docker_client,
                                            mock_find_container,
@@ -602,12 +756,12 @@ class TestDockerConductor(base.BaseTestCase):
             self.conductor.container_show(None, mock_container_uuid)
             mock_docker.inspect_container.assert_called_once_with(
                 mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, mock_get_by_uuid.return_value)
             mock_init.assert_called_once_with()
             self.assertEqual(obj_container.ERROR, mock_container.status)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_execute(self, mock_get_docker_client,
                                mock_find_container):
@@ -624,10 +778,10 @@ class TestDockerConductor(base.BaseTestCase):
 
         mock_docker.exec_start.assert_called_once_with(mock_create_res,
                                                        False, False, False)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, self.mock_get_container.return_value)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_execute_with_failure(self,
                                             mock_get_docker_client,
@@ -647,11 +801,11 @@ class TestDockerConductor(base.BaseTestCase):
             mock_docker.exec_create.assert_called_once_with(mock_docker_id,
                                                             'ls', True, True,
                                                             False)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_logs(self, mock_get_docker_client,
                             mock_find_container):
@@ -663,10 +817,10 @@ class TestDockerConductor(base.BaseTestCase):
         self.conductor.container_logs(None, mock_container_uuid)
         mock_docker.get_container_logs.assert_called_once_with(
             mock_docker_id)
-        mock_find_container.assert_called_once_with(mock_docker,
-                                                    mock_container_uuid)
+        mock_find_container.assert_called_once_with(
+            mock_docker, self.mock_get_container.return_value)
 
-    @patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @patch.object(docker_conductor.Handler, '_find_docker_id')
     @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
     def test_container_logs_with_failure(self, mock_get_docker_client,
                                          mock_find_container):
@@ -684,10 +838,120 @@ class TestDockerConductor(base.BaseTestCase):
                               None, mock_container_uuid)
             mock_docker.get_container_logs.assert_called_once_with(
                 mock_docker_id)
-            mock_find_container.assert_called_once_with(mock_docker,
-                                                        mock_container_uuid)
+            mock_find_container.assert_called_once_with(
+                mock_docker, self.mock_get_container.return_value)
             mock_init.assert_called_once_with()
 
+    def _mock_containers(self, *specs):
+        containers = []
+        for bay_uuid, docker_id, status in specs:
+            container = mock.MagicMock()
+            container.uuid = 'uuid-%d' % len(containers)
+            container.bay_uuid = bay_uuid
+            container.docker_id = docker_id
+            container.status = status
+            containers.append(container)
+        return containers
+
+    @mock.patch.object(objects.Container, 'update_statuses')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    def test_container_sync_status(self, mock_bay_get_by_uuid,
+                                   mock_docker_for_bay,
+                                   mock_update_statuses):
+        dockers = {'bay1': mock.MagicMock(), 'bay2': mock.MagicMock()}
+        mock_bay_get_by_uuid.side_effect = lambda ctx, uuid: uuid
+        mock_docker_for_bay.side_effect = dockers.get
+        dockers['bay1'].containers.return_value = [
+            {'Id': 'id0', 'Status': 'Up 2 hours'},
+            {'Id': 'id1', 'Status': 'Up 2 hours (Paused)'},
+            {'Id': 'other', 'Status': 'Up 1 hour'}]
+        dockers['bay2'].containers.return_value = [
+            {'Id': 'id2', 'Status': 'Exited (0) 3 minutes ago'}]
+        containers = self._mock_containers(
+            ('bay1', 'id0', obj_container.RUNNING),
+            ('bay1', 'id1', obj_container.RUNNING),
+            ('bay2', 'id2', obj_container.RUNNING),
+            ('bay2', 'gone', obj_container.STOPPED))
+
+        result = self.conductor.container_sync_status(None, containers)
+
+        self.assertEqual(containers, result)
+        self.assertEqual([obj_container.RUNNING, obj_container.PAUSED,
+                          obj_container.STOPPED, obj_container.ERROR],
+                         [c.status for c in result])
+        self.assertEqual(2, mock_bay_get_by_uuid.call_count)
+        for docker in dockers.values():
+            docker.containers.assert_called_once_with(all=True)
+            self.assertFalse(docker.inspect_container.called)
+        mock_update_statuses.assert_called_once_with(
+            None, {'uuid-1': obj_container.PAUSED,
+                   'uuid-2': obj_container.STOPPED,
+                   'uuid-3': obj_container.ERROR})
+        for container in containers:
+            self.assertFalse(container.save.called)
+
+    @mock.patch.object(objects.Container, 'update_statuses')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    def test_container_sync_status_unchanged(self, mock_bay_get_by_uuid,
+                                             mock_docker_for_bay,
+                                             mock_update_statuses):
+        mock_docker = mock_docker_for_bay.return_value
+        mock_docker.containers.return_value = [
+            {'Id': 'id0', 'Status': 'Up 2 hours'}]
+        containers = self._mock_containers(
+            ('bay1', 'id0', obj_container.RUNNING))
+
+        self.conductor.container_sync_status(None, containers)
+
+        self.assertFalse(mock_update_statuses.called)
+
+    @mock.patch.object(objects.Container, 'update_statuses')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    def test_container_sync_status_bay_failure(self, mock_bay_get_by_uuid,
+                                               mock_docker_for_bay,
+                                               mock_update_statuses):
+        dockers = {'bay1': mock.MagicMock(), 'bay2': mock.MagicMock()}
+        mock_bay_get_by_uuid.side_effect = lambda ctx, uuid: uuid
+        mock_docker_for_bay.side_effect = dockers.get
+        dockers['bay1'].containers.side_effect = errors.APIError(
+            'Error', mock.MagicMock(), '')
+        dockers['bay2'].containers.return_value = [
+            {'Id': 'id1', 'Status': 'Exited (0) 3 minutes ago'}]
+        containers = self._mock_containers(
+            ('bay1', 'id0', obj_container.RUNNING),
+            ('bay2', 'id1', obj_container.RUNNING))
+
+        self.conductor.container_sync_status(None, containers)
+
+        self.assertEqual([obj_container.RUNNING, obj_container.STOPPED],
+                         [c.status for c in containers])
+        mock_update_statuses.assert_called_once_with(
+            None, {'uuid-1': obj_container.STOPPED})
+
+    @mock.patch.object(docker_conductor.Handler, '_find_container_by_name')
+    @mock.patch.object(objects.Container, 'update_statuses')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    def test_container_sync_status_without_docker_id(
+            self, mock_bay_get_by_uuid, mock_docker_for_bay,
+            mock_update_statuses, mock_find_container):
+        mock_docker = mock_docker_for_bay.return_value
+        mock_docker.containers.return_value = [
+            {'Id': 'id0', 'Status': 'Up 2 hours'}]
+        mock_find_container.return_value = {'Id': 'id0'}
+        containers = self._mock_containers(
+            ('bay1', None, obj_container.STOPPED))
+
+        self.conductor.container_sync_status(None, containers)
+
+        self.assertEqual('id0', containers[0].docker_id)
+        containers[0].save.assert_called_once_with()
+        mock_update_statuses.assert_called_once_with(
+            None, {'uuid-0': obj_container.RUNNING})
+
     def test_container_common_exception(self):
         for action in ('container_execute', 'container_logs', 'container_show',
                        'container_delete', 'container_create',
@@ -698,3 +962,290 @@ class TestDockerConductor(base.BaseTestCase):
                 mock_docker.side_effect = Exception("So bad")
                 self.assertRaises(exception.ContainerException,
                                   func, None, None)
+
+    def _bulk_container(self, uuid, bay_uuid, status=obj_container.RUNNING):
+        container = mock.MagicMock(uuid=uuid, bay_uuid=bay_uuid,
+                                   docker_id='docker-%s' % uuid,
+                                   status=status)
+        return container
+
+    @mock.patch.object(objects.Container, 'update_statuses')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    @mock.patch.object(objects.Container, 'list')
+    def test_container_bulk_action(self, mock_container_list,
+                                   mock_bay_get_by_uuid, mock_docker_for_bay,
+                                   mock_update_statuses):
+        containers = [self._bulk_container('c1', 'bay1'),
+                      self._bulk_container('c2', 'bay1'),
+                      self._bulk_container('c3', 'bay2',
+                                           obj_container.STOPPED)]
+        mock_container_list.return_value = containers
+        mock_docker = mock_docker_for_bay.return_value
+
+        def stop(docker_id):
+            if docker_id == 'docker-c2':
+                raise errors.APIError('Error', mock.MagicMock(status_code=500))
+
+        mock_docker.stop.side_effect = stop
+
+        results = self.conductor.container_bulk_action(
+            mock.sentinel.context, ['c1', 'c2', 'c3', 'c4'], 'stop')
+
+        mock_container_list.assert_called_once_with(
+            mock.sentinel.context, filters={'uuid': ['c1', 'c2', 'c3', 'c4']})
+        self.assertEqual(2, mock_bay_get_by_uuid.call_count)
+        self.assertEqual(3, mock_docker.stop.call_count)
+        self.assertEqual(['c1', 'c2', 'c3', 'c4'],
+                         [result['uuid'] for result in results])
+        self.assertEqual(
+            [obj_container.STOPPED, obj_container.RUNNING,
+             obj_container.STOPPED, None],
+            [result['status'] for result in results])
+        self.assertIsNone(results[0]['error'])
+        self.assertIsNotNone(results[1]['error'])
+        self.assertIsNone(results[2]['error'])
+        self.assertIn('c4', results[3]['error'])
+        mock_update_statuses.assert_called_once_with(
+            mock.sentinel.context, {'c1': obj_container.STOPPED})
+
+    @mock.patch.object(objects.Container, 'update_statuses')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    @mock.patch.object(objects.Container, 'list')
+    def test_container_bulk_action_delete(self, mock_container_list,
+                                          mock_bay_get_by_uuid,
+                                          mock_docker_for_bay,
+                                          mock_update_statuses):
+        containers = [self._bulk_container('c1', 'bay1'),
+                      self._bulk_container('c2', 'bay1')]
+        mock_container_list.return_value = containers
+        mock_docker = mock_docker_for_bay.return_value
+        mock_docker.remove_container.side_effect = [
+            None, errors.APIError('404 Not Found',
+                                  mock.MagicMock(status_code=404))]
+
+        results = self.conductor.container_bulk_action(
+            mock.sentinel.context, ['c1', 'c2'], 'delete')
+
+        self.assertEqual([None, None],
+                         [result['error'] for result in results])
+        for container in containers:
+            container.destroy.assert_called_once_with()
+        self.assertFalse(mock_update_statuses.called)
+
+    @mock.patch.object(objects.Container, 'update_statuses')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    @mock.patch.object(objects.Container, 'list')
+    def test_container_bulk_action_bay_failure(self, mock_container_list,
+                                               mock_bay_get_by_uuid,
+                                               mock_update_statuses):
+        mock_container_list.return_value = [
+            self._bulk_container('c1', 'bay1')]
+        mock_bay_get_by_uuid.side_effect = exception.BayNotFound(bay='bay1')
+
+        results = self.conductor.container_bulk_action(
+            mock.sentinel.context, ['c1'], 'start')
+
+        self.assertEqual(obj_container.RUNNING, results[0]['status'])
+        self.assertIn('bay1', results[0]['error'])
+        self.assertFalse(mock_update_statuses.called)
+
+    def test_container_bulk_action_invalid(self):
+        self.assertRaises(exception.InvalidParameterValue,
+                          self.conductor.container_bulk_action,
+                          mock.sentinel.context, ['c1'], 'kill')
+
+    def _stats_sample(self, total_usage, system_usage):
+        return {'cpu_stats': {'cpu_usage': {'total_usage': total_usage,
+                                            'percpu_usage': [0]},
+                              'system_cpu_usage': system_usage},
+                'memory_stats': {'usage': 100, 'limit': 1000}}
+
+    @mock.patch.object(docker_conductor.Handler, '_find_docker_id')
+    @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
+    def test_container_stats(self, mock_get_docker_client,
+                             mock_find_docker_id):
+        mock_docker = mock.MagicMock()
+        mock_get_docker_client.return_value = mock_docker
+        mock_container = mock.MagicMock(uuid='some-uuid')
+        self.mock_get_container.return_value = mock_container
+        mock_find_docker_id.return_value = 'docker-id'
+        samples = [self._stats_sample(i * 100, i * 1000) for i in range(10)]
+        mock_stream = mock_docker.stats_stream.return_value
+        mock_stream.__iter__.return_value = iter(samples)
+
+        stats = self.conductor.container_stats(None, 'some-uuid', 3)
+
+        mock_docker.stats_stream.assert_called_once_with('docker-id')
+        mock_stream.close.assert_called_once_with()
+        self.assertEqual('some-uuid', stats['uuid'])
+        self.assertEqual(4, stats['samples'])
+        self.assertEqual(10.0, stats['cpu_percent'])
+        self.assertEqual(100, stats['memory_usage'])
+
+    @mock.patch.object(docker_conductor.Handler, '_find_docker_id')
+    @mock.patch.object(docker_conductor.Handler, 'get_docker_client')
+    def test_container_stats_with_failure(self, mock_get_docker_client,
+                                          mock_find_docker_id):
+        mock_docker = mock.MagicMock()
+        mock_get_docker_client.return_value = mock_docker
+        mock_docker.stats_stream.side_effect = errors.APIError(
+            'Error', mock.MagicMock(status_code=500))
+
+        self.assertRaises(exception.ContainerException,
+                          self.conductor.container_stats,
+                          None, 'some-uuid', 3)
+
+    @mock.patch.object(docker_conductor.Handler, '_container_stats')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    @mock.patch.object(objects.Container, 'list')
+    def test_bay_container_stats(self, mock_container_list,
+                                 mock_bay_get_by_uuid, mock_docker_for_bay,
+                                 mock_container_stats):
+        mock_bay_get_by_uuid.return_value.uuid = 'bay1'
+        mock_container_list.return_value = [
+            self._bulk_container('c1', 'bay1'),
+            self._bulk_container('c2', 'bay1'),
+            self._bulk_container('c3', 'bay1', obj_container.STOPPED),
+            self._bulk_container('c4', 'bay1')]
+
+        def container_stats(docker, container, window):
+            if container.uuid == 'c4':
+                raise errors.APIError('Error',
+                                      mock.MagicMock(status_code=500))
+            return {'uuid': container.uuid,
+                    'cpu_percent': {'c1': 5.0, 'c2': 20.0}[container.uuid],
+                    'cpu_percent_max': 30.0, 'memory_usage': 100,
+                    'memory_max_usage': 100, 'network_rx_bytes': 1,
+                    'network_tx_bytes': 1, 'blkio_read_bytes': 1,
+                    'blkio_write_bytes': 1}
+
+        mock_container_stats.side_effect = container_stats
+
+        stats = self.conductor.bay_container_stats(mock.sentinel.context,
+                                                   'bay1', 3)
+
+        mock_container_list.assert_called_once_with(
+            mock.sentinel.context, filters={'bay_uuid': 'bay1'})
+        self.assertEqual(3, mock_container_stats.call_count)
+        self.assertEqual('bay1', stats['bay_uuid'])
+        self.assertEqual(['c2', 'c1'],
+                         [snapshot['uuid']
+                          for snapshot in stats['containers']])
+        self.assertEqual(25.0, stats['total']['cpu_percent'])
+        self.assertEqual(200, stats['total']['memory_usage'])
+        self.assertEqual(0, stats['unsampled'])
+
+    @mock.patch.object(docker_conductor.Handler, '_container_stats')
+    @mock.patch.object(docker_conductor.Handler, '_docker_for_bay')
+    @mock.patch.object(objects.Bay, 'get_by_uuid')
+    @mock.patch.object(objects.Container, 'list')
+    def test_bay_container_stats_more_containers_than_pool(
+            self, mock_container_list, mock_bay_get_by_uuid,
+            mock_docker_for_bay, mock_container_stats):
+        cfg.CONF.set_override('max_concurrent_actions', 2, group='docker')
+        cfg.CONF.set_override('stats_max_containers', 3, group='docker')
+        mock_bay_get_by_uuid.return_value.uuid = 'bay1'
+        mock_container_list.return_value = [
+            self._bulk_container('c%d' % i, 'bay1') for i in range(5)]
+        sampling = []
+        max_sampling = []
+
+        def container_stats(docker, container, window):
+            sampling.append(container.uuid)
+            max_sampling.append(len(sampling))
+            eventlet.sleep(0)
+            sampling.remove(container.uuid)
+            return {'uuid': container.uuid, 'cpu_percent': 1.0,
+                    'cpu_percent_max': 1.0, 'memory_usage': 100,
+                    'memory_max_usage': 100, 'network_rx_bytes': 1,
+                    'network_tx_bytes': 1, 'blkio_read_bytes': 1,
+                    'blkio_write_bytes': 1}
+
+        mock_container_stats.side_effect = container_stats
+
+        stats = self.conductor.bay_container_stats(mock.sentinel.context,
+                                                   'bay1', 3)
+
+        self.assertEqual(3, mock_container_stats.call_count)
+        self.assertEqual(2, max(max_sampling))
+        self.assertEqual(['c0', 'c1', 'c2'],
+                         sorted(snapshot['uuid']
+                                for snapshot in stats['containers']))
+        self.assertEqual(2, stats['unsampled'])
+
+
+class TestDockerImageCache(base.BaseTestCase):
+    def setUp(self):
+        super(TestDockerImageCache, self).setUp()
+        self.cache = docker_conductor.DockerImageCache()
+        self.docker = mock.MagicMock()
+        self.docker.images.return_value = [
+            {'RepoTags': ['ubuntu:latest', 'ubuntu:14.04']},
+            {'RepoTags': None}]
+
+    def test_ensure_image_present(self):
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu')
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu', '14.04')
+
+        self.docker.images.assert_called_once_with()
+        self.assertFalse(self.docker.pull.called)
+
+    def test_ensure_image_missing(self):
+        self.cache.ensure_image(self.docker, 'bay1', 'nginx', '1.9')
+        self.cache.ensure_image(self.docker, 'bay1', 'nginx', '1.9')
+
+        self.docker.pull.assert_called_once_with('nginx', tag='1.9')
+        self.docker.images.assert_called_once_with()
+
+    def test_ensure_image_per_bay(self):
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu')
+        self.cache.ensure_image(self.docker, 'bay2', 'ubuntu')
+
+        self.assertEqual(2, self.docker.images.call_count)
+
+    @mock.patch('time.time')
+    def test_ensure_image_lists_images_again(self, mock_time):
+        CONF.set_override('image_cache_ttl', 60, group='docker')
+        mock_time.return_value = 1000
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu')
+        mock_time.return_value = 1030
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu')
+        self.assertEqual(1, self.docker.images.call_count)
+
+        mock_time.return_value = 1060
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu')
+        self.assertEqual(2, self.docker.images.call_count)
+
+    def test_ensure_image_concurrent_pulls(self):
+        pulled = event.Event()
+        self.docker.pull.side_effect = lambda *args, **kwargs: pulled.wait()
+
+        threads = [eventlet.spawn(self.cache.ensure_image, self.docker,
+                                  'bay1', 'nginx', '1.9')
+                   for i in range(3)]
+        eventlet.sleep(0)
+        pulled.send()
+        for thread in threads:
+            thread.wait()
+
+        self.docker.pull.assert_called_once_with('nginx', tag='1.9')
+
+    def test_ensure_image_failed_pull(self):
+        self.docker.pull.side_effect = [
+            errors.APIError('Error', mock.MagicMock(status_code=500)), None]
+
+        self.assertRaises(errors.APIError, self.cache.ensure_image,
+                          self.docker, 'bay1', 'nginx')
+        self.cache.ensure_image(self.docker, 'bay1', 'nginx')
+
+        self.assertEqual(2, self.docker.pull.call_count)
+
+    def test_invalidate(self):
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu')
+        self.cache.invalidate('bay1')
+        self.cache.ensure_image(self.docker, 'bay1', 'ubuntu')
+
+        self.assertEqual(2, self.docker.images.call_count)
@@ -0,0 +1,143 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import eventlet
+import mock
+from mock import patch
+from oslo_config import cfg
+import oslo_messaging as messaging
+
+from magnum.common import exception
+from magnum.conductor.handlers import heat_notification
+from magnum import objects
+from magnum.objects.bay import Status as bay_status
+from magnum.tests.unit.db import base as db_base
+from magnum.tests.unit.db import utils
+
+
+def _payload(stack_id, state, reason=None):
+    return {'stack_identity': 'arn:openstack:heat::fake_project:stacks/'
+                              'bay1-xyz/%s' % stack_id,
+            'stack_name': 'bay1-xyz',
+            'tenant_id': 'fake_project',
+            'state': state,
+            'state_reason': reason}
+
+
+class TestHandler(db_base.DbTestCase):
+
+    def setUp(self):
+        super(TestHandler, self).setUp()
+        self.handler = heat_notification.Handler()
+        bay_dict = utils.get_test_bay(stack_id='stack1',
+                                      status=bay_status.CREATE_IN_PROGRESS)
+        self.bay = objects.Bay(self.context, **bay_dict)
+        self.bay.create()
+
+    def test_notified_stack(self):
+        stack = heat_notification.NotifiedStack(
+            _payload('stack1', bay_status.CREATE_FAILED, 'failed'))
+        self.assertEqual('stack1', stack.id)
+        self.assertEqual(bay_status.CREATE_FAILED, stack.stack_status)
+        self.assertEqual('failed', stack.stack_status_reason)
+
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_error_updates_bay_status(self, mock_osc):
+        self.handler.error({}, 'orchestration.host',
+                           'orchestration.stack.create.error',
+                           _payload('stack1', bay_status.CREATE_FAILED,
+                                    'Resource CREATE failed'), {})
+
+        bay = objects.Bay.get_by_uuid(self.context, self.bay.uuid)
+        self.assertEqual(bay_status.CREATE_FAILED, bay.status)
+        self.assertEqual('Resource CREATE failed', bay.status_reason)
+        self.assertFalse(mock_osc.return_value.heat.called)
+
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_info_failed_updates_bay_status(self, mock_osc):
+        self.handler.info({}, 'orchestration.host',
+                          'orchestration.stack.create.end',
+                          _payload('stack1', bay_status.CREATE_FAILED,
+                                   'Stack CREATE cancelled'), {})
+
+        bay = objects.Bay.get_by_uuid(self.context, self.bay.uuid)
+        self.assertEqual(bay_status.CREATE_FAILED, bay.status)
+        self.assertEqual('Stack CREATE cancelled', bay.status_reason)
+        self.assertFalse(mock_osc.return_value.heat.called)
+
+    @patch('magnum.conductor.handlers.bay_conductor._update_stack_outputs')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_info_complete_updates_outputs(self, mock_osc,
+                                           mock_update_stack_outputs):
+        mock_stack = mock.MagicMock(stack_status=bay_status.CREATE_COMPLETE,
+                                    stack_status_reason='done')
+        mock_heat = mock_osc.return_value.heat.return_value
+        mock_heat.stacks.get.return_value = mock_stack
+
+        self.handler.info({}, 'orchestration.host',
+                          'orchestration.stack.create.end',
+                          _payload('stack1', bay_status.CREATE_COMPLETE), {})
+
+        mock_heat.stacks.get.assert_called_once_with('stack1')
+        self.assertEqual(1, mock_update_stack_outputs.call_count)
+        bay = objects.Bay.get_by_uuid(self.context, self.bay.uuid)
+        self.assertEqual(bay_status.CREATE_COMPLETE, bay.status)
+
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_info_delete_complete_destroys_bay(self, mock_osc):
+        self.handler.info({}, 'orchestration.host',
+                          'orchestration.stack.delete.end',
+                          _payload('stack1', bay_status.DELETE_COMPLETE), {})
+
+        self.assertRaises(exception.BayNotFound, objects.Bay.get_by_uuid,
+                          self.context, self.bay.uuid)
+
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_info_ignores_other_stacks_and_events(self, mock_osc):
+        self.handler.info({}, 'orchestration.host',
+                          'orchestration.stack.create.end',
+                          _payload('stack2', bay_status.CREATE_FAILED), {})
+        self.handler.info({}, 'orchestration.host',
+                          'orchestration.autoscaling.start',
+                          _payload('stack1', bay_status.CREATE_FAILED), {})
+
+        self.assertFalse(mock_osc.called)
+        bay = objects.Bay.get_by_uuid(self.context, self.bay.uuid)
+        self.assertEqual(bay_status.CREATE_IN_PROGRESS, bay.status)
+
+
+class TestNotificationListener(db_base.DbTestCase):
+
+    def test_listener_with_fake_driver(self):
+        transport = messaging.get_transport(cfg.CONF, url='fake:')
+        listener = heat_notification.get_notification_listener(transport)
+        notifier = messaging.Notifier(transport, 'orchestration.host',
+                                      driver='messaging',
+                                      topic='notifications')
+        payload = _payload('stack1', bay_status.CREATE_FAILED)
+
+        with patch.object(heat_notification.Handler,
+                          '_sync_bay') as mock_sync_bay:
+            listener.start()
+            try:
+                notifier.error({}, 'orchestration.stack.create.error',
+                               payload)
+                with eventlet.Timeout(5):
+                    while not mock_sync_bay.called:
+                        eventlet.sleep(0.01)
+            finally:
+                listener.stop()
+                listener.wait()
+
+        stack = mock_sync_bay.call_args[0][0]
+        self.assertEqual('stack1', stack.id)
+        self.assertEqual(bay_status.CREATE_FAILED, stack.stack_status)
@@ -14,6 +14,7 @@
 
 from oslo_config import cfg
 
+from magnum.common import context
 from magnum.common import exception
 from magnum.conductor.handlers import kube
 from magnum import objects
@@ -34,15 +35,17 @@ class TestKube(base.TestCase):
     def setUp(self):
         super(TestKube, self).setUp()
         self.kube_handler = kube.Handler()
+        kube.bay_endpoints.clear()
+        self.addCleanup(kube.bay_endpoints.clear)
 
     def mock_pod(self):
-        return objects.Pod({})
+        return objects.Pod({}, bay_uuid='bay_uuid')
 
     def mock_service(self):
-        return objects.Service({})
+        return objects.Service({}, bay_uuid='bay_uuid')
 
     def mock_rc(self):
-        return objects.ReplicationController({})
+        return objects.ReplicationController({}, bay_uuid='bay_uuid')
 
     def mock_bay(self):
         return objects.Bay({})
@@ -131,7 +134,9 @@ class TestKube(base.TestCase):
         expected_pod.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             mock_kube_api.createPod.return_value = {'status':
                                                     {'phase': 'Pending'}}
 
@@ -139,6 +144,29 @@ class TestKube(base.TestCase):
             self.assertEqual('Pending', expected_pod.status)
             expected_pod.create.assert_called_once_with(self.context)
 
+    @patch('magnum.common.k8s_manifest.parse')
+    @patch('magnum.conductor.handlers.kube._retrieve_k8s_master_url')
+    def test_pod_create_with_parsed_manifest(self,
+                                             mock_retrieve_k8s_master_url,
+                                             mock_parse):
+        expected_pod = self.mock_pod()
+        expected_pod.create = mock.MagicMock()
+        expected_pod.manifest = 'key: value'
+        manifest = {'key': 'value'}
+
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
+            mock_kube_api.createPod.return_value = {'status':
+                                                    {'phase': 'Pending'}}
+
+            self.kube_handler.pod_create(self.context, expected_pod,
+                                         manifest)
+
+        self.assertFalse(mock_parse.called)
+        mock_kube_api.createPod.assert_called_once_with(
+            body=manifest, namespaces='default')
+
     @patch('magnum.conductor.handlers.kube._retrieve_k8s_master_url')
     @patch('ast.literal_eval')
     def test_pod_create_with_fail(self, mock_literal_eval,
@@ -149,7 +177,9 @@ class TestKube(base.TestCase):
         expected_pod.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=500)
             mock_kube_api.createPod.side_effect = err
@@ -171,7 +201,9 @@ class TestKube(base.TestCase):
         expected_pod.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=409)
             mock_kube_api.createPod.side_effect = err
@@ -197,7 +229,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
             self.kube_handler.pod_delete(self.context, mock_pod.uuid)
 
@@ -222,7 +256,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=500)
             mock_kube_api.deletePod.side_effect = err
@@ -253,7 +289,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=404)
             mock_kube_api.deletePod.side_effect = err
@@ -275,7 +313,9 @@ class TestKube(base.TestCase):
         expected_service.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
             self.kube_handler.service_create(self.context, expected_service)
             mock_kube_api.createService.assert_called_once_with(
@@ -293,7 +333,9 @@ class TestKube(base.TestCase):
         expected_service.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=404)
             mock_kube_api.createService.side_effect = err
@@ -322,7 +364,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
             self.kube_handler.service_delete(self.context, mock_service.uuid)
 
@@ -347,7 +391,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=500)
             mock_kube_api.deleteService.side_effect = err
@@ -378,7 +424,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=404)
             mock_kube_api.deleteService.side_effect = err
@@ -400,9 +448,11 @@ class TestKube(base.TestCase):
         expected_rc.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
-            self.kube_handler.rc_create({}, expected_rc)
+            self.kube_handler.rc_create(self.context, expected_rc)
             mock_kube_api.createReplicationController.assert_called_once_with(
                 body=manifest, namespaces='default')
 
@@ -417,7 +467,9 @@ class TestKube(base.TestCase):
         expected_rc.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=500)
             mock_kube_api.createReplicationController.side_effect = err
@@ -445,7 +497,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
             self.kube_handler.rc_delete(self.context, mock_rc.uuid)
 
@@ -469,7 +523,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=500)
             mock_kube_api.deleteReplicationController.side_effect = err
@@ -500,7 +556,9 @@ class TestKube(base.TestCase):
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
         mock_object_has_stack.return_value = True
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=404)
             mock_kube_api.deleteReplicationController.side_effect = err
@@ -525,7 +583,9 @@ class TestKube(base.TestCase):
         expected_rc.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
             self.kube_handler.rc_update(self.context, expected_rc)
             mock_kube_api.replaceReplicationController.assert_called_once_with(
@@ -546,7 +606,9 @@ class TestKube(base.TestCase):
         expected_rc.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=404)
             mock_kube_api.replaceReplicationController.side_effect = err
@@ -573,7 +635,9 @@ class TestKube(base.TestCase):
         expected_service.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
             self.kube_handler.service_update(self.context, expected_service)
             mock_kube_api.replaceService.assert_called_once_with(
@@ -594,7 +658,9 @@ class TestKube(base.TestCase):
         manifest = {"key": "value"}
         expected_service.manifest = '{"key": "value"}'
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=404)
             mock_kube_api.replaceService.side_effect = err
@@ -621,7 +687,9 @@ class TestKube(base.TestCase):
         expected_pod.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
 
             self.kube_handler.pod_update(self.context, expected_pod)
             mock_kube_api.replacePod.assert_called_once_with(
@@ -643,7 +711,9 @@ class TestKube(base.TestCase):
         expected_pod.manifest = '{"key": "value"}'
 
         mock_retrieve_k8s_master_url.return_value = expected_master_url
-        with patch.object(self.kube_handler, '_k8s_api') as mock_kube_api:
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
             err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
                                   fp=mock.MagicMock(), code=404)
             mock_kube_api.replacePod.side_effect = err
@@ -656,3 +726,253 @@ class TestKube(base.TestCase):
                 body=manifest, name=expected_pod.name,
                 namespaces='default')
             self.assertFalse(expected_pod.refresh.called)
+
+    def _manifest_objects(self):
+        pod = objects.Pod({}, name='pod1', bay_uuid='bay_uuid',
+                          manifest='{"kind": "Pod"}')
+        service = objects.Service({}, name='service1', bay_uuid='bay_uuid',
+                                  manifest='{"kind": "Service"}')
+        rc = objects.ReplicationController(
+            {}, name='rc1', bay_uuid='bay_uuid',
+            manifest='{"kind": "ReplicationController"}')
+        return pod, service, rc
+
+    @patch('magnum.objects.Manifest.create_resources')
+    @patch('magnum.conductor.handlers.kube._retrieve_k8s_master_url')
+    def test_manifest_apply(self, mock_retrieve_k8s_master_url,
+                            mock_create_records):
+        pod, service, rc = self._manifest_objects()
+        calls = []
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
+            mock_kube_api.createService.side_effect = (
+                lambda **kw: calls.append('service'))
+            mock_kube_api.createReplicationController.side_effect = (
+                lambda **kw: calls.append('rc'))
+            mock_kube_api.createPod.return_value = {'status':
+                                                    {'phase': 'Pending'}}
+
+            result = self.kube_handler.manifest_apply(self.context, [pod],
+                                                      [service], [rc])
+
+        self.assertEqual(['service', 'rc'], calls)
+        mock_kube_api.createService.assert_called_once_with(
+            body={'kind': 'Service'}, namespaces='default')
+        mock_kube_api.createPod.assert_called_once_with(
+            body={'kind': 'Pod'}, namespaces='default')
+        self.assertEqual('Pending', pod.status)
+        mock_create_records.assert_called_once_with(self.context, [pod],
+                                                    [service], [rc])
+        self.assertEqual({'pods': [pod], 'services': [service],
+                          'rcs': [rc]}, result)
+
+    @patch('magnum.common.k8s_manifest.parse')
+    @patch('magnum.objects.Manifest.create_resources')
+    @patch('magnum.conductor.handlers.kube._retrieve_k8s_master_url')
+    def test_manifest_apply_with_parsed_manifests(
+            self, mock_retrieve_k8s_master_url, mock_create_records,
+            mock_parse):
+        pod, service, rc = self._manifest_objects()
+        manifests = {'pods': [{'kind': 'Pod', 'parsed': True}],
+                     'services': [{'kind': 'Service', 'parsed': True}],
+                     'rcs': [{'kind': 'ReplicationController',
+                              'parsed': True}]}
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
+            mock_kube_api.createPod.return_value = {'status':
+                                                    {'phase': 'Pending'}}
+
+            self.kube_handler.manifest_apply(self.context, [pod], [service],
+                                             [rc], manifests)
+
+        self.assertFalse(mock_parse.called)
+        mock_kube_api.createService.assert_called_once_with(
+            body=manifests['services'][0], namespaces='default')
+        mock_kube_api.createReplicationController.assert_called_once_with(
+            body=manifests['rcs'][0], namespaces='default')
+        mock_kube_api.createPod.assert_called_once_with(
+            body=manifests['pods'][0], namespaces='default')
+
+    @patch('magnum.objects.Manifest.create_resources')
+    @patch('magnum.conductor.handlers.kube._retrieve_k8s_master_url')
+    @patch('ast.literal_eval')
+    def test_manifest_apply_service_fails(self, mock_literal_eval,
+                                          mock_retrieve_k8s_master_url,
+                                          mock_create_records):
+        pod, service, rc = self._manifest_objects()
+        service2 = objects.Service({}, name='service2', bay_uuid='bay_uuid',
+                                   manifest='{"kind": "Service"}')
+        err = error.HTTPError(url='fake', msg='fake', hdrs='fake',
+                              fp=mock.MagicMock(), code=409)
+        mock_literal_eval.return_value = {'message': 'error'}
+        with patch.object(self.kube_handler,
+                          '_get_k8s_api') as mock_get_k8s_api:
+            mock_kube_api = mock_get_k8s_api.return_value
+            mock_kube_api.createService.side_effect = [err, None]
+
+            e = self.assertRaises(exception.KubernetesAPIFailed,
+                                  self.kube_handler.manifest_apply,
+                                  self.context, [pod], [service, service2],
+                                  [rc])
+
+        self.assertEqual(409, e.code)
+        self.assertIn('service1', str(e))
+        self.assertFalse(mock_kube_api.createReplicationController.called)
+        self.assertFalse(mock_kube_api.createPod.called)
+        mock_create_records.assert_called_once_with(self.context, [],
+                                                    [service2], [])
+
+    def test_get_k8s_api_per_master_url(self):
+        k8s_api_1 = self.kube_handler._get_k8s_api('http://10.0.0.1:8080')
+        k8s_api_2 = self.kube_handler._get_k8s_api('http://10.0.0.2:8080')
+
+        self.assertEqual('http://10.0.0.1:8080', k8s_api_1.apiClient.host)
+        self.assertEqual('http://10.0.0.2:8080', k8s_api_2.apiClient.host)
+        self.assertIs(k8s_api_1,
+                      self.kube_handler._get_k8s_api('http://10.0.0.1:8080'))
+
+
+class TestK8sClientCache(base.TestCase):
+    def setUp(self):
+        super(TestK8sClientCache, self).setUp()
+        self.cache = kube.K8sClientCache()
+        self.addCleanup(self.cache.clear)
+
+    def test_get_reuses_client(self):
+        k8s_api = self.cache.get('http://10.0.0.1:8080')
+        self.assertIs(k8s_api, self.cache.get('http://10.0.0.1:8080'))
+        self.assertEqual(1, len(self.cache))
+
+    def test_get_uses_pool_size(self):
+        cfg.CONF.set_override('k8s_pool_size', 3, group='kubernetes')
+        k8s_api = self.cache.get('http://10.0.0.1:8080')
+        adapter = k8s_api.apiClient.session.get_adapter('http://10.0.0.1')
+        self.assertEqual(3, adapter._pool_maxsize)
+
+    def test_get_evicts_least_recently_used(self):
+        cfg.CONF.set_override('k8s_client_cache_size', 2,
+                              group='kubernetes')
+        k8s_api_1 = self.cache.get('http://10.0.0.1:8080')
+        k8s_api_2 = self.cache.get('http://10.0.0.2:8080')
+        self.cache.get('http://10.0.0.1:8080')
+        with patch.object(k8s_api_1.apiClient, 'close') as mock_close, \
+                patch.object(k8s_api_2.apiClient, 'close') as mock_close_2:
+            self.cache.get('http://10.0.0.3:8080')
+
+        self.assertFalse(mock_close.called)
+        mock_close_2.assert_called_once_with()
+        self.assertIn('http://10.0.0.1:8080', self.cache)
+        self.assertNotIn('http://10.0.0.2:8080', self.cache)
+        self.assertIn('http://10.0.0.3:8080', self.cache)
+
+    @patch('time.time')
+    def test_get_closes_idle_clients(self, mock_time):
+        cfg.CONF.set_override('k8s_client_idle_timeout', 60,
+                              group='kubernetes')
+        mock_time.return_value = 1000
+        k8s_api_1 = self.cache.get('http://10.0.0.1:8080')
+        mock_time.return_value = 1030
+        k8s_api_2 = self.cache.get('http://10.0.0.2:8080')
+
+        mock_time.return_value = 1070
+        with patch.object(k8s_api_1.apiClient, 'close') as mock_close:
+            self.cache.get('http://10.0.0.2:8080')
+
+        mock_close.assert_called_once_with()
+        self.assertNotIn('http://10.0.0.1:8080', self.cache)
+        self.assertIs(k8s_api_2, self.cache.get('http://10.0.0.2:8080'))
+
+
+@patch('magnum.conductor.handlers.kube._object_has_stack')
+@patch('magnum.conductor.handlers.kube._retrieve_k8s_master_url')
+class TestBayEndpointCache(base.TestCase):
+    def setUp(self):
+        super(TestBayEndpointCache, self).setUp()
+        self.cache = kube.BayEndpointCache()
+        self.pod = objects.Pod({}, bay_uuid='bay1')
+
+    def test_k8s_master_url_cached(self, mock_retrieve, mock_has_stack):
+        mock_retrieve.return_value = 'http://10.0.0.1:8080'
+
+        for i in range(2):
+            self.assertEqual('http://10.0.0.1:8080',
+                             self.cache.k8s_master_url(self.context,
+                                                       self.pod))
+
+        mock_retrieve.assert_called_once_with(self.context, self.pod)
+
+    def test_has_stack_cached(self, mock_retrieve, mock_has_stack):
+        mock_has_stack.return_value = False
+
+        self.assertFalse(self.cache.has_stack(self.context, self.pod))
+        self.assertFalse(self.cache.has_stack(self.context, self.pod))
+
+        mock_has_stack.assert_called_once_with(self.context, self.pod)
+        self.assertFalse(mock_retrieve.called)
+
+    @patch('time.time')
+    def test_entries_expire(self, mock_time, mock_retrieve, mock_has_stack):
+        cfg.CONF.set_override('bay_endpoint_cache_ttl', 30,
+                              group='kubernetes')
+        cfg.CONF.set_override('bay_stack_cache_ttl', 10, group='kubernetes')
+        mock_time.return_value = 100
+        self.cache.k8s_master_url(self.context, self.pod)
+        self.cache.has_stack(self.context, self.pod)
+
+        mock_time.return_value = 115
+        self.cache.k8s_master_url(self.context, self.pod)
+        self.cache.has_stack(self.context, self.pod)
+
+        self.assertEqual(1, mock_retrieve.call_count)
+        self.assertEqual(2, mock_has_stack.call_count)
+
+        mock_time.return_value = 130
+        self.cache.k8s_master_url(self.context, self.pod)
+        self.assertEqual(2, mock_retrieve.call_count)
+
+    def test_entries_per_tenant(self, mock_retrieve, mock_has_stack):
+        other_context = context.make_context(project_id='other_project',
+                                             user_id='other_user')
+        mock_retrieve.side_effect = [
+            'http://10.0.0.1:8080', exception.BayNotFound(bay='bay1')]
+
+        self.cache.k8s_master_url(self.context, self.pod)
+
+        self.assertRaises(exception.BayNotFound, self.cache.k8s_master_url,
+                          other_context, self.pod)
+        mock_retrieve.assert_called_with(other_context, self.pod)
+
+    def test_invalidate(self, mock_retrieve, mock_has_stack):
+        other_pod = objects.Pod({}, bay_uuid='bay2')
+        self.cache.k8s_master_url(self.context, self.pod)
+        self.cache.has_stack(self.context, self.pod)
+        self.cache.k8s_master_url(self.context, other_pod)
+
+        self.cache.invalidate('bay1')
+        self.cache.k8s_master_url(self.context, self.pod)
+        self.cache.has_stack(self.context, self.pod)
+        self.cache.k8s_master_url(self.context, other_pod)
+
+        self.assertEqual(3, mock_retrieve.call_count)
+        self.assertEqual(2, mock_has_stack.call_count)
+
+    def test_handler_uses_cache(self, mock_retrieve, mock_has_stack):
+        handler = kube.Handler()
+        self.addCleanup(kube.bay_endpoints.clear)
+        mock_retrieve.return_value = 'http://10.0.0.1:8080'
+        mock_has_stack.return_value = True
+        pods = [objects.Pod({}, bay_uuid='bay1', name='pod%d' % i)
+                for i in range(2)]
+        with patch.object(objects.Pod, 'get_by_uuid',
+                          side_effect=pods), \
+                patch.object(objects.Pod, 'destroy'), \
+                patch.object(handler, '_get_k8s_api') as mock_get_k8s_api:
+            handler.pod_delete(self.context, 'pod0')
+            handler.pod_delete(self.context, 'pod1')
+
+        self.assertEqual(1, mock_retrieve.call_count)
+        self.assertEqual(1, mock_has_stack.call_count)
+        self.assertEqual(2,
+                         mock_get_k8s_api.return_value.deletePod.call_count)
@@ -12,7 +12,6 @@
 #    under the License.
 
 import mock
-import oslo_messaging as messaging
 
 from magnum.common import exception
 from magnum.common import short_id
@@ -55,70 +54,64 @@ class BayLockTest(base.TestCase):
     def test_successful_acquire_dead_conductor_lock(self, mock_object_create,
                                                     mock_object_steal):
         baylock = bay_lock.BayLock(self.context, self.bay, self.conductor_id)
-        with mock.patch.object(baylock, 'conductor_alive',
-                               return_value=False):
-            baylock.acquire()
+        baylock.acquire()
 
-            mock_object_create.assert_called_once_with(self.bay.uuid,
-                                                       self.conductor_id)
-            mock_object_steal.assert_called_once_with(
-                self.bay.uuid,
-                'fake-conductor-id', self.conductor_id)
+        mock_object_create.assert_called_once_with(self.bay.uuid,
+                                                   self.conductor_id)
+        mock_object_steal.assert_called_once_with(
+            self.bay.uuid,
+            'fake-conductor-id', self.conductor_id)
 
+    @patch('magnum.objects.BayLock.steal', return_value='fake-conductor-id')
     @patch('magnum.objects.BayLock.create', return_value='fake-conductor-id')
-    def test_failed_acquire_alive_conductor_lock(self, mock_object_create):
+    def test_failed_acquire_leased_lock(self, mock_object_create,
+                                        mock_object_steal):
         baylock = bay_lock.BayLock(self.context, self.bay, self.conductor_id)
-        with mock.patch.object(baylock, 'conductor_alive',
-                               return_value=True):
-            self.assertRaises(exception.OperationInProgress, baylock.acquire)
+        self.assertRaises(exception.OperationInProgress, baylock.acquire)
 
-            mock_object_create.assert_called_once_with(self.bay.uuid,
-                                                       self.conductor_id)
+        mock_object_create.assert_called_once_with(self.bay.uuid,
+                                                   self.conductor_id)
+        mock_object_steal.assert_called_once_with(
+            self.bay.uuid, 'fake-conductor-id', self.conductor_id)
 
     @patch('magnum.objects.BayLock.steal', return_value='fake-conductor-id2')
     @patch('magnum.objects.BayLock.create', return_value='fake-conductor-id')
     def test_failed_acquire_dead_conductor_lock(self, mock_object_create,
                                                 mock_object_steal):
         baylock = bay_lock.BayLock(self.context, self.bay, self.conductor_id)
-        with mock.patch.object(baylock, 'conductor_alive',
-                               return_value=False):
-            self.assertRaises(exception.OperationInProgress, baylock.acquire)
+        self.assertRaises(exception.OperationInProgress, baylock.acquire)
 
-            mock_object_create.assert_called_once_with(self.bay.uuid,
-                                                       self.conductor_id)
-            mock_object_steal.assert_called_once_with(
-                self.bay.uuid,
-                'fake-conductor-id', self.conductor_id)
+        mock_object_create.assert_called_once_with(self.bay.uuid,
+                                                   self.conductor_id)
+        mock_object_steal.assert_called_once_with(
+            self.bay.uuid,
+            'fake-conductor-id', self.conductor_id)
 
     @patch('magnum.objects.BayLock.steal', side_effect=[True, None])
     @patch('magnum.objects.BayLock.create', return_value='fake-conductor-id')
     def test_successful_acquire_with_retry(self, mock_object_create,
                                            mock_object_steal):
         baylock = bay_lock.BayLock(self.context, self.bay, self.conductor_id)
-        with mock.patch.object(baylock, 'conductor_alive',
-                               return_value=False):
-            baylock.acquire()
+        baylock.acquire()
 
-            mock_object_create.assert_has_calls(
-                [mock.call(self.bay.uuid, self.conductor_id)] * 2)
-            mock_object_steal.assert_has_calls(
-                [mock.call(self.bay.uuid, 'fake-conductor-id',
-                           self.conductor_id)] * 2)
+        mock_object_create.assert_has_calls(
+            [mock.call(self.bay.uuid, self.conductor_id)] * 2)
+        mock_object_steal.assert_has_calls(
+            [mock.call(self.bay.uuid, 'fake-conductor-id',
+                       self.conductor_id)] * 2)
 
     @patch('magnum.objects.BayLock.steal', return_value=True)
     @patch('magnum.objects.BayLock.create', return_value='fake-conductor-id')
     def test_failed_acquire_one_retry_only(self, mock_object_create,
                                            mock_object_steal):
         baylock = bay_lock.BayLock(self.context, self.bay, self.conductor_id)
-        with mock.patch.object(baylock, 'conductor_alive',
-                               return_value=False):
-            self.assertRaises(exception.OperationInProgress, baylock.acquire)
+        self.assertRaises(exception.OperationInProgress, baylock.acquire)
 
-            mock_object_create.assert_has_calls(
-                [mock.call(self.bay.uuid, self.conductor_id)] * 2)
-            mock_object_steal.assert_has_calls(
-                [mock.call(self.bay.uuid, 'fake-conductor-id',
-                           self.conductor_id)] * 2)
+        mock_object_create.assert_has_calls(
+            [mock.call(self.bay.uuid, self.conductor_id)] * 2)
+        mock_object_steal.assert_has_calls(
+            [mock.call(self.bay.uuid, 'fake-conductor-id',
+                       self.conductor_id)] * 2)
 
     @patch('magnum.objects.BayLock.release', return_value=None)
     @patch('magnum.objects.BayLock.create', return_value=None)
@@ -159,27 +152,26 @@ class BayLockTest(base.TestCase):
             self.assertEqual(1, mock_object_create.call_count)
         assert not mock_object_release.called
 
-    @patch('magnum.conductor.api.ListenerAPI.__new__')
-    def test_conductor_alive_ok(self, mock_listener_api_new):
-        mock_listener_api = mock.MagicMock()
-        mock_listener_api.ping_conductor.return_value = True
-        mock_listener_api_new.return_value = mock_listener_api
-        baylock = bay_lock.BayLock(self.context, self.bay, self.conductor_id)
 
-        ret = baylock.conductor_alive(self.context, self.conductor_id)
+class HeartbeatTest(base.TestCase):
 
-        self.assertIs(True, ret)
-        self.assertEqual(1, mock_listener_api_new.call_count)
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    @patch('magnum.objects.BayLock.renew')
+    def test_start_heartbeat(self, mock_heartbeat, mock_looping_call):
+        self.config(heartbeat_interval=5, group='conductor')
+        bay_lock.start_heartbeat('conductor1')
 
-    @patch('magnum.conductor.api.ListenerAPI.__new__')
-    def test_conductor_alive_timeout(self, mock_listener_api_new):
-        mock_listener_api = mock.MagicMock()
-        mock_listener_api.ping_conductor.side_effect = (
-            messaging.MessagingTimeout('too slow'))
-        mock_listener_api_new.return_value = mock_listener_api
-        baylock = bay_lock.BayLock(self.context, self.bay, self.conductor_id)
+        mock_looping_call.return_value.start.assert_called_once_with(5)
+        heartbeat = mock_looping_call.call_args[1]['f']
+        heartbeat()
+        mock_heartbeat.assert_called_once_with('conductor1')
 
-        ret = baylock.conductor_alive(self.context, self.conductor_id)
+    @patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+    @patch('magnum.objects.BayLock.renew')
+    def test_heartbeat_failure_keeps_timer(self, mock_heartbeat,
+                                           mock_looping_call):
+        mock_heartbeat.side_effect = Exception
+        bay_lock.start_heartbeat('conductor1')
 
-        self.assertIs(False, ret)
-        self.assertEqual(1, mock_listener_api_new.call_count)
+        heartbeat = mock_looping_call.call_args[1]['f']
+        heartbeat()
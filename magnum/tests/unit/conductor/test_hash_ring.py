@@ -0,0 +1,103 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+from oslo_config import cfg
+
+from magnum.conductor import hash_ring
+from magnum.tests import base
+
+
+class TestHashRing(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestHashRing, self).setUp()
+        self.keys = ['bay%d' % i for i in range(200)]
+
+    def _hosts(self, ring):
+        return dict((key, ring.get_host(key)) for key in self.keys)
+
+    def test_get_host_empty_ring(self):
+        self.assertIsNone(hash_ring.HashRing([]).get_host('bay1'))
+
+    def test_get_host_spreads_keys(self):
+        ring = hash_ring.HashRing(['c1', 'c2', 'c3'])
+        hosts = list(self._hosts(ring).values())
+        for host in ['c1', 'c2', 'c3']:
+            self.assertTrue(hosts.count(host) > 20)
+
+    def test_get_host_is_stable(self):
+        self.assertEqual(self._hosts(hash_ring.HashRing(['c1', 'c2'])),
+                         self._hosts(hash_ring.HashRing(['c2', 'c1'])))
+
+    def test_joining_host_only_takes_keys(self):
+        before = self._hosts(hash_ring.HashRing(['c1', 'c2']))
+        after = self._hosts(hash_ring.HashRing(['c1', 'c2', 'c3']))
+        for key in self.keys:
+            if after[key] != before[key]:
+                self.assertEqual('c3', after[key])
+
+
+class TestConductorRing(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestConductorRing, self).setUp()
+        self.ring = hash_ring.ConductorRing('c1')
+
+    def test_init(self):
+        self.assertEqual(['c1'], self.ring.conductors)
+        self.assertTrue(self.ring.is_owner('bay1'))
+
+    def test_heartbeat_rebalances_on_join(self):
+        version = self.ring.version
+        self.ring.heartbeat('c1')
+        self.assertEqual(version, self.ring.version)
+
+        self.ring.heartbeat('c2')
+        self.assertEqual(['c1', 'c2'], self.ring.conductors)
+        self.assertEqual(version + 1, self.ring.version)
+        owners = set(self.ring.get_owner('bay%d' % i) for i in range(50))
+        self.assertEqual(set(['c1', 'c2']), owners)
+
+    @mock.patch('time.time')
+    def test_expire(self, mock_time):
+        cfg.CONF.set_override('heartbeat_timeout', 30, group='conductor')
+        mock_time.return_value = 100
+        self.ring.heartbeat('c2')
+        self.ring.heartbeat('c3')
+        mock_time.return_value = 120
+        self.ring.heartbeat('c3')
+        version = self.ring.version
+
+        mock_time.return_value = 130
+        self.ring.expire()
+        self.assertEqual(['c1', 'c2', 'c3'], self.ring.conductors)
+        self.assertEqual(version, self.ring.version)
+
+        mock_time.return_value = 140
+        self.ring.expire()
+        self.assertEqual(['c1', 'c3'], self.ring.conductors)
+        self.assertEqual(version + 1, self.ring.version)
+
+    @mock.patch('magnum.conductor.api.ListenerAPI')
+    def test_send_heartbeat(self, mock_listener_api):
+        self.ring._send_heartbeat()
+
+        mock_listener_api.return_value.conductor_heartbeat.\
+            assert_called_once_with('c1')
+
+    @mock.patch('magnum.conductor.api.ListenerAPI')
+    def test_send_heartbeat_failure(self, mock_listener_api):
+        mock_listener_api.return_value.conductor_heartbeat.side_effect = (
+            Exception)
+        self.ring._send_heartbeat()
+        self.assertEqual(['c1'], self.ring.conductors)
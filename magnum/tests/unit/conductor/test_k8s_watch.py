@@ -0,0 +1,259 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import mock
+from oslo_config import cfg
+from six.moves.urllib import error
+
+from magnum.common import context
+from magnum.common.pythonk8sclient.client import swagger
+from magnum.common import utils as magnum_utils
+from magnum.conductor import k8s_watch
+from magnum import objects
+from magnum.openstack.common import loopingcall
+from magnum.tests import base
+from magnum.tests.unit.db import base as db_base
+from magnum.tests.unit.db import utils
+
+
+def _pod(name, phase, resource_version):
+    return {'metadata': {'name': name, 'resourceVersion': resource_version},
+            'status': {'phase': phase}}
+
+
+class TestBayWatcher(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestBayWatcher, self).setUp()
+        patcher = mock.patch('magnum.common.pythonk8sclient.client.swagger.'
+                             'ApiClient')
+        self.mock_client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch('eventlet.sleep')
+        self.mock_sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.mock_client.listAPI.side_effect = (
+            lambda path, query: swagger.JSONListStream([json.dumps({
+                'metadata': {'resourceVersion': '10'},
+                'items': [_pod('pod1', 'Pending', '9')]})]))
+        self.events = mock.MagicMock()
+        self.mock_client.streamAPI.return_value = self.events
+        self.watcher = k8s_watch.BayWatcher('bay-uuid', 'http://master:8080')
+
+    def _stream(self, *events):
+        self.events.__iter__.return_value = iter(events)
+
+    def test_watch_once_lists_first(self):
+        self._stream()
+
+        self.assertEqual('10', self.watcher._watch_once('pods', None))
+
+        self.mock_client.listAPI.assert_called_once_with(
+            '/api/v1beta3/namespaces/default/pods', None)
+        self.mock_client.streamAPI.assert_called_once_with(
+            '/api/v1beta3/namespaces/default/pods',
+            {'watch': 'true', 'resourceVersion': '10'},
+            timeout=cfg.CONF.kubernetes.k8s_watch_timeout)
+        self.assertEqual({'pod1': {'status': 'Pending'}},
+                         self.watcher._pending['pods'])
+        self.assertEqual(set(['pod1']), self.watcher._listed['pods'])
+        self.events.close.assert_called_once_with()
+
+    def test_watch_once_records_changes(self):
+        self._stream({'type': 'MODIFIED',
+                      'object': _pod('pod1', 'Running', '11')},
+                     {'type': 'ADDED',
+                      'object': _pod('pod2', 'Pending', '12')},
+                     {'type': 'DELETED',
+                      'object': _pod('pod3', 'Running', '13')})
+
+        self.assertEqual('13', self.watcher._watch_once('pods', '10'))
+
+        self.assertFalse(self.mock_client.listAPI.called)
+        self.assertEqual({'pod1': {'status': 'Running'},
+                          'pod2': {'status': 'Pending'},
+                          'pod3': None},
+                         self.watcher._pending['pods'])
+        self.assertIsNone(self.watcher._listed['pods'])
+
+    def test_watch_once_error_event(self):
+        self._stream({'type': 'ERROR', 'object': {'code': 410}},
+                     {'type': 'ADDED',
+                      'object': _pod('pod2', 'Pending', '12')})
+
+        self.assertIsNone(self.watcher._watch_once('pods', '10'))
+
+        self.assertEqual({}, self.watcher._pending['pods'])
+        self.events.close.assert_called_once_with()
+
+    def test_watch_once_http_error(self):
+        self.mock_client.streamAPI.side_effect = error.HTTPError(
+            'http://master:8080', 500, 'error', {}, None)
+
+        self.assertIsNone(self.watcher._watch_once('pods', '10'))
+
+        self.mock_sleep.assert_called_once_with(
+            cfg.CONF.kubernetes.k8s_watch_retry_interval)
+
+    def test_watch_once_connection_error(self):
+        self.events.__iter__.side_effect = IOError()
+
+        self.assertEqual('10', self.watcher._watch_once('pods', '10'))
+
+        self.mock_sleep.assert_called_once_with(
+            cfg.CONF.kubernetes.k8s_watch_retry_interval)
+        self.events.close.assert_called_once_with()
+
+    @mock.patch('time.time')
+    def test_watch_once_timed_out(self, mock_time):
+        mock_time.side_effect = [0, cfg.CONF.kubernetes.k8s_watch_timeout]
+        self.events.__iter__.side_effect = IOError()
+
+        self.assertEqual('10', self.watcher._watch_once('pods', '10'))
+
+        self.assertFalse(self.mock_sleep.called)
+
+    @mock.patch.object(objects.ReplicationController, 'update_by_names')
+    @mock.patch.object(objects.Pod, 'update_by_names')
+    def test_flush(self, mock_update_pods, mock_update_rcs):
+        ctx = mock.sentinel.context
+        mock_update_pods.side_effect = Exception()
+        self.watcher._record('pods', _pod('pod1', 'Running', '11'))
+        self.watcher._record('replicationcontrollers',
+                             {'metadata': {'name': 'rc1'},
+                              'spec': {'replicas': 2}})
+
+        self.watcher.flush(ctx)
+        self.watcher.flush(ctx)
+
+        mock_update_pods.assert_called_once_with(
+            ctx, 'bay-uuid', {'pod1': {'status': 'Running'}}, None)
+        mock_update_rcs.assert_called_once_with(
+            ctx, 'bay-uuid', {'rc1': {'replicas': 2}}, None)
+
+    @mock.patch.object(objects.Pod, 'update_by_names')
+    def test_flush_after_relist(self, mock_update_pods):
+        ctx = mock.sentinel.context
+        self.watcher._record('pods', _pod('stale', 'Running', '8'))
+        self._stream({'type': 'ADDED',
+                      'object': _pod('pod2', 'Pending', '11')},
+                     {'type': 'DELETED',
+                      'object': _pod('pod1', 'Running', '12')})
+        self.watcher._watch_once('pods', None)
+
+        self.watcher.flush(ctx)
+        self.watcher.flush(ctx)
+
+        mock_update_pods.assert_called_once_with(
+            ctx, 'bay-uuid', {'pod1': None, 'pod2': {'status': 'Pending'}},
+            set(['pod1', 'pod2']))
+
+    def test_service_values(self):
+        service = {'metadata': {'name': 'service1'},
+                   'spec': {'clusterIP': '10.0.0.5',
+                            'ports': [{'port': 80}]}}
+        self.assertEqual({'ip': '10.0.0.5', 'ports': [{'port': 80}]},
+                         k8s_watch._service_values(service))
+
+
+@mock.patch('magnum.openstack.common.loopingcall.FixedIntervalLoopingCall')
+@mock.patch('magnum.conductor.k8s_watch.BayWatcher')
+class TestK8sWatchService(db_base.DbTestCase):
+
+    def setUp(self):
+        super(TestK8sWatchService, self).setUp()
+        self.ctx = context.make_admin_context(all_tenants=True)
+        for i, coe in enumerate(['kubernetes', 'swarm']):
+            baymodel = utils.get_test_baymodel(id=i, uuid='baymodel%d' % i,
+                                               coe=coe, apiserver_port=8080)
+            objects.BayModel(self.context, **baymodel).create()
+
+        self.bays = []
+        for i, (baymodel, status, api_address) in enumerate([
+                ('baymodel0', 'CREATE_COMPLETE', '10.0.0.1'),
+                ('baymodel0', 'UPDATE_COMPLETE', '10.0.0.2'),
+                ('baymodel0', 'CREATE_IN_PROGRESS', '10.0.0.3'),
+                ('baymodel0', 'CREATE_COMPLETE', None),
+                ('baymodel1', 'CREATE_COMPLETE', '10.0.0.5')]):
+            bay = utils.get_test_bay(id=i, uuid=magnum_utils.generate_uuid(),
+                                     baymodel_id=baymodel, status=status,
+                                     api_address=api_address)
+            self.bays.append(objects.Bay(self.context, **bay))
+            self.bays[-1].create()
+        self.service = k8s_watch.K8sWatchService()
+
+    def test_sync(self, mock_watcher, mock_timer):
+        self.service.sync(self.ctx)
+
+        mock_watcher.assert_has_calls([
+            mock.call(self.bays[0].uuid, 'http://10.0.0.1:8080'),
+            mock.call(self.bays[1].uuid, 'http://10.0.0.2:8080')],
+            any_order=True)
+        self.assertEqual(2, mock_watcher.call_count)
+        self.assertEqual(2, mock_watcher.return_value.start.call_count)
+        self.assertTrue(self.service.is_watching(self.bays[0]))
+        mock_timer.assert_called_once_with(f=self.service.flush)
+        mock_timer.return_value.start.assert_called_once_with(
+            cfg.CONF.kubernetes.k8s_watch_flush_interval)
+
+    def test_sync_skips_bays_owned_elsewhere(self, mock_watcher, mock_timer):
+        ring = mock.MagicMock()
+        ring.is_owner.side_effect = (
+            lambda bay_uuid: bay_uuid != self.bays[0].uuid)
+        self.service = k8s_watch.K8sWatchService(ring)
+
+        self.service.sync(self.ctx)
+
+        mock_watcher.assert_called_once_with(self.bays[1].uuid,
+                                             'http://10.0.0.2:8080')
+
+    def test_sync_unwatches_bays(self, mock_watcher, mock_timer):
+        watchers = {}
+
+        def new_watcher(bay_uuid, url):
+            watchers[bay_uuid] = mock.MagicMock(k8s_master_url=url)
+            return watchers[bay_uuid]
+        mock_watcher.side_effect = new_watcher
+        self.service.sync(self.ctx)
+        deleted_watcher = watchers[self.bays[0].uuid]
+        moved_watcher = watchers[self.bays[1].uuid]
+        self.bays[0].status = 'DELETE_IN_PROGRESS'
+        self.bays[0].save()
+        self.bays[1].api_address = '10.0.0.9'
+        self.bays[1].save()
+
+        self.service.sync(self.ctx)
+
+        deleted_watcher.flush.assert_called_once_with(mock.ANY)
+        deleted_watcher.stop.assert_called_once_with()
+        moved_watcher.stop.assert_called_once_with()
+        self.assertFalse(self.service.is_watching(self.bays[0]))
+        self.assertEqual('http://10.0.0.9:8080',
+                         watchers[self.bays[1].uuid].k8s_master_url)
+        self.assertFalse(watchers[self.bays[1].uuid].stop.called)
+        mock_timer.assert_called_once_with(f=self.service.flush)
+
+    def test_flush(self, mock_watcher, mock_timer):
+        self.service.sync(self.ctx)
+
+        self.service.flush()
+
+        self.assertEqual(2, mock_watcher.return_value.flush.call_count)
+
+    def test_flush_no_watchers(self, mock_watcher, mock_timer):
+        self.service._timer = mock_timer.return_value
+
+        self.assertRaises(loopingcall.LoopingCallDone, self.service.flush)
+        self.assertIsNone(self.service._timer)
@@ -0,0 +1,173 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+
+import mock
+from oslo_config import cfg
+from oslo_utils import timeutils
+
+from magnum.common import context
+from magnum.common import exception
+from magnum.common import utils as magnum_utils
+from magnum.conductor import periodic
+from magnum import objects
+from magnum.tests.unit.db import base as db_base
+from magnum.tests.unit.db import utils
+
+
+class TestConductorPeriodicTasks(db_base.DbTestCase):
+
+    def setUp(self):
+        super(TestConductorPeriodicTasks, self).setUp()
+        self.heat_poller = mock.MagicMock()
+        self.heat_poller.is_polling.return_value = False
+        self.tasks = periodic.ConductorPeriodicTasks(self.heat_poller)
+        self.ctx = context.make_admin_context(all_tenants=True)
+
+        self.bays = []
+        for i, status in enumerate(['CREATE_IN_PROGRESS',
+                                    'CREATE_COMPLETE',
+                                    'DELETE_IN_PROGRESS',
+                                    'UPDATE_IN_PROGRESS']):
+            bay = utils.get_test_bay(id=i, uuid='uuid%d' % i,
+                                     stack_id='stack%d' % i, status=status,
+                                     project_id='project%d' % i)
+            self.bays.append(objects.Bay(self.context, **bay))
+            self.bays[-1].create()
+
+    def _polled_stacks(self):
+        return sorted(call[0][1].stack_id
+                      for call in self.heat_poller.add.call_args_list)
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status(self, mock_osc):
+        self.tasks.sync_bay_status(self.ctx)
+
+        mock_osc.assert_called_once_with(self.ctx)
+        self.assertEqual(['stack0', 'stack2', 'stack3'],
+                         self._polled_stacks())
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_skips_polled_bays(self, mock_osc):
+        self.heat_poller.is_polling.side_effect = (
+            lambda bay: bay.stack_id == 'stack2')
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        self.assertEqual(['stack0', 'stack3'], self._polled_stacks())
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_skips_bays_owned_elsewhere(self, mock_osc):
+        self.heat_poller.owns.side_effect = (
+            lambda bay: bay.stack_id != 'stack0')
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        self.assertEqual(['stack2', 'stack3'], self._polled_stacks())
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_nothing_to_poll(self, mock_osc):
+        self.heat_poller.is_polling.return_value = True
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        self.assertFalse(mock_osc.called)
+        self.assertFalse(self.heat_poller.add.called)
+
+    def _create_stackless_bay(self, minutes_ago,
+                              status='CREATE_IN_PROGRESS'):
+        bay = utils.get_test_bay(id=10, uuid=magnum_utils.generate_uuid(),
+                                 stack_id=None, status=status)
+        bay = objects.Bay(self.context, **bay)
+        bay.create()
+        created_at = timeutils.utcnow() - datetime.timedelta(
+            minutes=minutes_ago)
+        self.dbapi.update_bay(bay.id, {'created_at': created_at,
+                                       'updated_at': created_at})
+        return bay
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_fails_stackless_bays(self, mock_osc):
+        cfg.CONF.set_override('bay_create_timeout', 30, group='bay_heat')
+        bay = self._create_stackless_bay(31)
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        bay.refresh()
+        self.assertEqual('CREATE_FAILED', bay.status)
+        self.assertTrue(bay.status_reason)
+        self.assertEqual(['stack0', 'stack2', 'stack3'],
+                         self._polled_stacks())
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_waits_for_stackless_bays(self, mock_osc):
+        bay = self._create_stackless_bay(periodic.STACKLESS_BAY_TIMEOUT - 1)
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        bay.refresh()
+        self.assertEqual('CREATE_IN_PROGRESS', bay.status)
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_removes_deleted_stackless_bays(self, mock_osc):
+        bay = self._create_stackless_bay(periodic.STACKLESS_BAY_TIMEOUT + 1,
+                                         status='DELETE_IN_PROGRESS')
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        self.assertRaises(exception.BayNotFound, objects.Bay.get_by_uuid,
+                          self.context, bay.uuid)
+        self.assertEqual(['stack0', 'stack2', 'stack3'],
+                         self._polled_stacks())
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_waits_for_deleted_stackless_bays(self,
+                                                              mock_osc):
+        bay = self._create_stackless_bay(periodic.STACKLESS_BAY_TIMEOUT - 1,
+                                         status='DELETE_IN_PROGRESS')
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        bay.refresh()
+        self.assertEqual('DELETE_IN_PROGRESS', bay.status)
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_sync_bay_status_skips_stackless_bays_owned_elsewhere(
+            self, mock_osc):
+        bay = self._create_stackless_bay(periodic.STACKLESS_BAY_TIMEOUT + 1)
+        self.heat_poller.owns.side_effect = lambda b: b.uuid != bay.uuid
+
+        self.tasks.sync_bay_status(self.ctx)
+
+        bay.refresh()
+        self.assertEqual('CREATE_IN_PROGRESS', bay.status)
+
+    @mock.patch('magnum.openstack.common.loopingcall.DynamicLoopingCall')
+    def test_setup(self, mock_looping_call):
+        periodic.setup(self.heat_poller)
+
+        args = mock_looping_call.call_args[0]
+        self.assertTrue(args[1].is_admin)
+        self.assertTrue(args[1].all_tenants)
+        self.assertEqual(1, mock_looping_call.return_value.start.call_count)
+
+    def test_sync_k8s_watches(self):
+        k8s_watcher = mock.MagicMock()
+        tasks = periodic.ConductorPeriodicTasks(self.heat_poller, k8s_watcher)
+
+        tasks.sync_k8s_watches(self.ctx)
+
+        k8s_watcher.sync.assert_called_once_with(self.ctx)
+
+    def test_sync_k8s_watches_disabled(self):
+        self.tasks.sync_k8s_watches(self.ctx)
@@ -74,25 +74,32 @@ class RPCAPITestCase(base.DbTestCase):
 
     def test_bay_create(self):
         self._test_rpcapi('bay_create',
-                          'call',
+                          'cast',
                           version='1.0',
                           bay=self.fake_bay,
                           bay_create_timeout=15)
 
+    def test_bay_bulk_create(self):
+        self._test_rpcapi('bay_bulk_create',
+                          'cast',
+                          version='1.0',
+                          bays=[self.fake_bay],
+                          bay_create_timeout=15)
+
     def test_bay_delete(self):
         self._test_rpcapi('bay_delete',
-                          'call',
+                          'cast',
                           version='1.0',
                           uuid=self.fake_bay['uuid'])
 
         self._test_rpcapi('bay_delete',
-                          'call',
+                          'cast',
                           version='1.1',
                           uuid=self.fake_bay['name'])
 
     def test_bay_update(self):
         self._test_rpcapi('bay_update',
-                          'call',
+                          'cast',
                           version='1.1',
                           bay=self.fake_bay['name'])
 
@@ -164,6 +171,14 @@ class RPCAPITestCase(base.DbTestCase):
                           version='1.1',
                           uuid=self.fake_rc['name'])
 
+    def test_manifest_apply(self):
+        self._test_rpcapi('manifest_apply',
+                          'call',
+                          version='1.0',
+                          pods=[self.fake_pod],
+                          services=[self.fake_service],
+                          rcs=[self.fake_rc])
+
     def test_ping_conductor(self):
         self._test_rpcapi('ping_conductor',
                           'call',
@@ -12,12 +12,14 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import eventlet
 import mock
 from oslo_config import cfg
 
 from magnum.common import exception
 from magnum.conductor import template_definition as tdef
 from magnum.tests import base
+from magnum.tests import utils
 
 
 class TemplateDefinitionTestCase(base.TestCase):
@@ -155,3 +157,87 @@ class TemplateDefinitionTestCase(base.TestCase):
         actual_url = swarm_def.get_discovery_url(mock_bay)
 
         self.assertEqual(mock_bay.discovery_url, actual_url)
+
+
+class DiscoveryTokenPoolTestCase(base.TestCase):
+
+    def setUp(self):
+        super(DiscoveryTokenPoolTestCase, self).setUp()
+        self.server = self.useFixture(utils.DiscoveryServer())
+        cfg.CONF.set_override('coreos_discovery_token_url', self.server.url,
+                              group='bay')
+        cfg.CONF.set_override('public_swarm_discovery_url', self.server.url,
+                              group='bay')
+        for definition in [tdef.CoreOSK8sTemplateDefinition,
+                           tdef.AtomicSwarmTemplateDefinition]:
+            pool = tdef.DiscoveryTokenPool(definition.token_pool.name)
+            patcher = mock.patch.object(definition, 'token_pool', pool)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _wait_for_refill(self, pool):
+        for i in range(100):
+            if not pool._refilling:
+                return
+            eventlet.sleep(0.01)
+        self.fail('Discovery token pool %s was not refilled' % pool.name)
+
+    def test_get_token_without_pool(self):
+        definition = tdef.CoreOSK8sTemplateDefinition
+
+        self.assertEqual('token1', definition.get_token())
+        self.assertEqual('token2', definition.get_token())
+
+        self.assertEqual(0, definition.token_pool.depth)
+        self.assertFalse(definition.token_pool._refilling)
+
+    def test_get_token_from_pool(self):
+        cfg.CONF.set_override('discovery_token_pool_size', 3, group='bay')
+        definition = tdef.CoreOSK8sTemplateDefinition
+
+        self.assertEqual('token1', definition.get_token())
+        self._wait_for_refill(definition.token_pool)
+        self.assertEqual(3, definition.token_pool.depth)
+
+        self.assertEqual('token2', definition.get_token())
+        self._wait_for_refill(definition.token_pool)
+        self.assertEqual(3, definition.token_pool.depth)
+        self.assertEqual(5, self.server.tokens)
+
+    def test_get_public_token_from_pool(self):
+        cfg.CONF.set_override('discovery_token_pool_size', 1, group='bay')
+        definition = tdef.AtomicSwarmTemplateDefinition
+
+        self.assertEqual('token://token1', definition.get_public_token())
+        self._wait_for_refill(definition.token_pool)
+        self.assertEqual('token://token2', definition.get_public_token())
+
+    def test_fill_token_pools(self):
+        cfg.CONF.set_override('discovery_token_pool_size', 2, group='bay')
+
+        tdef.TemplateDefinition.fill_token_pools()
+
+        for definition in [tdef.CoreOSK8sTemplateDefinition,
+                           tdef.AtomicSwarmTemplateDefinition]:
+            self._wait_for_refill(definition.token_pool)
+            self.assertEqual(2, definition.token_pool.depth)
+        self.assertEqual(4, self.server.tokens)
+
+    def test_fill_token_pools_without_pool(self):
+        tdef.TemplateDefinition.fill_token_pools()
+
+        self.assertEqual(0, tdef.CoreOSK8sTemplateDefinition.token_pool.depth)
+        self.assertFalse(
+            tdef.AtomicSwarmTemplateDefinition.token_pool._refilling)
+        self.assertEqual(0, self.server.tokens)
+
+    def test_refill_failure(self):
+        cfg.CONF.set_override('discovery_token_pool_size', 3, group='bay')
+        pool = tdef.DiscoveryTokenPool('test')
+        fetch_token = mock.MagicMock(side_effect=['token1', Exception])
+
+        self.assertEqual('token1', pool.get(fetch_token))
+        self._wait_for_refill(pool)
+
+        self.assertEqual(0, pool.depth)
+        self.assertEqual(2, fetch_token.call_count)
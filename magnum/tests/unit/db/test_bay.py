@@ -17,6 +17,7 @@
 
 import six
 
+from magnum.common import context
 from magnum.common import exception
 from magnum.common import utils as magnum_utils
 from magnum.tests.unit.db import base
@@ -112,6 +113,34 @@ class DbBayTestCase(base.DbTestCase):
                                       filters={'node_count': 1})
         self.assertEqual([bay2.id], [r.id for r in res])
 
+    def test_get_bay_list_with_status_filter(self):
+        bay1 = utils.create_test_bay(uuid=magnum_utils.generate_uuid(),
+                                     status='CREATE_IN_PROGRESS')
+        utils.create_test_bay(uuid=magnum_utils.generate_uuid(),
+                              status='CREATE_COMPLETE')
+        bay3 = utils.create_test_bay(uuid=magnum_utils.generate_uuid(),
+                                     status='DELETE_IN_PROGRESS')
+
+        res = self.dbapi.get_bay_list(
+            self.context,
+            filters={'status': ['CREATE_IN_PROGRESS', 'DELETE_IN_PROGRESS']})
+        self.assertEqual(sorted([bay1.id, bay3.id]),
+                         sorted([r.id for r in res]))
+
+    def test_get_bay_list_all_tenants(self):
+        bay1 = utils.create_test_bay(uuid=magnum_utils.generate_uuid(),
+                                     project_id='project1')
+        bay2 = utils.create_test_bay(uuid=magnum_utils.generate_uuid(),
+                                     project_id='project2')
+
+        res = self.dbapi.get_bay_list(self.context)
+        self.assertEqual([], [r.id for r in res])
+
+        ctx = context.make_admin_context(all_tenants=True)
+        res = self.dbapi.get_bay_list(ctx)
+        self.assertEqual(sorted([bay1.id, bay2.id]),
+                         sorted([r.id for r in res]))
+
     def test_get_bay_list_baymodel_not_exist(self):
         utils.create_test_bay()
         self.assertEqual(1, len(self.dbapi.get_bay_list(self.context)))
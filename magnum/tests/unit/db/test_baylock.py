@@ -14,6 +14,10 @@
 
 import uuid
 
+from oslo_utils import timeutils
+
+from magnum.db.sqlalchemy import api as sqlalchemy_api
+from magnum.db.sqlalchemy import models
 from magnum.tests.unit.db import base
 from magnum.tests.unit.db import utils as utils
 
@@ -40,13 +44,45 @@ class DbBayLockTestCase(base.DbTestCase):
         ret = self.dbapi.create_bay_lock(self.bay.uuid, str(uuid.uuid4()))
         self.assertEqual(conductor_id, ret)
 
+    def _get_bay_lock(self):
+        query = sqlalchemy_api.model_query(models.BayLock)
+        return query.filter_by(bay_uuid=self.bay.uuid).one()
+
     def test_steal_bay_lock_success(self):
+        timeutils.set_time_override()
+        self.addCleanup(timeutils.clear_time_override)
         conductor_id = str(uuid.uuid4())
         self.dbapi.create_bay_lock(self.bay.uuid, conductor_id)
+        timeutils.advance_time_seconds(31)
         ret = self.dbapi.steal_bay_lock(self.bay.uuid, conductor_id,
                                         str(uuid.uuid4()))
         self.assertIsNone(ret)
 
+    def test_steal_bay_lock_fail_leased(self):
+        conductor_id = str(uuid.uuid4())
+        self.dbapi.create_bay_lock(self.bay.uuid, conductor_id)
+        ret = self.dbapi.steal_bay_lock(self.bay.uuid, conductor_id,
+                                        str(uuid.uuid4()))
+        self.assertEqual(conductor_id, ret)
+
+    def test_renew_bay_locks(self):
+        timeutils.set_time_override()
+        self.addCleanup(timeutils.clear_time_override)
+        conductor_id = str(uuid.uuid4())
+        self.dbapi.create_bay_lock(self.bay.uuid, conductor_id)
+        expires_at = self._get_bay_lock().expires_at
+
+        timeutils.advance_time_seconds(20)
+        self.dbapi.renew_bay_locks(conductor_id)
+
+        self.assertEqual(20, (self._get_bay_lock().expires_at -
+                              expires_at).seconds)
+
+        timeutils.advance_time_seconds(20)
+        ret = self.dbapi.steal_bay_lock(self.bay.uuid, conductor_id,
+                                        str(uuid.uuid4()))
+        self.assertEqual(conductor_id, ret)
+
     def test_steal_bay_lock_fail_gone(self):
         conductor_id = str(uuid.uuid4())
         self.dbapi.create_bay_lock(self.bay.uuid, conductor_id)
@@ -91,6 +91,20 @@ class DbContainerTestCase(base.DbTestCase):
                                             filters={'name': 'bad-container'})
         self.assertEqual([], [r.id for r in res])
 
+        res = self.dbapi.get_container_list(
+            self.context, filters={'uuid': [container1.uuid, container2.uuid]})
+        self.assertEqual(sorted([container1.id, container2.id]),
+                         sorted([r.id for r in res]))
+
+        res = self.dbapi.get_container_list(
+            self.context, filters={'bay_uuid': container1.bay_uuid})
+        self.assertEqual(sorted([container1.id, container2.id]),
+                         sorted([r.id for r in res]))
+
+        res = self.dbapi.get_container_list(
+            self.context, filters={'bay_uuid': magnum_utils.generate_uuid()})
+        self.assertEqual([], [r.id for r in res])
+
     def test_destroy_container(self):
         container = utils.create_test_container()
         self.dbapi.destroy_container(container.id)
@@ -132,3 +146,15 @@ class DbContainerTestCase(base.DbTestCase):
         self.assertRaises(exception.InvalidParameterValue,
                           self.dbapi.update_container, container.id,
                           {'uuid': ''})
+
+    def test_update_container_statuses(self):
+        containers = [utils.create_test_container(
+            id=i, uuid=magnum_utils.generate_uuid()) for i in range(3)]
+
+        self.dbapi.update_container_statuses(
+            {containers[0].uuid: 'Stopped', containers[1].uuid: 'Paused'})
+
+        self.assertEqual(
+            ['Stopped', 'Paused', 'Running'],
+            [self.dbapi.get_container_by_uuid(self.context, c.uuid).status
+             for c in containers])
@@ -176,3 +176,82 @@ class DbPodTestCase(base.DbTestCase):
         self.assertRaises(exception.InvalidParameterValue,
                           self.dbapi.update_pod, self.pod.id,
                           {'uuid': ''})
+
+    def test_update_pods_by_name(self):
+        pod2 = utils.create_test_pod(bay_uuid=self.bay.uuid, name='pod2',
+                                     uuid=magnum_utils.generate_uuid())
+        other_bay = utils.create_test_bay(uuid=magnum_utils.generate_uuid())
+        other_pod = utils.create_test_pod(bay_uuid=other_bay.uuid,
+                                          uuid=magnum_utils.generate_uuid())
+
+        self.dbapi.update_pods_by_name(self.bay.uuid,
+                                       {self.pod.name: {'status': 'Failed'},
+                                        'pod2': {'status': 'Pending'},
+                                        'missing': {'status': 'Running'}})
+
+        res = self.dbapi.get_pod_by_id(self.context, self.pod.id)
+        self.assertEqual('Failed', res.status)
+        res = self.dbapi.get_pod_by_id(self.context, pod2.id)
+        self.assertEqual('Pending', res.status)
+        res = self.dbapi.get_pod_by_id(self.context, other_pod.id)
+        self.assertEqual('Running', res.status)
+
+    def test_update_pods_by_name_deletes(self):
+        pod2 = utils.create_test_pod(bay_uuid=self.bay.uuid, name='pod2',
+                                     uuid=magnum_utils.generate_uuid())
+        pod3 = utils.create_test_pod(bay_uuid=self.bay.uuid, name='pod3',
+                                     uuid=magnum_utils.generate_uuid())
+        other_bay = utils.create_test_bay(uuid=magnum_utils.generate_uuid())
+        other_pod = utils.create_test_pod(bay_uuid=other_bay.uuid,
+                                          uuid=magnum_utils.generate_uuid())
+
+        self.dbapi.update_pods_by_name(self.bay.uuid,
+                                       {self.pod.name: {'status': 'Failed'},
+                                        'pod2': None},
+                                       names=set([self.pod.name, 'pod2']))
+
+        res = self.dbapi.get_pod_by_id(self.context, self.pod.id)
+        self.assertEqual('Failed', res.status)
+        for pod in (pod2, pod3):
+            self.assertRaises(exception.PodNotFound,
+                              self.dbapi.get_pod_by_id, self.context, pod.id)
+        res = self.dbapi.get_pod_by_id(self.context, other_pod.id)
+        self.assertEqual(other_pod.uuid, res.uuid)
+
+    def test_create_k8s_resources(self):
+        pod = utils.get_test_pod(bay_uuid=self.bay.uuid, name='pod2')
+        service = utils.get_test_service(bay_uuid=self.bay.uuid)
+        rc = utils.get_test_rc(bay_uuid=self.bay.uuid)
+        for values in (pod, service, rc):
+            del values['id']
+            del values['uuid']
+
+        pods, services, rcs = self.dbapi.create_k8s_resources([pod],
+                                                              [service],
+                                                              [rc])
+
+        self.assertEqual('pod2', pods[0].name)
+        self.assertTrue(magnum_utils.is_uuid_like(pods[0].uuid))
+        self.assertEqual(pods[0].id,
+                         self.dbapi.get_pod_by_uuid(self.context,
+                                                    pods[0].uuid).id)
+        self.assertEqual(1, len(self.dbapi.get_services_by_bay_uuid(
+            self.bay.uuid)))
+        self.assertEqual(1, len(self.dbapi.get_rcs_by_bay_uuid(
+            self.bay.uuid)))
+
+    def test_create_k8s_resources_is_atomic(self):
+        pod = utils.get_test_pod(bay_uuid=self.bay.uuid, name='pod2',
+                                 uuid=magnum_utils.generate_uuid())
+        del pod['id']
+        service = utils.get_test_service(bay_uuid=self.bay.uuid,
+                                         uuid=magnum_utils.generate_uuid())
+        del service['id']
+        duplicated = dict(service)
+
+        self.assertRaises(exception.ServiceAlreadyExists,
+                          self.dbapi.create_k8s_resources, [pod],
+                          [service, duplicated], [])
+        self.assertRaises(exception.PodNotFound,
+                          self.dbapi.get_pod_by_uuid, self.context,
+                          pod['uuid'])
@@ -134,3 +134,16 @@ class DbRCTestCase(base.DbTestCase):
         self.assertRaises(exception.InvalidParameterValue,
                           self.dbapi.update_rc, self.rc.id,
                           {'uuid': ''})
+
+    def test_update_rcs_by_name(self):
+        other_bay = utils.create_test_bay(uuid=magnum_utils.generate_uuid())
+        other_rc = utils.create_test_rc(bay_uuid=other_bay.uuid,
+                                        uuid=magnum_utils.generate_uuid())
+
+        self.dbapi.update_rcs_by_name(self.bay.uuid,
+                                      {self.rc.name: {'replicas': 5}})
+
+        res = self.dbapi.get_rc_by_id(self.context, self.rc.id)
+        self.assertEqual(5, res.replicas)
+        res = self.dbapi.get_rc_by_id(self.context, other_rc.id)
+        self.assertEqual(3, res.replicas)
@@ -175,3 +175,18 @@ class DbServiceTestCase(base.DbTestCase):
         self.assertRaises(exception.InvalidParameterValue,
                           self.dbapi.update_service, self.service.id,
                           {'uuid': ''})
+
+    def test_update_services_by_name(self):
+        other_bay = utils.create_test_bay(uuid=magnum_utils.generate_uuid())
+        other_service = utils.create_test_service(
+            bay_uuid=other_bay.uuid, uuid=magnum_utils.generate_uuid())
+
+        self.dbapi.update_services_by_name(
+            self.bay.uuid, {self.service.name: {'ip': '10.0.0.5',
+                                                'ports': [{'port': 8080}]}})
+
+        res = self.dbapi.get_service_by_id(self.context, self.service.id)
+        self.assertEqual('10.0.0.5', res.ip)
+        self.assertEqual([{'port': 8080}], res.ports)
+        res = self.dbapi.get_service_by_id(self.context, other_service.id)
+        self.assertEqual([{'port': 80}], res.ports)
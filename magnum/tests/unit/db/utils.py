@@ -188,6 +188,7 @@ def get_test_container(**kw):
         'command': kw.get('command', 'fake_command'),
         'bay_uuid': kw.get('bay_uuid', 'fff114da-3bfa-4a0f-a123-c0dffad9718e'),
         'status': kw.get('state', 'Running'),
+        'docker_id': kw.get('docker_id'),
     }
 
 
@@ -50,3 +50,9 @@ class TestBayLockObject(base.DbTestCase):
             objects.BayLock.release(self.bay_uuid, self.conductor_id)
             mock_release_baylock.assert_called_once_with(self.bay_uuid,
                                                          self.conductor_id)
+
+    def test_renew(self):
+        with mock.patch.object(self.dbapi, 'renew_bay_locks',
+                               autospec=True) as mock_renew_baylocks:
+            objects.BayLock.renew(self.conductor_id)
+            mock_renew_baylocks.assert_called_once_with(self.conductor_id)
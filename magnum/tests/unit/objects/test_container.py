@@ -67,6 +67,26 @@ class TestContainerObject(base.DbTestCase):
             self.assertIsInstance(containers[0], objects.Container)
             self.assertEqual(self.context, containers[0]._context)
 
+    def test_list_with_filters(self):
+        with mock.patch.object(self.dbapi, 'get_container_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_container]
+            filters = {'uuid': [self.fake_container['uuid']]}
+            containers = objects.Container.list(self.context,
+                                                filters=filters)
+            mock_get_list.assert_called_once_with(self.context, limit=None,
+                                                  marker=None, sort_key=None,
+                                                  sort_dir=None,
+                                                  filters=filters)
+            self.assertThat(containers, HasLength(1))
+
+    def test_update_statuses(self):
+        statuses = {self.fake_container['uuid']: 'Stopped'}
+        with mock.patch.object(self.dbapi, 'update_container_statuses',
+                               autospec=True) as mock_update_statuses:
+            objects.Container.update_statuses(self.context, statuses)
+            mock_update_statuses.assert_called_once_with(statuses)
+
     def test_create(self):
         with mock.patch.object(self.dbapi, 'create_container',
                                autospec=True) as mock_create_container:
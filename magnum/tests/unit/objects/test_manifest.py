@@ -0,0 +1,39 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+
+from magnum import objects
+from magnum.tests.unit.db import base
+from magnum.tests.unit.db import utils
+
+
+class TestManifestObject(base.DbTestCase):
+
+    def test_create_resources(self):
+        pod = objects.Pod(self.context, name='pod1', bay_uuid='bay-uuid')
+        service = objects.Service(self.context, name='service1',
+                                  bay_uuid='bay-uuid')
+        db_pod = utils.get_test_pod(name='pod1')
+        db_service = utils.get_test_service(name='service1')
+        with mock.patch.object(self.dbapi, 'create_k8s_resources',
+                               autospec=True) as mock_create:
+            mock_create.return_value = ([db_pod], [db_service], [])
+            objects.Manifest.create_resources(self.context, [pod], [service],
+                                              [])
+            mock_create.assert_called_once_with(
+                [{'name': 'pod1', 'bay_uuid': 'bay-uuid'}],
+                [{'name': 'service1', 'bay_uuid': 'bay-uuid'}], [])
+        self.assertEqual(db_pod['uuid'], pod.uuid)
+        self.assertEqual(db_service['uuid'], service.uuid)
+        self.assertEqual(set(), pod.obj_what_changed())
+        self.assertEqual(set(), service.obj_what_changed())
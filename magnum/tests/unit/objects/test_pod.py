@@ -65,6 +65,15 @@ class TestPodObject(base.DbTestCase):
             self.assertIsInstance(pods[0], objects.Pod)
             self.assertEqual(self.context, pods[0]._context)
 
+    def test_update_by_names(self):
+        values = {'name1': {'status': 'Running'}, 'name2': None}
+        names = set(['name1', 'name3'])
+        with mock.patch.object(self.dbapi, 'update_pods_by_name',
+                               autospec=True) as mock_update:
+            objects.Pod.update_by_names(self.context, 'bay-uuid', values,
+                                        names)
+            mock_update.assert_called_once_with('bay-uuid', values, names)
+
     def test_create(self):
         with mock.patch.object(self.dbapi, 'create_pod',
                                autospec=True) as mock_create_pod:
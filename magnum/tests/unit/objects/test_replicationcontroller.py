@@ -58,6 +58,14 @@ class TestReplicationControllerObject(base.DbTestCase):
             self.assertIsInstance(rcs[0], objects.ReplicationController)
             self.assertEqual(self.context, rcs[0]._context)
 
+    def test_update_by_names(self):
+        values = {'name1': {'replicas': 2}}
+        with mock.patch.object(self.dbapi, 'update_rcs_by_name',
+                               autospec=True) as mock_update:
+            objects.ReplicationController.update_by_names(self.context,
+                                                          'bay-uuid', values)
+            mock_update.assert_called_once_with('bay-uuid', values, None)
+
     def test_create(self):
         with mock.patch.object(self.dbapi, 'create_rc',
                                autospec=True) as mock_create_rc:
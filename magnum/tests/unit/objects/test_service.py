@@ -65,6 +65,13 @@ class TestServiceObject(base.DbTestCase):
             self.assertIsInstance(services[0], objects.Service)
             self.assertEqual(self.context, services[0]._context)
 
+    def test_update_by_names(self):
+        values = {'name1': {'ip': '10.0.0.5'}}
+        with mock.patch.object(self.dbapi, 'update_services_by_name',
+                               autospec=True) as mock_update:
+            objects.Service.update_by_names(self.context, 'bay-uuid', values)
+            mock_update.assert_called_once_with('bay-uuid', values, None)
+
     def test_create(self):
         with mock.patch.object(self.dbapi, 'create_service',
                                autospec=True) as mock_create_service:
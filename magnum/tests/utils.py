@@ -13,10 +13,12 @@
 # limitations under the License.
 
 import tempfile
+import threading
 
 import fixtures
 from oslo_config import cfg
 from oslo_db import options
+from six.moves import BaseHTTPServer
 
 from magnum.common import context as magnum_context
 from magnum.db import api as db_api
@@ -54,6 +56,53 @@ class Database(fixtures.Fixture):
                              sqlite_db=self.db_file)
 
 
+class DiscoveryServer(fixtures.Fixture):
+    """A local discovery service handing out numbered tokens.
+
+    GET requests are answered like the CoreOS discovery service and POST
+    requests like the public Swarm discovery service.
+    """
+
+    def setUp(self):
+        super(DiscoveryServer, self).setUp()
+        self.tokens = 0
+        server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0),
+                                           self._make_handler())
+        self.url = 'http://127.0.0.1:%d/new' % server.server_port
+
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+    def _make_handler(self):
+        fixture = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._reply('https://discovery.etcd.io/%s' % self._token())
+
+            def do_POST(self):
+                self._reply(self._token())
+
+            def _token(self):
+                fixture.tokens += 1
+                return 'token%d' % fixture.tokens
+
+            def _reply(self, body):
+                body = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
 def get_dummy_session():
     return db_api.IMPL.get_session()
 